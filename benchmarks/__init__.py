@@ -0,0 +1,5 @@
+"""Throughput benchmarks for the Power-Chess engine as seen from Python."""
+
+from .bench_engine import main
+
+__all__ = ["main"]
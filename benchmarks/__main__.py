@@ -0,0 +1,7 @@
+"""Module entry point for ``python -m benchmarks``."""
+
+from . import main
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
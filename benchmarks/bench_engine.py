@@ -0,0 +1,151 @@
+"""Engine throughput through the Python bindings.
+
+Mirrors ``chess_engine/bench/bench_engine.cpp`` (same fixed positions and workloads) so the two
+reports can be read side by side: the gap between them is the per-call binding overhead.
+
+Usage: ``python -m benchmarks [--perft-depth N] [--iters N] [--playouts N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Iterable, List, Sequence, Tuple, TypeVar
+
+from power_chess.engine import Engine, State
+
+# Fixed midgame lines as (from, to) squares; keep in sync with bench_engine.cpp.
+MIDGAME_A = [(32, 21), (2, 13), (21, 10), (3, 10), (27, 21), (13, 24), (28, 22), (10, 16),
+             (30, 24), (16, 10), (25, 19), (10, 17), (21, 15), (17, 23), (24, 18), (23, 16)]  # fmt: skip
+MIDGAME_B = [(25, 13), (9, 21), (28, 16), (4, 14), (26, 20), (14, 24), (16, 11), (2, 13), (33, 28), (24, 14),
+             (30, 18), (10, 22), (27, 22), (21, 27), (32, 19), (27, 33), (28, 33), (14, 9), (33, 27), (5, 4)]  # fmt: skip
+MIDGAME_C = [(26, 14), (6, 12), (31, 21), (10, 16), (14, 9), (2, 6), (32, 19), (4, 9),
+             (29, 23), (16, 23), (19, 8), (9, 16), (21, 7), (3, 2), (7, 12), (16, 31),
+             (27, 15), (2, 7), (12, 26), (5, 3), (28, 22), (7, 14), (8, 4), (31, 24)]  # fmt: skip
+
+
+def play_line(engine: Engine, line: Iterable[Tuple[int, int]]) -> State:
+    """Play (from, to) pairs from the initial state; each must match a generated move."""
+    state = engine.initial_state()
+    for frm, to in line:
+        move = next((m for m in engine.legal_moves(state) if m.from_ == frm and m.to == to), None)
+        if move is None:
+            raise ValueError(f"move {frm}->{to} is not legal in the fixed line")
+        engine.apply_move(state, move)
+    return state
+
+
+def fixed_positions(engine: Engine) -> List[Tuple[str, State]]:
+    """The initial position plus the fixed midgame positions."""
+    return [
+        ("initial", engine.initial_state()),
+        ("midgame-a", play_line(engine, MIDGAME_A)),
+        ("midgame-b", play_line(engine, MIDGAME_B)),
+        ("midgame-c", play_line(engine, MIDGAME_C)),
+    ]
+
+
+def clone(state: State) -> State:
+    copy = State()
+    copy.board = state.board
+    copy.to_move = state.to_move
+    copy.ply = state.ply
+    return copy
+
+
+def report(bench: str, position: str, count: int, unit: str, secs: float) -> None:
+    rate = count / secs if secs > 0 else 0.0
+    print(f"{bench:<22} {position:<10} {count:>12} {unit:<6} {secs:8.3f} s {rate:14.0f} {unit}/s")
+
+
+T = TypeVar("T")
+
+
+def timed(fn: Callable[[], T]) -> Tuple[T, float]:
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def bench_perft(engine: Engine, positions: Sequence[Tuple[str, State]], depth: int) -> None:
+    for name, state in positions:
+        nodes, secs = timed(lambda: engine.perft(state, depth))
+        report(f"perft({depth})", name, nodes, "nodes", secs)
+
+
+def bench_legal_moves(engine: Engine, positions: Sequence[Tuple[str, State]], iters: int) -> None:
+    for name, state in positions:
+        count, secs = timed(lambda: sum(len(engine.legal_moves(state)) for _ in range(iters)))
+        report("legal_moves", name, count, "moves", secs)
+
+
+def bench_apply_move(engine: Engine, positions: Sequence[Tuple[str, State]], iters: int) -> None:
+    for name, state in positions:
+        moves = engine.legal_moves(state)
+        rounds = max(1, iters // max(len(moves), 1))
+
+        # Fresh copies are made up front so only apply_move itself is timed.
+        copies = [clone(state) for _ in range(rounds * len(moves))]
+
+        def apply_all() -> int:
+            it = iter(copies)
+            for _ in range(rounds):
+                for m in moves:
+                    engine.apply_move(next(it), m)
+            return len(copies)
+
+        def make_unmake_all() -> int:
+            s = clone(state)
+            for _ in range(rounds):
+                for m in moves:
+                    engine.unmake_move(s, engine.make_move(s, m))
+            return rounds * len(moves)
+
+        count, secs = timed(apply_all)
+        report("apply_move", name, count, "moves", secs)
+        count, secs = timed(make_unmake_all)
+        report("make+unmake_move", name, count, "moves", secs)
+
+
+def bench_playouts(engine: Engine, playouts: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+
+    def run() -> int:
+        plies = 0
+        for _ in range(playouts):
+            state = engine.initial_state()
+            while True:
+                moves = engine.legal_moves(state)
+                if not moves:
+                    break
+                plies += 1
+                if engine.apply_move_unchecked(state, rng.choice(moves)).done:
+                    break
+        return plies
+
+    plies, secs = timed(run)
+    report("playouts", "initial", plies, "plies", secs)
+    report("playouts", "initial", playouts, "games", secs)
+
+    # Same workload without the per-move pybind round trips, on one thread and on every core.
+    for n_threads, label in ((1, "random_playouts(1)"), (0, "random_playouts(all)")):
+        stats, secs = timed(lambda: engine.random_playouts(engine.initial_state(), playouts, seed, n_threads))
+        report(label, "initial", stats.total_plies, "plies", secs)
+        report(label, "initial", stats.playouts, "games", secs)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--perft-depth", type=int, default=4)
+    parser.add_argument("--iters", type=int, default=20000)
+    parser.add_argument("--playouts", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    engine = Engine()
+    positions = fixed_positions(engine)
+    bench_perft(engine, positions, args.perft_depth)
+    bench_legal_moves(engine, positions, args.iters)
+    bench_apply_move(engine, positions, args.iters)
+    bench_playouts(engine, args.playouts)
+    return 0
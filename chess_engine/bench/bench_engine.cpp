@@ -0,0 +1,216 @@
+/**
+ * @file bench_engine.cpp
+ * @brief Throughput benchmark for the C++ core: perft, legal_moves, apply_move and playouts.
+ *
+ * Usage: chess_engine_bench [--perft-depth N] [--iters N] [--playouts N]
+ *
+ * Every workload is deterministic (fixed positions, fixed-seed RNG), and each line also
+ * prints a node/move count, so runs can be compared across builds and across machines.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+#include "chess/playout.hpp"
+#include "chess/state.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+#include <utility>
+#include <vector>
+
+using namespace engine;
+
+namespace {
+
+struct Position {
+  const char *name;
+  State state;
+};
+
+/** @brief Play (from, to) pairs from the initial state; each must match a generated move. */
+template <std::size_t N> State play_line(const Engine &E, const std::pair<int, int> (&line)[N]) {
+  State s = E.initial_state();
+  for (const auto &[from, to] : line) {
+    bool found = false;
+    for (const Move &m : E.legal_moves(s)) {
+      if (m.from == from && m.to == to) {
+        E.apply_move(s, m);
+        found = true;
+        break;
+      }
+    }
+    if (!found) {
+      std::fprintf(stderr, "bench: move %d->%d is not legal in the fixed line\n", from, to);
+      std::exit(1);
+    }
+  }
+  return s;
+}
+
+// Fixed midgame lines as (from, to) squares, 16-24 plies deep.
+const std::pair<int, int> MIDGAME_A[] = {{32, 21}, {2, 13},  {21, 10}, {3, 10},  {27, 21}, {13, 24}, {28, 22}, {10, 16},
+                                         {30, 24}, {16, 10}, {25, 19}, {10, 17}, {21, 15}, {17, 23}, {24, 18}, {23, 16}};
+const std::pair<int, int> MIDGAME_B[] = {{25, 13}, {9, 21},  {28, 16}, {4, 14},  {26, 20}, {14, 24}, {16, 11},
+                                         {2, 13},  {33, 28}, {24, 14}, {30, 18}, {10, 22}, {27, 22}, {21, 27},
+                                         {32, 19}, {27, 33}, {28, 33}, {14, 9},  {33, 27}, {5, 4}};
+const std::pair<int, int> MIDGAME_C[] = {{26, 14}, {6, 12},  {31, 21}, {10, 16}, {14, 9},  {2, 6},  {32, 19}, {4, 9},
+                                         {29, 23}, {16, 23}, {19, 8},  {9, 16},  {21, 7},  {3, 2},  {7, 12},  {16, 31},
+                                         {27, 15}, {2, 7},   {12, 26}, {5, 3},   {28, 22}, {7, 14}, {8, 4},   {31, 24}};
+
+/** @brief The initial position plus the fixed midgame positions. */
+std::vector<Position> fixed_positions(const Engine &E) {
+  return {
+      {"initial", E.initial_state()},
+      {"midgame-a", play_line(E, MIDGAME_A)},
+      {"midgame-b", play_line(E, MIDGAME_B)},
+      {"midgame-c", play_line(E, MIDGAME_C)},
+  };
+}
+
+using Clock = std::chrono::steady_clock;
+
+double seconds_since(Clock::time_point t0) {
+  return std::chrono::duration<double>(Clock::now() - t0).count();
+}
+
+void report(const char *bench, const char *position, std::uint64_t count, const char *unit, double secs) {
+  std::printf("%-22s %-10s %12llu %-6s %8.3f s %14.0f %s/s\n", bench, position, static_cast<unsigned long long>(count), unit,
+              secs, secs > 0 ? static_cast<double>(count) / secs : 0.0, unit);
+}
+
+/** @brief xorshift64: fixed sequence on every platform, unlike std distributions. */
+std::uint64_t next_random(std::uint64_t &x) {
+  x ^= x << 13;
+  x ^= x >> 7;
+  x ^= x << 17;
+  return x;
+}
+
+void bench_perft(const Engine &E, const std::vector<Position> &positions, int depth) {
+  for (const Position &p : positions) {
+    const auto t0 = Clock::now();
+    const std::uint64_t nodes = E.perft(p.state, depth);
+    report(("perft(" + std::to_string(depth) + ")").c_str(), p.name, nodes, "nodes", seconds_since(t0));
+  }
+}
+
+void bench_legal_moves(const Engine &E, const std::vector<Position> &positions, int iters) {
+  for (const Position &p : positions) {
+    MoveList moves;
+    std::uint64_t total = 0;
+    auto t0 = Clock::now();
+    for (int i = 0; i < iters; ++i) {
+      E.legal_moves(p.state, moves);
+      total += moves.size();
+    }
+    report("legal_moves(MoveList)", p.name, total, "moves", seconds_since(t0));
+
+    total = 0;
+    t0 = Clock::now();
+    for (int i = 0; i < iters; ++i)
+      total += E.legal_moves(p.state).size();
+    report("legal_moves(vector)", p.name, total, "moves", seconds_since(t0));
+  }
+}
+
+void bench_apply_move(const Engine &E, const std::vector<Position> &positions, int iters) {
+  for (const Position &p : positions) {
+    const std::vector<Move> moves = E.legal_moves(p.state);
+    const int rounds = std::max(1, iters / static_cast<int>(std::max<std::size_t>(moves.size(), 1)));
+    std::uint64_t applied = 0, sink = 0;
+
+    auto t0 = Clock::now();
+    for (int r = 0; r < rounds; ++r) {
+      for (const Move &m : moves) {
+        State s = p.state;
+        sink += E.apply_move(s, m).done;
+        ++applied;
+      }
+    }
+    report("apply_move", p.name, applied, "moves", seconds_since(t0));
+
+    State s = p.state;
+    applied = 0;
+    t0 = Clock::now();
+    for (int r = 0; r < rounds; ++r) {
+      for (const Move &m : moves) {
+        const UndoRecord u = E.make_move(s, m);
+        sink += s.hash & 1;
+        E.unmake_move(s, u);
+        ++applied;
+      }
+    }
+    report("make+unmake_move", p.name, applied, "moves", seconds_since(t0));
+    if (sink == ~std::uint64_t{0})
+      std::puts(""); // keep the loops observable
+  }
+}
+
+void bench_playouts(const Engine &E, int playouts) {
+  std::uint64_t rng = 0x9E3779B97F4A7C15ULL, plies = 0, p0_wins = 0;
+  MoveList moves;
+  const auto t0 = Clock::now();
+  for (int g = 0; g < playouts; ++g) {
+    State s = E.initial_state();
+    for (;;) {
+      E.legal_moves(s, moves);
+      if (moves.empty())
+        break;
+      const StepResult r = E.apply_move_unchecked(s, moves[next_random(rng) % moves.size()]);
+      ++plies;
+      if (r.done) {
+        p0_wins += r.reward_p0 > 0;
+        break;
+      }
+    }
+  }
+  const double secs = seconds_since(t0);
+  report("playouts", "initial", plies, "plies", secs);
+  std::printf("%-22s %-10s %12d %-6s %8.3f s %14.0f games/s (P0 won %llu)\n", "playouts", "initial", playouts, "games", secs,
+              secs > 0 ? playouts / secs : 0.0, static_cast<unsigned long long>(p0_wins));
+}
+
+void bench_random_playouts(const Engine &E, int playouts) {
+  for (const int n_threads : {1, 0}) {
+    const auto t0 = Clock::now();
+    const PlayoutStats stats = E.random_playouts(E.initial_state(), playouts, /*seed=*/0, n_threads);
+    const double secs = seconds_since(t0);
+    const char *bench = n_threads == 1 ? "random_playouts(1)" : "random_playouts(all)";
+    report(bench, "initial", stats.total_plies, "plies", secs);
+    report(bench, "initial", stats.playouts, "games", secs);
+  }
+}
+
+int parse_int(int argc, char **argv, const char *flag, int fallback) {
+  for (int i = 1; i + 1 < argc; ++i) {
+    if (std::strcmp(argv[i], flag) == 0)
+      return std::atoi(argv[i + 1]);
+  }
+  return fallback;
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  const int perft_depth = parse_int(argc, argv, "--perft-depth", 4);
+  const int iters = parse_int(argc, argv, "--iters", 200000);
+  const int playouts = parse_int(argc, argv, "--playouts", 2000);
+
+  const Engine E;
+  const std::vector<Position> positions = fixed_positions(E);
+
+  bench_perft(E, positions, perft_depth);
+  bench_legal_moves(E, positions, iters);
+  bench_apply_move(E, positions, iters);
+  bench_playouts(E, playouts);
+  bench_random_playouts(E, playouts);
+  return 0;
+}
@@ -0,0 +1,89 @@
+#pragma once
+/**
+ * @file action.hpp
+ * @brief Canonical, fixed action encoding shared by the batch engine and the RL envs.
+ *
+ * An action id is the index of a (from, to) pair in a static table holding every pair
+ * some piece could ever move along on the 6x6 board: queen lines (which also cover
+ * pawns, kings, rooks and bishops) and knight jumps. Pairs are sorted by from, then to,
+ * so ids are identical in every process and build.
+ *
+ * The rest of a Move is implied by the board: promotions always produce a queen, and
+ * the move type follows from the mover and the target square. Special moves are not
+ * generated yet and have no ids.
+ */
+
+#include "chess/config.hpp"
+#include "chess/move.hpp"
+#include "chess/state.hpp"
+
+#include <array>
+#include <cstdint>
+
+namespace engine {
+namespace action {
+
+constexpr int NUM_SQUARES = BOARD_N * BOARD_N;
+
+/** @return True if a piece could ever move from `from` to `to` (queen line or knight jump). */
+constexpr bool is_geometric(int from, int to) {
+  if (from == to)
+    return false;
+  const int dr = to / BOARD_N - from / BOARD_N;
+  const int dc = to % BOARD_N - from % BOARD_N;
+  const int adr = dr < 0 ? -dr : dr;
+  const int adc = dc < 0 ? -dc : dc;
+  return dr == 0 || dc == 0 || adr == adc || (adr == 1 && adc == 2) || (adr == 2 && adc == 1);
+}
+
+constexpr int count_actions() {
+  int n = 0;
+  for (int from = 0; from < NUM_SQUARES; ++from) {
+    for (int to = 0; to < NUM_SQUARES; ++to)
+      n += is_geometric(from, to) ? 1 : 0;
+  }
+  return n;
+}
+
+/** @brief Size of the action space. */
+constexpr int NUM_ACTIONS = count_actions();
+
+struct Table {
+  std::array<Square, NUM_ACTIONS> from{};                              ///< [action]
+  std::array<Square, NUM_ACTIONS> to{};                                ///< [action]
+  std::array<std::array<std::int16_t, NUM_SQUARES>, NUM_SQUARES> id{}; ///< [from][to], -1 if none.
+};
+
+constexpr Table make_table() {
+  Table t;
+  int n = 0;
+  for (int from = 0; from < NUM_SQUARES; ++from) {
+    for (int to = 0; to < NUM_SQUARES; ++to) {
+      t.id[from][to] = -1;
+      if (!is_geometric(from, to))
+        continue;
+      t.from[n] = static_cast<Square>(from);
+      t.to[n] = static_cast<Square>(to);
+      t.id[from][to] = static_cast<std::int16_t>(n++);
+    }
+  }
+  return t;
+}
+
+inline constexpr Table TABLE = make_table();
+
+/** @return Action id of `m`, or -1 if it has none (special moves, out-of-range squares). */
+constexpr int encode(const Move &m) {
+  if (m.special_code != 0 || m.from >= NUM_SQUARES || m.to >= NUM_SQUARES)
+    return -1;
+  return TABLE.id[m.from][m.to];
+}
+
+/**
+ * @brief Rebuild the generator's Move for `action` in `s` (type and promotion filled in).
+ * The result is only meaningful if the action is legal in `s`.
+ */
+Move decode(const State &s, int action);
+
+} // namespace action
+} // namespace engine
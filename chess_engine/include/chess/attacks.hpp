@@ -0,0 +1,33 @@
+#pragma once
+/**
+ * @file attacks.hpp
+ * @brief Attack maps and king-safety queries on top of the bitboard tables.
+ *
+ * Everything is computed in one pass from a Bitboards snapshot: attackers_to is a reverse
+ * lookup from one square (a handful of table probes plus eight rays), and attack_map ORs
+ * every piece's attack set. A square counts as attacked even if it holds a piece of the
+ * attacker's own side, so a king can never take a defended piece.
+ */
+
+#include "chess/bitboard.hpp"
+#include "chess/config.hpp"
+#include "chess/move_list.hpp"
+#include "chess/state.hpp"
+
+namespace engine {
+
+/** @return Pieces of player `by` that attack `sq`, with sliders blocked by `occupied`. */
+Bitboard attackers_to(const Bitboards &bbs, int sq, Player by, Bitboard occupied);
+
+/** @return Every square attacked by player `by`, with sliders blocked by `occupied`. */
+Bitboard attack_map(const Bitboards &bbs, Player by, Bitboard occupied);
+
+/**
+ * @brief Drop the moves in `moves` (generated for s.to_move) that leave the mover's own king
+ * attacked, keeping generation order. Moves of unpinned pieces out of check are accepted
+ * without simulation; only king moves, pinned pieces and check evasions are examined.
+ * Does nothing if the mover has no king on the board.
+ */
+void remove_self_checks(const State &s, MoveList &moves);
+
+} // namespace engine
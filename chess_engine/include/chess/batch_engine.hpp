@@ -0,0 +1,126 @@
+#pragma once
+/**
+ * @file batch_engine.hpp
+ * @brief N independent games stepped together over flat, NumPy-friendly buffers.
+ */
+
+#include "chess/action.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace engine {
+
+/**
+ * @brief Vector of games in struct-of-arrays form.
+ *
+ * Game i lives in row i of every buffer: boards (N x 36), to_move, ply, the legal-action
+ * mask (N x action::NUM_ACTIONS) and the last step's reward/done flags. Finished games are
+ * reset to the initial position within the same step, so after step() the boards and
+ * masks always describe games in progress while rewards/dones describe the move just made;
+ * final_state() keeps each finished game's last position. A game whose side to move has no
+ * legal move is finished as a draw, like in playouts, MCTS and Opponent, so every published
+ * mask has at least one legal action.
+ *
+ * A BatchEngine is not synchronised: give each thread its own.
+ */
+class BatchEngine {
+public:
+  /**
+   * @param seed Seeds random_actions(); games themselves are deterministic.
+   * @param config Rules shared by every game (e.g. the ply limit).
+   */
+  explicit BatchEngine(std::size_t num_envs, std::uint64_t seed = 0, EngineConfig config = {});
+
+  std::size_t num_envs() const {
+    return num_envs_;
+  }
+
+  /** @brief Put every game back to the initial position and clear rewards/dones. */
+  void reset();
+
+  /**
+   * @brief Apply actions[i] to game i for every game, auto-resetting finished games.
+   * @param actions num_envs() action ids (see action.hpp).
+   * @throws std::invalid_argument if any action is not legal in its game; no game is changed.
+   */
+  void step(const std::int64_t *actions);
+
+  /**
+   * @brief Draw one uniformly random legal action per game (the RandomPolicy of the UI).
+   * @return num_envs() action ids, valid until the next call.
+   */
+  const std::int64_t *random_actions();
+
+  /** @return Game i, valid until the next reset/step/set_state. */
+  const State &get_state(std::size_t i) const {
+    return states_[i];
+  }
+
+  /** @return Game i as the last step ended it; only meaningful where dones()[i] is set. */
+  const State &final_state(std::size_t i) const {
+    return finals_[i];
+  }
+
+  /**
+   * @brief Overwrite game i (derived fields and the mask are recomputed).
+   *
+   * A finished position, or one without legal moves (a draw), ends game i at once as if a step
+   * had reached it: dones()[i] and rewards()[i] are set, final_state(i) holds it and game i
+   * restarts.
+   */
+  void set_state(std::size_t i, const State &s);
+
+  // Raw buffers, row-major, one row per game.
+  const piece::Code *boards() const {
+    return boards_.data();
+  }
+  const Player *to_move() const {
+    return to_move_.data();
+  }
+  const std::uint32_t *ply() const {
+    return ply_.data();
+  }
+  const std::int8_t *action_masks() const {
+    return masks_.data();
+  }
+  /** @brief Player-0 reward of the last step. */
+  const float *rewards() const {
+    return rewards_.data();
+  }
+  /** @brief 1 where the last step ended the game. */
+  const std::uint8_t *dones() const {
+    return dones_.data();
+  }
+
+private:
+  /**
+   * @brief Mirror states_[i] into the row buffers and recompute its mask.
+   * @return Whether the side to move has a legal action.
+   */
+  bool publish(std::size_t i);
+  /** @brief Mark game i done, keep its position in finals_ and restart it. */
+  void finish(std::size_t i);
+
+  Engine engine_;
+  State initial_;
+  std::size_t num_envs_;
+  std::vector<State> states_; ///< Source of truth; the buffers below mirror it.
+  std::vector<State> finals_; ///< Last position of each game the last step finished.
+
+  std::vector<piece::Code> boards_;
+  std::vector<Player> to_move_;
+  std::vector<std::uint32_t> ply_;
+  std::vector<std::int8_t> masks_;
+  std::vector<float> rewards_;
+  std::vector<std::uint8_t> dones_;
+  std::vector<std::int64_t> actions_;
+  std::uint64_t rng_;
+};
+
+} // namespace engine
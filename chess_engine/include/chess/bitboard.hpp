@@ -0,0 +1,142 @@
+#pragma once
+/**
+ * @file bitboard.hpp
+ * @brief 36-bit bitboards, precomputed attack tables and per-state occupancy masks.
+ *
+ * Square `sq` maps to bit `sq` of a std::uint64_t (bits 36..63 are always zero).
+ */
+
+#include "chess/config.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <array>
+#include <cstdint>
+
+#if defined(_MSC_VER)
+#include <intrin.h>
+#endif
+
+namespace engine {
+
+using Bitboard = std::uint64_t;
+
+constexpr int NUM_SQUARES = BOARD_N * BOARD_N;                         ///< 36 squares.
+constexpr Bitboard BOARD_MASK = (Bitboard{1} << NUM_SQUARES) - 1;      ///< All on-board bits.
+constexpr int NUM_UNIT_TYPES = static_cast<int>(piece::KIND_MASK) + 1; ///< Kind slots (0 = EMPTY).
+
+namespace bb {
+
+constexpr Bitboard square(int sq) {
+  return Bitboard{1} << sq;
+}
+
+/** @return Index of the least significant set bit (b must be non-zero). */
+inline int lsb(Bitboard b) {
+#if defined(_MSC_VER)
+  unsigned long idx;
+  _BitScanForward64(&idx, b);
+  return static_cast<int>(idx);
+#else
+  return __builtin_ctzll(b);
+#endif
+}
+
+/** @return Index of the most significant set bit (b must be non-zero). */
+inline int msb(Bitboard b) {
+#if defined(_MSC_VER)
+  unsigned long idx;
+  _BitScanReverse64(&idx, b);
+  return static_cast<int>(idx);
+#else
+  return 63 - __builtin_clzll(b);
+#endif
+}
+
+/** @brief Remove and return the least significant set bit. */
+inline int pop_lsb(Bitboard &b) {
+  const int sq = lsb(b);
+  b &= b - 1;
+  return sq;
+}
+
+/** @brief Remove and return the most significant set bit. */
+inline int pop_msb(Bitboard &b) {
+  const int sq = msb(b);
+  b ^= square(sq);
+  return sq;
+}
+
+inline int popcount(Bitboard b) {
+#if defined(_MSC_VER)
+  return static_cast<int>(__popcnt64(b));
+#else
+  return __builtin_popcountll(b);
+#endif
+}
+
+} // namespace bb
+
+/**
+ * @brief Ray directions, ordered like the King/Queen direction tables.
+ * "Positive" directions (E, SW, S, SE) walk towards higher square indices.
+ */
+enum Direction : int { NW = 0, N, NE, W, E, SW, S, SE, NUM_DIRECTIONS };
+
+constexpr std::array<Vec2, NUM_DIRECTIONS> DIRECTION_VECTORS = {
+    {{-1, -1}, {-1, 0}, {-1, 1}, {0, -1}, {0, 1}, {1, -1}, {1, 0}, {1, 1}}};
+
+constexpr bool is_positive(Direction d) {
+  return d >= E;
+}
+
+/** @brief Attack/step tables, built once on first use. */
+struct AttackTables {
+  std::array<Bitboard, NUM_SQUARES> knight{};
+  std::array<Bitboard, NUM_SQUARES> king{};
+  std::array<std::array<Bitboard, NUM_SQUARES>, 2> pawn_attacks{};      ///< [player][sq] diagonal captures.
+  std::array<std::array<Bitboard, NUM_SQUARES>, 2> pawn_push{};         ///< [player][sq] single step (0 if off-board).
+  std::array<std::array<Bitboard, NUM_SQUARES>, NUM_DIRECTIONS> rays{}; ///< [dir][sq], excludes sq.
+};
+
+/** @return Process-wide attack tables (thread-safe lazy init). */
+const AttackTables &attack_tables();
+
+/**
+ * @brief Sliding attacks from `sq` along one direction, stopping at (and including) the first blocker.
+ */
+inline Bitboard ray_attacks(const AttackTables &t, Direction d, int sq, Bitboard occupied) {
+  Bitboard attacks = t.rays[d][sq];
+  const Bitboard blockers = attacks & occupied;
+  if (blockers) {
+    const int first = is_positive(d) ? bb::lsb(blockers) : bb::msb(blockers);
+    attacks &= ~t.rays[d][first];
+  }
+  return attacks;
+}
+
+/** @brief Occupancy masks for one position, per side and per (side, kind). */
+struct Bitboards {
+  std::array<Bitboard, 2> side{};                             ///< [player] occupancy.
+  std::array<std::array<Bitboard, NUM_UNIT_TYPES>, 2> kind{}; ///< [player][UnitType] occupancy.
+
+  Bitboard occupied() const {
+    return side[0] | side[1];
+  }
+
+  /** @brief Build masks with a single, branch-free pass over the board. */
+  static Bitboards from_state(const State &s) {
+    Bitboards out;
+    for (int sq = 0; sq < NUM_SQUARES; ++sq) {
+      const piece::Code pc = s.board[sq];
+      const int owner = (pc & piece::SIDE_MASK) ? 1 : 0;
+      // Empty squares only ever touch kind[owner][EMPTY], which nothing reads.
+      const Bitboard bit = bb::square(sq);
+      out.kind[owner][piece::unit_type(pc)] |= bit;
+      out.side[owner] |= piece::is_empty(pc) ? 0 : bit;
+    }
+    return out;
+  }
+};
+
+} // namespace engine
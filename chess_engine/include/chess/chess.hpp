@@ -5,8 +5,24 @@
  * @brief Umbrella header that imports all major engine types.
  */
 
+#include "chess/action.hpp"
+#include "chess/attacks.hpp"
+#include "chess/batch_engine.hpp"
+#include "chess/bitboard.hpp"
 #include "chess/config.hpp"
 #include "chess/engine.hpp"
+#include "chess/mcts.hpp"
 #include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/movegen.hpp"
+#include "chess/opponent.hpp"
 #include "chess/piece.hpp"
+#include "chess/planes.hpp"
+#include "chess/playout.hpp"
+#include "chess/search.hpp"
+#include "chess/serialize.hpp"
 #include "chess/state.hpp"
+#include "chess/stats.hpp"
+#include "chess/symmetry.hpp"
+#include "chess/tablebase.hpp"
+#include "chess/zobrist.hpp"
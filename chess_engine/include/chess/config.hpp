@@ -5,16 +5,38 @@
  */
 
 #include <cstdint>
+#include <memory>
 
 namespace engine {
 
 // Board configuration
 constexpr int BOARD_N = 6; ///< Board dimension (6x6).
 
+// Game rules
+constexpr std::uint32_t MAX_GAME_PLY = 200; ///< Default EngineConfig::max_ply.
+
 // Small POD primitives
 using Square = std::uint8_t; ///< Encodes a 0..(BOARD_N*BOARD_N-1) square index.
 using Player = std::uint8_t; ///< 0 (P1) or 1 (P2).
 
+class Tablebase;
+
+/** @brief Per-engine rule settings. */
+struct EngineConfig {
+  std::uint32_t max_ply = MAX_GAME_PLY; ///< Games are drawn once this many half-moves were played.
+  /**
+   * Drop moves that leave the mover's king attacked. Kings are then never captured: a side
+   * without legal moves is checkmated if in check and stalemated (draw) otherwise.
+   */
+  bool strict_legality = false;
+  /**
+   * Adjudicates the positions it covers: outcome() reports their exact result under the ply
+   * limit, so games, playouts and searches end there (see tablebase.hpp). Must be solved
+   * under the same strict_legality.
+   */
+  std::shared_ptr<const Tablebase> tablebase = nullptr;
+};
+
 /** @brief 2D vector for grid math (rows, cols). */
 struct Vec2 {
   int row;
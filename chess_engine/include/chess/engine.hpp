@@ -4,31 +4,74 @@
  * @brief Stateless rule engine operating on engine::State.
  */
 
+#include "chess/mcts.hpp"
 #include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/playout.hpp"
+#include "chess/search.hpp"
 #include "chess/state.hpp"
+#include "chess/stats.hpp"
+#include "chess/tablebase.hpp"
 
+#include <cstdint>
+#include <optional>
+#include <utility>
 #include <vector>
 
 namespace engine {
 
+/**
+ * @brief Result of a game as seen from a State. With EngineConfig::tablebase, positions it
+ * covers are decided early by their exact result.
+ */
+enum class Outcome : std::uint8_t {
+  Ongoing = 0,
+  Player0Wins = 1, ///< Player 1's (P2's) king was captured, or player 1 is checkmated (strict legality).
+  Player1Wins = 2, ///< Player 0's (P1's) king was captured, or player 0 is checkmated (strict legality).
+  /// The ply limit was reached, stalemate (strict legality), or a tablebase position that is a draw
+  /// or a win too long to finish before max_ply.
+  Draw = 3,
+};
+
 /**
  * @brief Engine exposes rule queries (legal moves) and state transitions.
  * The engine is intentionally stateless; State is passed in/out explicitly.
+ *
+ * Thread safety: an Engine holds no mutable data (the attack tables and unit instances it
+ * reads are immutable after static initialisation), so one instance can be shared by any
+ * number of threads. Each State must only be used by one thread at a time.
  */
 class Engine {
 public:
-  Engine() = default;
+  /** @throws std::invalid_argument if config.tablebase was solved under other rules. */
+  explicit Engine(EngineConfig config = {});
+
+  const EngineConfig &config() const {
+    return config_;
+  }
+  /** @brief Games are drawn once this many half-moves were played. */
+  std::uint32_t max_ply() const {
+    return config_.max_ply;
+  }
 
   /** @return A fresh initial position. */
   State initial_state() const;
 
   /**
-   * @brief Compute pseudo-legal moves (captures overwrite; no check rules yet).
+   * @brief Compute the moves of the side to move (captures overwrite). Pseudo-legal by default;
+   * with EngineConfig::strict_legality, moves leaving the mover's king attacked are removed.
    * @param s Current state.
    * @return Vector of legal Move.
    */
   std::vector<Move> legal_moves(const State &s) const;
 
+  /**
+   * @brief Allocation-free variant of legal_moves.
+   * @param s Current state.
+   * @param out Caller-provided buffer; its previous contents are replaced.
+   */
+  void legal_moves(const State &s, MoveList &out) const;
+
   /**
    * @brief Apply a move to the state in-place.
    * @param s Mutable state.
@@ -37,12 +80,114 @@ public:
    */
   StepResult apply_move(State &s, const Move &m) const;
 
+  /**
+   * @brief apply_move without the legality check, for moves taken from legal_moves.
+   * @param s Mutable state.
+   * @param m Move produced by the generator for this exact state.
+   * @return StepResult containing termination and reward-from-P0.
+   */
+  StepResult apply_move_unchecked(State &s, const Move &m) const;
+
+  /**
+   * @brief Apply a trusted move in-place with no legality or terminal checks.
+   * @return Undo record to pass to unmake_move.
+   */
+  UndoRecord make_move(State &s, const Move &m) const;
+
+  /** @brief Revert the make_move that returned `u` (must be the most recent one on `s`). */
+  void unmake_move(State &s, const UndoRecord &u) const;
+
+  /**
+   * @brief Game result of `s` (needs current derived fields). O(1) from the king squares and
+   * ply; with strict_legality it also generates moves to spot checkmate and stalemate. With a
+   * tablebase, a covered position is decided by its exact result: a win that takes more plies
+   * than the limit leaves is a draw.
+   */
+  Outcome outcome(const State &s) const;
+
+  /** @brief outcome() for callers that already hold `legal` = legal_moves(s); never generates. */
+  Outcome outcome(const State &s, const MoveList &legal) const;
+
+  /** @return The tablebase entry of `s`, or nullopt without a tablebase or if `s` is not covered. */
+  std::optional<TablebaseEntry> probe_tablebase(const State &s) const;
+
+  /** @return True if the game in `s` is over (see outcome()). */
+  bool is_terminal(const State &s) const {
+    return outcome(s) != Outcome::Ongoing;
+  }
+
+  /** @return Bitboard (bit = square) of every square attacked by player `by`. */
+  std::uint64_t attack_map(const State &s, Player by) const;
+
+  /** @return True if a piece of player `by` attacks `sq`. */
+  bool is_square_attacked(const State &s, Square sq, Player by) const;
+
+  /** @return True if `side`'s king is attacked; false if it has no king. */
+  bool in_check(const State &s, Player side) const;
+
   /** @brief Check if a move is legal under current rules. */
   bool is_legal(const State &s, const Move &m) const;
 
+  /**
+   * @brief Write the legal-action mask of `s` under the canonical encoding (see action.hpp).
+   * @param out action::NUM_ACTIONS bytes; set to 1 for legal actions and 0 elsewhere.
+   */
+  void legal_action_mask(const State &s, std::int8_t *out) const;
+
+  /**
+   * @brief Negamax alpha-beta search with iterative deepening, a transposition table and
+   * move ordering (TT move, captures, promotions, killers, history).
+   * @param s Root state (not modified).
+   * @param max_depth Deepest iteration, clamped to [1, MAX_SEARCH_DEPTH].
+   * @param time_limit_ms Wall-clock budget in milliseconds; 0 = none. Depth 1 always completes.
+   * @return Best move, score, principal variation and node count.
+   */
+  SearchResult search(const State &s, int max_depth, int time_limit_ms = 0) const;
+
+  /**
+   * @brief Count leaf nodes of the move tree `depth` plies below `s` (make/unmake, no copies).
+   * Positions where the game has ended (a king was captured or the ply cap reached) are
+   * leaves and are not expanded further.
+   * @return Number of move sequences of length `depth`; 1 for depth <= 0.
+   */
+  std::uint64_t perft(const State &s, int depth) const;
+
+  /** @brief perft broken down by root move, in generation order; the counts sum to perft(s, depth). */
+  std::vector<std::pair<Move, std::uint64_t>> perft_divide(const State &s, int depth) const;
+
+  /**
+   * @brief Play uniform-random games from `s` to completion (the UI's RandomPolicy, natively).
+   * Game i uses a random stream derived from (seed, i), so results do not depend on n_threads.
+   * @param n_threads Worker threads; <= 0 uses std::thread::hardware_concurrency().
+   * @return Win/draw/loss counts for the side to move in `s` and the total game length.
+   */
+  PlayoutStats random_playouts(const State &s, std::uint64_t n_playouts, std::uint64_t seed = 0, int n_threads = 0) const;
+
+  /**
+   * @brief AlphaZero-style MCTS from `s` (see mcts.hpp): PUCT selection, virtual loss, and
+   * leaves evaluated in batches by `evaluate`, possibly from config.num_threads threads.
+   * @throws std::invalid_argument for a non-finite or negative c_puct or virtual_loss, a
+   * dirichlet_epsilon outside [0, 1], or dirichlet_alpha <= 0 while noise is on.
+   * @throws Whatever `evaluate` throws; the search stops at the first failure.
+   * @return Root visit counts per action id, the most visited action and the root value.
+   */
+  MctsResult mcts(const State &s, const LeafEvaluator &evaluate, const MctsConfig &config = {}) const;
+
+  /**
+   * @brief Process-wide hot-path counters (see stats.hpp); all zero, with enabled = false,
+   * unless the library was compiled with CHESS_ENGINE_STATS.
+   */
+  static EngineStats stats();
+
+  /** @brief Zero the counters returned by stats(). */
+  static void reset_stats();
+
   /** @brief get legal moves of specific unit in from */
   std::vector<Move> legal_moves_from(const State &s, Square from) const;
 
+  /** @brief Allocation-free variant of legal_moves_from; replaces the contents of `out`. */
+  void legal_moves_from(const State &s, Square from, MoveList &out) const;
+
   // Optional helper: grouped by source square
   std::array<std::vector<Move>, BOARD_N * BOARD_N> group_legal_moves_by_from(const State &s) const;
 
@@ -78,6 +223,9 @@ public:
   static inline int col(int idx) {
     return idx % BOARD_N;
   }
+
+private:
+  EngineConfig config_;
 };
 
 } // namespace engine
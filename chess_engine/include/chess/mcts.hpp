@@ -0,0 +1,65 @@
+#pragma once
+/**
+ * @file mcts.hpp
+ * @brief AlphaZero-style Monte-Carlo tree search with batched leaf evaluation.
+ *
+ * Selection uses PUCT over the canonical action encoding (see action.hpp). Leaves are not
+ * evaluated one at a time: each worker collects up to batch_size of them, applying a
+ * virtual loss along every selected path so the next selection explores elsewhere, and
+ * hands the whole batch to a LeafEvaluator (typically a neural network). Tree updates are
+ * serialised by one mutex; evaluations run outside it, so with several workers the tree
+ * keeps growing while a batch is being evaluated.
+ */
+
+#include "chess/action.hpp"
+#include "chess/config.hpp"
+#include "chess/piece.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <vector>
+
+namespace engine {
+
+/** @brief Search parameters for Engine::mcts. */
+struct MctsConfig {
+  std::uint32_t num_simulations = 800; ///< Leaf evaluations plus terminal visits, root excluded.
+  std::uint32_t batch_size = 16;       ///< Maximum leaves per evaluator call.
+  std::uint32_t num_threads = 1;       ///< Tree workers; each owns one batch at a time.
+  float c_puct = 1.5f;                 ///< Exploration constant of the PUCT formula.
+  float virtual_loss = 1.0f;           ///< Value subtracted per in-flight visit while a leaf awaits evaluation.
+  float dirichlet_alpha = 0.3f;        ///< Root noise concentration.
+  float dirichlet_epsilon = 0.0f;      ///< Root noise weight; 0 disables noise (evaluation play).
+  std::uint64_t seed = 0;              ///< Seeds the root noise.
+};
+
+/**
+ * @brief Leaf positions handed to a LeafEvaluator, in the RL envs' observation format.
+ * Every array has one row per leaf; the pointers are valid only during the call.
+ */
+struct LeafBatch {
+  std::size_t size = 0;
+  const piece::Code *boards = nullptr;       ///< size x BOARD_N*BOARD_N piece codes.
+  const Player *to_move = nullptr;           ///< size side-to-move flags.
+  const std::int8_t *action_masks = nullptr; ///< size x action::NUM_ACTIONS legal-action masks.
+};
+
+/**
+ * @brief Fills `priors` (size x action::NUM_ACTIONS) and `values` (size) for a batch.
+ * Values are from the view of the side to move in each leaf, in [-1, 1]. Priors need not be
+ * normalised and are only read at legal actions. With num_threads > 1 the evaluator may be
+ * called from several threads at once.
+ */
+using LeafEvaluator = std::function<void(const LeafBatch &batch, float *priors, float *values)>;
+
+/** @brief Result of Engine::mcts. */
+struct MctsResult {
+  std::vector<std::uint32_t> visits; ///< [action] visit count of each root child (NUM_ACTIONS entries).
+  int best_action = -1;              ///< Most visited root action; -1 if the root is terminal.
+  float root_value = 0.0f;           ///< Mean backed-up value for the side to move at the root.
+  std::uint32_t simulations = 0;     ///< Simulations completed (root evaluation excluded).
+  std::uint32_t evaluator_calls = 0; ///< Number of LeafEvaluator invocations, root included.
+};
+
+} // namespace engine
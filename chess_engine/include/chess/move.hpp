@@ -31,6 +31,14 @@ struct Move {
   std::uint16_t special_code = 0; ///< Optional payload for “Special” moves.
 };
 
+/** @brief What Engine::unmake_move needs to restore the state before Engine::make_move. */
+struct UndoRecord {
+  Move move;                ///< The move that was made.
+  piece::Code moved = 0;    ///< Code that stood on move.from.
+  piece::Code captured = 0; ///< Code that stood on move.to (EMPTY if none).
+  std::uint64_t hash = 0;   ///< State::hash before the move.
+};
+
 /** @brief Step result after applying a move. */
 struct StepResult {
   State state;
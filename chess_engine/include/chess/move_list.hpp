@@ -0,0 +1,85 @@
+#pragma once
+/**
+ * @file move_list.hpp
+ * @brief Fixed-capacity, stack-allocated move buffer.
+ */
+
+#include "chess/move.hpp"
+
+#include <array>
+#include <cassert>
+#include <cstddef>
+#include <cstdlib>
+#include <new>
+
+namespace engine {
+
+/**
+ * @brief Capacity of a MoveList.
+ * Game positions stay far below it; even dense random all-queen boards peak under 150 moves.
+ */
+constexpr std::size_t MAX_MOVES = 256;
+
+/** @brief Inline array of moves plus a count; never touches the heap. */
+class MoveList {
+public:
+  using value_type = Move;
+  using iterator = Move *;
+  using const_iterator = const Move *;
+
+  // Leave the slots uninitialised: Move has default member initialisers, and zeroing
+  // 256 of them on every construction would cost more than generating the moves.
+  MoveList() {}
+
+  /** @brief Append `m`; overflowing MAX_MOVES aborts (in every build) rather than write past the array. */
+  void push_back(const Move &m) {
+    if (size_ >= MAX_MOVES)
+      std::abort();
+    new (&moves_[size_++]) Move(m);
+  }
+
+  void clear() {
+    size_ = 0;
+  }
+
+  /** @brief Keep only the first `n` moves (n <= size()), e.g. after std::remove_if. */
+  void truncate(std::size_t n) {
+    assert(n <= size_);
+    size_ = n;
+  }
+
+  std::size_t size() const {
+    return size_;
+  }
+  bool empty() const {
+    return size_ == 0;
+  }
+
+  Move &operator[](std::size_t i) {
+    return moves_[i];
+  }
+  const Move &operator[](std::size_t i) const {
+    return moves_[i];
+  }
+
+  iterator begin() {
+    return moves_.data();
+  }
+  iterator end() {
+    return moves_.data() + size_;
+  }
+  const_iterator begin() const {
+    return moves_.data();
+  }
+  const_iterator end() const {
+    return moves_.data() + size_;
+  }
+
+private:
+  union {
+    std::array<Move, MAX_MOVES> moves_;
+  };
+  std::size_t size_ = 0;
+};
+
+} // namespace engine
@@ -0,0 +1,24 @@
+#pragma once
+/**
+ * @file movegen.hpp
+ * @brief Bitboard move generator.
+ *
+ * Produces exactly the same moves, in the same order, as the `Unit` subclasses:
+ * squares are visited in ascending order and each piece emits its targets in its
+ * unit's direction order, nearest square first.
+ */
+
+#include "chess/config.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/state.hpp"
+
+namespace engine {
+
+/** @brief Append pseudo-legal moves for the side to move. */
+void generate_moves(const State &s, MoveList &out);
+
+/** @brief Append pseudo-legal moves of the piece on `from` (nothing if it is not the mover's). */
+void generate_moves_from(const State &s, Square from, MoveList &out);
+
+} // namespace engine
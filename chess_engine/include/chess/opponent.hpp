@@ -0,0 +1,88 @@
+#pragma once
+/**
+ * @file opponent.hpp
+ * @brief Built-in opponents that answer an agent's move inside the engine.
+ *
+ * Single-agent training plays one side against a fixed policy. Opponent::play applies the
+ * agent's move and, unless that ended the game, the opponent's reply, so one call advances
+ * the game by a full agent transition without returning to Python in between.
+ */
+
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/state.hpp"
+
+#include <cstdint>
+#include <optional>
+#include <string_view>
+
+namespace engine {
+
+/** @brief Policy of an Opponent. */
+enum class OpponentKind : std::uint8_t {
+  Random = 0, ///< Uniformly random legal move (the UI's RandomPolicy).
+  Greedy = 1, ///< Captures the most valuable piece it can, the king first; otherwise a random move.
+  Search = 2, ///< Engine::search to search_depth (the UI's SearchPolicy); random if it finds no move.
+};
+
+/** @return The OpponentKind named "random", "greedy" or "search". @throws std::invalid_argument otherwise. */
+OpponentKind parse_opponent_kind(std::string_view name);
+
+/** @return Lower-case name of `kind` (inverse of parse_opponent_kind). */
+const char *opponent_kind_name(OpponentKind kind);
+
+/** @brief Opponent parameters. */
+struct OpponentConfig {
+  OpponentKind kind = OpponentKind::Random;
+  int search_depth = 2;   ///< Search: deepest iteration.
+  int time_limit_ms = 0;  ///< Search: wall-clock budget per move; 0 = none.
+  std::uint64_t seed = 0; ///< Seeds random moves and tie-breaks.
+};
+
+/** @brief Result of Opponent::play. */
+struct VersusStep {
+  bool done = false;    ///< True if the agent's move or the reply ended the game.
+  int reward_p0 = 0;    ///< Result from player 0's view once done ({-1, 0, 1}), else 0.
+  bool replied = false; ///< True if the opponent moved.
+  Move reply{};         ///< The opponent's move (valid if replied).
+};
+
+/**
+ * @brief A fixed policy for the side to move. Deterministic given its seed; not synchronised,
+ * so give each thread its own.
+ */
+class Opponent {
+public:
+  explicit Opponent(OpponentConfig config = {});
+
+  const OpponentConfig &config() const {
+    return config_;
+  }
+
+  /** @brief Restart the random stream. */
+  void seed(std::uint64_t seed);
+
+  /** @return The opponent's move for the side to move in `s`, or nullopt if it has none. */
+  std::optional<Move> select(const Engine &engine, const State &s);
+
+  /**
+   * @brief Apply the agent's move to `s` and, unless the game ended, the opponent's reply.
+   * A side left without legal moves in an ongoing game ends it as a draw (as in
+   * Engine::random_playouts).
+   * @param mask If not null, receives the legal-action mask (action::NUM_ACTIONS bytes) of the
+   *             position the agent faces next; all zero once done.
+   * @throws std::invalid_argument if agent_move is illegal in `s`, which is then unchanged.
+   */
+  VersusStep play(const Engine &engine, State &s, const Move &agent_move, std::int8_t *mask = nullptr);
+
+private:
+  /** @brief Policy choice among `moves_`, the non-empty legal moves of `s`. */
+  Move choose(const Engine &engine, const State &s);
+
+  OpponentConfig config_;
+  std::uint64_t rng_;
+  MoveList moves_;
+};
+
+} // namespace engine
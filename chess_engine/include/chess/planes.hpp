@@ -0,0 +1,67 @@
+#pragma once
+/**
+ * @file planes.hpp
+ * @brief Multi-plane tensor encoding of positions for neural-network inputs.
+ *
+ * A position becomes NUM_PLANES planes of BOARD_N x BOARD_N values (channel-major, the
+ * (C, H, W) layout of convolutional models), decoded from the packed piece codes:
+ *
+ *   planes 0-5   player 0's pawns, knights, bishops, rooks, queens, kings (1 where present)
+ *   planes 6-11  the same for player 1
+ *   plane 12     has-moved bit of every piece
+ *   plane 13     power level of every piece
+ *   plane 14     side to move (constant plane)
+ *   plane 15     ply / max_ply, clamped to 1 (constant plane)
+ *
+ * The board keeps its absolute orientation (row 0 is player 1's back rank). Encoders are
+ * provided for float and std::uint8_t outputs: with float, power levels are scaled by 1/7
+ * so every plane lies in [0, 1]; with std::uint8_t, power holds the raw level 0-7 and the ply
+ * plane is scaled to 0-255. Outputs are fully overwritten, so buffers can be reused.
+ */
+
+#include "chess/config.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <cstddef>
+#include <cstdint>
+
+namespace engine {
+namespace planes {
+
+constexpr int PIECE = 0;    ///< First piece plane: PIECE + 6 * side + (kind - PAWN).
+constexpr int MOVED = 12;   ///< Has-moved bits.
+constexpr int POWER = 13;   ///< Power levels.
+constexpr int TO_MOVE = 14; ///< 1 everywhere when player 1 is to move.
+constexpr int PLY = 15;     ///< Game progress.
+constexpr int NUM_PLANES = 16;
+
+constexpr std::size_t PLANE_SIZE = static_cast<std::size_t>(BOARD_N) * BOARD_N;
+constexpr std::size_t ENCODED_SIZE = NUM_PLANES * PLANE_SIZE; ///< Values written per position.
+
+/** @return Plane of the piece planes holding `pc` (which must not be empty or an invalid kind). */
+constexpr int piece_plane(piece::Code pc) {
+  return PIECE + 6 * ((pc & piece::SIDE_MASK) ? 1 : 0) + (piece::unit_type(pc) - piece::PAWN);
+}
+
+/**
+ * @brief Encode one board into `out` (ENCODED_SIZE values).
+ * @param max_ply Denominator of the ply plane (EngineConfig::max_ply); 0 leaves it at 0.
+ */
+template <typename T> void encode(const piece::Code *board, Player to_move, std::uint32_t ply, std::uint32_t max_ply, T *out);
+
+/** @brief encode() of a State. */
+template <typename T> void encode(const State &s, std::uint32_t max_ply, T *out) {
+  encode(s.board.data(), s.to_move, s.ply, max_ply, out);
+}
+
+/**
+ * @brief Encode n boards (BOARD_N*BOARD_N codes each) into n consecutive ENCODED_SIZE blocks.
+ * @param ply Ply of each row, or nullptr to leave the ply planes at 0.
+ */
+template <typename T>
+void encode_batch(const piece::Code *boards, const Player *to_move, const std::uint32_t *ply, std::size_t n,
+                  std::uint32_t max_ply, T *out);
+
+} // namespace planes
+} // namespace engine
@@ -0,0 +1,32 @@
+#pragma once
+/**
+ * @file playout.hpp
+ * @brief Result of Engine::random_playouts (Monte-Carlo evaluation of a position).
+ */
+
+#include <cstdint>
+
+namespace engine {
+
+/**
+ * @brief Aggregate over uniform-random games played to completion from one position.
+ * Wins and losses are from the view of the side to move in that position; a side left
+ * without legal moves ends its game as a draw.
+ */
+struct PlayoutStats {
+  std::uint64_t playouts = 0;
+  std::uint64_t wins = 0;
+  std::uint64_t draws = 0;
+  std::uint64_t losses = 0;
+  std::uint64_t total_plies = 0; ///< Plies played past the start position, over all games.
+
+  double mean_length() const {
+    return playouts ? static_cast<double>(total_plies) / static_cast<double>(playouts) : 0.0;
+  }
+  /** @brief Mean result in [-1, 1] for the side to move (win 1, draw 0, loss -1). */
+  double mean_score() const {
+    return playouts ? (static_cast<double>(wins) - static_cast<double>(losses)) / static_cast<double>(playouts) : 0.0;
+  }
+};
+
+} // namespace engine
@@ -0,0 +1,78 @@
+#pragma once
+/**
+ * @file search.hpp
+ * @brief Alpha-beta search types: results and the transposition table.
+ *
+ * Scores are in centipawns from the point of view of the side to move. Capturing the
+ * enemy king ends the game, so a forced king capture in n plies scores MATE_SCORE - n.
+ */
+
+#include "chess/move.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace engine {
+
+constexpr int MATE_SCORE = 30000;    ///< Score of capturing the king right now.
+constexpr int MAX_SEARCH_PLY = 64;   ///< Hard limit on search depth (including quiescence).
+constexpr int MAX_SEARCH_DEPTH = 32; ///< Largest max_depth accepted by Engine::search.
+
+/** @return True if `score` encodes a forced king capture for either side. */
+constexpr bool is_mate_score(int score) {
+  return score >= MATE_SCORE - MAX_SEARCH_PLY || score <= -(MATE_SCORE - MAX_SEARCH_PLY);
+}
+
+/** @brief Outcome of Engine::search. */
+struct SearchResult {
+  Move best_move{};        ///< Best move found (valid only if has_move).
+  bool has_move = false;   ///< False when the root has no moves or the game is already over.
+  int score = 0;           ///< Score of best_move for the side to move.
+  int depth = 0;           ///< Deepest fully completed iteration.
+  std::uint64_t nodes = 0; ///< Nodes visited (main search + quiescence).
+  std::vector<Move> pv;    ///< Principal variation starting with best_move.
+};
+
+/**
+ * @brief Fixed-size transposition table.
+ * Each bucket has two slots: one keeps the deepest result seen for its index, the other
+ * always takes the most recent store, so shallow entries cannot evict deep ones.
+ */
+class TranspositionTable {
+public:
+  enum Bound : std::uint8_t { NONE = 0, EXACT = 1, LOWER = 2, UPPER = 3 };
+
+  struct Entry {
+    std::uint64_t key = 0;
+    Move move{};
+    std::int16_t score = 0;
+    std::int8_t depth = -1;
+    Bound bound = NONE;
+  };
+
+  /** @param num_buckets Rounded down to a power of two (at least 1). */
+  explicit TranspositionTable(std::size_t num_buckets);
+
+  /** @return Matching entry or nullptr. */
+  const Entry *probe(std::uint64_t key) const;
+
+  void store(std::uint64_t key, int depth, int score, Bound bound, const Move &move);
+
+  void clear();
+
+  std::size_t num_buckets() const {
+    return buckets_.size();
+  }
+
+private:
+  struct Bucket {
+    Entry deepest;
+    Entry recent;
+  };
+
+  std::vector<Bucket> buckets_;
+  std::uint64_t mask_ = 0;
+};
+
+} // namespace engine
@@ -0,0 +1,30 @@
+#pragma once
+/**
+ * @file serialize.hpp
+ * @brief Fixed-size packed byte records for engine::State.
+ *
+ * Layout (PACKED_STATE_SIZE bytes): the BOARD_N*BOARD_N piece codes, the side to move,
+ * then ply as a little-endian uint32. Derived fields (hash, king squares, counts) are not
+ * stored; unpacking recomputes them, so records are stable across builds and platforms.
+ */
+
+#include "chess/config.hpp"
+#include "chess/state.hpp"
+
+#include <cstddef>
+#include <cstdint>
+
+namespace engine {
+
+constexpr std::size_t PACKED_STATE_SIZE = BOARD_N * BOARD_N + 1 + 4; ///< Bytes per packed State.
+
+/** @brief Write `s` to `out` (PACKED_STATE_SIZE bytes). */
+void pack_state(const State &s, std::uint8_t *out);
+
+/**
+ * @brief Read a State written by pack_state; derived fields are recomputed.
+ * @throws std::invalid_argument if the side-to-move byte is not 0 or 1.
+ */
+State unpack_state(const std::uint8_t *in);
+
+} // namespace engine
@@ -12,11 +12,39 @@
 
 namespace engine {
 
-/** @brief Entire game state (compact, POD). */
+constexpr Square NO_SQUARE = 0xFF; ///< king_sq value once that king has been captured.
+
+/** @return 0 for player-0 (P1) pieces, 1 for player-1 (P2) pieces. */
+constexpr int side_index(piece::Code c) {
+  return (c & piece::SIDE_MASK) ? 1 : 0;
+}
+
+/**
+ * @brief Entire game state (compact, POD).
+ * board, to_move and ply define the position; the remaining fields are derived from them
+ * and kept current by the engine (see refresh_derived for hand-made positions).
+ */
 struct State {
-  std::array<piece::Code, BOARD_N * BOARD_N> board{}; ///< Encoded piece per square.
-  Player to_move = 0;                                 ///< Side to move (0 or 1).
-  std::uint32_t ply = 0;                              ///< Half-move count.
+  std::array<piece::Code, BOARD_N * BOARD_N> board{};  ///< Encoded piece per square.
+  Player to_move = 0;                                  ///< Side to move (0 or 1).
+  std::uint32_t ply = 0;                               ///< Half-move count.
+  std::uint64_t hash = 0;                              ///< Zobrist key of board + to_move (see zobrist.hpp).
+  std::array<Square, 2> king_sq{NO_SQUARE, NO_SQUARE}; ///< [side] king square, NO_SQUARE if captured.
+  std::array<std::array<std::uint8_t, 8>, 2> counts{}; ///< [side][UnitType] number of pieces on the board.
 };
 
+/** @brief States are equal when board, side to move and ply all match. */
+inline bool operator==(const State &a, const State &b) {
+  return a.board == b.board && a.to_move == b.to_move && a.ply == b.ply;
+}
+inline bool operator!=(const State &a, const State &b) {
+  return !(a == b);
+}
+
+/**
+ * @brief Recompute the derived fields (hash, king squares, piece counts) from board and to_move.
+ * Call after editing a State by hand; the engine keeps them current on its own.
+ */
+void refresh_derived(State &s);
+
 } // namespace engine
@@ -0,0 +1,127 @@
+#pragma once
+/**
+ * @file stats.hpp
+ * @brief Optional hot-path counters: calls, moves, time and allocations per engine entry point.
+ *
+ * Compiled in only with CHESS_ENGINE_STATS=1 (CMake option CHESS_ENGINE_STATS). Otherwise
+ * StatScope is an empty type and every probe compiles away, so release builds pay nothing.
+ *
+ * Counters are process-wide (Engine holds no state): each thread adds to its own block
+ * without synchronisation and Engine::stats() sums the blocks, including those of threads
+ * that have exited. Times are inclusive wall-clock nanoseconds, so nested probes overlap
+ * (apply_move contains is_legal, which contains legal_moves_from, which contains movegen).
+ *
+ * Only the owning thread ever writes a counter: Engine::reset_stats() records each block's
+ * current values as its baseline instead of zeroing it, so a reset while other threads are
+ * counting loses neither the reset nor their later counts.
+ */
+
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+
+#ifndef CHESS_ENGINE_STATS
+#define CHESS_ENGINE_STATS 0
+#endif
+
+namespace engine {
+
+constexpr bool STATS_ENABLED = CHESS_ENGINE_STATS != 0;
+
+/** @brief Instrumented entry points. */
+enum StatProbe : std::uint8_t {
+  STAT_LEGAL_MOVES = 0,  ///< Engine::legal_moves (both overloads).
+  STAT_LEGAL_MOVES_FROM, ///< Engine::legal_moves_from (both overloads).
+  STAT_IS_LEGAL,         ///< Engine::is_legal.
+  STAT_APPLY_MOVE,       ///< Engine::apply_move and apply_move_unchecked.
+  STAT_MAKE_MOVE,        ///< Engine::make_move (search, perft, playouts and apply_move all use it).
+  STAT_MOVEGEN,          ///< Bitboard generator (generate_moves, generate_moves_from).
+  STAT_UNIT_GENERATE,    ///< Unit::get_legal_moves, the reference per-piece generators.
+  NUM_STAT_PROBES,
+};
+
+/** @brief Name of each probe, as used for Engine.stats() keys in Python. */
+inline constexpr std::array<const char *, NUM_STAT_PROBES> STAT_PROBE_NAMES = {
+    "legal_moves", "legal_moves_from", "is_legal", "apply_move", "make_move", "movegen", "unit_generate",
+};
+
+/** @brief Totals of one probe. */
+struct ProbeStats {
+  std::uint64_t calls = 0;
+  std::uint64_t moves = 0;       ///< Moves generated (generators) or played (apply_move, make_move).
+  std::uint64_t nanoseconds = 0; ///< Inclusive wall-clock time.
+  std::uint64_t allocations = 0; ///< Heap buffers allocated for results (std::vector-returning overloads).
+};
+
+/** @brief Result of Engine::stats(). */
+struct EngineStats {
+  bool enabled = STATS_ENABLED; ///< False when compiled without CHESS_ENGINE_STATS (all counts are then 0).
+  std::array<ProbeStats, NUM_STAT_PROBES> probes{};
+};
+
+namespace detail {
+
+/** @brief One thread's counters; written only by that thread, read by Engine::stats(). */
+struct StatBlock {
+  static constexpr int CALLS = 0, MOVES = 1, NANOSECONDS = 2, ALLOCATIONS = 3;
+  std::array<std::array<std::atomic<std::uint64_t>, 4>, NUM_STAT_PROBES> v{};
+  /// Values of `v` at the last Engine::reset_stats(); only touched under the registry lock.
+  std::array<std::array<std::uint64_t, 4>, NUM_STAT_PROBES> base{};
+};
+
+/** @return The calling thread's block, registered on first use. */
+StatBlock &thread_stats();
+
+/** @brief Single-writer increment: a relaxed load and store, no read-modify-write. */
+inline void bump(std::atomic<std::uint64_t> &c, std::uint64_t n) {
+  c.store(c.load(std::memory_order_relaxed) + n, std::memory_order_relaxed);
+}
+
+} // namespace detail
+
+#if CHESS_ENGINE_STATS
+
+/** @brief Counts one call of `probe` and its duration, from construction to destruction. */
+class StatScope {
+public:
+  explicit StatScope(StatProbe probe) : counters_(detail::thread_stats().v[probe]), start_(std::chrono::steady_clock::now()) {}
+  ~StatScope() {
+    const auto ns = std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now() - start_).count();
+    detail::bump(counters_[detail::StatBlock::CALLS], 1);
+    detail::bump(counters_[detail::StatBlock::NANOSECONDS], static_cast<std::uint64_t>(ns));
+  }
+  StatScope(const StatScope &) = delete;
+  StatScope &operator=(const StatScope &) = delete;
+
+  void moves(std::size_t n) {
+    detail::bump(counters_[detail::StatBlock::MOVES], n);
+  }
+  void allocation() {
+    detail::bump(counters_[detail::StatBlock::ALLOCATIONS], 1);
+  }
+
+private:
+  std::array<std::atomic<std::uint64_t>, 4> &counters_;
+  std::chrono::steady_clock::time_point start_;
+};
+
+#else
+
+class StatScope {
+public:
+  explicit StatScope(StatProbe) {}
+  void moves(std::size_t) {}
+  void allocation() {}
+};
+
+#endif
+
+/** @brief Count a result allocation against `probe` without counting a call. */
+inline void count_allocation([[maybe_unused]] StatProbe probe) {
+  if constexpr (STATS_ENABLED)
+    detail::bump(detail::thread_stats().v[probe][detail::StatBlock::ALLOCATIONS], 1);
+}
+
+} // namespace engine
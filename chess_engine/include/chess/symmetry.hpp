@@ -0,0 +1,123 @@
+#pragma once
+/**
+ * @file symmetry.hpp
+ * @brief Board symmetries of the rules: left-right mirror and colour flip.
+ *
+ * Every piece moves symmetrically about the board's vertical axis, so mirroring the columns
+ * maps a position (and its legal moves) onto an equivalent one. Pawns fix the vertical
+ * direction, so rows can only be mirrored together with swapping the players: the colour
+ * flip mirrors the rows, toggles the side bit of every piece and the side to move. The start
+ * position is invariant under the colour flip but not under the mirror (the king is on
+ * column 3). Together they form four transforms; each is its own inverse.
+ *
+ * A colour flip swaps the players, so values from the side to move's view are unchanged
+ * while player-0 rewards change sign. Moved and power bits and the ply counter are kept.
+ */
+
+#include "chess/action.hpp"
+#include "chess/config.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <algorithm>
+#include <array>
+#include <cstddef>
+#include <cstdint>
+
+namespace engine {
+namespace symmetry {
+
+/** @brief Transform ids; bit 0 mirrors the columns, bit 1 flips the colours. */
+enum Transform : std::uint8_t {
+  IDENTITY = 0,
+  MIRROR = 1,
+  COLOR_FLIP = 2,
+  MIRROR_COLOR_FLIP = 3,
+};
+
+constexpr int NUM_TRANSFORMS = 4;
+
+/** @return Image of square `sq` under `t`. */
+constexpr int map_square(int t, int sq) {
+  const int r = sq / BOARD_N, c = sq % BOARD_N;
+  const int rr = (t & COLOR_FLIP) ? BOARD_N - 1 - r : r;
+  const int cc = (t & MIRROR) ? BOARD_N - 1 - c : c;
+  return rr * BOARD_N + cc;
+}
+
+/** @return Image of piece code `pc` under `t` (side bit toggled by a colour flip). */
+constexpr piece::Code map_piece(int t, piece::Code pc) {
+  return (t & COLOR_FLIP) && !piece::is_empty(pc) ? static_cast<piece::Code>(pc ^ piece::SIDE_MASK) : pc;
+}
+
+struct Table {
+  std::array<std::array<Square, action::NUM_SQUARES>, NUM_TRANSFORMS> square{};       ///< [transform][square]
+  std::array<std::array<std::int16_t, action::NUM_ACTIONS>, NUM_TRANSFORMS> action{}; ///< [transform][action]
+};
+
+constexpr Table make_table() {
+  Table t;
+  for (int x = 0; x < NUM_TRANSFORMS; ++x) {
+    for (int sq = 0; sq < action::NUM_SQUARES; ++sq)
+      t.square[x][sq] = static_cast<Square>(map_square(x, sq));
+    // Mirrors preserve queen lines and knight jumps, so every action has an image.
+    for (int a = 0; a < action::NUM_ACTIONS; ++a)
+      t.action[x][a] = action::TABLE.id[map_square(x, action::TABLE.from[a])][map_square(x, action::TABLE.to[a])];
+  }
+  return t;
+}
+
+inline constexpr Table TABLE = make_table();
+
+/** @return Image of action id `a` under `t`. */
+constexpr int map_action(int t, int a) {
+  return TABLE.action[t][a];
+}
+
+/** @return `s` under `t`, derived fields recomputed. */
+State apply(const State &s, Transform t);
+
+/**
+ * @brief The transform taking `s` to its canonical form: side to move 0 (colour flip iff
+ * player 1 is to move), then the lexicographically smaller board of it and its mirror.
+ * Equivalent positions share one canonical form; ties prefer no mirror.
+ */
+Transform canonical_transform(const State &s);
+
+/** @return apply(s, canonical_transform(s)). */
+State canonicalize(const State &s);
+
+/** @return Zobrist key of the canonical form; equal for all four images of a position. */
+std::uint64_t canonical_hash(const State &s);
+
+// ---- Batched forms over row-major arrays (row i = one position). `transforms` holds one
+// Transform (< NUM_TRANSFORMS) per row. Outputs may be the input buffers themselves.
+
+/** @brief Map n boards (BOARD_N*BOARD_N codes each) and their side-to-move flags. */
+void apply_boards(const piece::Code *boards, const Player *to_move, const std::uint8_t *transforms, std::size_t n,
+                  piece::Code *out_boards, Player *out_to_move);
+
+/** @brief Canonicalise n boards; the transform used for each row goes to out_transforms. */
+void canonicalize_boards(const piece::Code *boards, const Player *to_move, std::size_t n, piece::Code *out_boards,
+                         Player *out_to_move, std::uint8_t *out_transforms);
+
+/** @brief Map n action ids; ids outside [0, NUM_ACTIONS) (e.g. -1 for none) are copied unchanged. */
+void apply_actions(const std::int64_t *actions, const std::uint8_t *transforms, std::size_t n, std::int64_t *out);
+
+/**
+ * @brief Permute n rows of per-action values (masks, priors, visit counts) so that
+ * out[i][map_action(t, a)] = rows[i][a].
+ */
+template <typename T> void apply_action_rows(const T *rows, const std::uint8_t *transforms, std::size_t n, T *out) {
+  constexpr std::size_t A = action::NUM_ACTIONS;
+  std::array<T, A> tmp;
+  for (std::size_t i = 0; i < n; ++i) {
+    const auto &perm = TABLE.action[transforms[i]];
+    for (std::size_t a = 0; a < A; ++a)
+      tmp[perm[a]] = rows[i * A + a];
+    std::copy(tmp.begin(), tmp.end(), out + i * A);
+  }
+}
+
+} // namespace symmetry
+} // namespace engine
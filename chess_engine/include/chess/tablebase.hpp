@@ -0,0 +1,104 @@
+#pragma once
+/**
+ * @file tablebase.hpp
+ * @brief Retrograde-solved endgame tables, memory-mapped for O(1) probes.
+ *
+ * A tablebase holds the exact result of every position with at most max_pieces pieces
+ * (both kings included) under one rule set (king capture or strict legality), ignoring the
+ * ply limit. Positions are stored once per symmetry class: a colour flip puts player 0 to
+ * move and a mirror puts that king on columns 0-2 (see symmetry.hpp). Each material
+ * signature (the sorted non-king pieces) gets one table of 18 x 36 x 36^k one-byte entries,
+ * indexed by the two king squares and the other pieces' squares.
+ *
+ * Entry bytes: 0 = draw, 255 = no such position, otherwise plies + 1, where plies is the
+ * distance to the end of the game with best play: odd for a win of the side to move, even
+ * for a loss (0 = checkmated now under strict legality).
+ *
+ * File layout (little-endian): a 32-byte header (magic "PCTBASE", version, board size,
+ * max_pieces, flags, table count), one 24-byte directory record per table (signature key,
+ * byte offset, byte size), then the tables. Pawn moved bits are implied by their rows; a
+ * position with a moved pawn on its start row (or an unmoved one elsewhere) is not covered.
+ */
+
+#include "chess/config.hpp"
+#include "chess/state.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <string>
+#include <vector>
+
+namespace engine {
+
+constexpr int MAX_TABLEBASE_PIECES = 4; ///< Largest max_pieces the generator accepts (~46 MB of tables).
+
+/** @brief Exact result of a covered position, from the side to move's view. */
+struct TablebaseEntry {
+  int result = 0;          ///< +1 win, 0 draw, -1 loss with best play and no ply limit.
+  std::uint32_t plies = 0; ///< Plies until the game ends with best play; 0 for draws.
+};
+
+/** @brief Read-only, memory-mapped tablebase file; safe to probe from any number of threads. */
+class Tablebase {
+public:
+  /**
+   * @brief Map `path` into memory.
+   * @throws std::runtime_error if the file cannot be opened or is not a tablebase for this board.
+   */
+  explicit Tablebase(const std::string &path);
+  ~Tablebase();
+
+  Tablebase(const Tablebase &) = delete;
+  Tablebase &operator=(const Tablebase &) = delete;
+
+  /** @return Result of `s`, or nullopt if the tablebase does not cover it. */
+  std::optional<TablebaseEntry> probe(const State &s) const;
+
+  int max_pieces() const {
+    return max_pieces_;
+  }
+  /** @brief Rule set the tables were solved under (EngineConfig::strict_legality). */
+  bool strict_legality() const {
+    return strict_legality_;
+  }
+  const std::string &path() const {
+    return path_;
+  }
+
+private:
+  std::string path_;
+  const std::uint8_t *data_ = nullptr;
+  std::size_t size_ = 0;
+  void *mapping_ = nullptr; ///< Platform mapping handle (Windows); unused elsewhere.
+  int max_pieces_ = 0;
+  bool strict_legality_ = false;
+  std::vector<const std::uint8_t *> tables_; ///< [signature key] start of that table, nullptr if absent.
+};
+
+/** @brief Counts reported by generate_tablebase. */
+struct TablebaseSummary {
+  std::size_t tables = 0;      ///< Material signatures solved.
+  std::uint64_t positions = 0; ///< Valid positions stored (one per symmetry class and indexing).
+  std::uint64_t wins = 0;      ///< Positions won by the side to move.
+  std::uint64_t draws = 0;
+  std::uint64_t losses = 0;
+  std::uint32_t longest = 0; ///< Longest decisive distance, in plies.
+  std::uint64_t bytes = 0;   ///< Size of the written file.
+};
+
+/**
+ * @brief Solve every position with at most `max_pieces` pieces by retrograde analysis and
+ * write the tablebase to `path`.
+ *
+ * Tables are solved from fewer pieces (and pawns) up, so captures and promotions always
+ * lead into tables already solved. Successors are generated with the engine's own rules;
+ * n_threads <= 0 uses every hardware thread for that step. Peak memory is about 8 bytes per
+ * move of the largest signature pair (a few hundred MB for 4 pieces).
+ *
+ * @throws std::invalid_argument if max_pieces is outside [2, MAX_TABLEBASE_PIECES].
+ * @throws std::runtime_error if the file cannot be written.
+ */
+TablebaseSummary generate_tablebase(const std::string &path, int max_pieces, bool strict_legality = false, int n_threads = 0);
+
+} // namespace engine
@@ -0,0 +1,65 @@
+#pragma once
+/**
+ * @file zobrist.hpp
+ * @brief Zobrist keys for engine::State.
+ *
+ * The key XORs one 64-bit value per (square, full piece code) — so the moved and power
+ * bits are part of the position — plus a side key when player 1 is to move. The ply
+ * counter is deliberately excluded so repeated positions hash equal.
+ */
+
+#include "chess/config.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <array>
+#include <cstdint>
+
+namespace engine {
+namespace zobrist {
+
+constexpr int NUM_CODES = 256; ///< Every possible piece::Code byte.
+
+struct Keys {
+  std::array<std::array<std::uint64_t, NUM_CODES>, BOARD_N * BOARD_N> piece{}; ///< [square][code]
+  std::uint64_t side = 0;                                                      ///< XORed in when to_move == 1.
+};
+
+/** @brief SplitMix64 step; deterministic across platforms and builds. */
+constexpr std::uint64_t splitmix64(std::uint64_t &state) {
+  std::uint64_t z = (state += 0x9E3779B97F4A7C15ULL);
+  z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+  z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+  return z ^ (z >> 31);
+}
+
+constexpr Keys make_keys() {
+  Keys k;
+  std::uint64_t seed = 0x5045'4348'4553'5321ULL; // fixed: keys must not change between runs
+  for (auto &square : k.piece) {
+    for (auto &key : square)
+      key = splitmix64(seed);
+  }
+  k.side = splitmix64(seed);
+  return k;
+}
+
+inline constexpr Keys KEYS = make_keys();
+
+/** @return Key contribution of `code` standing on `sq` (0 for empty squares). */
+constexpr std::uint64_t piece_key(int sq, piece::Code code) {
+  return piece::is_empty(code) ? 0 : KEYS.piece[sq][code];
+}
+
+/** @return Full key of `s`, computed from scratch. */
+inline std::uint64_t compute(const State &s) {
+  std::uint64_t h = 0;
+  for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq)
+    h ^= piece_key(sq, s.board[sq]);
+  if (s.to_move != 0)
+    h ^= KEYS.side;
+  return h;
+}
+
+} // namespace zobrist
+} // namespace engine
@@ -7,4 +7,7 @@
 namespace engine {
 class Unit;
 std::unique_ptr<Unit> make_unit_from_code(piece::Code code);
+
+/** @brief Shared, immutable unit for `code` (nullptr if empty/unknown); no allocation. */
+const Unit *unit_for_code(piece::Code code);
 } // namespace engine
@@ -1,7 +1,9 @@
 #pragma once
 #include "chess/config.hpp"
 #include "chess/move.hpp"
+#include "chess/move_list.hpp"
 #include "chess/state.hpp"
+#include "chess/stats.hpp"
 
 #include <memory>
 #include <vector>
@@ -26,10 +28,22 @@ public:
     return owner_;
   }
 
+  /**
+   * @brief Append all legal moves for this unit from the given square to `moves`.
+   */
+  virtual void generate_moves(const State &state, Square from, MoveList &moves) const = 0;
+
   /**
    * @brief Generate all legal moves for this unit from the given square.
    */
-  virtual std::vector<Move> get_legal_moves(const State &state, Square from) const = 0;
+  std::vector<Move> get_legal_moves(const State &state, Square from) const {
+    StatScope probe(STAT_UNIT_GENERATE);
+    MoveList moves;
+    generate_moves(state, from, moves);
+    probe.moves(moves.size());
+    probe.allocation();
+    return std::vector<Move>(moves.begin(), moves.end());
+  }
 
   /**
    * @brief Symbolic representation (for rendering / debugging).
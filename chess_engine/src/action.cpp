@@ -0,0 +1,34 @@
+#include "chess/action.hpp"
+
+#include "chess/engine.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+
+#include <algorithm>
+
+namespace engine {
+namespace action {
+
+Move decode(const State &s, int action) {
+  Move m{TABLE.from[action], TABLE.to[action]};
+  const piece::Code mover = s.board[m.from];
+  if (piece::unit_type(mover) != piece::PAWN)
+    return m; // the generator types every non-pawn move (captures included) as Quiet
+
+  m.type = Engine::deduce_move_type(s, m);
+  if (m.type == MoveType::Promote || m.type == MoveType::CapturePromote)
+    m.promo_piece = piece::make(piece::QUEEN, piece::side(mover), /*hasMoved=*/true, piece::POWER_NONE);
+  return m;
+}
+
+} // namespace action
+
+void Engine::legal_action_mask(const State &s, std::int8_t *out) const {
+  std::fill_n(out, action::NUM_ACTIONS, std::int8_t{0});
+  MoveList moves;
+  legal_moves(s, moves);
+  for (const Move &m : moves)
+    out[action::encode(m)] = 1;
+}
+
+} // namespace engine
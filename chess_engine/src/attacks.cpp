@@ -0,0 +1,114 @@
+#include "chess/attacks.hpp"
+
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+
+#include <algorithm>
+#include <array>
+
+namespace engine {
+
+namespace {
+
+constexpr std::array<Direction, 4> ORTHOGONAL = {N, W, E, S};
+constexpr std::array<Direction, 4> DIAGONAL = {NW, NE, SW, SE};
+
+/** @return Slider attacks from `sq` along `dirs`. */
+template <std::size_t N>
+Bitboard slider_attacks(const AttackTables &t, int sq, const std::array<Direction, N> &dirs, Bitboard occupied) {
+  Bitboard attacks = 0;
+  for (Direction d : dirs)
+    attacks |= ray_attacks(t, d, sq, occupied);
+  return attacks;
+}
+
+/**
+ * @return Pieces of `us` that are the only blocker between their king on `ksq` and an enemy
+ * slider moving along that line.
+ */
+Bitboard pinned_pieces(const AttackTables &t, const Bitboards &bbs, Player us, int ksq) {
+  const Player them = 1 - us;
+  const Bitboard occupied = bbs.occupied();
+  const Bitboard rook_like = bbs.kind[them][piece::ROOK] | bbs.kind[them][piece::QUEEN];
+  const Bitboard bishop_like = bbs.kind[them][piece::BISHOP] | bbs.kind[them][piece::QUEEN];
+
+  Bitboard pinned = 0;
+  for (int d = 0; d < NUM_DIRECTIONS; ++d) {
+    const Direction dir = static_cast<Direction>(d);
+    const Bitboard near = ray_attacks(t, dir, ksq, occupied);
+    const Bitboard blocker = near & bbs.side[us];
+    if (!blocker)
+      continue;
+    const Bitboard beyond = ray_attacks(t, dir, ksq, occupied & ~blocker) & ~near;
+    const bool diagonal = dir == NW || dir == NE || dir == SW || dir == SE;
+    if (beyond & (diagonal ? bishop_like : rook_like))
+      pinned |= blocker;
+  }
+  return pinned;
+}
+
+/** @brief Exact test: make the move on the bitboards and look for attackers of the king. */
+bool leaves_king_attacked(const Bitboards &bbs, Player us, int ksq, const Move &m) {
+  const Player them = 1 - us;
+  Bitboards after = bbs;
+  const Bitboard from = bb::square(m.from), to = bb::square(m.to);
+  after.side[them] &= ~to;
+  for (Bitboard &kind : after.kind[them])
+    kind &= ~to;
+  after.side[us] = (after.side[us] & ~from) | to;
+  const int king = (m.from == ksq) ? m.to : ksq;
+  return attackers_to(after, king, them, after.occupied()) != 0;
+}
+
+} // namespace
+
+Bitboard attackers_to(const Bitboards &bbs, int sq, Player by, Bitboard occupied) {
+  const AttackTables &t = attack_tables();
+  const auto &k = bbs.kind[by];
+  return (t.knight[sq] & k[piece::KNIGHT]) | (t.king[sq] & k[piece::KING]) | (t.pawn_attacks[1 - by][sq] & k[piece::PAWN]) |
+         (slider_attacks(t, sq, ORTHOGONAL, occupied) & (k[piece::ROOK] | k[piece::QUEEN])) |
+         (slider_attacks(t, sq, DIAGONAL, occupied) & (k[piece::BISHOP] | k[piece::QUEEN]));
+}
+
+Bitboard attack_map(const Bitboards &bbs, Player by, Bitboard occupied) {
+  const AttackTables &t = attack_tables();
+  const auto &k = bbs.kind[by];
+  Bitboard attacks = 0;
+  for (Bitboard b = k[piece::PAWN]; b;)
+    attacks |= t.pawn_attacks[by][bb::pop_lsb(b)];
+  for (Bitboard b = k[piece::KNIGHT]; b;)
+    attacks |= t.knight[bb::pop_lsb(b)];
+  for (Bitboard b = k[piece::KING]; b;)
+    attacks |= t.king[bb::pop_lsb(b)];
+  for (Bitboard b = k[piece::ROOK] | k[piece::QUEEN]; b;)
+    attacks |= slider_attacks(t, bb::pop_lsb(b), ORTHOGONAL, occupied);
+  for (Bitboard b = k[piece::BISHOP] | k[piece::QUEEN]; b;)
+    attacks |= slider_attacks(t, bb::pop_lsb(b), DIAGONAL, occupied);
+  return attacks;
+}
+
+void remove_self_checks(const State &s, MoveList &moves) {
+  const Player us = s.to_move;
+  const int ksq = s.king_sq[us];
+  if (ksq == NO_SQUARE || moves.empty())
+    return;
+
+  const AttackTables &t = attack_tables();
+  const Bitboards bbs = Bitboards::from_state(s);
+  const Bitboard occupied = bbs.occupied();
+  const bool in_check = attackers_to(bbs, ksq, 1 - us, occupied) != 0;
+  // Squares the king may not step to: sliders see through the king's current square.
+  const Bitboard danger = attack_map(bbs, 1 - us, occupied & ~bb::square(ksq));
+  const Bitboard pinned = pinned_pieces(t, bbs, us, ksq);
+
+  auto illegal = [&](const Move &m) {
+    if (m.from == ksq)
+      return (danger & bb::square(m.to)) != 0;
+    if (!in_check && !(pinned & bb::square(m.from)))
+      return false;
+    return leaves_king_attacked(bbs, us, ksq, m);
+  };
+  moves.truncate(static_cast<std::size_t>(std::remove_if(moves.begin(), moves.end(), illegal) - moves.begin()));
+}
+
+} // namespace engine
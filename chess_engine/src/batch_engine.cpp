@@ -0,0 +1,107 @@
+#include "chess/batch_engine.hpp"
+
+#include "chess/action.hpp"
+
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+
+namespace engine {
+
+namespace {
+constexpr std::size_t CELLS = BOARD_N * BOARD_N;
+constexpr std::size_t ACTIONS = action::NUM_ACTIONS;
+
+std::uint64_t next_random(std::uint64_t &x) {
+  x ^= x << 13;
+  x ^= x >> 7;
+  x ^= x << 17;
+  return x;
+}
+
+float reward_of(Outcome o) {
+  return o == Outcome::Player0Wins ? 1.0f : o == Outcome::Player1Wins ? -1.0f : 0.0f;
+}
+} // namespace
+
+BatchEngine::BatchEngine(std::size_t num_envs, std::uint64_t seed, EngineConfig config)
+    : engine_(config), initial_(engine_.initial_state()), num_envs_(num_envs), states_(num_envs), finals_(num_envs),
+      boards_(num_envs * CELLS), to_move_(num_envs), ply_(num_envs), masks_(num_envs * ACTIONS), rewards_(num_envs),
+      dones_(num_envs), actions_(num_envs), rng_((seed * 0x9E3779B97F4A7C15ULL) | 1) { // xorshift state must be non-zero
+  reset();
+}
+
+void BatchEngine::reset() {
+  for (std::size_t i = 0; i < num_envs_; ++i) {
+    states_[i] = initial_;
+    publish(i);
+  }
+  std::fill(rewards_.begin(), rewards_.end(), 0.0f);
+  std::fill(dones_.begin(), dones_.end(), std::uint8_t{0});
+}
+
+void BatchEngine::step(const std::int64_t *actions) {
+  // Validate everything first so a bad action leaves the whole batch untouched.
+  for (std::size_t i = 0; i < num_envs_; ++i) {
+    const std::int64_t a = actions[i];
+    if (a < 0 || a >= static_cast<std::int64_t>(ACTIONS) || masks_[i * ACTIONS + a] == 0)
+      throw std::invalid_argument("action " + std::to_string(a) + " is illegal in game " + std::to_string(i));
+  }
+
+  for (std::size_t i = 0; i < num_envs_; ++i) {
+    State &s = states_[i];
+    engine_.make_move(s, action::decode(s, static_cast<int>(actions[i])));
+    const Outcome o = engine_.outcome(s);
+    rewards_[i] = reward_of(o);
+    dones_[i] = 0;
+    if (o != Outcome::Ongoing || !publish(i)) // no legal move: a draw, as in playouts, MCTS and Opponent
+      finish(i);
+  }
+}
+
+const std::int64_t *BatchEngine::random_actions() {
+  for (std::size_t i = 0; i < num_envs_; ++i) {
+    const std::int8_t *row = masks_.data() + i * ACTIONS;
+    const int legal = static_cast<int>(std::count(row, row + ACTIONS, std::int8_t{1}));
+    actions_[i] = -1;
+    if (legal == 0)
+      continue;
+    int pick = static_cast<int>(next_random(rng_) % legal);
+    for (std::size_t j = 0; j < ACTIONS; ++j) {
+      if (row[j] && pick-- == 0) {
+        actions_[i] = static_cast<std::int64_t>(j);
+        break;
+      }
+    }
+  }
+  return actions_.data();
+}
+
+void BatchEngine::set_state(std::size_t i, const State &s) {
+  states_[i] = s;
+  refresh_derived(states_[i]);
+  const Outcome o = engine_.outcome(states_[i]);
+  rewards_[i] = reward_of(o);
+  dones_[i] = 0;
+  if (o != Outcome::Ongoing || !publish(i))
+    finish(i);
+}
+
+bool BatchEngine::publish(std::size_t i) {
+  const State &s = states_[i];
+  std::copy(s.board.begin(), s.board.end(), boards_.begin() + i * CELLS);
+  to_move_[i] = s.to_move;
+  ply_[i] = s.ply;
+  std::int8_t *mask = masks_.data() + i * ACTIONS;
+  engine_.legal_action_mask(s, mask);
+  return std::find(mask, mask + ACTIONS, std::int8_t{1}) != mask + ACTIONS;
+}
+
+void BatchEngine::finish(std::size_t i) {
+  dones_[i] = 1;
+  finals_[i] = states_[i];
+  states_[i] = initial_;
+  publish(i);
+}
+
+} // namespace engine
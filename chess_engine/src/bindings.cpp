@@ -1,27 +1,454 @@
+#include "chess/action.hpp"
+#include "chess/batch_engine.hpp"
 #include "chess/engine.hpp"
+#include "chess/mcts.hpp"
 #include "chess/move.hpp"
+#include "chess/opponent.hpp"
+#include "chess/planes.hpp"
+#include "chess/search.hpp"
+#include "chess/serialize.hpp"
 #include "chess/state.hpp"
+#include "chess/stats.hpp"
+#include "chess/symmetry.hpp"
+#include "chess/tablebase.hpp"
 
+#include <algorithm>
+#include <array>
+#include <memory>
+#include <optional>
+#include <pybind11/numpy.h>
+#include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <string>
 
 namespace py = pybind11;
 using namespace engine;
 
+namespace {
+
+// Engine methods only touch C++ data, so they run without the GIL and Python threads
+// can drive games concurrently (arguments are converted before, results after).
+using release_gil = py::call_guard<py::gil_scoped_release>;
+
+/** @brief NumPy view of `data` that keeps `owner` alive; read-only unless `writable`. */
+template <typename T>
+py::array numpy_view(const T *data, std::vector<py::ssize_t> shape, py::handle owner, bool writable = false,
+                     py::dtype dtype = py::dtype::of<T>()) {
+  std::vector<py::ssize_t> strides(shape.size());
+  py::ssize_t stride = sizeof(T);
+  for (std::size_t d = shape.size(); d-- > 0;) {
+    strides[d] = stride;
+    stride *= shape[d];
+  }
+  py::array view(dtype, shape, strides, data, owner);
+  if (!writable)
+    view.attr("setflags")(py::arg("write") = false);
+  return view;
+}
+
+/** @return Packed bytes of `s` (see serialize.hpp). */
+py::bytes state_to_bytes(const State &s) {
+  std::array<std::uint8_t, PACKED_STATE_SIZE> buf;
+  pack_state(s, buf.data());
+  return py::bytes(reinterpret_cast<const char *>(buf.data()), buf.size());
+}
+
+/** @brief Inverse of state_to_bytes; accepts any contiguous bytes-like object. */
+State state_from_buffer(const py::buffer &data) {
+  const py::buffer_info info = data.request();
+  if (info.itemsize != 1 || info.ndim != 1 || info.size != static_cast<py::ssize_t>(PACKED_STATE_SIZE) || info.strides[0] != 1)
+    throw py::value_error("expected " + std::to_string(PACKED_STATE_SIZE) + " contiguous bytes");
+  return unpack_state(static_cast<const std::uint8_t *>(info.ptr));
+}
+
+/**
+ * @brief LeafEvaluator calling a Python function with NumPy copies of the batch.
+ * fn(observations (B, BOARD_N, BOARD_N) uint8, action_masks (B, NUM_ACTIONS) int8, to_move (B,) uint8)
+ * must return (priors (B, NUM_ACTIONS), values (B,)); the GIL is taken only for the call.
+ */
+LeafEvaluator python_evaluator(py::function fn) {
+  return [fn = std::move(fn)](const LeafBatch &batch, float *priors, float *values) {
+    py::gil_scoped_acquire gil;
+    const auto n = static_cast<py::ssize_t>(batch.size);
+    py::array_t<piece::Code> obs({n, py::ssize_t{BOARD_N}, py::ssize_t{BOARD_N}}, batch.boards);
+    py::array_t<std::int8_t> masks({n, py::ssize_t{action::NUM_ACTIONS}}, batch.action_masks);
+    py::array_t<Player> to_move({n}, batch.to_move);
+
+    py::tuple out = fn(obs, masks, to_move);
+    if (out.size() != 2)
+      throw py::value_error("evaluator must return (priors, values)");
+    auto p = py::array_t<float, py::array::c_style | py::array::forcecast>::ensure(out[0]);
+    auto v = py::array_t<float, py::array::c_style | py::array::forcecast>::ensure(out[1]);
+    if (!p || !v || p.size() != n * action::NUM_ACTIONS || v.size() != n)
+      throw py::value_error("evaluator must return priors of shape (B, NUM_ACTIONS) and values of shape (B,)");
+    std::copy_n(p.data(), p.size(), priors);
+    std::copy_n(v.data(), v.size(), values);
+  };
+}
+
+/**
+ * @return One validated transform per row: `symmetries` is a Symmetry, an int, or a length-n
+ * integer array.
+ */
+std::vector<std::uint8_t> symmetry_rows(const py::object &symmetries, py::ssize_t n) {
+  std::vector<std::int64_t> ids;
+  if (py::isinstance<symmetry::Transform>(symmetries) || py::isinstance<py::int_>(symmetries)) {
+    ids.assign(static_cast<std::size_t>(n), symmetries.cast<std::int64_t>());
+  } else {
+    auto arr = py::array_t<std::int64_t, py::array::c_style | py::array::forcecast>::ensure(symmetries);
+    if (!arr || arr.ndim() > 1 || (arr.ndim() == 1 && arr.size() != n))
+      throw py::value_error("symmetries must be a Symmetry, an int or an array of shape (N,)");
+    if (arr.ndim() == 0)
+      ids.assign(static_cast<std::size_t>(n), *arr.data());
+    else
+      ids.assign(arr.data(), arr.data() + n);
+  }
+  std::vector<std::uint8_t> rows(ids.size());
+  for (std::size_t i = 0; i < ids.size(); ++i) {
+    if (ids[i] < 0 || ids[i] >= symmetry::NUM_TRANSFORMS)
+      throw py::value_error("symmetry id " + std::to_string(ids[i]) + " out of range");
+    rows[i] = static_cast<std::uint8_t>(ids[i]);
+  }
+  return rows;
+}
+
+using board_array = py::array_t<piece::Code, py::array::c_style | py::array::forcecast>;
+using flag_array = py::array_t<Player, py::array::c_style | py::array::forcecast>;
+
+/** @return Number of boards in a (N, BOARD_N*BOARD_N) or (N, BOARD_N, BOARD_N) array, with to_move checked against it. */
+py::ssize_t board_rows(const board_array &boards, const flag_array &to_move) {
+  const bool flat = boards.ndim() == 2 && boards.shape(1) == BOARD_N * BOARD_N;
+  const bool square = boards.ndim() == 3 && boards.shape(1) == BOARD_N && boards.shape(2) == BOARD_N;
+  if (!flat && !square)
+    throw py::value_error("boards must have shape (N, BOARD_N*BOARD_N) or (N, BOARD_N, BOARD_N)");
+  if (to_move.ndim() != 1 || to_move.shape(0) != boards.shape(0))
+    throw py::value_error("to_move must have shape (N,)");
+  return boards.shape(0);
+}
+
+/** @brief Row permutation of any fixed-size numeric dtype; the values are only moved, never read. */
+template <typename Word> void permute_action_rows(const py::array &in, const std::vector<std::uint8_t> &t, py::array &out) {
+  const auto *src = static_cast<const Word *>(in.data());
+  auto *dst = static_cast<Word *>(out.mutable_data());
+  py::gil_scoped_release release;
+  symmetry::apply_action_rows(src, t.data(), t.size(), dst);
+}
+
+/**
+ * @return `out` if given (checked to be a writable, C-contiguous float32 or uint8 array of
+ * `shape`), else a new array of `dtype` and `shape`.
+ */
+py::array planes_buffer(const std::optional<py::array> &out, const py::object &dtype, const std::vector<py::ssize_t> &shape) {
+  py::array buf = out ? *out : py::array(py::dtype::from_args(dtype), shape);
+  const char kind = buf.dtype().kind();
+  const bool supported = (kind == 'f' && buf.itemsize() == 4) || (kind == 'u' && buf.itemsize() == 1);
+  if (!supported)
+    throw py::value_error("planes must be float32 or uint8, got " + py::str(buf.dtype()).cast<std::string>());
+  if (buf.ndim() != static_cast<py::ssize_t>(shape.size()) || !std::equal(shape.begin(), shape.end(), buf.shape()) ||
+      !(buf.flags() & py::array::c_style) || !buf.writeable())
+    throw py::value_error("out must be a writable, contiguous array of shape (..., NUM_PLANES, BOARD_N, BOARD_N)");
+  return buf;
+}
+
+/** @brief Call fn(float *) or fn(std::uint8_t *) on the data of a planes_buffer array. */
+template <typename Fn> void with_planes(py::array &buf, Fn &&fn) {
+  if (buf.dtype().kind() == 'f')
+    fn(static_cast<float *>(buf.mutable_data()));
+  else
+    fn(static_cast<std::uint8_t *>(buf.mutable_data()));
+}
+
+/** @return (result, plies) for a probe hit, None otherwise. */
+py::object entry_to_python(const std::optional<TablebaseEntry> &e) {
+  return e ? py::object(py::make_tuple(e->result, e->plies)) : py::object(py::none());
+}
+
+/**
+ * @return `out`, checked to be a writable, C-contiguous int8 ndarray of shape (NUM_ACTIONS,), or a
+ * new one if it is None. Anything else raises TypeError: a converted copy would be filled and
+ * dropped without the caller's buffer ever being written.
+ */
+py::array mask_buffer(const py::object &out, const char *name) {
+  if (out.is_none())
+    return py::array_t<std::int8_t>(action::NUM_ACTIONS);
+  if (py::isinstance<py::array_t<std::int8_t>>(out)) {
+    auto mask = py::reinterpret_borrow<py::array>(out);
+    if (mask.ndim() == 1 && mask.shape(0) == action::NUM_ACTIONS && (mask.flags() & py::array::c_style) && mask.writeable())
+      return mask;
+  }
+  throw py::type_error(std::string(name) + " must be a writable, C-contiguous int8 ndarray of shape (NUM_ACTIONS,)");
+}
+
+/** @brief Raise ValueError unless `sq` is a board square; the engine indexes State::board with it unchecked. */
+void check_square(int sq, const char *name) {
+  if (sq < 0 || sq >= BOARD_N * BOARD_N)
+    throw py::value_error(std::string(name) + " must be a square in [0, BOARD_N*BOARD_N), got " + std::to_string(sq));
+}
+
+/** @brief Raise ValueError unless `p` is 0 or 1; it indexes per-player arrays unchecked. */
+void check_player(int p, const char *name) {
+  if (p != 0 && p != 1)
+    throw py::value_error(std::string(name) + " must be player 0 or 1, got " + std::to_string(p));
+}
+
+void check_move_squares(const Move &m) {
+  check_square(m.from, "move.from_");
+  check_square(m.to, "move.to");
+}
+
+/** @brief EngineConfig from the keyword arguments shared by Engine and BatchEngine. */
+EngineConfig make_config(std::uint32_t max_ply, bool strict_legality, std::shared_ptr<Tablebase> tablebase) {
+  return EngineConfig{max_ply, strict_legality, std::move(tablebase)};
+}
+
+} // namespace
+
 /**
  * @brief pybind11 module exposing the C++ engine:
- *  - enums: MoveType
- *  - classes: Move, StepResult, State, Engine
+ *  - enums: MoveType, Outcome, Symmetry
+ *  - classes: Move, UndoRecord, StepResult, SearchResult, PlayoutStats, MctsResult, VersusStep, State, Tablebase,
+ *             TablebaseSummary, Engine, BatchEngine, Opponent
  *  - Engine methods: initial_state(), legal_moves(), legal_moves_from(), group_legal_moves_by_from(),
- *                    is_legal(), apply_move()
+ *                    is_legal(), apply_move(), apply_move_unchecked(), make_move(), unmake_move(), search(),
+ *                    perft(), perft_divide(), legal_action_mask(), outcome(), is_terminal(),
+ *                    random_playouts(), mcts(),
+ *                    attack_map(), is_square_attacked(), in_check(), probe_tablebase(), stats(), reset_stats()
  *  - Engine static helpers: get_pos(), row(), col()
- *  - constant: BOARD_N
+ *  - action encoding: NUM_ACTIONS, encode_action(), decode_action()
+ *  - serialization: PACKED_STATE_SIZE, State.to_bytes()/from_bytes(), pickling, pack_states(), unpack_states()
+ *  - symmetries: Symmetry, NUM_SYMMETRIES, transform_state(), transform_action(), canonical_symmetry(),
+ *                canonicalize(), canonical_hash(), transform_boards(), canonicalize_boards(),
+ *                transform_actions(), transform_action_rows()
+ *  - plane encoding: NUM_PLANES, encode_planes(), encode_planes_batch()
+ *  - endgame tables: MAX_TABLEBASE_PIECES, generate_tablebase(), Tablebase.probe()
+ *  - constants: BOARD_N, MAX_GAME_PLY, STATS_ENABLED
  */
 PYBIND11_MODULE(_ccore, m) {
   m.doc() = "Custom 6x6 power-chess engine (C++ core)";
 
   // Export board size constant for convenience
   m.attr("BOARD_N") = BOARD_N;
+  m.attr("MAX_GAME_PLY") = MAX_GAME_PLY;
+  m.attr("STATS_ENABLED") = STATS_ENABLED;
+
+  // ---- Action encoding
+  m.attr("NUM_ACTIONS") = action::NUM_ACTIONS;
+  m.def("encode_action", &action::encode, py::arg("move"), R"pbdoc(Action id of a move, or -1 if it has none.)pbdoc");
+  m.def(
+      "decode_action",
+      [](const State &s, int a) {
+        if (a < 0 || a >= action::NUM_ACTIONS)
+          throw py::index_error("action id out of range");
+        return action::decode(s, a);
+      },
+      py::arg("state"), py::arg("action"), R"pbdoc(The Move that action id stands for in state.)pbdoc");
+
+  // ---- Serialization
+  m.attr("PACKED_STATE_SIZE") = PACKED_STATE_SIZE;
+  m.def(
+      "pack_states",
+      [](const std::vector<const State *> &states, std::optional<py::array> out) {
+        if (std::find(states.begin(), states.end(), nullptr) != states.end())
+          throw py::type_error("states must not contain None");
+        const auto n = static_cast<py::ssize_t>(states.size());
+        const auto k = static_cast<py::ssize_t>(PACKED_STATE_SIZE);
+        py::array buf = out ? *out : py::array_t<std::uint8_t>({n, k});
+        if (buf.itemsize() != 1 || buf.dtype().kind() != 'u' || buf.ndim() != 2 || buf.shape(0) != n || buf.shape(1) != k ||
+            !(buf.flags() & py::array::c_style) || !buf.writeable())
+          throw py::value_error("out must be a writable, contiguous uint8 array of shape (len(states), PACKED_STATE_SIZE)");
+        auto *data = static_cast<std::uint8_t *>(buf.mutable_data());
+        {
+          py::gil_scoped_release release;
+          for (std::size_t i = 0; i < states.size(); ++i)
+            pack_state(*states[i], data + i * PACKED_STATE_SIZE);
+        }
+        return buf;
+      },
+      py::arg("states"), py::arg("out") = py::none(), R"pbdoc(
+        Pack states into rows of a (N, PACKED_STATE_SIZE) uint8 array (out if given, else a new one).
+      )pbdoc");
+  m.def(
+      "unpack_states",
+      [](const py::object &rows) {
+        // Only uint8 arrays: converting another dtype (or a list) would unpack garbage states silently.
+        if (!py::isinstance<py::array_t<std::uint8_t>>(rows))
+          throw py::type_error("packed must be a uint8 ndarray of shape (N, PACKED_STATE_SIZE)");
+        const auto packed = py::array_t<std::uint8_t, py::array::c_style>::ensure(rows); // same dtype, C order
+        if (packed.ndim() != 2 || packed.shape(1) != static_cast<py::ssize_t>(PACKED_STATE_SIZE))
+          throw py::value_error("packed must be a uint8 ndarray of shape (N, PACKED_STATE_SIZE)");
+        std::vector<State> states;
+        states.reserve(packed.shape(0));
+        {
+          py::gil_scoped_release release;
+          for (py::ssize_t i = 0; i < packed.shape(0); ++i)
+            states.push_back(unpack_state(packed.data(i, 0)));
+        }
+        return states;
+      },
+      py::arg("packed"), R"pbdoc(
+        Inverse of pack_states: a list of States, one per row. Raises TypeError unless packed
+        is a uint8 ndarray, ValueError unless its shape is (N, PACKED_STATE_SIZE).
+      )pbdoc");
+
+  // ---- Symmetries
+  py::enum_<symmetry::Transform>(m, "Symmetry", R"pbdoc(
+    Board symmetries of the rules (each is its own inverse):
+      - Identity
+      - Mirror (columns reversed)
+      - ColorFlip (rows reversed, players and side to move swapped)
+      - MirrorColorFlip (both)
+  )pbdoc")
+      .value("Identity", symmetry::IDENTITY)
+      .value("Mirror", symmetry::MIRROR)
+      .value("ColorFlip", symmetry::COLOR_FLIP)
+      .value("MirrorColorFlip", symmetry::MIRROR_COLOR_FLIP);
+  m.attr("NUM_SYMMETRIES") = symmetry::NUM_TRANSFORMS;
+
+  m.def("transform_state", &symmetry::apply, py::arg("state"), py::arg("symmetry"),
+        R"pbdoc(Image of state under symmetry (a new State; ply is kept).)pbdoc");
+  m.def(
+      "transform_action",
+      [](int a, symmetry::Transform t) {
+        if (a < 0 || a >= action::NUM_ACTIONS)
+          throw py::index_error("action id out of range");
+        return symmetry::map_action(t, a);
+      },
+      py::arg("action"), py::arg("symmetry"), R"pbdoc(Action id of the image of action under symmetry.)pbdoc");
+  m.def("canonical_symmetry", &symmetry::canonical_transform, py::arg("state"), R"pbdoc(
+        The symmetry taking state to its canonical form: player 0 to move, then the smaller of the
+        board and its mirror. Apply the same symmetry to actions/masks to move them along.
+      )pbdoc");
+  m.def("canonicalize", &symmetry::canonicalize, py::arg("state"),
+        R"pbdoc(transform_state(state, canonical_symmetry(state)); equal for all images of a position.)pbdoc");
+  m.def("canonical_hash", &symmetry::canonical_hash, py::arg("state"),
+        R"pbdoc(Zobrist key of the canonical form, for symmetry-aware caches and dedupe.)pbdoc");
+
+  m.def(
+      "transform_boards",
+      [](const board_array &boards, const flag_array &to_move, const py::object &symmetries) {
+        const py::ssize_t n = board_rows(boards, to_move);
+        const std::vector<std::uint8_t> t = symmetry_rows(symmetries, n);
+        board_array out_boards(std::vector<py::ssize_t>(boards.shape(), boards.shape() + boards.ndim()));
+        flag_array out_to_move(n);
+        {
+          py::gil_scoped_release release;
+          symmetry::apply_boards(boards.data(), to_move.data(), t.data(), static_cast<std::size_t>(n), out_boards.mutable_data(),
+                                 out_to_move.mutable_data());
+        }
+        return py::make_tuple(out_boards, out_to_move);
+      },
+      py::arg("boards"), py::arg("to_move"), py::arg("symmetries"), R"pbdoc(
+        Map (N, 36) or (N, 6, 6) uint8 boards and (N,) side-to-move flags; symmetries is one
+        Symmetry for every row or an (N,) array of ids. Returns new (boards, to_move) arrays.
+      )pbdoc");
+  m.def(
+      "canonicalize_boards",
+      [](const board_array &boards, const flag_array &to_move) {
+        const py::ssize_t n = board_rows(boards, to_move);
+        board_array out_boards(std::vector<py::ssize_t>(boards.shape(), boards.shape() + boards.ndim()));
+        flag_array out_to_move(n);
+        py::array_t<std::uint8_t> out_symmetries(n);
+        {
+          py::gil_scoped_release release;
+          symmetry::canonicalize_boards(boards.data(), to_move.data(), static_cast<std::size_t>(n), out_boards.mutable_data(),
+                                        out_to_move.mutable_data(), out_symmetries.mutable_data());
+        }
+        return py::make_tuple(out_boards, out_to_move, out_symmetries);
+      },
+      py::arg("boards"), py::arg("to_move"), R"pbdoc(
+        Canonical forms of (N, 36) or (N, 6, 6) boards: returns (boards, to_move, symmetries), where
+        symmetries[i] is the (N,) uint8 id that mapped row i, for transforming its actions as well.
+      )pbdoc");
+  m.def(
+      "transform_actions",
+      [](const py::array_t<std::int64_t, py::array::c_style | py::array::forcecast> &actions, const py::object &symmetries) {
+        const py::ssize_t n = actions.size();
+        const std::vector<std::uint8_t> t = symmetry_rows(symmetries, n);
+        py::array_t<std::int64_t> out(std::vector<py::ssize_t>(actions.shape(), actions.shape() + actions.ndim()));
+        {
+          py::gil_scoped_release release;
+          symmetry::apply_actions(actions.data(), t.data(), static_cast<std::size_t>(n), out.mutable_data());
+        }
+        return out;
+      },
+      py::arg("actions"), py::arg("symmetries"),
+      R"pbdoc(Map an (N,) array of action ids; ids outside [0, NUM_ACTIONS) such as -1 are kept.)pbdoc");
+  m.def(
+      "transform_action_rows",
+      [](const py::array &rows, const py::object &symmetries) {
+        const py::array in = py::array::ensure(rows, py::array::c_style);
+        const char kind = in ? in.dtype().kind() : 'O';
+        if (!in || (kind != 'b' && kind != 'i' && kind != 'u' && kind != 'f') || in.ndim() < 1 || in.ndim() > 2 ||
+            in.shape(in.ndim() - 1) != action::NUM_ACTIONS)
+          throw py::value_error("rows must be a numeric array of shape (NUM_ACTIONS,) or (N, NUM_ACTIONS)");
+        const py::ssize_t n = in.ndim() == 2 ? in.shape(0) : 1;
+        const std::vector<std::uint8_t> t = symmetry_rows(symmetries, n);
+        py::array out(in.dtype(), std::vector<py::ssize_t>(in.shape(), in.shape() + in.ndim()));
+        switch (in.itemsize()) {
+        case 1:
+          permute_action_rows<std::uint8_t>(in, t, out);
+          break;
+        case 2:
+          permute_action_rows<std::uint16_t>(in, t, out);
+          break;
+        case 4:
+          permute_action_rows<std::uint32_t>(in, t, out);
+          break;
+        case 8:
+          permute_action_rows<std::uint64_t>(in, t, out);
+          break;
+        default:
+          throw py::value_error("unsupported dtype " + py::str(in.dtype()).cast<std::string>());
+        }
+        return out;
+      },
+      py::arg("rows"), py::arg("symmetries"), R"pbdoc(
+        Permute per-action rows (legal masks, policy targets, visit counts) of shape (NUM_ACTIONS,)
+        or (N, NUM_ACTIONS) so that entry a moves to transform_action(a, symmetry). Any numeric
+        dtype; returns a new array.
+      )pbdoc");
+
+  // ---- Plane encoding
+  m.attr("NUM_PLANES") = planes::NUM_PLANES;
+  m.def(
+      "encode_planes",
+      [](const State &s, std::optional<py::array> out, const py::object &dtype, std::uint32_t max_ply) {
+        py::array buf = planes_buffer(out, dtype, {planes::NUM_PLANES, BOARD_N, BOARD_N});
+        with_planes(buf, [&](auto *data) {
+          py::gil_scoped_release release;
+          planes::encode(s, max_ply, data);
+        });
+        return buf;
+      },
+      py::arg("state"), py::arg("out") = py::none(), py::arg("dtype") = "float32", py::arg("max_ply") = MAX_GAME_PLY, R"pbdoc(
+        (NUM_PLANES, BOARD_N, BOARD_N) plane stack of state: piece kind per side (planes 0-11),
+        has-moved (12), power level (13), side to move (14) and ply / max_ply (15). Written into
+        out (float32 or uint8) if given, else into a new array of dtype; returns it. float32
+        planes lie in [0, 1]; uint8 keeps raw power levels and scales the ply plane to 0-255.
+      )pbdoc");
+  m.def(
+      "encode_planes_batch",
+      [](const board_array &boards, const flag_array &to_move,
+         std::optional<py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast>> ply, std::optional<py::array> out,
+         const py::object &dtype, std::uint32_t max_ply) {
+        const py::ssize_t n = board_rows(boards, to_move);
+        if (ply && (ply->ndim() != 1 || ply->shape(0) != n))
+          throw py::value_error("ply must have shape (N,)");
+        py::array buf = planes_buffer(out, dtype, {n, planes::NUM_PLANES, BOARD_N, BOARD_N});
+        const std::uint32_t *plies = ply ? ply->data() : nullptr;
+        with_planes(buf, [&](auto *data) {
+          py::gil_scoped_release release;
+          planes::encode_batch(boards.data(), to_move.data(), plies, static_cast<std::size_t>(n), max_ply, data);
+        });
+        return buf;
+      },
+      py::arg("boards"), py::arg("to_move"), py::arg("ply") = py::none(), py::arg("out") = py::none(),
+      py::arg("dtype") = "float32", py::arg("max_ply") = MAX_GAME_PLY, R"pbdoc(
+        encode_planes for (N, 36) or (N, 6, 6) uint8 boards (e.g. BatchEngine or MCTS evaluator
+        observations) and (N,) side-to-move flags; returns (N, NUM_PLANES, BOARD_N, BOARD_N).
+        Without ply the ply planes are 0.
+      )pbdoc");
 
   // ---- Enums
   py::enum_<MoveType>(m, "MoveType", R"pbdoc(
@@ -39,6 +466,21 @@ PYBIND11_MODULE(_ccore, m) {
       .value("Special", MoveType::Special)
       .export_values();
 
+  py::enum_<Outcome>(m, "Outcome", R"pbdoc(
+    Game result:
+      - Ongoing
+      - Player0Wins (player 1's king was captured or, in strict legality, mated)
+      - Player1Wins (player 0's king was captured or, in strict legality, mated)
+      - Draw (ply limit reached, stalemate in strict legality, or a tablebase position that is
+        drawn or whose win takes more plies than max_ply leaves)
+    With a tablebase, covered positions are adjudicated at once by their exact result.
+  )pbdoc")
+      .value("Ongoing", Outcome::Ongoing)
+      .value("Player0Wins", Outcome::Player0Wins)
+      .value("Player1Wins", Outcome::Player1Wins)
+      .value("Draw", Outcome::Draw)
+      .export_values();
+
   // ---- PODs
   py::class_<Move>(m, "Move", R"pbdoc(A move from one square to another.)pbdoc")
       .def(py::init<>())
@@ -46,43 +488,519 @@ PYBIND11_MODULE(_ccore, m) {
       .def_readwrite("to", &Move::to, R"pbdoc(Destination square index.)pbdoc")
       .def_readwrite("type", &Move::type, R"pbdoc(MoveType.)pbdoc")
       .def_readwrite("promo_piece", &Move::promo_piece, R"pbdoc(Encoded piece::Code for promotions.)pbdoc")
-      .def_readwrite("special_code", &Move::special_code, R"pbdoc(16-bit payload for special moves.)pbdoc");
+      .def_readwrite("special_code", &Move::special_code, R"pbdoc(16-bit payload for special moves.)pbdoc")
+      .def(py::pickle([](const Move &mv) { return py::make_tuple(mv.from, mv.to, mv.type, mv.promo_piece, mv.special_code); },
+                      [](const py::tuple &t) {
+                        if (t.size() != 5)
+                          throw std::runtime_error("invalid Move pickle");
+                        return Move{t[0].cast<Square>(), t[1].cast<Square>(), t[2].cast<MoveType>(), t[3].cast<piece::Code>(),
+                                    t[4].cast<std::uint16_t>()};
+                      }));
+
+  py::class_<UndoRecord>(m, "UndoRecord", R"pbdoc(Opaque record returned by Engine.make_move.)pbdoc")
+      .def_readonly("move", &UndoRecord::move, R"pbdoc(The move that was made.)pbdoc")
+      .def_readonly("moved", &UndoRecord::moved, R"pbdoc(Piece code that stood on the source square.)pbdoc")
+      .def_readonly("captured", &UndoRecord::captured, R"pbdoc(Piece code that stood on the destination square.)pbdoc");
 
   py::class_<StepResult>(m, "StepResult", R"pbdoc(Result of applying a move.)pbdoc")
       .def(py::init<>())
       .def_readwrite("state", &StepResult::state, R"pbdoc(State of board after the step)pbdoc")
       .def_readwrite("done", &StepResult::done, R"pbdoc(True if terminal.)pbdoc")
       .def_readwrite("reward_p0", &StepResult::reward_p0, R"pbdoc(Reward from player-0's perspective.)pbdoc")
-      .def_readwrite("info", &StepResult::info, R"pbdoc(Optional info/debug string.)pbdoc");
+      .def_readwrite("info", &StepResult::info, R"pbdoc(Optional info/debug string.)pbdoc")
+      .def(py::pickle([](const StepResult &r) { return py::make_tuple(state_to_bytes(r.state), r.done, r.reward_p0, r.info); },
+                      [](const py::tuple &t) {
+                        if (t.size() != 4)
+                          throw std::runtime_error("invalid StepResult pickle");
+                        return StepResult{state_from_buffer(t[0]), t[1].cast<bool>(), t[2].cast<int>(), t[3].cast<std::string>()};
+                      }));
+
+  py::class_<SearchResult>(m, "SearchResult", R"pbdoc(Result of Engine.search.)pbdoc")
+      .def_readonly("best_move", &SearchResult::best_move, R"pbdoc(Best move found (valid only if has_move).)pbdoc")
+      .def_readonly("has_move", &SearchResult::has_move, R"pbdoc(False if the game is over or there are no moves.)pbdoc")
+      .def_readonly("score", &SearchResult::score, R"pbdoc(Score for the side to move, in centipawns.)pbdoc")
+      .def_readonly("depth", &SearchResult::depth, R"pbdoc(Deepest fully completed iteration.)pbdoc")
+      .def_readonly("nodes", &SearchResult::nodes, R"pbdoc(Nodes visited.)pbdoc")
+      .def_readonly("pv", &SearchResult::pv, R"pbdoc(Principal variation, starting with best_move.)pbdoc");
+
+  py::class_<PlayoutStats>(m, "PlayoutStats", R"pbdoc(Result of Engine.random_playouts, from the side to move's view.)pbdoc")
+      .def_readonly("playouts", &PlayoutStats::playouts, R"pbdoc(Games played.)pbdoc")
+      .def_readonly("wins", &PlayoutStats::wins, R"pbdoc(Games won by the side to move.)pbdoc")
+      .def_readonly("draws", &PlayoutStats::draws, R"pbdoc(Drawn games (ply limit, or a side without moves).)pbdoc")
+      .def_readonly("losses", &PlayoutStats::losses, R"pbdoc(Games lost by the side to move.)pbdoc")
+      .def_readonly("total_plies", &PlayoutStats::total_plies, R"pbdoc(Plies played over all games.)pbdoc")
+      .def_property_readonly("mean_length", &PlayoutStats::mean_length, R"pbdoc(Mean plies per game.)pbdoc")
+      .def_property_readonly("mean_score", &PlayoutStats::mean_score, R"pbdoc(Mean result in [-1, 1].)pbdoc");
+
+  py::class_<VersusStep>(m, "VersusStep", R"pbdoc(Result of Opponent.play.)pbdoc")
+      .def_readonly("done", &VersusStep::done, R"pbdoc(True if the agent's move or the reply ended the game.)pbdoc")
+      .def_readonly("reward_p0", &VersusStep::reward_p0, R"pbdoc(Result from player 0's view once done, else 0.)pbdoc")
+      .def_readonly("replied", &VersusStep::replied, R"pbdoc(True if the opponent moved.)pbdoc")
+      .def_readonly("reply", &VersusStep::reply, R"pbdoc(The opponent's move (valid if replied).)pbdoc");
 
-  py::class_<State>(m, "State", R"pbdoc(Complete game state.)pbdoc")
+  py::class_<MctsResult>(m, "MctsResult", R"pbdoc(Result of Engine.mcts.)pbdoc")
+      .def_property_readonly(
+          "visits",
+          [](const MctsResult &r) {
+            return py::array_t<std::uint32_t>({static_cast<py::ssize_t>(r.visits.size())}, r.visits.data());
+          },
+          R"pbdoc((NUM_ACTIONS,) uint32 visit count of each root action.)pbdoc")
+      .def_readonly("best_action", &MctsResult::best_action, R"pbdoc(Most visited root action; -1 if the root is terminal.)pbdoc")
+      .def_readonly("root_value", &MctsResult::root_value, R"pbdoc(Mean backed-up value for the side to move.)pbdoc")
+      .def_readonly("simulations", &MctsResult::simulations, R"pbdoc(Simulations completed.)pbdoc")
+      .def_readonly("evaluator_calls", &MctsResult::evaluator_calls, R"pbdoc(Evaluator invocations, root included.)pbdoc");
+
+  py::class_<State>(m, "State", py::buffer_protocol(), R"pbdoc(Complete game state.)pbdoc")
       .def(py::init<>())
-      .def_readwrite("board", &State::board, R"pbdoc(Flat array of length BOARD_N*BOARD_N with piece codes.)pbdoc")
-      .def_readwrite("to_move", &State::to_move, R"pbdoc(Player to move: 0 or 1.)pbdoc")
-      .def_readwrite("ply", &State::ply, R"pbdoc(Half-move count.)pbdoc");
+      // Buffer protocol: memoryview(state) / np.asarray(state) alias the board bytes, read-only.
+      .def_buffer([](State &s) {
+        return py::buffer_info(s.board.data(), sizeof(piece::Code), py::format_descriptor<piece::Code>::format(), 1,
+                               {BOARD_N * BOARD_N}, {sizeof(piece::Code)}, /*readonly=*/true);
+      })
+      // board/to_move setters keep the Zobrist key in sync with hand-made positions.
+      .def_property(
+          "board", [](py::object self) { return numpy_view(self.cast<State &>().board.data(), {BOARD_N * BOARD_N}, self); },
+          [](State &s, const std::array<piece::Code, BOARD_N * BOARD_N> &board) {
+            s.board = board;
+            refresh_derived(s);
+          },
+          R"pbdoc(
+            Read-only uint8 NumPy view (length BOARD_N*BOARD_N) of the piece codes; it aliases
+            the state, so it follows later moves. Assigning a sequence copies it in.
+          )pbdoc")
+      .def(
+          "board_view",
+          [](py::object self, bool writable) {
+            return numpy_view(self.cast<State &>().board.data(), {BOARD_N * BOARD_N}, self, writable);
+          },
+          py::arg("writable") = false, R"pbdoc(
+            NumPy view of the board; with writable=True edits go straight into the state.
+            Call refresh_derived() after editing so the hash matches the new position.
+          )pbdoc")
+      .def("refresh_derived", &refresh_derived,
+           R"pbdoc(Recompute hash, king squares and piece counts after editing board_view(writable=True).)pbdoc")
+      .def_property(
+          "to_move", [](const State &s) { return s.to_move; },
+          [](State &s, Player p) {
+            check_player(p, "to_move");
+            s.to_move = p;
+            refresh_derived(s);
+          },
+          R"pbdoc(Player to move: 0 or 1 (anything else raises ValueError).)pbdoc")
+      .def_readwrite("ply", &State::ply, R"pbdoc(Half-move count.)pbdoc")
+      .def_readonly("hash", &State::hash, R"pbdoc(64-bit Zobrist key of board and side to move (ply excluded).)pbdoc")
+      .def_property_readonly(
+          "king_squares",
+          [](const State &s) {
+            auto square = [](Square sq) { return sq == NO_SQUARE ? py::object(py::none()) : py::object(py::int_(sq)); };
+            return py::make_tuple(square(s.king_sq[0]), square(s.king_sq[1]));
+          },
+          R"pbdoc((player 0, player 1) king squares; None once that king has been captured.)pbdoc")
+      .def_property_readonly(
+          "piece_counts", [](py::object self) { return numpy_view(self.cast<State &>().counts[0].data(), {2, 8}, self); },
+          R"pbdoc(Read-only (2, 8) uint8 view: pieces on the board per [player][UnitType].)pbdoc")
+      .def("to_bytes", &state_to_bytes, R"pbdoc(PACKED_STATE_SIZE-byte record: board, side to move, ply (LE uint32).)pbdoc")
+      .def_static("from_bytes", &state_from_buffer, py::arg("data"),
+                  R"pbdoc(State from a to_bytes record (any bytes-like object); derived fields are recomputed.)pbdoc")
+      .def(py::pickle(&state_to_bytes, [](const py::bytes &data) { return state_from_buffer(data); }))
+      .def(py::self == py::self)
+      .def(py::self != py::self)
+      .def("__hash__", [](const State &s) { return s.hash; });
+
+  // ---- Endgame tablebases
+  m.attr("MAX_TABLEBASE_PIECES") = MAX_TABLEBASE_PIECES;
+
+  py::class_<TablebaseSummary>(m, "TablebaseSummary", R"pbdoc(Counts reported by generate_tablebase.)pbdoc")
+      .def_readonly("tables", &TablebaseSummary::tables, R"pbdoc(Material signatures solved.)pbdoc")
+      .def_readonly("positions", &TablebaseSummary::positions, R"pbdoc(Positions stored (one per symmetry class).)pbdoc")
+      .def_readonly("wins", &TablebaseSummary::wins, R"pbdoc(Positions won by the side to move.)pbdoc")
+      .def_readonly("draws", &TablebaseSummary::draws)
+      .def_readonly("losses", &TablebaseSummary::losses)
+      .def_readonly("longest", &TablebaseSummary::longest, R"pbdoc(Longest decisive distance, in plies.)pbdoc")
+      .def_readonly("bytes", &TablebaseSummary::bytes, R"pbdoc(Size of the written file.)pbdoc");
+
+  m.def("generate_tablebase", &generate_tablebase, py::arg("path"), py::arg("max_pieces") = 3, py::arg("strict_legality") = false,
+        py::arg("n_threads") = 0, release_gil(), R"pbdoc(
+        Solve every position with at most max_pieces pieces (kings included) by retrograde
+        analysis and write the tables to path; returns a TablebaseSummary. Three pieces take
+        well under a second; four take minutes and about 46 MB (see chess_engine_tbgen).
+      )pbdoc");
+
+  py::class_<Tablebase, std::shared_ptr<Tablebase>>(m, "Tablebase", R"pbdoc(
+    Memory-mapped endgame tables written by generate_tablebase. Attach one to an Engine or
+    BatchEngine (tablebase=...) to end covered positions with their exact result.
+  )pbdoc")
+      .def(py::init<const std::string &>(), py::arg("path"))
+      .def(
+          "probe", [](const Tablebase &tb, const State &s) { return entry_to_python(tb.probe(s)); }, py::arg("state"), R"pbdoc(
+            (result, plies) for state from the side to move's view (result +1/0/-1, plies to the end
+            of the game with best play, ply limit ignored), or None if the tables do not cover it.
+          )pbdoc")
+      .def_property_readonly("max_pieces", &Tablebase::max_pieces)
+      .def_property_readonly("strict_legality", &Tablebase::strict_legality,
+                             R"pbdoc(Rule set the tables were solved under; must match the Engine's.)pbdoc")
+      .def_property_readonly("path", &Tablebase::path);
 
   // ---- Engine
-  py::class_<Engine>(m, "Engine", R"pbdoc(Stateless rule engine.)pbdoc")
-      .def(py::init<>())
+  py::class_<Engine>(m, "Engine", R"pbdoc(Stateless rule engine; one instance may be shared across threads.)pbdoc")
+      .def(py::init([](std::uint32_t max_ply, bool strict_legality, std::shared_ptr<Tablebase> tablebase) {
+             return Engine(make_config(max_ply, strict_legality, std::move(tablebase)));
+           }),
+           py::arg("max_ply") = MAX_GAME_PLY, py::arg("strict_legality") = false, py::arg("tablebase") = py::none(), R"pbdoc(
+            Games are drawn once max_ply half-moves were played. With strict_legality, moves that
+            leave the mover's king attacked are not generated and games end in checkmate/stalemate.
+            With a tablebase, positions it covers end at once with their exact result (a win
+            that needs more plies than remain is a draw); raises ValueError if its rules differ.
+          )pbdoc")
+      .def_property_readonly("max_ply", &Engine::max_ply)
+      .def_property_readonly("strict_legality", [](const Engine &e) { return e.config().strict_legality; })
+      .def_property_readonly(
+          "tablebase", [](const Engine &e) { return std::const_pointer_cast<Tablebase>(e.config().tablebase); },
+          R"pbdoc(The attached Tablebase, or None.)pbdoc")
+      .def(
+          "probe_tablebase", [](const Engine &e, const State &s) { return entry_to_python(e.probe_tablebase(s)); },
+          py::arg("state"), R"pbdoc(Tablebase.probe(state) on the attached tables; None without them.)pbdoc")
 
-      .def("initial_state", &Engine::initial_state, R"pbdoc(Return a fresh initial state.)pbdoc")
+      .def("initial_state", &Engine::initial_state, release_gil(), R"pbdoc(Return a fresh initial state.)pbdoc")
 
-      .def("legal_moves", &Engine::legal_moves, py::arg("state"), R"pbdoc(Return all legal moves for the side to move.)pbdoc")
+      .def("legal_moves", py::overload_cast<const State &>(&Engine::legal_moves, py::const_), py::arg("state"), release_gil(),
+           R"pbdoc(Return all legal moves for the side to move.)pbdoc")
 
-      .def("legal_moves_from", &Engine::legal_moves_from, py::arg("state"), py::arg("from_"),
-           R"pbdoc(Return legal moves originating from a specific square.)pbdoc")
+      .def(
+          "legal_moves_from",
+          [](const Engine &e, const State &s, Square from) {
+            check_square(from, "from_");
+            py::gil_scoped_release release;
+            return e.legal_moves_from(s, from);
+          },
+          py::arg("state"), py::arg("from_"), R"pbdoc(Return legal moves originating from a specific square.)pbdoc")
 
-      .def("group_legal_moves_by_from", &Engine::group_legal_moves_by_from, py::arg("state"),
+      .def("group_legal_moves_by_from", &Engine::group_legal_moves_by_from, py::arg("state"), release_gil(),
            R"pbdoc(Return a list (size BOARD_N*BOARD_N) of move lists, indexed by 'from' square.)pbdoc")
 
-      .def("is_legal", &Engine::is_legal, py::arg("state"), py::arg("move"),
-           R"pbdoc(Check if a move is legal in the given state.)pbdoc")
+      .def(
+          "is_legal",
+          [](const Engine &e, const State &s, const Move &m) {
+            check_move_squares(m);
+            py::gil_scoped_release release;
+            return e.is_legal(s, m);
+          },
+          py::arg("state"), py::arg("move"), R"pbdoc(Check if a move is legal in the given state.)pbdoc")
+
+      .def(
+          "legal_action_mask",
+          [](const Engine &e, const State &s, const py::object &out) {
+            py::array mask = mask_buffer(out, "out");
+            auto *data = static_cast<std::int8_t *>(mask.mutable_data());
+            {
+              py::gil_scoped_release release;
+              e.legal_action_mask(s, data);
+            }
+            return mask;
+          },
+          py::arg("state"), py::arg("out") = py::none(), R"pbdoc(
+            Legal-action mask of state under the canonical action encoding (see encode_action):
+            1 at legal action ids, 0 elsewhere. Written into out (a writable, C-contiguous int8
+            ndarray of shape (NUM_ACTIONS,), else TypeError) if given, else into a new int8 array;
+            returns the mask.
+          )pbdoc")
+
+      .def(
+          "apply_move",
+          [](const Engine &e, State &s, const Move &m) {
+            check_move_squares(m);
+            py::gil_scoped_release release;
+            return e.apply_move(s, m);
+          },
+          py::arg("state"), py::arg("move"), R"pbdoc(Apply move to state in-place; returns StepResult.)pbdoc")
+
+      .def(
+          "apply_move_unchecked",
+          [](const Engine &e, State &s, const Move &m) {
+            check_move_squares(m);
+            py::gil_scoped_release release;
+            return e.apply_move_unchecked(s, m);
+          },
+          py::arg("state"), py::arg("move"), R"pbdoc(
+            Like apply_move but skips the legality check; only pass moves from legal_moves(state).
+            Squares are still range-checked (ValueError).
+          )pbdoc")
+
+      .def(
+          "make_move",
+          [](const Engine &e, State &s, const Move &m) {
+            check_move_squares(m);
+            py::gil_scoped_release release;
+            return e.make_move(s, m);
+          },
+          py::arg("state"), py::arg("move"), R"pbdoc(
+            Apply a trusted move in-place without legality/terminal checks; returns an UndoRecord.
+            Squares are still range-checked (ValueError).
+          )pbdoc")
+
+      .def("unmake_move", &Engine::unmake_move, py::arg("state"), py::arg("undo"), release_gil(),
+           R"pbdoc(Revert the most recent make_move on state.)pbdoc")
+
+      .def("outcome", py::overload_cast<const State &>(&Engine::outcome, py::const_), py::arg("state"), release_gil(),
+           R"pbdoc(Game result of state; O(1) unless strict_legality, which also checks for mate/stalemate.)pbdoc")
+      .def("is_terminal", &Engine::is_terminal, py::arg("state"), release_gil(),
+           R"pbdoc(True if the game is over (king captured, mate/stalemate, ply limit).)pbdoc")
+      .def(
+          "attack_map",
+          [](const Engine &e, const State &s, Player by) {
+            check_player(by, "by");
+            const std::uint64_t attacks = e.attack_map(s, by);
+            py::array_t<bool> out(BOARD_N * BOARD_N);
+            for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq)
+              out.mutable_at(sq) = (attacks >> sq) & 1;
+            return out;
+          },
+          py::arg("state"), py::arg("by"), R"pbdoc((BOARD_N*BOARD_N,) bool array of the squares player by attacks.)pbdoc")
+      .def(
+          "is_square_attacked",
+          [](const Engine &e, const State &s, Square square, Player by) {
+            check_square(square, "square");
+            check_player(by, "by");
+            py::gil_scoped_release release;
+            return e.is_square_attacked(s, square, by);
+          },
+          py::arg("state"), py::arg("square"), py::arg("by"), R"pbdoc(True if a piece of player by attacks square.)pbdoc")
+      .def(
+          "in_check",
+          [](const Engine &e, const State &s, Player side) {
+            check_player(side, "side");
+            py::gil_scoped_release release;
+            return e.in_check(s, side);
+          },
+          py::arg("state"), py::arg("side"), R"pbdoc(True if side's king is attacked (False if it has no king).)pbdoc")
+      .def("search", &Engine::search, py::arg("state"), py::arg("max_depth") = 4, py::arg("time_limit_ms") = 0, release_gil(),
+           R"pbdoc(Alpha-beta search from state (not modified); time_limit_ms <= 0 means no limit.)pbdoc")
+
+      .def("random_playouts", &Engine::random_playouts, py::arg("state"), py::arg("n_playouts"), py::arg("seed") = 0,
+           py::arg("n_threads") = 0, release_gil(), R"pbdoc(
+            Play n_playouts uniform-random games from state to completion in C++ (like RandomPolicy)
+            on n_threads threads (0 = all cores). Results depend only on seed, not on n_threads.
+          )pbdoc")
+
+      .def(
+          "mcts",
+          [](const Engine &e, const State &s, py::function evaluate, std::uint32_t num_simulations, std::uint32_t batch_size,
+             std::uint32_t num_threads, float c_puct, float virtual_loss, float dirichlet_alpha, float dirichlet_epsilon,
+             std::uint64_t seed) {
+            const MctsConfig config{num_simulations, batch_size,      num_threads,       c_puct,
+                                    virtual_loss,    dirichlet_alpha, dirichlet_epsilon, seed};
+            const LeafEvaluator evaluator = python_evaluator(std::move(evaluate));
+            py::gil_scoped_release release;
+            return e.mcts(s, evaluator, config);
+          },
+          py::arg("state"), py::arg("evaluate"), py::arg("num_simulations") = 800, py::arg("batch_size") = 16,
+          py::arg("num_threads") = 1, py::arg("c_puct") = 1.5f, py::arg("virtual_loss") = 1.0f, py::arg("dirichlet_alpha") = 0.3f,
+          py::arg("dirichlet_epsilon") = 0.0f, py::arg("seed") = 0, R"pbdoc(
+            AlphaZero-style MCTS from state with PUCT selection and virtual loss. Leaves are
+            evaluated in batches by evaluate(observations, action_masks, to_move), which gets
+            (B, BOARD_N, BOARD_N) uint8 boards and (B, NUM_ACTIONS) int8 masks as in the RL envs
+            plus (B,) side-to-move flags, and returns (priors (B, NUM_ACTIONS), values (B,)) with
+            values for the side to move. num_threads workers traverse the tree in parallel; the
+            GIL is held only while evaluate runs. dirichlet_epsilon > 0 mixes noise into the root priors.
+            Raises ValueError for a non-finite or negative c_puct or virtual_loss, a
+            dirichlet_epsilon outside [0, 1], or dirichlet_alpha <= 0 while noise is on.
+          )pbdoc")
 
-      .def("apply_move", &Engine::apply_move, py::arg("state"), py::arg("move"),
-           R"pbdoc(Apply move to state in-place; returns StepResult.)pbdoc")
+      .def("perft", &Engine::perft, py::arg("state"), py::arg("depth"), release_gil(),
+           R"pbdoc(Count leaf nodes depth plies below state; finished games are not expanded.)pbdoc")
 
+      .def("perft_divide", &Engine::perft_divide, py::arg("state"), py::arg("depth"), release_gil(),
+           R"pbdoc(perft per root move: list of (Move, count) in generation order.)pbdoc")
+
+      .def_static(
+          "stats",
+          []() {
+            const EngineStats stats = Engine::stats();
+            py::dict out;
+            for (int p = 0; p < NUM_STAT_PROBES; ++p) {
+              const ProbeStats &c = stats.probes[p];
+              py::dict probe;
+              probe["calls"] = c.calls;
+              probe["moves"] = c.moves;
+              probe["nanoseconds"] = c.nanoseconds;
+              probe["allocations"] = c.allocations;
+              out[STAT_PROBE_NAMES[p]] = probe;
+            }
+            return out;
+          },
+          R"pbdoc(
+            Process-wide hot-path counters: {probe: {calls, moves, nanoseconds, allocations}} for
+            legal_moves, legal_moves_from, is_legal, apply_move, make_move, movegen (bitboard
+            generator) and unit_generate. Times are inclusive. All zero unless STATS_ENABLED (build
+            with -DCHESS_ENGINE_STATS=ON); compare with Python-side timings to locate overhead.
+          )pbdoc")
+      .def_static("reset_stats", &Engine::reset_stats, R"pbdoc(Zero the counters returned by stats().)pbdoc")
       .def_static("get_pos", &Engine::get_pos, py::arg("row"), py::arg("col"),
                   R"pbdoc(Convert (row, col) to flat square index.)pbdoc")
       .def_static("row", &Engine::row, py::arg("idx"), R"pbdoc(Row from flat square index.)pbdoc")
       .def_static("col", &Engine::col, py::arg("idx"), R"pbdoc(Col from flat square index.)pbdoc");
+
+  // ---- BatchEngine
+  py::class_<BatchEngine>(m, "BatchEngine", R"pbdoc(
+    N independent games stepped together; observations, masks, rewards and dones
+    are read-only NumPy views of buffers that each step() overwrites in place. A game
+    whose side to move has no legal move ends as a draw, so every mask row has a legal
+    action.
+  )pbdoc")
+      .def(py::init([](std::size_t num_envs, std::uint64_t seed, std::uint32_t max_ply, bool strict_legality,
+                       std::shared_ptr<Tablebase> tablebase) {
+             return std::make_unique<BatchEngine>(num_envs, seed, make_config(max_ply, strict_legality, std::move(tablebase)));
+           }),
+           py::arg("num_envs"), py::arg("seed") = 0, py::arg("max_ply") = MAX_GAME_PLY, py::arg("strict_legality") = false,
+           py::arg("tablebase") = py::none())
+      .def_property_readonly("num_envs", &BatchEngine::num_envs)
+
+      .def(
+          "reset",
+          [](py::object self) {
+            self.cast<BatchEngine &>().reset();
+            return py::make_tuple(self.attr("observations"), self.attr("action_masks"));
+          },
+          R"pbdoc(Reset every game; returns (observations, action_masks).)pbdoc")
+
+      .def(
+          "step",
+          [](py::object self, py::array_t<std::int64_t, py::array::c_style | py::array::forcecast> actions) {
+            BatchEngine &be = self.cast<BatchEngine &>();
+            if (actions.ndim() != 1 || static_cast<std::size_t>(actions.shape(0)) != be.num_envs())
+              throw py::value_error("actions must have shape (num_envs,)");
+            {
+              py::gil_scoped_release release;
+              be.step(actions.data());
+            }
+            return py::make_tuple(self.attr("observations"), self.attr("action_masks"), self.attr("rewards"), self.attr("dones"));
+          },
+          py::arg("actions"), R"pbdoc(
+            Apply one action id per game; finished games restart from the initial position.
+            Returns (observations, action_masks, rewards, dones). Raises ValueError, without
+            changing any game, if an action is illegal.
+          )pbdoc")
+
+      .def(
+          "random_actions",
+          [](py::object self) {
+            BatchEngine &be = self.cast<BatchEngine &>();
+            const std::int64_t *actions;
+            {
+              py::gil_scoped_release release;
+              actions = be.random_actions();
+            }
+            return numpy_view(actions, {static_cast<py::ssize_t>(be.num_envs())}, self);
+          },
+          R"pbdoc(One uniformly random legal action per game, drawn from the engine's seeded RNG (reused buffer).)pbdoc")
+
+      .def_property_readonly(
+          "observations",
+          [](py::object self) {
+            const BatchEngine &be = self.cast<const BatchEngine &>();
+            return numpy_view(be.boards(), {static_cast<py::ssize_t>(be.num_envs()), BOARD_N, BOARD_N}, self);
+          },
+          R"pbdoc((N, BOARD_N, BOARD_N) uint8 piece codes.)pbdoc")
+      .def_property_readonly(
+          "to_move",
+          [](py::object self) {
+            const BatchEngine &be = self.cast<const BatchEngine &>();
+            return numpy_view(be.to_move(), {static_cast<py::ssize_t>(be.num_envs())}, self);
+          },
+          R"pbdoc((N,) uint8 side to move.)pbdoc")
+      .def_property_readonly(
+          "ply",
+          [](py::object self) {
+            const BatchEngine &be = self.cast<const BatchEngine &>();
+            return numpy_view(be.ply(), {static_cast<py::ssize_t>(be.num_envs())}, self);
+          },
+          R"pbdoc((N,) uint32 half-move counters.)pbdoc")
+      .def_property_readonly(
+          "action_masks",
+          [](py::object self) {
+            const BatchEngine &be = self.cast<const BatchEngine &>();
+            return numpy_view(be.action_masks(), {static_cast<py::ssize_t>(be.num_envs()), action::NUM_ACTIONS}, self);
+          },
+          R"pbdoc((N, NUM_ACTIONS) int8 legal-action masks.)pbdoc")
+      .def_property_readonly(
+          "rewards",
+          [](py::object self) {
+            const BatchEngine &be = self.cast<const BatchEngine &>();
+            return numpy_view(be.rewards(), {static_cast<py::ssize_t>(be.num_envs())}, self);
+          },
+          R"pbdoc((N,) float32 player-0 rewards of the last step.)pbdoc")
+      .def_property_readonly(
+          "dones",
+          [](py::object self) {
+            const BatchEngine &be = self.cast<const BatchEngine &>();
+            return numpy_view(be.dones(), {static_cast<py::ssize_t>(be.num_envs())}, self, false, py::dtype::of<bool>());
+          },
+          R"pbdoc((N,) bool, True where the last step ended the game.)pbdoc")
+
+      .def(
+          "get_state",
+          [](const BatchEngine &be, std::size_t i) {
+            if (i >= be.num_envs())
+              throw py::index_error("game index out of range");
+            return be.get_state(i);
+          },
+          py::arg("index"), R"pbdoc(Copy of game index as a State.)pbdoc")
+      .def(
+          "final_state",
+          [](const BatchEngine &be, std::size_t i) {
+            if (i >= be.num_envs())
+              throw py::index_error("game index out of range");
+            return be.final_state(i);
+          },
+          py::arg("index"), R"pbdoc(
+            Copy of game index as the last step ended it, before the auto-reset; only
+            meaningful where dones[index] is True.
+          )pbdoc")
+      .def(
+          "set_state",
+          [](BatchEngine &be, std::size_t i, const State &s) {
+            if (i >= be.num_envs())
+              throw py::index_error("game index out of range");
+            be.set_state(i, s);
+          },
+          py::arg("index"), py::arg("state"), R"pbdoc(
+            Overwrite game index with state. A finished position, or one where the side to
+            move has no legal move (a draw), ends the game at once: dones, rewards and
+            final_state report it and the game restarts.
+          )pbdoc");
+
+  py::class_<Opponent>(m, "Opponent", R"pbdoc(
+    Fixed policy that answers an agent's move inside the engine, selected by name:
+      - "random": uniformly random legal move
+      - "greedy": captures the most valuable piece it can (the king first), else random
+      - "search": Engine.search to search_depth / time_limit_ms
+    Deterministic given its seed. Not thread-safe: give each thread its own.
+  )pbdoc")
+      .def(py::init([](const std::string &kind, int search_depth, int time_limit_ms, std::uint64_t seed) {
+             return Opponent(OpponentConfig{parse_opponent_kind(kind), search_depth, time_limit_ms, seed});
+           }),
+           py::arg("kind") = "random", py::arg("search_depth") = 2, py::arg("time_limit_ms") = 0, py::arg("seed") = 0,
+           R"pbdoc(Raises ValueError for an unknown kind.)pbdoc")
+      .def_property_readonly("kind", [](const Opponent &o) { return opponent_kind_name(o.config().kind); })
+      .def_property_readonly("search_depth", [](const Opponent &o) { return o.config().search_depth; })
+      .def_property_readonly("time_limit_ms", [](const Opponent &o) { return o.config().time_limit_ms; })
+      .def("seed", &Opponent::seed, py::arg("seed"), R"pbdoc(Restart the random stream.)pbdoc")
+      .def("select", &Opponent::select, py::arg("engine"), py::arg("state"), release_gil(),
+           R"pbdoc(The opponent's move for the side to move in state, or None if it has none.)pbdoc")
+      .def(
+          "play",
+          [](Opponent &o, const Engine &e, State &s, const Move &agent_move, const py::object &mask) {
+            std::int8_t *data = nullptr;
+            if (!mask.is_none())
+              data = static_cast<std::int8_t *>(mask_buffer(mask, "mask").mutable_data());
+            py::gil_scoped_release release;
+            return o.play(e, s, agent_move, data);
+          },
+          py::arg("engine"), py::arg("state"), py::arg("move"), py::arg("mask") = py::none(), R"pbdoc(
+            Apply the agent's move to state in place and, unless that ended the game, the
+            opponent's reply; returns a VersusStep. A side left without legal moves ends the
+            game as a draw. If mask (like legal_action_mask's out) is given it receives the
+            legal-action mask the agent faces next, all zero once done. Raises ValueError,
+            without changing state, if move is illegal.
+          )pbdoc");
 }
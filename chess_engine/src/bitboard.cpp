@@ -0,0 +1,67 @@
+#include "chess/bitboard.hpp"
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+
+namespace engine {
+
+namespace {
+
+bool on_board(int row, int col) {
+  return row >= 0 && row < BOARD_N && col >= 0 && col < BOARD_N;
+}
+
+/** @brief Union of single-step targets from `sq` for the given offsets. */
+template <std::size_t N> Bitboard step_targets(int sq, const std::array<Vec2, N> &offsets) {
+  Bitboard out = 0;
+  const int row = Engine::row(sq);
+  const int col = Engine::col(sq);
+  for (Vec2 d : offsets) {
+    if (on_board(row + d.row, col + d.col))
+      out |= bb::square(Engine::get_pos(row + d.row, col + d.col));
+  }
+  return out;
+}
+
+AttackTables build_attack_tables() {
+  AttackTables t;
+
+  constexpr std::array<Vec2, 8> knight_jumps = {{{-2, -1}, {-2, 1}, {-1, -2}, {-1, 2}, {1, -2}, {1, 2}, {2, -1}, {2, 1}}};
+
+  for (int sq = 0; sq < NUM_SQUARES; ++sq) {
+    t.knight[sq] = step_targets(sq, knight_jumps);
+    t.king[sq] = step_targets(sq, DIRECTION_VECTORS);
+
+    // P1 (player 0) moves towards row 0, P2 (player 1) towards row BOARD_N - 1.
+    for (int player = 0; player < 2; ++player) {
+      const int dir = (player == 0) ? -1 : +1;
+      t.pawn_push[player][sq] = step_targets(sq, std::array<Vec2, 1>{{{dir, 0}}});
+      t.pawn_attacks[player][sq] = step_targets(sq, std::array<Vec2, 2>{{{dir, 1}, {dir, -1}}});
+    }
+
+    for (int d = 0; d < NUM_DIRECTIONS; ++d) {
+      Bitboard ray = 0;
+      int row = Engine::row(sq) + DIRECTION_VECTORS[d].row;
+      int col = Engine::col(sq) + DIRECTION_VECTORS[d].col;
+      while (on_board(row, col)) {
+        ray |= bb::square(Engine::get_pos(row, col));
+        row += DIRECTION_VECTORS[d].row;
+        col += DIRECTION_VECTORS[d].col;
+      }
+      t.rays[d][sq] = ray;
+    }
+  }
+  return t;
+}
+
+// Build the tables during static initialisation so the first move generation does not pay for it.
+[[maybe_unused]] const AttackTables &warm_tables = attack_tables();
+
+} // namespace
+
+const AttackTables &attack_tables() {
+  static const AttackTables tables = build_attack_tables();
+  return tables;
+}
+
+} // namespace engine
@@ -1,15 +1,26 @@
 #include "chess/engine.hpp"
 
+#include "chess/attacks.hpp"
+#include "chess/bitboard.hpp"
 #include "chess/move.hpp"
+#include "chess/movegen.hpp"
 #include "chess/piece.hpp"
 #include "chess/state.hpp"
-#include "units/factory.hpp"
-#include "units/unit.hpp"
+#include "chess/stats.hpp"
+#include "chess/tablebase.hpp"
+#include "chess/zobrist.hpp"
 
 #include <algorithm>
+#include <stdexcept>
 
 namespace engine {
 
+Engine::Engine(EngineConfig config) : config_(std::move(config)) {
+  if (config_.tablebase && config_.tablebase->strict_legality() != config_.strict_legality)
+    throw std::invalid_argument("tablebase " + config_.tablebase->path() +
+                                " was solved with strict_legality=" + (config_.tablebase->strict_legality() ? "true" : "false"));
+}
+
 /**
  * @brief Set the initial state for the chess board.
  *
@@ -51,67 +62,149 @@ State Engine::initial_state() const {
 
   s.to_move = 0; // P1 starts
   s.ply = 0;
+  refresh_derived(s);
   return s;
 }
 
 std::vector<Move> Engine::legal_moves_from(const State &s, Square from) const {
-  std::vector<Move> out;
-  if (from >= BOARD_N * BOARD_N)
-    return out;
-
-  const piece::Code pc = s.board[from];
-  if (piece::is_empty(pc))
-    return out;
-
-  const Player side = s.to_move;
-  const bool belongs_to_side = (side == 0) ? piece::is_p1(pc) : piece::is_p2(pc);
-  if (!belongs_to_side)
-    return out;
-
-  auto unit = make_unit_from_code(pc);
-  if (!unit)
-    return out;
-
-  out = unit->get_legal_moves(s, from);
+  MoveList list;
+  legal_moves_from(s, from, list);
+  count_allocation(STAT_LEGAL_MOVES_FROM);
+  return std::vector<Move>(list.begin(), list.end());
+}
 
-  // (Optional) If your unit code produces pseudo-legal moves, you could
-  // filter here (e.g., remove moves that leave king in check).
-  return out;
+void Engine::legal_moves_from(const State &s, Square from, MoveList &out) const {
+  StatScope probe(STAT_LEGAL_MOVES_FROM);
+  out.clear();
+  generate_moves_from(s, from, out);
+  if (config_.strict_legality)
+    remove_self_checks(s, out);
+  probe.moves(out.size());
 }
 
 std::array<std::vector<Move>, BOARD_N * BOARD_N> Engine::group_legal_moves_by_from(const State &s) const {
+  // One generation pass; only squares that actually have moves get a vector.
+  MoveList list;
+  legal_moves(s, list);
+
   std::array<std::vector<Move>, BOARD_N * BOARD_N> buckets;
-  for (int idx = 0; idx < BOARD_N * BOARD_N; ++idx) {
-    buckets[idx] = legal_moves_from(s, idx);
+  for (const Move &m : list) {
+    buckets[m.from].push_back(m);
   }
   return buckets;
 }
 
 std::vector<Move> Engine::legal_moves(const State &s) const {
-  std::vector<Move> moves;
-  moves.reserve(64); // small pre-reserve
+  MoveList list;
+  legal_moves(s, list);
+  count_allocation(STAT_LEGAL_MOVES);
+  return std::vector<Move>(list.begin(), list.end());
+}
+
+void Engine::legal_moves(const State &s, MoveList &out) const {
+  StatScope probe(STAT_LEGAL_MOVES);
+  out.clear();
+  generate_moves(s, out);
+  if (config_.strict_legality)
+    remove_self_checks(s, out);
+  probe.moves(out.size());
+}
+
+namespace {
 
-  for (int idx = 0; idx < BOARD_N * BOARD_N; ++idx) {
-    const piece::Code pc = s.board[idx];
-    if (piece::is_empty(pc))
-      continue;
+/** @brief Result decided by the king squares alone, or Ongoing. */
+Outcome king_outcome(const State &s) {
+  const bool king0 = s.king_sq[0] != NO_SQUARE;
+  const bool king1 = s.king_sq[1] != NO_SQUARE;
+  if (!king1)
+    return king0 ? Outcome::Player0Wins : Outcome::Draw;
+  if (!king0)
+    return Outcome::Player1Wins;
+  return Outcome::Ongoing;
+}
+
+/** @brief Tablebase adjudication, then the ply limit, for a game with both kings and a move to make. */
+Outcome adjudicate(const Engine &engine, const State &s) {
+  if (const std::optional<TablebaseEntry> e = engine.probe_tablebase(s)) {
+    if (e->result == 0 || s.ply + e->plies > engine.max_ply())
+      return Outcome::Draw; // the winner cannot force the king capture (or mate) in time
+    return (e->result > 0) == (s.to_move == 0) ? Outcome::Player0Wins : Outcome::Player1Wins;
+  }
+  return s.ply >= engine.max_ply() ? Outcome::Draw : Outcome::Ongoing;
+}
+
+/** @brief make_move, then the result of the game: apply_move after its legality check. */
+StepResult step(const Engine &engine, State &s, const Move &m) {
+  engine.make_move(s, m);
+
+  int reward_p0 = 0;
+  switch (engine.outcome(s)) {
+  case Outcome::Ongoing:
+    return StepResult{s, false, 0, std::string{}};
+  case Outcome::Player0Wins:
+    reward_p0 = +1;
+    break;
+  case Outcome::Player1Wins:
+    reward_p0 = -1;
+    break;
+  case Outcome::Draw:
+    break;
+  }
+  return StepResult{s, true, reward_p0, std::string{}};
+}
 
-    const bool is_ours = (s.to_move == 0) ? piece::is_p1(pc) : piece::is_p2(pc);
-    if (!is_ours)
-      continue;
+} // namespace
 
-    auto unit = make_unit_from_code(pc);
-    if (!unit)
-      continue;
+Outcome Engine::outcome(const State &s) const {
+  const Outcome o = king_outcome(s);
+  if (o != Outcome::Ongoing)
+    return o;
+  if (config_.strict_legality) {
+    MoveList legal;
+    legal_moves(s, legal);
+    return outcome(s, legal);
+  }
+  return adjudicate(*this, s);
+}
 
-    auto v = unit->get_legal_moves(s, idx);
-    moves.insert(moves.end(), v.begin(), v.end());
+Outcome Engine::outcome(const State &s, const MoveList &legal) const {
+  const Outcome o = king_outcome(s);
+  if (o != Outcome::Ongoing)
+    return o;
+  if (config_.strict_legality && legal.empty()) {
+    if (!in_check(s, s.to_move))
+      return Outcome::Draw; // stalemate
+    return s.to_move == 0 ? Outcome::Player1Wins : Outcome::Player0Wins;
   }
-  return moves;
+  return adjudicate(*this, s);
+}
+
+std::optional<TablebaseEntry> Engine::probe_tablebase(const State &s) const {
+  if (!config_.tablebase)
+    return std::nullopt;
+  return config_.tablebase->probe(s);
+}
+
+std::uint64_t Engine::attack_map(const State &s, Player by) const {
+  const Bitboards bbs = Bitboards::from_state(s);
+  return engine::attack_map(bbs, by, bbs.occupied());
+}
+
+bool Engine::is_square_attacked(const State &s, Square sq, Player by) const {
+  const Bitboards bbs = Bitboards::from_state(s);
+  return attackers_to(bbs, sq, by, bbs.occupied()) != 0;
+}
+
+bool Engine::in_check(const State &s, Player side) const {
+  return s.king_sq[side] != NO_SQUARE && is_square_attacked(s, s.king_sq[side], 1 - side);
 }
 
 bool Engine::is_legal(const State &s, const Move &m) const {
-  for (const Move &lm : legal_moves(s)) {
+  StatScope probe(STAT_IS_LEGAL);
+  // Only the piece on m.from can produce m.
+  MoveList list;
+  legal_moves_from(s, m.from, list);
+  for (const Move &lm : list) {
     if (lm.from == m.from && lm.to == m.to && lm.type == m.type && lm.promo_piece == m.promo_piece &&
         lm.special_code == m.special_code) {
       return true;
@@ -121,14 +214,20 @@ bool Engine::is_legal(const State &s, const Move &m) const {
 }
 
 StepResult Engine::apply_move(State &s, const Move &m) const {
-  const piece::Code moved = s.board[m.from];
-  const piece::Code dest = s.board[m.to];
-  (void)dest;
-
+  StatScope probe(STAT_APPLY_MOVE);
   // Checking if the move is legal or not
   if (!is_legal(s, m)) {
     return StepResult{s, false, 0, "Illegal"};
   }
+  probe.moves(1);
+  return step(*this, s, m);
+}
+
+UndoRecord Engine::make_move(State &s, const Move &m) const {
+  StatScope probe(STAT_MAKE_MOVE);
+  probe.moves(1);
+  const piece::Code moved = s.board[m.from];
+  const UndoRecord undo{m, moved, s.board[m.to], s.hash};
 
   Move move = m;
   move.type = Engine::deduce_move_type(s, m);
@@ -165,31 +264,50 @@ StepResult Engine::apply_move(State &s, const Move &m) const {
   }
   }
 
+  // Incremental hash: remove mover and captured piece, add whatever now stands on `to`.
+  const piece::Code placed = s.board[m.to];
+  s.hash ^= zobrist::piece_key(m.from, moved) ^ zobrist::piece_key(m.to, undo.captured) ^ zobrist::piece_key(m.to, placed) ^
+            zobrist::KEYS.side;
+
+  // Incremental counts and king squares: the mover becomes `placed` (differs on promotion).
+  s.counts[side_index(moved)][piece::unit_type(moved)] -= 1;
+  s.counts[side_index(placed)][piece::unit_type(placed)] += 1;
+  if (piece::unit_type(moved) == piece::KING)
+    s.king_sq[side_index(moved)] = m.to;
+  if (!piece::is_empty(undo.captured)) {
+    s.counts[side_index(undo.captured)][piece::unit_type(undo.captured)] -= 1;
+    if (piece::unit_type(undo.captured) == piece::KING)
+      s.king_sq[side_index(undo.captured)] = NO_SQUARE;
+  }
+
   s.ply += 1;
   s.to_move = 1 - s.to_move;
+  return undo;
+}
 
-  // Terminal check (kings missing or ply cap)
-  bool p1_king = false, p2_king = false;
-  for (piece::Code cell : s.board) {
-    if (!piece::is_empty(cell) && piece::unit_type(cell) == piece::KING) {
-      if (piece::is_p1(cell))
-        p1_king = true;
-      else
-        p2_king = true;
-    }
+void Engine::unmake_move(State &s, const UndoRecord &u) const {
+  const piece::Code placed = s.board[u.move.to];
+  s.counts[side_index(placed)][piece::unit_type(placed)] -= 1;
+  s.counts[side_index(u.moved)][piece::unit_type(u.moved)] += 1;
+  if (piece::unit_type(u.moved) == piece::KING)
+    s.king_sq[side_index(u.moved)] = u.move.from;
+  if (!piece::is_empty(u.captured)) {
+    s.counts[side_index(u.captured)][piece::unit_type(u.captured)] += 1;
+    if (piece::unit_type(u.captured) == piece::KING)
+      s.king_sq[side_index(u.captured)] = u.move.to;
   }
-  const bool done = (!p1_king || !p2_king || s.ply >= 200);
 
-  int reward_p0 = 0;
-  if (done) {
-    if (p1_king && !p2_king)
-      reward_p0 = +1;
-    else if (!p1_king && p2_king)
-      reward_p0 = -1;
-    else
-      reward_p0 = 0;
-  }
-  return StepResult{s, done, reward_p0, std::string{}};
+  s.board[u.move.from] = u.moved;
+  s.board[u.move.to] = u.captured;
+  s.hash = u.hash;
+  s.ply -= 1;
+  s.to_move = 1 - s.to_move;
+}
+
+StepResult Engine::apply_move_unchecked(State &s, const Move &m) const {
+  StatScope probe(STAT_APPLY_MOVE);
+  probe.moves(1);
+  return step(*this, s, m);
 }
 
 } // namespace engine
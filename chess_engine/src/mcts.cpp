@@ -0,0 +1,336 @@
+#include "chess/mcts.hpp"
+
+#include "chess/action.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/state.hpp"
+
+#include <algorithm>
+#include <atomic>
+#include <cmath>
+#include <exception>
+#include <mutex>
+#include <optional>
+#include <random>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+namespace engine {
+
+namespace {
+
+constexpr std::size_t CELLS = BOARD_N * BOARD_N;
+constexpr std::size_t ACTIONS = action::NUM_ACTIONS;
+
+enum class Status : std::uint8_t { Unexpanded, Pending, Expanded, Terminal };
+
+/**
+ * @brief Tree node; statistics are from the view of the player who moved into the node,
+ * so a parent picks the child with the highest value.
+ */
+struct Node {
+  Move move{};                    ///< Move from the parent (unused at the root).
+  std::int16_t action = -1;       ///< Action id of `move`.
+  std::uint16_t num_children = 0; ///< Children occupy [first_child, first_child + num_children).
+  std::int32_t first_child = -1;
+  float prior = 0.0f;
+  std::int32_t visits = 0;
+  std::int32_t virtual_visits = 0;
+  float value_sum = 0.0f;
+  float terminal_value = 0.0f; ///< For Terminal nodes: value for the side to move there.
+  Status status = Status::Unexpanded;
+};
+
+/** @brief A leaf selected for evaluation, with the path that led to it. */
+struct Pending {
+  State state;
+  std::vector<std::int32_t> path; ///< Root first, leaf last.
+};
+
+class Tree {
+public:
+  Tree(const Engine &engine, const State &root, const MctsConfig &config, const LeafEvaluator &evaluate)
+      : engine_(engine), root_(root), config_(config), evaluate_(evaluate) {
+    nodes_.emplace_back();
+  }
+
+  MctsResult run() {
+    MctsResult result;
+    result.visits.assign(ACTIONS, 0);
+
+    if (terminal_value(root_))
+      return result;
+
+    // Evaluate the root on its own so every worker starts from an expanded tree.
+    nodes_[0].status = Status::Pending;
+    std::vector<Pending> batch{Pending{root_, {0}}};
+    std::vector<float> priors, values;
+    evaluate_batch(batch, priors, values);
+    finish_batch(batch, priors, values, /*is_root=*/true);
+
+    const std::uint32_t workers = std::max<std::uint32_t>(1, config_.num_threads);
+    if (workers == 1) {
+      work();
+    } else {
+      std::vector<std::thread> threads;
+      threads.reserve(workers);
+      for (std::uint32_t t = 0; t < workers; ++t)
+        threads.emplace_back([this] { work(); });
+      for (std::thread &t : threads)
+        t.join();
+    }
+    if (error_)
+      std::rethrow_exception(error_);
+
+    const Node &r = nodes_[0];
+    int best_visits = -1;
+    for (int c = r.first_child; c < r.first_child + r.num_children; ++c) {
+      result.visits[nodes_[c].action] = static_cast<std::uint32_t>(nodes_[c].visits);
+      if (nodes_[c].visits > best_visits) {
+        best_visits = nodes_[c].visits;
+        result.best_action = nodes_[c].action;
+      }
+    }
+    result.root_value = r.visits ? -r.value_sum / static_cast<float>(r.visits) : 0.0f;
+    result.simulations = completed_;
+    result.evaluator_calls = evaluator_calls_.load();
+    return result;
+  }
+
+private:
+  enum class Selection { Leaf, Terminal, Collision };
+
+  /** @return Value of a finished game for the side to move, or nullopt if it goes on. */
+  std::optional<float> terminal_value(const State &s) const {
+    MoveList moves;
+    engine_.legal_moves(s, moves);
+    switch (const Outcome o = engine_.outcome(s, moves)) {
+    case Outcome::Ongoing:
+      break;
+    case Outcome::Draw:
+      return 0.0f;
+    case Outcome::Player0Wins:
+    case Outcome::Player1Wins:
+      // Usually the side to move lost its king (or is mated); a tablebase may rule either way.
+      return (o == Outcome::Player0Wins) == (s.to_move == 0) ? 1.0f : -1.0f;
+    }
+    if (moves.empty())
+      return 0.0f; // stuck side: draw, as in random_playouts
+    return std::nullopt;
+  }
+
+  /** @brief Worker loop: collect a batch under the lock, evaluate it outside, then apply it. */
+  void work() {
+    std::vector<Pending> batch;
+    std::vector<float> priors, values;
+    for (;;) {
+      batch.clear();
+      {
+        std::lock_guard<std::mutex> lock(mu_);
+        if (stop_ || completed_ >= config_.num_simulations)
+          return;
+        while (batch.size() < std::max<std::uint32_t>(1, config_.batch_size) &&
+               completed_ + in_flight_ < config_.num_simulations) {
+          Pending leaf;
+          const Selection sel = select(leaf);
+          if (sel == Selection::Collision)
+            break;
+          if (sel == Selection::Leaf) {
+            ++in_flight_;
+            batch.push_back(std::move(leaf));
+          }
+        }
+      }
+      if (batch.empty()) {
+        std::this_thread::yield(); // every open leaf is being evaluated by another worker
+        continue;
+      }
+      try {
+        evaluate_batch(batch, priors, values);
+      } catch (...) {
+        std::lock_guard<std::mutex> lock(mu_);
+        if (!error_)
+          error_ = std::current_exception();
+        stop_ = true;
+        return;
+      }
+      std::lock_guard<std::mutex> lock(mu_);
+      finish_batch(batch, priors, values, /*is_root=*/false);
+    }
+  }
+
+  /**
+   * @brief Descend from the root by PUCT, adding virtual loss on the way (lock held).
+   * Terminal nodes are backed up at once; a Pending node means another batch already owns it.
+   */
+  Selection select(Pending &leaf) {
+    leaf.state = root_;
+    leaf.path.assign(1, 0);
+    std::int32_t node = 0;
+    while (nodes_[node].status == Status::Expanded) {
+      node = best_child(node);
+      nodes_[node].virtual_visits += 1;
+      leaf.path.push_back(node);
+      engine_.make_move(leaf.state, nodes_[node].move);
+    }
+
+    Node &n = nodes_[node];
+    if (n.status == Status::Pending) {
+      for (std::size_t i = 1; i < leaf.path.size(); ++i)
+        nodes_[leaf.path[i]].virtual_visits -= 1;
+      return Selection::Collision;
+    }
+    if (n.status == Status::Unexpanded) {
+      if (const std::optional<float> value = terminal_value(leaf.state)) {
+        n.status = Status::Terminal;
+        n.terminal_value = *value;
+      }
+    }
+    if (n.status == Status::Terminal) {
+      backup(leaf.path, n.terminal_value);
+      ++completed_;
+      return Selection::Terminal;
+    }
+    n.status = Status::Pending;
+    return Selection::Leaf;
+  }
+
+  std::int32_t best_child(std::int32_t parent) const {
+    const Node &p = nodes_[parent];
+    const float sqrt_n = std::sqrt(static_cast<float>(p.visits + p.virtual_visits));
+    std::int32_t best = p.first_child;
+    float best_score = -1e30f;
+    for (std::int32_t c = p.first_child; c < p.first_child + p.num_children; ++c) {
+      const Node &ch = nodes_[c];
+      const int n = ch.visits + ch.virtual_visits;
+      const float q = n ? (ch.value_sum - config_.virtual_loss * ch.virtual_visits) / static_cast<float>(n) : 0.0f;
+      const float score = q + config_.c_puct * ch.prior * sqrt_n / static_cast<float>(1 + n);
+      if (score > best_score) {
+        best_score = score;
+        best = c;
+      }
+    }
+    return best;
+  }
+
+  /** @brief Pack the leaves in the envs' format and call the evaluator (no lock held). */
+  void evaluate_batch(const std::vector<Pending> &batch, std::vector<float> &priors, std::vector<float> &values) {
+    const std::size_t n = batch.size();
+    std::vector<piece::Code> boards(n * CELLS);
+    std::vector<Player> to_move(n);
+    std::vector<std::int8_t> masks(n * ACTIONS);
+    for (std::size_t i = 0; i < n; ++i) {
+      std::copy(batch[i].state.board.begin(), batch[i].state.board.end(), boards.begin() + i * CELLS);
+      to_move[i] = batch[i].state.to_move;
+      engine_.legal_action_mask(batch[i].state, masks.data() + i * ACTIONS);
+    }
+    priors.assign(n * ACTIONS, 0.0f);
+    values.assign(n, 0.0f);
+    evaluate_(LeafBatch{n, boards.data(), to_move.data(), masks.data()}, priors.data(), values.data());
+    ++evaluator_calls_;
+  }
+
+  /** @brief Expand every evaluated leaf and back its value up (lock held, or before workers start). */
+  void finish_batch(const std::vector<Pending> &batch, const std::vector<float> &priors, const std::vector<float> &values,
+                    bool is_root) {
+    for (std::size_t i = 0; i < batch.size(); ++i) {
+      expand(batch[i], priors.data() + i * ACTIONS, is_root);
+      const float v = std::isfinite(values[i]) ? std::clamp(values[i], -1.0f, 1.0f) : 0.0f;
+      backup(batch[i].path, v);
+      if (!is_root) {
+        --in_flight_;
+        ++completed_;
+      }
+    }
+  }
+
+  void expand(const Pending &leaf, const float *priors, bool is_root) {
+    MoveList moves;
+    engine_.legal_moves(leaf.state, moves);
+    const std::int32_t first = static_cast<std::int32_t>(nodes_.size());
+    float total = 0.0f;
+    for (const Move &m : moves) {
+      Node child;
+      child.move = m;
+      child.action = static_cast<std::int16_t>(action::encode(m));
+      const float p = child.action >= 0 ? priors[child.action] : 0.0f;
+      child.prior = std::isfinite(p) && p > 0.0f ? p : 0.0f;
+      total += child.prior;
+      nodes_.push_back(child);
+    }
+    const std::size_t count = moves.size();
+    for (std::size_t c = 0; c < count; ++c) {
+      Node &child = nodes_[first + c];
+      child.prior = total > 0.0f ? child.prior / total : 1.0f / static_cast<float>(count);
+    }
+    if (is_root && config_.dirichlet_epsilon > 0.0f && count > 0)
+      add_root_noise(first, count);
+
+    Node &n = nodes_[leaf.path.back()]; // after the push_backs: the vector may have moved
+    n.first_child = first;
+    n.num_children = static_cast<std::uint16_t>(count);
+    n.status = Status::Expanded;
+  }
+
+  void add_root_noise(std::int32_t first, std::size_t count) {
+    std::mt19937_64 rng(config_.seed);
+    std::gamma_distribution<float> gamma(config_.dirichlet_alpha, 1.0f);
+    std::vector<float> noise(count);
+    float sum = 0.0f;
+    for (float &x : noise)
+      sum += (x = gamma(rng));
+    const float eps = config_.dirichlet_epsilon;
+    for (std::size_t c = 0; c < count; ++c) {
+      Node &child = nodes_[first + c];
+      const float eta = sum > 0.0f ? noise[c] / sum : 1.0f / static_cast<float>(count);
+      child.prior = (1.0f - eps) * child.prior + eps * eta;
+    }
+  }
+
+  /** @brief Add `value` (for the side to move at the leaf) along `path`, removing its virtual loss. */
+  void backup(const std::vector<std::int32_t> &path, float value) {
+    float v = -value; // the leaf's statistics are for the player who moved into it
+    for (std::size_t i = path.size(); i-- > 0;) {
+      Node &n = nodes_[path[i]];
+      n.visits += 1;
+      n.value_sum += v;
+      if (i > 0)
+        n.virtual_visits -= 1;
+      v = -v;
+    }
+  }
+
+  const Engine &engine_;
+  const State root_;
+  const MctsConfig &config_;
+  const LeafEvaluator &evaluate_;
+
+  std::mutex mu_; // guards everything below except evaluator_calls_
+  std::vector<Node> nodes_;
+  std::uint32_t completed_ = 0;
+  std::uint32_t in_flight_ = 0;
+  bool stop_ = false;
+  std::exception_ptr error_;
+  std::atomic<std::uint32_t> evaluator_calls_{0};
+};
+
+} // namespace
+
+MctsResult Engine::mcts(const State &s, const LeafEvaluator &evaluate, const MctsConfig &config) const {
+  // Bad values would otherwise run silently: NaN scores make every PUCT comparison false, and
+  // std::gamma_distribution requires alpha > 0.
+  if (!std::isfinite(config.c_puct) || config.c_puct < 0.0f)
+    throw std::invalid_argument("c_puct must be finite and non-negative");
+  if (!std::isfinite(config.virtual_loss) || config.virtual_loss < 0.0f)
+    throw std::invalid_argument("virtual_loss must be finite and non-negative");
+  if (!(config.dirichlet_epsilon >= 0.0f && config.dirichlet_epsilon <= 1.0f))
+    throw std::invalid_argument("dirichlet_epsilon must be in [0, 1]");
+  if (config.dirichlet_epsilon > 0.0f && !(config.dirichlet_alpha > 0.0f && std::isfinite(config.dirichlet_alpha)))
+    throw std::invalid_argument("dirichlet_alpha must be positive and finite when dirichlet_epsilon > 0");
+  Tree tree(*this, s, config, evaluate);
+  return tree.run();
+}
+
+} // namespace engine
@@ -0,0 +1,133 @@
+#include "chess/movegen.hpp"
+
+#include "chess/bitboard.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+#include "chess/stats.hpp"
+
+#include <array>
+
+namespace engine {
+
+namespace {
+
+// Direction orders of the Unit subclasses (bishop.cpp, rook.cpp, queen.cpp).
+constexpr std::array<Direction, 4> BISHOP_DIRECTIONS = {NW, NE, SW, SE};
+constexpr std::array<Direction, 4> ROOK_DIRECTIONS = {S, E, N, W};
+constexpr std::array<Direction, 8> QUEEN_DIRECTIONS = {NW, N, NE, W, E, SW, S, SE};
+
+/** @brief Emit one quiet-typed move per target, lowest square first. */
+template <typename Out> void emit_ascending(Square from, Bitboard targets, Out &out) {
+  while (targets)
+    out.push_back(Move{from, static_cast<Square>(bb::pop_lsb(targets))});
+}
+
+/** @brief Emit one quiet-typed move per target, highest square first. */
+template <typename Out> void emit_descending(Square from, Bitboard targets, Out &out) {
+  while (targets)
+    out.push_back(Move{from, static_cast<Square>(bb::pop_msb(targets))});
+}
+
+template <std::size_t N, typename Out>
+void emit_sliders(const AttackTables &t, Square from, const std::array<Direction, N> &dirs, Bitboard occupied, Bitboard own,
+                  Out &out) {
+  for (Direction d : dirs) {
+    const Bitboard targets = ray_attacks(t, d, from, occupied) & ~own;
+    // Nearest square first: it has the lowest index on positive rays and the highest on negative ones.
+    if (is_positive(d))
+      emit_ascending(from, targets, out);
+    else
+      emit_descending(from, targets, out);
+  }
+}
+
+template <typename Out>
+void emit_pawn(const AttackTables &t, const State &s, Player us, Square from, Bitboard occupied, Bitboard enemy, Out &out) {
+  const int last_row = (us == 0) ? 0 : BOARD_N - 1;
+  const piece::Code queen_code = piece::make(piece::QUEEN, us == 0 ? piece::P1 : piece::P2, /*hasMoved=*/true, piece::POWER_NONE);
+
+  auto push = [&](int to, bool capture) {
+    const bool promotes = Engine::row(to) == last_row;
+    if (promotes)
+      out.push_back(Move{from, static_cast<Square>(to), capture ? MoveType::CapturePromote : MoveType::Promote, queen_code});
+    else
+      out.push_back(Move{from, static_cast<Square>(to), capture ? MoveType::Capture : MoveType::Quiet});
+  };
+
+  // Forward 1, then forward 2 (unmoved pawn, both squares empty).
+  const Bitboard single = t.pawn_push[us][from] & ~occupied;
+  if (single) {
+    const int one = bb::lsb(single);
+    push(one, false);
+    const Bitboard dbl = t.pawn_push[us][one] & ~occupied;
+    if (dbl && !piece::has_moved(s.board[from]))
+      push(bb::lsb(dbl), false);
+  }
+
+  // Diagonal captures: col+1 before col-1, which is the higher square index for both sides.
+  Bitboard captures = t.pawn_attacks[us][from] & enemy;
+  while (captures)
+    push(bb::pop_msb(captures), true);
+}
+
+template <typename Out> void emit_piece(const AttackTables &t, const State &s, const Bitboards &bbs, Square from, Out &out) {
+  const Player us = s.to_move;
+  const Bitboard own = bbs.side[us];
+  const Bitboard occupied = bbs.occupied();
+
+  switch (piece::unit_type(s.board[from])) {
+  case piece::PAWN:
+    emit_pawn(t, s, us, from, occupied, bbs.side[1 - us], out);
+    break;
+  case piece::KNIGHT:
+    emit_ascending(from, t.knight[from] & ~own, out);
+    break;
+  case piece::BISHOP:
+    emit_sliders(t, from, BISHOP_DIRECTIONS, occupied, own, out);
+    break;
+  case piece::ROOK:
+    emit_sliders(t, from, ROOK_DIRECTIONS, occupied, own, out);
+    break;
+  case piece::QUEEN:
+    emit_sliders(t, from, QUEEN_DIRECTIONS, occupied, own, out);
+    break;
+  case piece::KING:
+    emit_ascending(from, t.king[from] & ~own, out);
+    break;
+  default:
+    break;
+  }
+}
+
+} // namespace
+
+void generate_moves(const State &s, MoveList &out) {
+  StatScope probe(STAT_MOVEGEN);
+  const std::size_t before = out.size();
+  const AttackTables &t = attack_tables();
+  const Bitboards bbs = Bitboards::from_state(s);
+
+  Bitboard ours = bbs.side[s.to_move];
+  while (ours)
+    emit_piece(t, s, bbs, static_cast<Square>(bb::pop_lsb(ours)), out);
+  probe.moves(out.size() - before);
+}
+
+void generate_moves_from(const State &s, Square from, MoveList &out) {
+  StatScope probe(STAT_MOVEGEN);
+  if (from >= NUM_SQUARES)
+    return;
+
+  const piece::Code pc = s.board[from];
+  const bool belongs_to_side = (s.to_move == 0) ? piece::is_p1(pc) : piece::is_p2(pc);
+  if (!belongs_to_side)
+    return;
+
+  const std::size_t before = out.size();
+  emit_piece(attack_tables(), s, Bitboards::from_state(s), from, out);
+  probe.moves(out.size() - before);
+}
+
+} // namespace engine
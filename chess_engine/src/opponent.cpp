@@ -0,0 +1,132 @@
+#include "chess/opponent.hpp"
+
+#include "chess/action.hpp"
+#include "chess/piece.hpp"
+#include "chess/search.hpp"
+#include "chess/zobrist.hpp"
+
+#include <algorithm>
+#include <array>
+#include <stdexcept>
+#include <string>
+
+namespace engine {
+
+namespace {
+
+/// Greedy capture order, indexed by UnitType: the king outranks everything.
+constexpr std::array<int, 8> VICTIM_VALUES = {0, 1, 3, 3, 5, 9, 100, 0};
+
+std::uint64_t next_random(std::uint64_t &x) {
+  x ^= x << 13;
+  x ^= x >> 7;
+  x ^= x << 17;
+  return x;
+}
+
+std::uint64_t seed_stream(std::uint64_t seed) {
+  return zobrist::splitmix64(seed) | 1; // xorshift state must be non-zero
+}
+
+int reward_of(Outcome o) {
+  return o == Outcome::Player0Wins ? 1 : o == Outcome::Player1Wins ? -1 : 0;
+}
+
+} // namespace
+
+OpponentKind parse_opponent_kind(std::string_view name) {
+  if (name == "random")
+    return OpponentKind::Random;
+  if (name == "greedy")
+    return OpponentKind::Greedy;
+  if (name == "search")
+    return OpponentKind::Search;
+  throw std::invalid_argument("unknown opponent '" + std::string(name) + "' (expected random, greedy or search)");
+}
+
+const char *opponent_kind_name(OpponentKind kind) {
+  switch (kind) {
+  case OpponentKind::Random:
+    return "random";
+  case OpponentKind::Greedy:
+    return "greedy";
+  case OpponentKind::Search:
+    return "search";
+  }
+  return "unknown";
+}
+
+Opponent::Opponent(OpponentConfig config) : config_(config), rng_(seed_stream(config.seed)) {}
+
+void Opponent::seed(std::uint64_t seed) {
+  config_.seed = seed;
+  rng_ = seed_stream(seed);
+}
+
+std::optional<Move> Opponent::select(const Engine &engine, const State &s) {
+  engine.legal_moves(s, moves_);
+  if (moves_.empty())
+    return std::nullopt;
+  return choose(engine, s);
+}
+
+Move Opponent::choose(const Engine &engine, const State &s) {
+  if (config_.kind == OpponentKind::Search) {
+    const SearchResult r = engine.search(s, config_.search_depth, config_.time_limit_ms);
+    if (r.has_move)
+      return r.best_move;
+  } else if (config_.kind == OpponentKind::Greedy) {
+    // Most valuable victim; ties are broken uniformly at random (reservoir sampling).
+    int best = 0;
+    std::uint64_t ties = 0;
+    Move pick{};
+    for (const Move &m : moves_) {
+      const piece::Code victim = s.board[m.to];
+      if (piece::is_empty(victim))
+        continue;
+      const int value = VICTIM_VALUES[piece::unit_type(victim)];
+      if (value > best) {
+        best = value;
+        ties = 0;
+      }
+      if (value == best && next_random(rng_) % ++ties == 0)
+        pick = m;
+    }
+    if (ties > 0)
+      return pick;
+  }
+  return moves_[next_random(rng_) % moves_.size()];
+}
+
+VersusStep Opponent::play(const Engine &engine, State &s, const Move &agent_move, std::int8_t *mask) {
+  if (!engine.is_legal(s, agent_move))
+    throw std::invalid_argument("agent move is illegal");
+
+  VersusStep r;
+  // After each move, moves_ holds the legal moves of the side to move next.
+  const auto advance = [&](const Move &m) {
+    engine.make_move(s, m);
+    engine.legal_moves(s, moves_);
+    const Outcome o = engine.outcome(s, moves_);
+    r.done = o != Outcome::Ongoing || moves_.empty(); // a side without moves ends the game as a draw
+    r.reward_p0 = reward_of(o);
+  };
+
+  advance(agent_move);
+  if (!r.done) {
+    r.reply = choose(engine, s);
+    r.replied = true;
+    advance(r.reply);
+  }
+
+  if (mask != nullptr) {
+    std::fill_n(mask, action::NUM_ACTIONS, std::int8_t{0});
+    if (!r.done) {
+      for (const Move &m : moves_)
+        mask[action::encode(m)] = 1;
+    }
+  }
+  return r;
+}
+
+} // namespace engine
@@ -0,0 +1,63 @@
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+namespace engine {
+
+namespace {
+
+/** @brief Leaf count below `s`; finished games (king captured, ply cap) are not expanded. */
+std::uint64_t perft_rec(const Engine &E, State &s, int depth) {
+  if (depth == 0)
+    return 1;
+  if (s.ply >= E.max_ply())
+    return 0;
+
+  MoveList moves;
+  E.legal_moves(s, moves);
+  if (depth == 1)
+    return moves.size(); // bulk count: every move is a leaf, including king captures
+
+  std::uint64_t nodes = 0;
+  for (const Move &m : moves) {
+    const UndoRecord u = E.make_move(s, m);
+    if (piece::unit_type(u.captured) != piece::KING)
+      nodes += perft_rec(E, s, depth - 1);
+    E.unmake_move(s, u);
+  }
+  return nodes;
+}
+
+} // namespace
+
+std::uint64_t Engine::perft(const State &s, int depth) const {
+  if (depth <= 0)
+    return 1;
+  if (is_terminal(s))
+    return 0;
+  State work = s;
+  return perft_rec(*this, work, depth);
+}
+
+std::vector<std::pair<Move, std::uint64_t>> Engine::perft_divide(const State &s, int depth) const {
+  std::vector<std::pair<Move, std::uint64_t>> out;
+  if (depth <= 0 || is_terminal(s))
+    return out;
+
+  State work = s;
+  MoveList moves;
+  legal_moves(work, moves);
+  out.reserve(moves.size());
+  for (const Move &m : moves) {
+    const UndoRecord u = make_move(work, m);
+    const bool ended = piece::unit_type(u.captured) == piece::KING;
+    out.emplace_back(m, ended && depth > 1 ? 0 : perft_rec(*this, work, depth - 1));
+    unmake_move(work, u);
+  }
+  return out;
+}
+
+} // namespace engine
@@ -0,0 +1,60 @@
+#include "chess/planes.hpp"
+
+#include <algorithm>
+
+namespace engine {
+namespace planes {
+
+namespace {
+
+constexpr int MAX_POWER = piece::POWER_7;
+
+template <typename T> T power_value(int level);
+template <> float power_value<float>(int level) {
+  return static_cast<float>(level) / MAX_POWER;
+}
+template <> std::uint8_t power_value<std::uint8_t>(int level) {
+  return static_cast<std::uint8_t>(level);
+}
+
+template <typename T> T ply_value(std::uint32_t ply, std::uint32_t max_ply);
+template <> float ply_value<float>(std::uint32_t ply, std::uint32_t max_ply) {
+  return max_ply ? static_cast<float>(std::min(ply, max_ply)) / static_cast<float>(max_ply) : 0.0f;
+}
+template <> std::uint8_t ply_value<std::uint8_t>(std::uint32_t ply, std::uint32_t max_ply) {
+  return max_ply ? static_cast<std::uint8_t>(std::uint64_t{std::min(ply, max_ply)} * 255 / max_ply) : 0;
+}
+
+} // namespace
+
+template <typename T> void encode(const piece::Code *board, Player to_move, std::uint32_t ply, std::uint32_t max_ply, T *out) {
+  std::fill(out, out + TO_MOVE * PLANE_SIZE, T(0));
+  for (std::size_t sq = 0; sq < PLANE_SIZE; ++sq) {
+    const piece::Code pc = board[sq];
+    const int kind = piece::unit_type(pc);
+    if (kind < piece::PAWN || kind > piece::KING)
+      continue; // empty (or a kind the rules do not use)
+    out[piece_plane(pc) * PLANE_SIZE + sq] = T(1);
+    out[MOVED * PLANE_SIZE + sq] = piece::has_moved(pc) ? T(1) : T(0);
+    out[POWER * PLANE_SIZE + sq] = power_value<T>(piece::power(pc));
+  }
+  std::fill(out + TO_MOVE * PLANE_SIZE, out + PLY * PLANE_SIZE, to_move ? T(1) : T(0));
+  std::fill(out + PLY * PLANE_SIZE, out + ENCODED_SIZE, ply_value<T>(ply, max_ply));
+}
+
+template <typename T>
+void encode_batch(const piece::Code *boards, const Player *to_move, const std::uint32_t *ply, std::size_t n,
+                  std::uint32_t max_ply, T *out) {
+  for (std::size_t i = 0; i < n; ++i)
+    encode(boards + i * PLANE_SIZE, to_move[i], ply ? ply[i] : 0, max_ply, out + i * ENCODED_SIZE);
+}
+
+template void encode<float>(const piece::Code *, Player, std::uint32_t, std::uint32_t, float *);
+template void encode<std::uint8_t>(const piece::Code *, Player, std::uint32_t, std::uint32_t, std::uint8_t *);
+template void encode_batch<float>(const piece::Code *, const Player *, const std::uint32_t *, std::size_t, std::uint32_t,
+                                  float *);
+template void encode_batch<std::uint8_t>(const piece::Code *, const Player *, const std::uint32_t *, std::size_t, std::uint32_t,
+                                         std::uint8_t *);
+
+} // namespace planes
+} // namespace engine
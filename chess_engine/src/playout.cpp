@@ -0,0 +1,82 @@
+#include "chess/playout.hpp"
+
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/state.hpp"
+#include "chess/zobrist.hpp"
+
+#include <algorithm>
+#include <thread>
+#include <vector>
+
+namespace engine {
+
+namespace {
+
+std::uint64_t next_random(std::uint64_t &x) {
+  x ^= x << 13;
+  x ^= x >> 7;
+  x ^= x << 17;
+  return x;
+}
+
+/** @brief Play games [begin, end) from `root`; game i draws its moves from its own seeded stream. */
+PlayoutStats run_range(const Engine &E, const State &root, std::uint64_t seed, std::uint64_t begin, std::uint64_t end) {
+  PlayoutStats stats;
+  MoveList moves;
+  const Player me = root.to_move;
+  for (std::uint64_t i = begin; i < end; ++i) {
+    std::uint64_t mix = seed ^ (i * 0xD1B54A32D192ED03ULL);
+    std::uint64_t rng = zobrist::splitmix64(mix) | 1; // xorshift state must be non-zero
+
+    State s = root;
+    Outcome o;
+    for (;;) {
+      E.legal_moves(s, moves);
+      o = E.outcome(s, moves);
+      if (o != Outcome::Ongoing || moves.empty())
+        break; // an Ongoing game without moves is a stuck side: draw, as RandomPolicy has no move to return
+      E.make_move(s, moves[next_random(rng) % moves.size()]);
+    }
+
+    ++stats.playouts;
+    stats.total_plies += s.ply - root.ply;
+    if (o == Outcome::Player0Wins || o == Outcome::Player1Wins)
+      ++((o == Outcome::Player0Wins) == (me == 0) ? stats.wins : stats.losses);
+    else
+      ++stats.draws;
+  }
+  return stats;
+}
+
+} // namespace
+
+PlayoutStats Engine::random_playouts(const State &s, std::uint64_t n_playouts, std::uint64_t seed, int n_threads) const {
+  if (n_threads <= 0)
+    n_threads = static_cast<int>(std::max(1u, std::thread::hardware_concurrency()));
+  const std::uint64_t workers = std::max<std::uint64_t>(1, std::min<std::uint64_t>(n_threads, n_playouts));
+  if (workers == 1)
+    return run_range(*this, s, seed, 0, n_playouts);
+
+  // Contiguous ranges per thread; results depend only on (seed, game index), not on threading.
+  std::vector<PlayoutStats> partial(workers);
+  std::vector<std::thread> threads;
+  threads.reserve(workers);
+  for (std::uint64_t t = 0; t < workers; ++t) {
+    const std::uint64_t begin = n_playouts * t / workers, end = n_playouts * (t + 1) / workers;
+    threads.emplace_back([&, t, begin, end] { partial[t] = run_range(*this, s, seed, begin, end); });
+  }
+  PlayoutStats total;
+  for (std::uint64_t t = 0; t < workers; ++t) {
+    threads[t].join();
+    total.playouts += partial[t].playouts;
+    total.wins += partial[t].wins;
+    total.draws += partial[t].draws;
+    total.losses += partial[t].losses;
+    total.total_plies += partial[t].total_plies;
+  }
+  return total;
+}
+
+} // namespace engine
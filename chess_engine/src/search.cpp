@@ -0,0 +1,339 @@
+#include "chess/search.hpp"
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+#include "chess/tablebase.hpp"
+
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <cstdlib>
+#include <memory>
+
+namespace engine {
+
+// ── Transposition table ────────────────────────────────────────────────────────
+
+TranspositionTable::TranspositionTable(std::size_t num_buckets) {
+  std::size_t n = 1;
+  while (n * 2 <= num_buckets)
+    n *= 2;
+  buckets_.resize(n);
+  mask_ = n - 1;
+}
+
+const TranspositionTable::Entry *TranspositionTable::probe(std::uint64_t key) const {
+  const Bucket &b = buckets_[key & mask_];
+  if (b.deepest.bound != NONE && b.deepest.key == key)
+    return &b.deepest;
+  if (b.recent.bound != NONE && b.recent.key == key)
+    return &b.recent;
+  return nullptr;
+}
+
+void TranspositionTable::store(std::uint64_t key, int depth, int score, Bound bound, const Move &move) {
+  Bucket &b = buckets_[key & mask_];
+  const Entry e{key, move, static_cast<std::int16_t>(score), static_cast<std::int8_t>(depth), bound};
+  if (b.deepest.bound == NONE || b.deepest.key == key || depth >= b.deepest.depth)
+    b.deepest = e;
+  else
+    b.recent = e;
+}
+
+void TranspositionTable::clear() {
+  std::fill(buckets_.begin(), buckets_.end(), Bucket{});
+}
+
+// ── Search ─────────────────────────────────────────────────────────────────────
+
+namespace {
+
+constexpr int INF = MATE_SCORE + 1;
+constexpr std::size_t TT_BUCKETS = std::size_t{1} << 15; // 2 x 32768 entries, ~1 MiB
+
+constexpr std::array<int, 8> PIECE_VALUES = {0, 100, 300, 300, 500, 900, 0, 0}; // indexed by UnitType
+
+bool same_move(const Move &a, const Move &b) {
+  return a.from == b.from && a.to == b.to && a.promo_piece == b.promo_piece && a.special_code == b.special_code;
+}
+
+/** @brief Material plus a small bonus for advanced pawns, from the side to move's view. */
+int evaluate(const State &s) {
+  int score = 0;
+  for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+    const piece::Code pc = s.board[sq];
+    if (piece::is_empty(pc))
+      continue;
+    int v = PIECE_VALUES[piece::unit_type(pc)];
+    if (piece::unit_type(pc) == piece::PAWN)
+      v += 10 * (piece::is_p1(pc) ? (BOARD_N - 2 - Engine::row(sq)) : (Engine::row(sq) - 1));
+    score += piece::is_p1(pc) ? v : -v;
+  }
+  return s.to_move == 0 ? score : -score;
+}
+
+/**
+ * @brief Score of a tablebase entry `ply` plies below the root. Distances beyond the search
+ * horizon are clamped so the score still reads as a forced result.
+ */
+int tablebase_score(const TablebaseEntry &e, const State &s, std::uint32_t max_ply, int ply) {
+  if (e.result == 0 || s.ply + e.plies > max_ply)
+    return 0;
+  const int distance = std::min(ply + static_cast<int>(e.plies), MAX_SEARCH_PLY - 1);
+  return e.result > 0 ? MATE_SCORE - distance : -(MATE_SCORE - distance);
+}
+
+/** @brief Mate scores are stored relative to the node, not the root. */
+int to_tt(int score, int ply) {
+  if (score >= MATE_SCORE - MAX_SEARCH_PLY)
+    return score + ply;
+  if (score <= -(MATE_SCORE - MAX_SEARCH_PLY))
+    return score - ply;
+  return score;
+}
+
+int from_tt(int score, int ply) {
+  if (score >= MATE_SCORE - MAX_SEARCH_PLY)
+    return score - ply;
+  if (score <= -(MATE_SCORE - MAX_SEARCH_PLY))
+    return score + ply;
+  return score;
+}
+
+class Searcher {
+public:
+  Searcher(const Engine &engine, int time_limit_ms) : engine_(engine), tt_(TT_BUCKETS), time_limit_ms_(time_limit_ms) {
+    start_ = std::chrono::steady_clock::now();
+  }
+
+  SearchResult run(State root, int max_depth) {
+    SearchResult result;
+
+    for (int depth = 1; depth <= max_depth; ++depth) {
+      can_stop_ = depth > 1; // the first iteration always completes
+      const int score = negamax(root, depth, -INF, INF, 0);
+      if (stopped_)
+        break;
+      if (pv_len_[0] == 0)
+        break; // no moves at the root
+
+      result.has_move = true;
+      result.best_move = pv_[0][0];
+      result.score = score;
+      result.depth = depth;
+      result.pv.assign(pv_[0].begin(), pv_[0].begin() + pv_len_[0]);
+
+      // Stop once a forced king capture lies within the completed horizon. A mate reported beyond
+      // it came from a transposition-table or tablebase hit, and deeper iterations may shorten it.
+      if (is_mate_score(score) && MATE_SCORE - std::abs(score) <= depth)
+        break;
+    }
+    result.nodes = nodes_;
+    return result;
+  }
+
+private:
+  int negamax(State &s, int depth, int alpha, int beta, int ply) {
+    pv_len_[ply] = 0;
+    if (time_up())
+      return 0;
+    if (s.ply >= engine_.max_ply())
+      return 0;
+    if (ply > 0) {
+      if (const auto e = engine_.probe_tablebase(s))
+        return tablebase_score(*e, s, engine_.max_ply(), ply);
+    }
+    if (depth <= 0 || ply >= MAX_SEARCH_PLY - 1)
+      return quiescence(s, alpha, beta, ply);
+    ++nodes_;
+
+    const int alpha_orig = alpha;
+    Move tt_move{};
+    bool has_tt_move = false;
+    if (const auto *e = tt_.probe(s.hash)) {
+      tt_move = e->move;
+      has_tt_move = true;
+      if (ply > 0 && e->depth >= depth) {
+        const int tt_score = from_tt(e->score, ply);
+        if (e->bound == TranspositionTable::EXACT || (e->bound == TranspositionTable::LOWER && tt_score >= beta) ||
+            (e->bound == TranspositionTable::UPPER && tt_score <= alpha))
+          return tt_score;
+      }
+    }
+
+    MoveList moves;
+    engine_.legal_moves(s, moves);
+    if (moves.empty()) // checkmate under strict legality; otherwise a stuck side, treated as a draw
+      return engine_.config().strict_legality && engine_.in_check(s, s.to_move) ? -(MATE_SCORE - ply) : 0;
+
+    std::array<int, MAX_MOVES> scores;
+    score_moves(s, moves, scores, has_tt_move ? &tt_move : nullptr, ply);
+
+    int best = -INF;
+    Move best_move = moves[0];
+    for (std::size_t i = 0; i < moves.size(); ++i) {
+      pick_next(moves, scores, i);
+      const Move &m = moves[i];
+      const bool quiet = piece::is_empty(s.board[m.to]) && m.promo_piece == 0;
+
+      int score;
+      if (piece::unit_type(s.board[m.to]) == piece::KING) {
+        score = MATE_SCORE - (ply + 1); // king capture ends the game
+        pv_len_[ply + 1] = 0;
+      } else {
+        const UndoRecord u = engine_.make_move(s, m);
+        score = -negamax(s, depth - 1, -beta, -alpha, ply + 1);
+        engine_.unmake_move(s, u);
+      }
+      if (stopped_)
+        return 0;
+
+      if (score > best) {
+        best = score;
+        best_move = m;
+        if (score > alpha) {
+          alpha = score;
+          update_pv(ply, m);
+        }
+      }
+      if (alpha >= beta) {
+        if (quiet) {
+          if (!same_move(killers_[ply][0], m)) {
+            killers_[ply][1] = killers_[ply][0];
+            killers_[ply][0] = m;
+          }
+          history_[s.to_move][m.from][m.to] += depth * depth;
+        }
+        break;
+      }
+    }
+
+    const auto bound = best >= beta        ? TranspositionTable::LOWER
+                       : best > alpha_orig ? TranspositionTable::EXACT
+                                           : TranspositionTable::UPPER;
+    tt_.store(s.hash, depth, to_tt(best, ply), bound, best_move);
+    return best;
+  }
+
+  /** @brief Captures and promotions only, with stand-pat. */
+  int quiescence(State &s, int alpha, int beta, int ply) {
+    ++nodes_;
+    if (s.ply >= engine_.max_ply())
+      return 0;
+    const int stand_pat = evaluate(s);
+    if (stand_pat >= beta || ply >= MAX_SEARCH_PLY - 1)
+      return stand_pat;
+    alpha = std::max(alpha, stand_pat);
+
+    MoveList moves;
+    engine_.legal_moves(s, moves);
+    std::array<int, MAX_MOVES> scores;
+    score_moves(s, moves, scores, nullptr, ply);
+
+    for (std::size_t i = 0; i < moves.size(); ++i) {
+      pick_next(moves, scores, i);
+      const Move &m = moves[i];
+      if (piece::is_empty(s.board[m.to]) && m.promo_piece == 0)
+        break; // ordering puts captures and promotions first
+
+      int score;
+      if (piece::unit_type(s.board[m.to]) == piece::KING) {
+        score = MATE_SCORE - (ply + 1);
+      } else {
+        const UndoRecord u = engine_.make_move(s, m);
+        score = -quiescence(s, -beta, -alpha, ply + 1);
+        engine_.unmake_move(s, u);
+      }
+      if (score >= beta)
+        return score;
+      alpha = std::max(alpha, score);
+    }
+    return alpha;
+  }
+
+  /** @brief TT move, then captures (MVV-LVA), promotions, killers, history. */
+  void score_moves(const State &s, const MoveList &moves, std::array<int, MAX_MOVES> &scores, const Move *tt_move,
+                   int ply) const {
+    for (std::size_t i = 0; i < moves.size(); ++i) {
+      const Move &m = moves[i];
+      const piece::Code victim = s.board[m.to];
+      int score;
+      if (tt_move && same_move(m, *tt_move))
+        score = 1 << 30;
+      else if (!piece::is_empty(victim))
+        score = (1 << 28) + 16 * PIECE_VALUES[piece::unit_type(victim)] - PIECE_VALUES[piece::unit_type(s.board[m.from])] +
+                (piece::unit_type(victim) == piece::KING ? (1 << 20) : 0);
+      else if (m.promo_piece != 0)
+        score = (1 << 27) + PIECE_VALUES[piece::unit_type(m.promo_piece)];
+      else if (same_move(m, killers_[ply][0]))
+        score = (1 << 26) + 1;
+      else if (same_move(m, killers_[ply][1]))
+        score = 1 << 26;
+      else
+        score = std::min(history_[s.to_move][m.from][m.to], (1 << 26) - 1);
+      scores[i] = score;
+    }
+  }
+
+  /** @brief Selection step: move the best remaining move to index i. */
+  static void pick_next(MoveList &moves, std::array<int, MAX_MOVES> &scores, std::size_t i) {
+    std::size_t best = i;
+    for (std::size_t j = i + 1; j < moves.size(); ++j) {
+      if (scores[j] > scores[best])
+        best = j;
+    }
+    if (best != i) {
+      std::swap(moves[i], moves[best]);
+      std::swap(scores[i], scores[best]);
+    }
+  }
+
+  void update_pv(int ply, const Move &m) {
+    pv_[ply][0] = m;
+    const int child_len = pv_len_[ply + 1];
+    for (int i = 0; i < child_len; ++i)
+      pv_[ply][i + 1] = pv_[ply + 1][i];
+    pv_len_[ply] = child_len + 1;
+  }
+
+  bool time_up() {
+    if (stopped_)
+      return true;
+    if (time_limit_ms_ <= 0 || !can_stop_ || (nodes_ & 1023) != 0)
+      return false;
+    const auto elapsed = std::chrono::steady_clock::now() - start_;
+    stopped_ = std::chrono::duration_cast<std::chrono::milliseconds>(elapsed).count() >= time_limit_ms_;
+    return stopped_;
+  }
+
+  const Engine &engine_;
+  TranspositionTable tt_;
+  int time_limit_ms_;
+  std::chrono::steady_clock::time_point start_;
+  bool can_stop_ = false;
+  bool stopped_ = false;
+  std::uint64_t nodes_ = 0;
+
+  std::array<std::array<Move, MAX_SEARCH_PLY>, MAX_SEARCH_PLY> pv_{};
+  std::array<int, MAX_SEARCH_PLY> pv_len_{};
+  std::array<std::array<Move, 2>, MAX_SEARCH_PLY> killers_{};
+  std::array<std::array<std::array<int, BOARD_N * BOARD_N>, BOARD_N * BOARD_N>, 2> history_{};
+};
+
+} // namespace
+
+SearchResult Engine::search(const State &s, int max_depth, int time_limit_ms) const {
+  // No search from finished games: a king is already gone or the ply cap was reached.
+  if (is_terminal(s))
+    return SearchResult{};
+
+  // The Searcher holds a ~1 MiB table and PV/history arrays: keep it off the stack.
+  auto searcher = std::make_unique<Searcher>(*this, time_limit_ms);
+  return searcher->run(s, std::clamp(max_depth, 1, MAX_SEARCH_DEPTH));
+}
+
+} // namespace engine
@@ -0,0 +1,33 @@
+#include "chess/serialize.hpp"
+
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+
+namespace engine {
+
+namespace {
+constexpr std::size_t CELLS = BOARD_N * BOARD_N;
+} // namespace
+
+void pack_state(const State &s, std::uint8_t *out) {
+  std::copy(s.board.begin(), s.board.end(), out);
+  out[CELLS] = s.to_move;
+  for (int b = 0; b < 4; ++b)
+    out[CELLS + 1 + b] = static_cast<std::uint8_t>(s.ply >> (8 * b));
+}
+
+State unpack_state(const std::uint8_t *in) {
+  State s;
+  std::copy_n(in, CELLS, s.board.begin());
+  if (in[CELLS] > 1)
+    throw std::invalid_argument("packed state has side to move " + std::to_string(in[CELLS]) + "; expected 0 or 1");
+  s.to_move = in[CELLS];
+  s.ply = 0;
+  for (int b = 0; b < 4; ++b)
+    s.ply |= static_cast<std::uint32_t>(in[CELLS + 1 + b]) << (8 * b);
+  refresh_derived(s);
+  return s;
+}
+
+} // namespace engine
@@ -0,0 +1,21 @@
+#include "chess/state.hpp"
+
+#include "chess/zobrist.hpp"
+
+namespace engine {
+
+void refresh_derived(State &s) {
+  s.hash = zobrist::compute(s);
+  s.king_sq = {NO_SQUARE, NO_SQUARE};
+  s.counts = {};
+  for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+    const piece::Code pc = s.board[sq];
+    if (piece::is_empty(pc))
+      continue;
+    s.counts[side_index(pc)][piece::unit_type(pc)] += 1;
+    if (piece::unit_type(pc) == piece::KING)
+      s.king_sq[side_index(pc)] = static_cast<Square>(sq);
+  }
+}
+
+} // namespace engine
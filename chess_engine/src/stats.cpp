@@ -0,0 +1,92 @@
+#include "chess/stats.hpp"
+
+#include "chess/engine.hpp"
+
+#include <algorithm>
+#include <mutex>
+#include <vector>
+
+namespace engine {
+
+namespace {
+
+/** @return Counter `k` of `probe` in `b` since the last reset; call with the registry lock held. */
+std::uint64_t since_reset(const detail::StatBlock &b, int probe, int k) {
+  return b.v[probe][k].load(std::memory_order_relaxed) - b.base[probe][k];
+}
+
+/** @brief Live per-thread blocks plus the totals of threads that have exited. */
+struct Registry {
+  std::mutex mutex;
+  std::vector<detail::StatBlock *> live;
+  std::array<std::array<std::uint64_t, 4>, NUM_STAT_PROBES> retired{};
+};
+
+Registry &registry() {
+  // Never destroyed: threads may still exit (and fold their block in) during static destruction.
+  static Registry *r = new Registry;
+  return *r;
+}
+
+/** @brief Owns a thread's block; registers it on creation and folds it into `retired` on exit. */
+struct ThreadStats {
+  detail::StatBlock block;
+
+  ThreadStats() {
+    Registry &r = registry();
+    const std::lock_guard<std::mutex> lock(r.mutex);
+    r.live.push_back(&block);
+  }
+  ~ThreadStats() {
+    Registry &r = registry();
+    const std::lock_guard<std::mutex> lock(r.mutex);
+    for (int p = 0; p < NUM_STAT_PROBES; ++p) {
+      for (int k = 0; k < 4; ++k)
+        r.retired[p][k] += since_reset(block, p, k);
+    }
+    r.live.erase(std::find(r.live.begin(), r.live.end(), &block));
+  }
+};
+
+} // namespace
+
+namespace detail {
+
+StatBlock &thread_stats() {
+  thread_local ThreadStats stats;
+  return stats.block;
+}
+
+} // namespace detail
+
+EngineStats Engine::stats() {
+  EngineStats out;
+  Registry &r = registry();
+  const std::lock_guard<std::mutex> lock(r.mutex);
+  for (int p = 0; p < NUM_STAT_PROBES; ++p) {
+    std::array<std::uint64_t, 4> sum = r.retired[p];
+    for (const detail::StatBlock *b : r.live) {
+      for (int k = 0; k < 4; ++k)
+        sum[k] += since_reset(*b, p, k);
+    }
+    out.probes[p] = ProbeStats{sum[detail::StatBlock::CALLS], sum[detail::StatBlock::MOVES], sum[detail::StatBlock::NANOSECONDS],
+                               sum[detail::StatBlock::ALLOCATIONS]};
+  }
+  return out;
+}
+
+void Engine::reset_stats() {
+  Registry &r = registry();
+  const std::lock_guard<std::mutex> lock(r.mutex);
+  r.retired = {};
+  // Move each live block's baseline up to its current values rather than storing 0 into counters
+  // that their threads may be bumping right now, which could write the old value back.
+  for (detail::StatBlock *b : r.live) {
+    for (int p = 0; p < NUM_STAT_PROBES; ++p) {
+      for (int k = 0; k < 4; ++k)
+        b->base[p][k] = b->v[p][k].load(std::memory_order_relaxed);
+    }
+  }
+}
+
+} // namespace engine
@@ -0,0 +1,91 @@
+#include "chess/symmetry.hpp"
+
+#include <algorithm>
+
+namespace engine {
+namespace symmetry {
+
+namespace {
+
+constexpr std::size_t CELLS = BOARD_N * BOARD_N;
+
+/** @brief Map one board; `out` may equal `in`. */
+void map_board(const piece::Code *in, int t, piece::Code *out) {
+  std::array<piece::Code, CELLS> tmp;
+  for (std::size_t sq = 0; sq < CELLS; ++sq)
+    tmp[TABLE.square[t][sq]] = map_piece(t, in[sq]);
+  std::copy(tmp.begin(), tmp.end(), out);
+}
+
+/** @return True if the mirror of `board` sorts strictly before `board`. */
+bool mirror_is_smaller(const piece::Code *board) {
+  for (int r = 0; r < BOARD_N; ++r) {
+    const piece::Code *row = board + r * BOARD_N;
+    for (int c = 0; c < BOARD_N; ++c) {
+      if (row[BOARD_N - 1 - c] != row[c])
+        return row[BOARD_N - 1 - c] < row[c];
+    }
+  }
+  return false; // symmetric board
+}
+
+/** @return Canonical transform of a board with side to move `to_move`. */
+Transform canonical_for(const piece::Code *board, Player to_move) {
+  if (to_move == 0)
+    return mirror_is_smaller(board) ? MIRROR : IDENTITY;
+  std::array<piece::Code, CELLS> flipped;
+  map_board(board, COLOR_FLIP, flipped.data());
+  return mirror_is_smaller(flipped.data()) ? MIRROR_COLOR_FLIP : COLOR_FLIP;
+}
+
+} // namespace
+
+State apply(const State &s, Transform t) {
+  State out = s;
+  map_board(s.board.data(), t, out.board.data());
+  if (t & COLOR_FLIP)
+    out.to_move = static_cast<Player>(1 - s.to_move);
+  refresh_derived(out);
+  return out;
+}
+
+Transform canonical_transform(const State &s) {
+  return canonical_for(s.board.data(), s.to_move);
+}
+
+State canonicalize(const State &s) {
+  return apply(s, canonical_transform(s));
+}
+
+std::uint64_t canonical_hash(const State &s) {
+  return canonicalize(s).hash;
+}
+
+void apply_boards(const piece::Code *boards, const Player *to_move, const std::uint8_t *transforms, std::size_t n,
+                  piece::Code *out_boards, Player *out_to_move) {
+  for (std::size_t i = 0; i < n; ++i) {
+    const int t = transforms[i];
+    map_board(boards + i * CELLS, t, out_boards + i * CELLS);
+    out_to_move[i] = (t & COLOR_FLIP) ? static_cast<Player>(1 - to_move[i]) : to_move[i];
+  }
+}
+
+void canonicalize_boards(const piece::Code *boards, const Player *to_move, std::size_t n, piece::Code *out_boards,
+                         Player *out_to_move, std::uint8_t *out_transforms) {
+  for (std::size_t i = 0; i < n; ++i) {
+    const Transform t = canonical_for(boards + i * CELLS, to_move[i]);
+    map_board(boards + i * CELLS, t, out_boards + i * CELLS);
+    out_to_move[i] = 0;
+    out_transforms[i] = t;
+  }
+}
+
+void apply_actions(const std::int64_t *actions, const std::uint8_t *transforms, std::size_t n, std::int64_t *out) {
+  for (std::size_t i = 0; i < n; ++i) {
+    const std::int64_t a = actions[i];
+    out[i] = a >= 0 && a < action::NUM_ACTIONS ? map_action(transforms[i], static_cast<int>(a)) : a;
+  }
+}
+
+} // namespace symmetry
+} // namespace engine
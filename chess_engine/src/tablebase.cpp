@@ -0,0 +1,581 @@
+#include "chess/tablebase.hpp"
+
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+#include "chess/symmetry.hpp"
+
+#include <algorithm>
+#include <array>
+#include <cstring>
+#include <exception>
+#include <fstream>
+#include <limits>
+#include <map>
+#include <stdexcept>
+#include <thread>
+#include <utility>
+
+#ifdef _WIN32
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#define WIN32_LEAN_AND_MEAN
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+namespace engine {
+
+namespace {
+
+constexpr char MAGIC[8] = {'P', 'C', 'T', 'B', 'A', 'S', 'E', '\0'};
+constexpr std::uint32_t VERSION = 1;
+constexpr std::size_t HEADER_SIZE = 32;
+constexpr std::size_t RECORD_SIZE = 24;
+constexpr std::uint32_t FLAG_STRICT = 1;
+
+constexpr int CELLS = BOARD_N * BOARD_N;
+constexpr int HALF_COLS = BOARD_N / 2;                ///< Columns the side to move's king is mirrored into.
+constexpr int KINDS = piece::QUEEN - piece::PAWN + 1; ///< Non-king unit types.
+constexpr int NUM_CODES = 2 * KINDS;                  ///< Non-king (side, type) pairs.
+constexpr int KEY_BASE = NUM_CODES + 1;
+constexpr int MAX_OTHERS = MAX_TABLEBASE_PIECES - 2;
+
+constexpr std::uint8_t DRAW = 0;
+constexpr std::uint8_t INVALID = 255;
+constexpr int MAX_PLIES = 253; ///< Largest distance an entry byte can hold.
+
+constexpr std::size_t num_keys() {
+  std::size_t n = 1;
+  for (int i = 0; i < MAX_OTHERS; ++i)
+    n *= KEY_BASE;
+  return n;
+}
+
+/** @brief Non-king material: codes side * KINDS + (type - PAWN), sorted ascending. */
+struct Signature {
+  int size = 0;
+  std::array<int, MAX_OTHERS> codes{};
+};
+
+/** @brief Insertion sort of a[0, n); the arrays hold at most MAX_OTHERS items. */
+template <typename T, std::size_t N> void sort_prefix(std::array<T, N> &a, int n) {
+  for (int i = 1; i < n; ++i) {
+    for (int j = i; j > 0 && a[j] < a[j - 1]; --j)
+      std::swap(a[j], a[j - 1]);
+  }
+}
+
+std::uint32_t key_of(const Signature &sig) {
+  std::uint32_t key = 0, mult = 1;
+  for (int i = 0; i < sig.size; ++i, mult *= KEY_BASE)
+    key += static_cast<std::uint32_t>(sig.codes[i] + 1) * mult;
+  return key;
+}
+
+/** @return The signature of `key`, or nullopt if the key is malformed. */
+std::optional<Signature> signature_of(std::uint32_t key) {
+  Signature sig;
+  for (; key != 0; key /= KEY_BASE) {
+    const int digit = static_cast<int>(key % KEY_BASE);
+    if (digit == 0 || sig.size == MAX_OTHERS || (sig.size > 0 && digit - 1 < sig.codes[sig.size - 1]))
+      return std::nullopt;
+    sig.codes[sig.size++] = digit - 1;
+  }
+  return sig;
+}
+
+/** @return The same material with the players swapped. */
+Signature flipped(Signature sig) {
+  for (int i = 0; i < sig.size; ++i)
+    sig.codes[i] = (sig.codes[i] + KINDS) % NUM_CODES;
+  sort_prefix(sig.codes, sig.size);
+  return sig;
+}
+
+int pawns_in(const Signature &sig) {
+  return static_cast<int>(std::count_if(sig.codes.begin(), sig.codes.begin() + sig.size, [](int c) { return c % KINDS == 0; }));
+}
+
+std::uint64_t table_size(int others) {
+  std::uint64_t n = static_cast<std::uint64_t>(BOARD_N) * HALF_COLS * CELLS;
+  for (int i = 0; i < others; ++i)
+    n *= CELLS;
+  return n;
+}
+
+int start_row(int side) {
+  return side == 0 ? BOARD_N - 2 : 1;
+}
+
+/** @brief Where a position is stored: table key and index within that table. */
+struct Location {
+  std::uint32_t key = 0;
+  std::uint64_t index = 0;
+};
+
+/**
+ * @return Location of the canonical image of `s`, or nullopt if no table of a
+ * `max_pieces` tablebase can hold it.
+ */
+std::optional<Location> locate(const State &s, int max_pieces) {
+  if (s.king_sq[0] == NO_SQUARE || s.king_sq[1] == NO_SQUARE || s.to_move > 1)
+    return std::nullopt;
+  int others = 0;
+  for (int side = 0; side < 2; ++side) {
+    for (int t = piece::PAWN; t <= piece::QUEEN; ++t)
+      others += s.counts[side][t];
+  }
+  if (others > max_pieces - 2)
+    return std::nullopt;
+
+  const Player us = s.to_move;
+  int t = us ? symmetry::COLOR_FLIP : symmetry::IDENTITY;
+  if (symmetry::map_square(t, s.king_sq[us]) % BOARD_N >= HALF_COLS)
+    t |= symmetry::MIRROR;
+
+  std::array<std::pair<int, int>, MAX_OTHERS> pieces{}; // (code, square) after the transform
+  int n = 0;
+  for (int sq = 0; sq < CELLS; ++sq) {
+    const piece::Code pc = s.board[sq];
+    const int type = piece::unit_type(pc);
+    if (type == piece::EMPTY || type == piece::KING)
+      continue;
+    const int side = side_index(pc);
+    if (type > piece::QUEEN || n == others)
+      return std::nullopt; // unknown kind, or counts out of date
+    if (type == piece::PAWN && piece::has_moved(pc) == (sq / BOARD_N == start_row(side)))
+      return std::nullopt; // double-push right differs from what the row implies
+    pieces[n++] = {(side ^ us) * KINDS + (type - piece::PAWN), symmetry::map_square(t, sq)};
+  }
+  sort_prefix(pieces, n);
+
+  const int k0 = symmetry::map_square(t, s.king_sq[us]);
+  Location loc;
+  loc.index = static_cast<std::uint64_t>((k0 / BOARD_N) * HALF_COLS + k0 % BOARD_N);
+  loc.index = loc.index * CELLS + static_cast<std::uint64_t>(symmetry::map_square(t, s.king_sq[1 - us]));
+  std::uint32_t mult = 1;
+  for (int i = 0; i < n; ++i, mult *= KEY_BASE) {
+    loc.index = loc.index * CELLS + static_cast<std::uint64_t>(pieces[i].second);
+    loc.key += static_cast<std::uint32_t>(pieces[i].first + 1) * mult;
+  }
+  return loc;
+}
+
+std::optional<TablebaseEntry> decode_entry(std::uint8_t v) {
+  if (v == INVALID)
+    return std::nullopt;
+  if (v == DRAW)
+    return TablebaseEntry{0, 0};
+  const std::uint32_t plies = v - 1u;
+  return TablebaseEntry{plies % 2 ? 1 : -1, plies};
+}
+
+/**
+ * @brief Build the position stored at `index` of the table for `sig` (player 0 to move).
+ * @return False if the index holds no position (shared squares, pawn on a back rank).
+ */
+bool position_at(const Signature &sig, std::uint64_t index, State &s) {
+  std::array<int, MAX_OTHERS> squares{};
+  for (int i = sig.size; i-- > 0; index /= CELLS)
+    squares[i] = static_cast<int>(index % CELLS);
+  const int k1 = static_cast<int>(index % CELLS);
+  index /= CELLS;
+  const int k0 = static_cast<int>(index / HALF_COLS) * BOARD_N + static_cast<int>(index % HALF_COLS);
+
+  s = State{};
+  s.board.fill(piece::EMPTY);
+  s.board[k0] = piece::make(piece::KING, piece::P1);
+  if (k1 == k0)
+    return false;
+  s.board[k1] = piece::make(piece::KING, piece::P2);
+  for (int i = 0; i < sig.size; ++i) {
+    const int sq = squares[i], row = sq / BOARD_N;
+    const int side = sig.codes[i] / KINDS;
+    const auto type = static_cast<piece::UnitType>(sig.codes[i] % KINDS + piece::PAWN);
+    if (!piece::is_empty(s.board[sq]))
+      return false;
+    if (type == piece::PAWN && (row == 0 || row == BOARD_N - 1))
+      return false; // promoted, or behind its start row
+    const bool moved = type == piece::PAWN && row != start_row(side);
+    s.board[sq] = piece::make(type, side ? piece::P2 : piece::P1, moved);
+  }
+  refresh_derived(s);
+  return true;
+}
+
+void put_u32(std::string &out, std::uint32_t v) {
+  for (int b = 0; b < 4; ++b)
+    out.push_back(static_cast<char>((v >> (8 * b)) & 0xFF));
+}
+
+void put_u64(std::string &out, std::uint64_t v) {
+  for (int b = 0; b < 8; ++b)
+    out.push_back(static_cast<char>((v >> (8 * b)) & 0xFF));
+}
+
+std::uint64_t get_le(const std::uint8_t *p, int bytes) {
+  std::uint64_t v = 0;
+  for (int b = 0; b < bytes; ++b)
+    v |= static_cast<std::uint64_t>(p[b]) << (8 * b);
+  return v;
+}
+
+/** @brief Retrograde solver; tables are kept in memory until written. */
+class Solver {
+public:
+  Solver(int max_pieces, bool strict_legality, int n_threads)
+      : engine_(EngineConfig{std::numeric_limits<std::uint32_t>::max(), strict_legality}), max_pieces_(max_pieces),
+        n_threads_(n_threads) {}
+
+  /** @brief Solve every signature, fewest pieces and pawns first. */
+  void run() {
+    std::vector<Signature> all;
+    Signature sig;
+    enumerate(sig, 0, all);
+    std::stable_sort(all.begin(), all.end(), [](const Signature &a, const Signature &b) {
+      return std::make_pair(a.size, pawns_in(a)) < std::make_pair(b.size, pawns_in(b));
+    });
+    for (const Signature &x : all) {
+      if (solved_.count(key_of(x)))
+        continue;
+      const Signature y = flipped(x);
+      // Player 0 always moves in stored positions, so a table's successors lie in its mirror image.
+      if (key_of(y) == key_of(x))
+        solve({x});
+      else
+        solve({x, y});
+    }
+  }
+
+  TablebaseSummary write(const std::string &path) const {
+    std::string head(MAGIC, sizeof(MAGIC));
+    put_u32(head, VERSION);
+    put_u32(head, BOARD_N);
+    put_u32(head, static_cast<std::uint32_t>(max_pieces_));
+    put_u32(head, engine_.config().strict_legality ? FLAG_STRICT : 0);
+    put_u32(head, static_cast<std::uint32_t>(solved_.size()));
+    put_u32(head, 0);
+    std::uint64_t offset = HEADER_SIZE + RECORD_SIZE * solved_.size();
+    for (const auto &[key, table] : solved_) {
+      put_u32(head, key);
+      put_u32(head, 0);
+      put_u64(head, offset);
+      put_u64(head, table.size());
+      offset += table.size();
+    }
+
+    std::ofstream out(path, std::ios::binary | std::ios::trunc);
+    if (!out)
+      throw std::runtime_error("cannot open " + path + " for writing");
+    out.write(head.data(), static_cast<std::streamsize>(head.size()));
+    for (const auto &entry : solved_)
+      out.write(reinterpret_cast<const char *>(entry.second.data()), static_cast<std::streamsize>(entry.second.size()));
+    if (!out.flush())
+      throw std::runtime_error("failed to write " + path);
+
+    TablebaseSummary summary = summary_;
+    summary.tables = solved_.size();
+    summary.bytes = offset;
+    return summary;
+  }
+
+private:
+  enum Flag : std::uint8_t { VALID = 1, HAS_DRAW = 2, MATED = 4 };
+
+  /** @brief Per-position facts gathered from its moves. */
+  struct Node {
+    std::uint16_t remaining = 0; ///< Successors in this component not yet known to win.
+    std::uint8_t flags = 0;
+    std::uint8_t win_at = 0;   ///< Fastest win through a solved table (0 = none).
+    std::uint8_t loss_max = 0; ///< Longest loss through solved tables or children known to win.
+  };
+
+  void enumerate(Signature &sig, int first, std::vector<Signature> &out) const {
+    out.push_back(sig);
+    if (sig.size == max_pieces_ - 2)
+      return;
+    for (int c = first; c < NUM_CODES; ++c) {
+      sig.codes[sig.size++] = c;
+      enumerate(sig, c, out);
+      --sig.size;
+    }
+  }
+
+  void solve(const std::vector<Signature> &sigs) {
+    std::vector<std::uint32_t> keys;
+    std::vector<std::uint64_t> base{0};
+    for (const Signature &sig : sigs) {
+      keys.push_back(key_of(sig));
+      base.push_back(base.back() + table_size(sig.size));
+    }
+    const std::uint64_t n = base.back();
+    std::vector<Node> nodes(n);
+
+    // 1. Generate every position's moves: classify exits into solved tables, keep edges inside.
+    std::size_t workers =
+        n_threads_ > 0 ? static_cast<std::size_t>(n_threads_) : std::max(1u, std::thread::hardware_concurrency());
+    workers = std::max<std::size_t>(1, std::min<std::size_t>(workers, n / 4096));
+    std::vector<std::vector<std::uint32_t>> edges(workers); // targets, in source order per worker
+    std::vector<std::exception_ptr> errors(workers);
+    auto scan = [&](std::size_t w) {
+      try {
+        const std::uint64_t begin = n * w / workers, end = n * (w + 1) / workers;
+        for (std::uint64_t p = begin; p < end; ++p) {
+          const std::size_t t = std::upper_bound(base.begin(), base.end(), p) - base.begin() - 1;
+          expand(sigs[t], p - base[t], keys, base, nodes[p], edges[w]);
+        }
+      } catch (...) {
+        errors[w] = std::current_exception();
+      }
+    };
+    if (workers == 1) {
+      scan(0);
+    } else {
+      std::vector<std::thread> threads;
+      for (std::size_t w = 0; w < workers; ++w)
+        threads.emplace_back(scan, w);
+      for (std::thread &t : threads)
+        t.join();
+    }
+    for (const std::exception_ptr &e : errors) {
+      if (e)
+        std::rethrow_exception(e);
+    }
+
+    // 2. Reverse the edges: predecessors of p are preds[pred_start[p], pred_start[p + 1]).
+    std::vector<std::uint32_t> pred_start(n + 1, 0);
+    for (const auto &list : edges) {
+      for (std::uint32_t target : list)
+        ++pred_start[target + 1];
+    }
+    for (std::uint64_t p = 0; p < n; ++p)
+      pred_start[p + 1] += pred_start[p];
+    std::vector<std::uint32_t> preds(pred_start[n]);
+    {
+      std::vector<std::uint32_t> cursor(pred_start.begin(), pred_start.end() - 1);
+      for (std::size_t w = 0; w < workers; ++w) {
+        std::size_t e = 0;
+        for (std::uint64_t p = n * w / workers; p < n * (w + 1) / workers; ++p) {
+          for (std::uint16_t k = 0; k < nodes[p].remaining; ++k)
+            preds[cursor[edges[w][e++]]++] = static_cast<std::uint32_t>(p);
+        }
+        std::vector<std::uint32_t>().swap(edges[w]);
+      }
+    }
+
+    // 3. Retrograde: resolve positions in order of distance. Wins sit at odd, losses at even plies.
+    std::vector<std::uint8_t> value(n, DRAW); // plies + 1 once resolved
+    std::vector<std::vector<std::uint32_t>> bucket(MAX_PLIES + 1);
+    auto schedule = [&](std::uint64_t p, int plies) {
+      if (plies > MAX_PLIES)
+        throw std::runtime_error("tablebase distance exceeds " + std::to_string(MAX_PLIES) + " plies");
+      bucket[plies].push_back(static_cast<std::uint32_t>(p));
+    };
+    for (std::uint64_t p = 0; p < n; ++p) {
+      const Node &v = nodes[p];
+      if (v.flags & MATED)
+        schedule(p, 0);
+      else if (v.win_at)
+        schedule(p, v.win_at);
+      else if ((v.flags & VALID) && v.remaining == 0 && !(v.flags & HAS_DRAW))
+        schedule(p, v.loss_max);
+    }
+    for (int d = 0; d <= MAX_PLIES; ++d) {
+      for (std::size_t i = 0; i < bucket[d].size(); ++i) {
+        const std::uint32_t p = bucket[d][i];
+        if (value[p] != DRAW)
+          continue;
+        value[p] = static_cast<std::uint8_t>(d + 1);
+        for (std::uint32_t k = pred_start[p]; k < pred_start[p + 1]; ++k) {
+          const std::uint32_t q = preds[k];
+          if (value[q] != DRAW)
+            continue;
+          if (d % 2 == 0) { // p is lost for its mover: q wins by moving there
+            schedule(q, d + 1);
+            continue;
+          }
+          Node &v = nodes[q]; // p is won for its mover: one fewer escape for q
+          v.loss_max = std::max<std::uint8_t>(v.loss_max, static_cast<std::uint8_t>(d + 1));
+          if (--v.remaining == 0 && !(v.flags & HAS_DRAW) && !v.win_at)
+            schedule(q, v.loss_max);
+        }
+      }
+      std::vector<std::uint32_t>().swap(bucket[d]);
+    }
+
+    // 4. Store the tables.
+    for (std::size_t t = 0; t < sigs.size(); ++t) {
+      std::vector<std::uint8_t> &table = solved_[keys[t]];
+      table.resize(base[t + 1] - base[t]);
+      for (std::uint64_t i = 0; i < table.size(); ++i) {
+        const std::uint64_t p = base[t] + i;
+        table[i] = (nodes[p].flags & VALID) ? value[p] : INVALID;
+        if (!(nodes[p].flags & VALID))
+          continue;
+        ++summary_.positions;
+        if (value[p] == DRAW) {
+          ++summary_.draws;
+          continue;
+        }
+        ++((value[p] - 1) % 2 ? summary_.wins : summary_.losses);
+        summary_.longest = std::max<std::uint32_t>(summary_.longest, value[p] - 1u);
+      }
+    }
+  }
+
+  /** @brief Fill `node` from the moves of position `index` of `sig`; internal targets go to `edges`. */
+  void expand(const Signature &sig, std::uint64_t index, const std::vector<std::uint32_t> &keys,
+              const std::vector<std::uint64_t> &base, Node &node, std::vector<std::uint32_t> &edges) const {
+    State s;
+    if (!position_at(sig, index, s))
+      return;
+    node.flags = VALID;
+    MoveList moves;
+    engine_.legal_moves(s, moves);
+    if (moves.empty()) {
+      node.flags |= engine_.config().strict_legality && engine_.in_check(s, 0) ? MATED : HAS_DRAW;
+      return;
+    }
+    auto win_in = [&node](int plies) {
+      if (!node.win_at || plies < node.win_at)
+        node.win_at = static_cast<std::uint8_t>(plies);
+    };
+    for (const Move &m : moves) {
+      State child = s;
+      engine_.make_move(child, m);
+      if (child.king_sq[1] == NO_SQUARE) {
+        win_in(1);
+        continue;
+      }
+      const std::optional<Location> loc = locate(child, max_pieces_);
+      if (!loc)
+        throw std::logic_error("tablebase: a successor position has no table entry");
+      const auto own = std::find(keys.begin(), keys.end(), loc->key);
+      if (own != keys.end()) {
+        edges.push_back(static_cast<std::uint32_t>(base[own - keys.begin()] + loc->index));
+        ++node.remaining;
+        continue;
+      }
+      const std::uint8_t v = solved_.at(loc->key)[loc->index];
+      if (v == INVALID)
+        throw std::logic_error("tablebase: a successor position is marked invalid");
+      if (v == DRAW)
+        node.flags |= HAS_DRAW;
+      else if ((v - 1) % 2) // the opponent wins there
+        node.loss_max = std::max<std::uint8_t>(node.loss_max, v);
+      else
+        win_in(v);
+    }
+  }
+
+  const Engine engine_;
+  const int max_pieces_;
+  const int n_threads_;
+  std::map<std::uint32_t, std::vector<std::uint8_t>> solved_;
+  TablebaseSummary summary_;
+};
+
+#ifdef _WIN32
+void unmap(const std::uint8_t *data, void *mapping) {
+  if (data)
+    UnmapViewOfFile(data);
+  if (mapping)
+    CloseHandle(static_cast<HANDLE>(mapping));
+}
+#else
+void unmap(const std::uint8_t *data, std::size_t size) {
+  if (data)
+    munmap(const_cast<std::uint8_t *>(data), size);
+}
+#endif
+
+} // namespace
+
+Tablebase::Tablebase(const std::string &path) : path_(path) {
+#ifdef _WIN32
+  HANDLE file = CreateFileA(path.c_str(), GENERIC_READ, FILE_SHARE_READ, nullptr, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, nullptr);
+  if (file == INVALID_HANDLE_VALUE)
+    throw std::runtime_error("cannot open tablebase " + path);
+  LARGE_INTEGER file_size;
+  GetFileSizeEx(file, &file_size);
+  size_ = static_cast<std::size_t>(file_size.QuadPart);
+  HANDLE mapping = size_ ? CreateFileMappingA(file, nullptr, PAGE_READONLY, 0, 0, nullptr) : nullptr;
+  CloseHandle(file);
+  if (mapping) {
+    mapping_ = mapping;
+    data_ = static_cast<const std::uint8_t *>(MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0));
+  }
+  auto fail = [&](const std::string &why) {
+    unmap(data_, mapping_);
+    throw std::runtime_error("tablebase " + path + ": " + why);
+  };
+#else
+  const int fd = ::open(path.c_str(), O_RDONLY);
+  if (fd < 0)
+    throw std::runtime_error("cannot open tablebase " + path);
+  struct stat st{};
+  if (::fstat(fd, &st) == 0 && st.st_size > 0) {
+    size_ = static_cast<std::size_t>(st.st_size);
+    void *p = ::mmap(nullptr, size_, PROT_READ, MAP_SHARED, fd, 0);
+    data_ = p == MAP_FAILED ? nullptr : static_cast<const std::uint8_t *>(p);
+  }
+  ::close(fd);
+  auto fail = [&](const std::string &why) {
+    unmap(data_, size_);
+    throw std::runtime_error("tablebase " + path + ": " + why);
+  };
+#endif
+  if (!data_ || size_ < HEADER_SIZE || std::memcmp(data_, MAGIC, sizeof(MAGIC)) != 0)
+    fail("not a tablebase file");
+  if (get_le(data_ + 8, 4) != VERSION)
+    fail("unsupported version " + std::to_string(get_le(data_ + 8, 4)));
+  if (get_le(data_ + 12, 4) != BOARD_N)
+    fail("built for a different board size");
+  max_pieces_ = static_cast<int>(get_le(data_ + 16, 4));
+  strict_legality_ = (get_le(data_ + 20, 4) & FLAG_STRICT) != 0;
+  const std::uint64_t num_tables = get_le(data_ + 24, 4);
+  if (max_pieces_ < 2 || max_pieces_ > MAX_TABLEBASE_PIECES || HEADER_SIZE + RECORD_SIZE * num_tables > size_)
+    fail("corrupt header");
+
+  tables_.assign(num_keys(), nullptr);
+  for (std::uint64_t i = 0; i < num_tables; ++i) {
+    const std::uint8_t *record = data_ + HEADER_SIZE + RECORD_SIZE * i;
+    const std::uint64_t key = get_le(record, 4), offset = get_le(record + 8, 8), bytes = get_le(record + 16, 8);
+    const std::optional<Signature> sig = key < num_keys() ? signature_of(static_cast<std::uint32_t>(key)) : std::nullopt;
+    if (!sig || sig->size > max_pieces_ - 2 || bytes != table_size(sig->size) || offset > size_ || bytes > size_ - offset)
+      fail("corrupt table directory");
+    tables_[key] = data_ + offset;
+  }
+}
+
+Tablebase::~Tablebase() {
+#ifdef _WIN32
+  unmap(data_, mapping_);
+#else
+  unmap(data_, size_);
+#endif
+}
+
+std::optional<TablebaseEntry> Tablebase::probe(const State &s) const {
+  const std::optional<Location> loc = locate(s, max_pieces_);
+  if (!loc || !tables_[loc->key])
+    return std::nullopt;
+  return decode_entry(tables_[loc->key][loc->index]);
+}
+
+TablebaseSummary generate_tablebase(const std::string &path, int max_pieces, bool strict_legality, int n_threads) {
+  if (max_pieces < 2 || max_pieces > MAX_TABLEBASE_PIECES)
+    throw std::invalid_argument("max_pieces must be in [2, " + std::to_string(MAX_TABLEBASE_PIECES) + "]");
+  Solver solver(max_pieces, strict_legality, n_threads);
+  solver.run();
+  return solver.write(path);
+}
+
+} // namespace engine
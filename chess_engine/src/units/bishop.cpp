@@ -1,13 +1,13 @@
 #include "chess/config.hpp"
 #include "chess/engine.hpp"
 #include "chess/move.hpp"
+#include "chess/move_list.hpp"
 #include "chess/piece.hpp"
 #include "chess/state.hpp"
 #include "units/unit.hpp"
 
 #include <array>
 #include <memory>
-#include <vector>
 
 namespace engine {
 
@@ -15,8 +15,7 @@ class Bishop : public Unit {
 public:
   using Unit::Unit; // inherit ctor
 
-  std::vector<Move> get_legal_moves(const State &state, Square from) const override {
-    std::vector<Move> moves;
+  void generate_moves(const State &state, Square from, MoveList &moves) const override {
     int row = Engine::row(from);
     int col = Engine::col(from);
 
@@ -46,8 +45,6 @@ public:
         new_col += direction.col;
       }
     }
-
-    return moves;
   }
 
   char symbol() const override {
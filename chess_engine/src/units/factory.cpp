@@ -33,4 +33,35 @@ std::unique_ptr<Unit> make_unit_from_code(piece::Code code) {
   }
 }
 
+const Unit *unit_for_code(piece::Code code) {
+  if (piece::is_empty(code))
+    return nullptr;
+
+  // Units are stateless apart from their owner, so one instance per (type, owner) suffices.
+  static const King kings[2] = {King(0), King(1)};
+  static const Queen queens[2] = {Queen(0), Queen(1)};
+  static const Rook rooks[2] = {Rook(0), Rook(1)};
+  static const Bishop bishops[2] = {Bishop(0), Bishop(1)};
+  static const Knight knights[2] = {Knight(0), Knight(1)};
+  static const Pawn pawns[2] = {Pawn(0), Pawn(1)};
+
+  const int owner = piece::is_p1(code) ? 0 : 1;
+  switch (piece::unit_type(code)) {
+  case piece::KING:
+    return &kings[owner];
+  case piece::QUEEN:
+    return &queens[owner];
+  case piece::ROOK:
+    return &rooks[owner];
+  case piece::BISHOP:
+    return &bishops[owner];
+  case piece::KNIGHT:
+    return &knights[owner];
+  case piece::PAWN:
+    return &pawns[owner];
+  default:
+    return nullptr;
+  }
+}
+
 } // namespace engine
@@ -0,0 +1,96 @@
+/**
+ * @file test_action.cpp
+ * @brief Canonical action table: size, ordering, and round trips through generated moves.
+ */
+
+#include "chess/action.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/state.hpp"
+
+#include <array>
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <random>
+
+using namespace engine;
+
+TEST_CASE("action table is sorted and indexes both ways", "[action]") {
+  // Queen lines and knight jumps on 6x6; changing this breaks trained policy heads.
+  REQUIRE(action::NUM_ACTIONS == 740);
+
+  int prev = -1;
+  for (int a = 0; a < action::NUM_ACTIONS; ++a) {
+    const int from = action::TABLE.from[a], to = action::TABLE.to[a];
+    REQUIRE(from * BOARD_N * BOARD_N + to > prev);
+    prev = from * BOARD_N * BOARD_N + to;
+    REQUIRE(action::TABLE.id[from][to] == a);
+  }
+
+  // Spot checks: a knight jump exists, a non-line pair does not, nor a null move.
+  REQUIRE(action::TABLE.id[0][Engine::get_pos(1, 2)] >= 0);
+  REQUIRE(action::TABLE.id[0][Engine::get_pos(1, 3)] == -1);
+  REQUIRE(action::TABLE.id[7][7] == -1);
+}
+
+TEST_CASE("every generated move round-trips through its action id", "[action]") {
+  Engine E;
+  std::mt19937 rng(7);
+
+  for (int game = 0; game < 50; ++game) {
+    State s = E.initial_state();
+    for (int ply = 0; ply < 200; ++ply) {
+      const auto moves = E.legal_moves(s);
+      if (moves.empty())
+        break;
+      for (const Move &m : moves) {
+        const int a = action::encode(m);
+        REQUIRE(a >= 0);
+        const Move back = action::decode(s, a);
+        REQUIRE(back.from == m.from);
+        REQUIRE(back.to == m.to);
+        REQUIRE(back.type == m.type);
+        REQUIRE(back.promo_piece == m.promo_piece);
+        REQUIRE(E.is_legal(s, back));
+      }
+      if (E.apply_move(s, moves[rng() % moves.size()]).done)
+        break;
+    }
+  }
+}
+
+TEST_CASE("special moves have no action id", "[action]") {
+  Move m{0, 1};
+  REQUIRE(action::encode(m) >= 0);
+  m.special_code = 3;
+  REQUIRE(action::encode(m) == -1);
+}
+
+TEST_CASE("legal_action_mask marks exactly the generated moves", "[action][mask]") {
+  Engine E;
+  std::mt19937 rng(3);
+  std::array<std::int8_t, action::NUM_ACTIONS> mask;
+
+  for (int game = 0; game < 20; ++game) {
+    State s = E.initial_state();
+    for (int ply = 0; ply < 200; ++ply) {
+      mask.fill(7); // stale contents must be overwritten
+      E.legal_action_mask(s, mask.data());
+      const auto moves = E.legal_moves(s);
+
+      int ones = 0, others = 0;
+      for (std::int8_t v : mask) {
+        ones += v == 1;
+        others += v != 0 && v != 1;
+      }
+      REQUIRE(others == 0);
+      REQUIRE(ones == static_cast<int>(moves.size()));
+      for (const Move &m : moves)
+        REQUIRE(mask[action::encode(m)] == 1);
+
+      if (moves.empty() || E.apply_move(s, moves[rng() % moves.size()]).done)
+        break;
+    }
+  }
+}
@@ -0,0 +1,202 @@
+/**
+ * @file test_attacks.cpp
+ * @brief Attack maps, check detection and the strict-legality mode.
+ */
+
+#include "chess/attacks.hpp"
+#include "chess/bitboard.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+#include "chess/search.hpp"
+#include "chess/state.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <random>
+#include <vector>
+
+using namespace engine;
+
+namespace {
+
+/** @brief Naive attack set of the piece on `sq`: walk every direction square by square. */
+Bitboard reference_attacks(const State &s, int sq) {
+  const piece::Code pc = s.board[sq];
+  const int r = sq / BOARD_N, c = sq % BOARD_N;
+  Bitboard out = 0;
+  auto add = [&](int rr, int cc) {
+    if (rr >= 0 && rr < BOARD_N && cc >= 0 && cc < BOARD_N)
+      out |= bb::square(rr * BOARD_N + cc);
+  };
+  auto slide = [&](int dr, int dc) {
+    for (int rr = r + dr, cc = c + dc; rr >= 0 && rr < BOARD_N && cc >= 0 && cc < BOARD_N; rr += dr, cc += dc) {
+      out |= bb::square(rr * BOARD_N + cc);
+      if (!piece::is_empty(s.board[rr * BOARD_N + cc]))
+        break;
+    }
+  };
+  switch (piece::unit_type(pc)) {
+  case piece::PAWN: {
+    const int dr = piece::is_p1(pc) ? -1 : 1;
+    add(r + dr, c - 1);
+    add(r + dr, c + 1);
+    break;
+  }
+  case piece::KNIGHT:
+    for (auto [dr, dc] : {std::pair{1, 2}, {2, 1}, {-1, 2}, {-2, 1}, {1, -2}, {2, -1}, {-1, -2}, {-2, -1}})
+      add(r + dr, c + dc);
+    break;
+  case piece::KING:
+    for (int dr = -1; dr <= 1; ++dr)
+      for (int dc = -1; dc <= 1; ++dc)
+        if (dr || dc)
+          add(r + dr, c + dc);
+    break;
+  default:
+    break;
+  }
+  const int t = piece::unit_type(pc);
+  if (t == piece::ROOK || t == piece::QUEEN)
+    for (auto [dr, dc] : {std::pair{1, 0}, {-1, 0}, {0, 1}, {0, -1}})
+      slide(dr, dc);
+  if (t == piece::BISHOP || t == piece::QUEEN)
+    for (auto [dr, dc] : {std::pair{1, 1}, {1, -1}, {-1, 1}, {-1, -1}})
+      slide(dr, dc);
+  return out;
+}
+
+/** @brief Legality the slow way: make the move, regenerate every reply, look for a king capture. */
+std::vector<Move> reference_strict_moves(const Engine &pseudo, const State &s) {
+  std::vector<Move> out;
+  for (const Move &m : pseudo.legal_moves(s)) {
+    State after = s;
+    pseudo.make_move(after, m);
+    bool king_en_prise = false;
+    for (const Move &reply : pseudo.legal_moves(after))
+      king_en_prise |= piece::unit_type(after.board[reply.to]) == piece::KING;
+    if (!king_en_prise)
+      out.push_back(m);
+  }
+  return out;
+}
+
+State position(std::initializer_list<std::pair<int, piece::Code>> pieces, Player to_move) {
+  State s{};
+  s.board.fill(piece::EMPTY);
+  for (const auto &[sq, pc] : pieces)
+    s.board[sq] = pc;
+  s.to_move = to_move;
+  refresh_derived(s);
+  return s;
+}
+
+piece::Code p1(piece::UnitType t) {
+  return piece::make(t, piece::P1);
+}
+piece::Code p2(piece::UnitType t) {
+  return piece::make(t, piece::P2);
+}
+
+} // namespace
+
+TEST_CASE("attack maps and attackers_to match a naive reference", "[attacks]") {
+  Engine E;
+  std::mt19937 rng(17);
+  int mismatches = 0, positions = 0;
+  for (int game = 0; game < 30; ++game) {
+    State s = E.initial_state();
+    while (!E.is_terminal(s)) {
+      const Bitboards bbs = Bitboards::from_state(s);
+      for (Player by = 0; by < 2; ++by) {
+        Bitboard expected = 0;
+        std::vector<Bitboard> per_square(BOARD_N * BOARD_N, 0);
+        for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+          if (piece::is_empty(s.board[sq]) || side_index(s.board[sq]) != by)
+            continue;
+          const Bitboard a = reference_attacks(s, sq);
+          expected |= a;
+          for (Bitboard b = a; b;)
+            per_square[bb::pop_lsb(b)] |= bb::square(sq);
+        }
+        mismatches += E.attack_map(s, by) != expected;
+        for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+          mismatches += attackers_to(bbs, sq, by, bbs.occupied()) != per_square[sq];
+          mismatches += E.is_square_attacked(s, static_cast<Square>(sq), by) != (per_square[sq] != 0);
+        }
+      }
+      ++positions;
+      const auto moves = E.legal_moves(s);
+      if (moves.empty())
+        break;
+      E.apply_move(s, moves[rng() % moves.size()]);
+    }
+  }
+  REQUIRE(positions > 100);
+  REQUIRE(mismatches == 0);
+}
+
+TEST_CASE("strict legality matches regenerating every reply", "[attacks][strict]") {
+  const Engine pseudo;
+  const Engine strict(EngineConfig{MAX_GAME_PLY, /*strict_legality=*/true});
+  std::mt19937 rng(3);
+  int mismatches = 0, filtered = 0, positions = 0;
+  for (int game = 0; game < 40; ++game) {
+    State s = strict.initial_state();
+    while (!strict.is_terminal(s)) {
+      const std::vector<Move> expected = reference_strict_moves(pseudo, s);
+      const std::vector<Move> got = strict.legal_moves(s);
+      filtered += pseudo.legal_moves(s).size() != got.size();
+      bool same = expected.size() == got.size();
+      for (std::size_t i = 0; same && i < got.size(); ++i)
+        same = expected[i].from == got[i].from && expected[i].to == got[i].to;
+      mismatches += !same;
+      ++positions;
+      REQUIRE_FALSE(got.empty());
+      strict.apply_move(s, got[rng() % got.size()]);
+      REQUIRE(s.king_sq[0] != NO_SQUARE);
+      REQUIRE(s.king_sq[1] != NO_SQUARE);
+    }
+  }
+  REQUIRE(positions > 100);
+  REQUIRE(filtered > 0); // checks and pins actually occurred
+  REQUIRE(mismatches == 0);
+}
+
+TEST_CASE("in_check and checkmate / stalemate outcomes", "[attacks][strict]") {
+  const Engine pseudo;
+  const Engine strict(EngineConfig{MAX_GAME_PLY, true});
+
+  // Rooks on rows 0 and 1 mate the P2 king in the corner.
+  const State mate = position({{0, p2(piece::KING)}, {4, p1(piece::ROOK)}, {11, p1(piece::ROOK)}, {35, p1(piece::KING)}}, 1);
+  REQUIRE(strict.in_check(mate, 1));
+  REQUIRE_FALSE(strict.in_check(mate, 0));
+  REQUIRE(strict.legal_moves(mate).empty());
+  REQUIRE(strict.outcome(mate) == Outcome::Player0Wins);
+  REQUIRE(pseudo.outcome(mate) == Outcome::Ongoing);
+
+  // Queen on (1,2) covers every flight square without giving check.
+  const State stalemate = position({{0, p2(piece::KING)}, {8, p1(piece::QUEEN)}, {35, p1(piece::KING)}}, 1);
+  REQUIRE_FALSE(strict.in_check(stalemate, 1));
+  REQUIRE(strict.legal_moves(stalemate).empty());
+  REQUIRE(strict.outcome(stalemate) == Outcome::Draw);
+
+  // A pinned rook may only move along the pin line.
+  const State pin = position({{33, p1(piece::KING)}, {27, p1(piece::ROOK)}, {3, p2(piece::ROOK)}, {0, p2(piece::KING)}}, 0);
+  for (const Move &m : strict.legal_moves_from(pin, 27))
+    REQUIRE(m.to % BOARD_N == 3);
+  REQUIRE(strict.legal_moves_from(pin, 27).size() == 4);
+  REQUIRE(pseudo.legal_moves_from(pin, 27).size() == 9);
+}
+
+TEST_CASE("strict search scores checkmate as a win", "[attacks][strict][search]") {
+  const Engine strict(EngineConfig{MAX_GAME_PLY, true});
+  // P1 to move: rook (3,4) -> (0,4) mates, the other rook guarding row 1.
+  const State s = position({{0, p2(piece::KING)}, {22, p1(piece::ROOK)}, {11, p1(piece::ROOK)}, {35, p1(piece::KING)}}, 0);
+  const SearchResult r = strict.search(s, 3);
+  REQUIRE(r.has_move);
+  REQUIRE(r.best_move.from == 22);
+  REQUIRE(r.best_move.to == 4);
+  REQUIRE(r.score >= MATE_SCORE - MAX_SEARCH_PLY);
+}
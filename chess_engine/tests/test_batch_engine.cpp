@@ -0,0 +1,143 @@
+/**
+ * @file test_batch_engine.cpp
+ * @brief BatchEngine: lock-step games match Engine, masks, auto-reset (and final states) and action validation.
+ */
+
+#include "chess/action.hpp"
+#include "chess/batch_engine.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <random>
+#include <stdexcept>
+#include <vector>
+
+using namespace engine;
+
+static std::vector<std::int64_t> random_actions(const BatchEngine &be, std::mt19937 &rng) {
+  std::vector<std::int64_t> actions(be.num_envs());
+  for (std::size_t i = 0; i < be.num_envs(); ++i) {
+    std::vector<int> legal;
+    for (int a = 0; a < action::NUM_ACTIONS; ++a) {
+      if (be.action_masks()[i * action::NUM_ACTIONS + a])
+        legal.push_back(a);
+    }
+    REQUIRE_FALSE(legal.empty());
+    actions[i] = legal[rng() % legal.size()];
+  }
+  return actions;
+}
+
+TEST_CASE("BatchEngine games track independent Engine games", "[batch]") {
+  constexpr std::size_t N = 8;
+  Engine E;
+  BatchEngine be(N);
+  std::vector<State> mirror(N, E.initial_state());
+  std::mt19937 rng(11);
+  int finished = 0;
+
+  for (int step = 0; step < 400; ++step) {
+    const auto actions = random_actions(be, rng);
+    be.step(actions.data());
+
+    for (std::size_t i = 0; i < N; ++i) {
+      const StepResult r = E.apply_move(mirror[i], action::decode(mirror[i], static_cast<int>(actions[i])));
+      REQUIRE(be.dones()[i] == (r.done ? 1 : 0));
+      REQUIRE(be.rewards()[i] == static_cast<float>(r.reward_p0));
+      if (r.done) {
+        REQUIRE(be.final_state(i) == mirror[i]); // the finished game survives its auto-reset
+        mirror[i] = E.initial_state();
+        ++finished;
+      }
+
+      const State got = be.get_state(i);
+      REQUIRE(got == mirror[i]);
+      REQUIRE(got.hash == mirror[i].hash);
+      REQUIRE(be.to_move()[i] == mirror[i].to_move);
+      REQUIRE(be.ply()[i] == mirror[i].ply);
+
+      MoveList moves;
+      E.legal_moves(mirror[i], moves);
+      int mask_count = 0;
+      for (int a = 0; a < action::NUM_ACTIONS; ++a)
+        mask_count += be.action_masks()[i * action::NUM_ACTIONS + a];
+      REQUIRE(mask_count == static_cast<int>(moves.size()));
+      for (const Move &m : moves)
+        REQUIRE(be.action_masks()[i * action::NUM_ACTIONS + action::encode(m)] == 1);
+    }
+  }
+  REQUIRE(finished > 0); // auto-reset was exercised
+}
+
+TEST_CASE("BatchEngine rejects an illegal action without touching any game", "[batch]") {
+  BatchEngine be(3);
+  std::mt19937 rng(5);
+  auto actions = random_actions(be, rng);
+  be.step(actions.data());
+  const State before0 = be.get_state(0), before2 = be.get_state(2);
+
+  actions = random_actions(be, rng);
+  actions[1] = action::TABLE.id[0][1]; // P2 rook onto its own bishop
+  REQUIRE_THROWS_AS(be.step(actions.data()), std::invalid_argument);
+  actions[1] = -1;
+  REQUIRE_THROWS_AS(be.step(actions.data()), std::invalid_argument);
+  REQUIRE(be.get_state(0) == before0);
+  REQUIRE(be.get_state(2) == before2);
+}
+
+TEST_CASE("BatchEngine set_state and reset", "[batch]") {
+  Engine E;
+  BatchEngine be(2);
+  State s = E.initial_state();
+  E.apply_move(s, E.legal_moves(s)[0]);
+
+  be.set_state(1, s);
+  REQUIRE(be.get_state(1) == s);
+  REQUIRE(be.get_state(1).hash == s.hash);
+  REQUIRE(be.to_move()[1] == 1);
+
+  be.reset();
+  REQUIRE(be.get_state(1) == E.initial_state());
+  REQUIRE(be.dones()[1] == 0);
+}
+
+TEST_CASE("BatchEngine ends a game without legal moves as a draw", "[batch]") {
+  // Player 1's king on square 0 is walled in by its own pawns filling columns 0 and 1.
+  Engine E;
+  State blocked{};
+  blocked.board.fill(piece::EMPTY);
+  blocked.board[0] = piece::make(piece::KING, piece::P2);
+  for (int sq : {1, 6, 7, 12, 13, 18, 19, 24, 25, 30, 31})
+    blocked.board[sq] = piece::make(piece::PAWN, piece::P2, true);
+  blocked.board[35] = piece::make(piece::KING, piece::P1);
+  blocked.to_move = 1;
+  refresh_derived(blocked);
+  REQUIRE(E.outcome(blocked) == Outcome::Ongoing);
+  REQUIRE(E.legal_moves(blocked).empty());
+
+  BatchEngine be(2);
+  be.set_state(0, blocked); // reached directly
+  REQUIRE(be.dones()[0] == 1);
+  REQUIRE(be.rewards()[0] == 0.0f);
+  REQUIRE(be.final_state(0) == blocked);
+  REQUIRE(be.get_state(0) == E.initial_state());
+
+  State before = blocked; // reached by a step: player 0's king steps aside
+  before.to_move = 0;
+  refresh_derived(before);
+  be.set_state(1, before);
+  REQUIRE(be.dones()[1] == 0);
+  std::vector<std::int64_t> actions{be.random_actions()[0], action::encode(Move{35, 34})};
+  be.step(actions.data());
+  REQUIRE(be.dones()[1] == 1);
+  REQUIRE(be.rewards()[1] == 0.0f);
+  REQUIRE(be.final_state(1).board[34] == piece::make(piece::KING, piece::P1, true));
+  REQUIRE(be.get_state(1) == E.initial_state());
+  for (std::size_t i = 0; i < be.num_envs(); ++i)
+    REQUIRE(be.random_actions()[i] >= 0); // no game is left without a move
+}
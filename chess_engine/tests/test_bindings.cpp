@@ -4,6 +4,7 @@
  */
 
 #include <catch2/catch_all.hpp>
+#include <limits>
 #include <pybind11/embed.h> // py::scoped_interpreter
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -14,16 +15,31 @@ namespace py = pybind11;
 #error "PY_MODULE_DIR not defined (set in CMake to the folder that contains _ccore.*)"
 #endif
 
-TEST_CASE("pybind11 bindings basic roundtrip", "[bindings][embed]") {
-  // Start the Python interpreter for this test scope
-  py::scoped_interpreter guard{};
+// One interpreter for the whole test binary: extension modules (and numpy) cannot be
+// re-imported safely after the interpreter is finalized and started again.
+static py::module_ &core() {
+  static py::scoped_interpreter guard{};
+  static py::module_ m = [] {
+    // Ensure the build dir (where _ccore.* lives) is on sys.path
+    py::module_ sys = py::module_::import("sys");
+    sys.attr("path").cast<py::list>().append(PY_MODULE_DIR);
+    return py::module_::import("_ccore");
+  }();
+  return m;
+}
 
-  // Ensure the build dir (where _ccore.* lives) is on sys.path
-  py::module_ sys = py::module_::import("sys");
-  sys.attr("path").cast<py::list>().append(PY_MODULE_DIR);
+/** @return Whether fn() raises a Python exception of `type` (e.g. PyExc_ValueError). */
+template <typename Fn> static bool raises(Fn &&fn, PyObject *type) {
+  try {
+    fn();
+  } catch (py::error_already_set &e) {
+    return e.matches(type);
+  }
+  return false;
+}
 
-  // Import our module
-  py::module_ m = py::module_::import("_ccore");
+TEST_CASE("pybind11 bindings basic roundtrip", "[bindings][embed]") {
+  py::module_ m = core();
 
   // Sanity: BOARD_N is exported and equals 6
   int board_n = m.attr("BOARD_N").cast<int>();
@@ -73,3 +89,445 @@ TEST_CASE("pybind11 bindings basic roundtrip", "[bindings][embed]") {
   // Note: mv0 may no longer be legal after we already applied it; skip strict check.
   (void)ok;
 }
+
+TEST_CASE("unchecked apply and make/unmake are exposed", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object eng = m.attr("Engine")();
+  py::object state = eng.attr("initial_state")();
+  py::list board_before = state.attr("board");
+
+  py::list moves = eng.attr("legal_moves")(state);
+  py::object mv = moves[0];
+
+  py::object undo = eng.attr("make_move")(state, mv);
+  REQUIRE(state.attr("ply").cast<int>() == 1);
+  REQUIRE(undo.attr("move").attr("to").cast<int>() == mv.attr("to").cast<int>());
+  eng.attr("unmake_move")(state, undo);
+  REQUIRE(state.attr("ply").cast<int>() == 0);
+  REQUIRE(py::list(state.attr("board")).equal(board_before));
+
+  py::object step = eng.attr("apply_move_unchecked")(state, mv);
+  REQUIRE_FALSE(step.attr("done").cast<bool>());
+  REQUIRE(state.attr("to_move").cast<int>() == 1);
+
+  // Squares off the board are rejected before they can index the board.
+  py::object bad = m.attr("Move")();
+  bad.attr("from_") = 0;
+  bad.attr("to") = 36;
+  for (const char *method : {"make_move", "apply_move_unchecked", "apply_move", "is_legal"})
+    REQUIRE(raises([&] { eng.attr(method)(state, bad); }, PyExc_ValueError));
+  REQUIRE(raises([&] { eng.attr("legal_moves_from")(state, 200); }, PyExc_ValueError));
+  REQUIRE(state.attr("to_move").cast<int>() == 1);
+}
+
+TEST_CASE("State exposes its Zobrist hash and is hashable", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object eng = m.attr("Engine")();
+  py::object a = eng.attr("initial_state")();
+  py::object b = eng.attr("initial_state")();
+
+  REQUIRE(a.attr("hash").cast<std::uint64_t>() != 0);
+  REQUIRE(a.equal(b));
+  REQUIRE(py::hash(a) == py::hash(b));
+
+  py::set seen;
+  seen.add(a);
+  seen.add(b);
+  REQUIRE(seen.size() == 1);
+
+  // Moving changes the key; setting to_move by hand re-derives it.
+  py::list moves = eng.attr("legal_moves")(b);
+  eng.attr("apply_move")(b, moves[0]);
+  REQUIRE_FALSE(a.equal(b));
+  REQUIRE(a.attr("hash").cast<std::uint64_t>() != b.attr("hash").cast<std::uint64_t>());
+
+  const auto h0 = a.attr("hash").cast<std::uint64_t>();
+  a.attr("to_move") = 1;
+  REQUIRE(a.attr("hash").cast<std::uint64_t>() != h0);
+  a.attr("to_move") = 0;
+  REQUIRE(a.attr("hash").cast<std::uint64_t>() == h0);
+
+  // The side to move indexes per-player tables, so only 0 and 1 are accepted.
+  REQUIRE(raises([&] { a.attr("to_move") = 2; }, PyExc_ValueError));
+  REQUIRE(a.attr("to_move").cast<int>() == 0);
+  REQUIRE(a.attr("hash").cast<std::uint64_t>() == h0);
+}
+
+TEST_CASE("Engine.search is exposed and returns a playable move", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object eng = m.attr("Engine")();
+  py::object state = eng.attr("initial_state")();
+  const auto h0 = state.attr("hash").cast<std::uint64_t>();
+
+  py::object r = eng.attr("search")(state, py::arg("max_depth") = 2);
+  REQUIRE(r.attr("has_move").cast<bool>());
+  REQUIRE(r.attr("depth").cast<int>() == 2);
+  REQUIRE(r.attr("nodes").cast<std::uint64_t>() > 0);
+  REQUIRE(py::len(r.attr("pv")) >= 1);
+  REQUIRE(eng.attr("is_legal")(state, r.attr("best_move")).cast<bool>());
+  REQUIRE(state.attr("hash").cast<std::uint64_t>() == h0); // root is left untouched
+}
+
+TEST_CASE("perft and perft_divide are exposed", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object eng = m.attr("Engine")();
+  py::object state = eng.attr("initial_state")();
+
+  REQUIRE(eng.attr("perft")(state, 3).cast<std::uint64_t>() == 2809);
+
+  py::list divide = eng.attr("perft_divide")(state, 2);
+  REQUIRE(py::len(divide) == 14);
+  std::uint64_t total = 0;
+  for (py::handle entry : divide) {
+    py::tuple t = entry.cast<py::tuple>();
+    REQUIRE(py::isinstance(t[0], m.attr("Move")));
+    total += t[1].cast<std::uint64_t>();
+  }
+  REQUIRE(total == 186);
+}
+
+TEST_CASE("BatchEngine returns read-only NumPy views and validates actions", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ np = py::module_::import("numpy");
+  const int num_actions = m.attr("NUM_ACTIONS").cast<int>();
+
+  py::object be = m.attr("BatchEngine")(3);
+  py::tuple reset = be.attr("reset")();
+  py::object obs = reset[0], masks = reset[1];
+  REQUIRE(py::tuple(obs.attr("shape")).equal(py::make_tuple(3, 6, 6)));
+  REQUIRE(py::tuple(masks.attr("shape")).equal(py::make_tuple(3, num_actions)));
+  REQUIRE_FALSE(obs.attr("flags").attr("writeable").cast<bool>());
+
+  // First legal action of every game.
+  py::tuple out = be.attr("step")(masks.attr("argmax")(1));
+  REQUIRE(out.size() == 4);
+  REQUIRE(py::str(out[2].attr("dtype")).cast<std::string>() == "float32");
+  REQUIRE(py::str(out[3].attr("dtype")).cast<std::string>() == "bool");
+  REQUIRE(np.attr("all")(be.attr("to_move").attr("__eq__")(1)).cast<bool>());
+
+  // Views alias the live buffers: the array returned by reset() now shows the moved piece.
+  py::object state = be.attr("get_state")(0);
+  REQUIRE(state.attr("ply").cast<int>() == 1);
+  REQUIRE(py::list(obs.attr("reshape")(3, 36)[py::int_(0)].attr("tolist")()).equal(py::list(state.attr("board"))));
+
+  py::object zeros = np.attr("zeros")(3, py::arg("dtype") = "int64");
+  REQUIRE_THROWS_AS(be.attr("step")(zeros), py::error_already_set);
+
+  const int first = be.attr("action_masks")[py::int_(0)].attr("argmax")().cast<int>();
+  py::object move = m.attr("decode_action")(state, first);
+  REQUIRE(m.attr("encode_action")(move).cast<int>() == first);
+}
+
+TEST_CASE("State.board is a zero-copy NumPy view", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ np = py::module_::import("numpy");
+  py::object eng = m.attr("Engine")();
+  py::object state = eng.attr("initial_state")();
+
+  py::object board = state.attr("board");
+  REQUIRE_FALSE(board.attr("flags").attr("writeable").cast<bool>());
+  REQUIRE(np.attr("shares_memory")(board, np.attr("asarray")(state)).cast<bool>());
+
+  // The view follows the state as moves are made.
+  py::list moves = eng.attr("legal_moves")(state);
+  py::object mv = moves[0];
+  eng.attr("apply_move")(state, mv);
+  REQUIRE(board[mv.attr("from_")].cast<int>() == 0);
+  REQUIRE(board[mv.attr("to")].cast<int>() != 0);
+
+  // Writable variant edits in place; refresh_derived re-syncs the hash.
+  py::object writable = state.attr("board_view")(py::arg("writable") = true);
+  const auto h0 = state.attr("hash").cast<std::uint64_t>();
+  writable[py::int_(0)] = 0;
+  REQUIRE(board[py::int_(0)].cast<int>() == 0);
+  state.attr("refresh_derived")();
+  REQUIRE(state.attr("hash").cast<std::uint64_t>() != h0);
+
+  // The view keeps its State alive.
+  state = py::none();
+  py::module_::import("gc").attr("collect")();
+  REQUIRE(board[py::int_(1)].cast<int>() != 0);
+}
+
+TEST_CASE("legal_action_mask fills a caller buffer in place", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ np = py::module_::import("numpy");
+  py::object eng = m.attr("Engine")();
+  py::object state = eng.attr("initial_state")();
+  const int n = m.attr("NUM_ACTIONS").cast<int>();
+
+  py::object fresh = eng.attr("legal_action_mask")(state);
+  REQUIRE(py::str(fresh.attr("dtype")).cast<std::string>() == "int8");
+  REQUIRE(fresh.attr("sum")().cast<int>() == 14);
+
+  py::object buf = np.attr("ones")(n, py::arg("dtype") = "int8");
+  py::object ret = eng.attr("legal_action_mask")(state, buf);
+  REQUIRE(ret.is(buf));
+  REQUIRE(buf.attr("sum")().cast<int>() == 14);
+  for (py::handle mv : eng.attr("legal_moves")(state))
+    REQUIRE(buf[m.attr("encode_action")(mv)].cast<int>() == 1);
+
+  // Only a buffer that can be written in place is accepted, never a converted copy.
+  py::list as_list = buf.attr("tolist")();
+  py::object read_only = buf.attr("copy")();
+  read_only.attr("setflags")(py::arg("write") = false);
+  py::object strided = np.attr("zeros")(2 * n, py::arg("dtype") = "int8")[py::slice(0, 2 * n, 2)];
+  for (py::object bad :
+       {py::object(as_list), np.attr("zeros")(n, py::arg("dtype") = "float32"), np.attr("zeros")(n, py::arg("dtype") = "bool"),
+        np.attr("zeros")(n - 1, py::arg("dtype") = "int8"), read_only, strided})
+    REQUIRE(raises([&] { eng.attr("legal_action_mask")(state, bad); }, PyExc_TypeError));
+}
+
+TEST_CASE("max_ply, outcome and derived state fields are exposed", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object eng = m.attr("Engine")(py::arg("max_ply") = 2);
+  REQUIRE(eng.attr("max_ply").cast<int>() == 2);
+  REQUIRE(m.attr("Engine")().attr("max_ply").cast<int>() == m.attr("MAX_GAME_PLY").cast<int>());
+
+  py::object state = eng.attr("initial_state")();
+  py::tuple kings = state.attr("king_squares");
+  REQUIRE(kings[0].cast<int>() == 33);
+  REQUIRE(kings[1].cast<int>() == 3);
+  py::object counts = state.attr("piece_counts");
+  REQUIRE(py::list(counts.attr("shape")).cast<std::vector<int>>() == std::vector<int>{2, 8});
+  REQUIRE(counts.attr("sum")().cast<int>() == 24);
+
+  py::object outcome = m.attr("Outcome");
+  REQUIRE(eng.attr("outcome")(state).equal(outcome.attr("Ongoing")));
+  for (int i = 0; i < 2; ++i)
+    eng.attr("apply_move")(state, eng.attr("legal_moves")(state)[py::int_(0)]);
+  REQUIRE(eng.attr("is_terminal")(state).cast<bool>());
+  REQUIRE(eng.attr("outcome")(state).equal(outcome.attr("Draw")));
+}
+
+TEST_CASE("State, Move and StepResult pickle; states pack into uint8 rows", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ pickle = py::module_::import("pickle");
+  auto roundtrip = [&](py::handle obj) { return pickle.attr("loads")(pickle.attr("dumps")(obj)); };
+
+  py::object eng = m.attr("Engine")();
+  py::object state = eng.attr("initial_state")();
+  py::object mv = eng.attr("legal_moves")(state)[py::int_(0)];
+  py::object step = eng.attr("apply_move")(state, mv);
+
+  REQUIRE(roundtrip(state).equal(state));
+  REQUIRE(roundtrip(state).attr("hash").cast<std::uint64_t>() == state.attr("hash").cast<std::uint64_t>());
+  py::object mv2 = roundtrip(mv);
+  REQUIRE(mv2.attr("to").cast<int>() == mv.attr("to").cast<int>());
+  REQUIRE(mv2.attr("type").equal(mv.attr("type")));
+  REQUIRE(state.equal(roundtrip(step).attr("state")));
+
+  py::bytes raw = state.attr("to_bytes")();
+  REQUIRE(py::len(raw) == m.attr("PACKED_STATE_SIZE").cast<std::size_t>());
+  REQUIRE(m.attr("State").attr("from_bytes")(raw).equal(state));
+
+  py::list states;
+  states.append(eng.attr("initial_state")());
+  states.append(state);
+  py::object packed = m.attr("pack_states")(states);
+  REQUIRE(py::list(packed.attr("shape")).cast<std::vector<int>>() == std::vector<int>{2, 41});
+  py::list back = m.attr("unpack_states")(packed);
+  REQUIRE(back[0].equal(states[0]));
+  REQUIRE(back[1].equal(states[1]));
+
+  // Rows are raw bytes: other dtypes are rejected rather than cast, and the row size must match.
+  for (const char *dtype : {"uint16", "int64", "int8"})
+    REQUIRE(raises([&] { m.attr("unpack_states")(packed.attr("astype")(dtype)); }, PyExc_TypeError));
+  REQUIRE(raises([&] { m.attr("unpack_states")(packed.attr("tolist")()); }, PyExc_TypeError));
+  REQUIRE(raises([&] { m.attr("unpack_states")(packed[py::make_tuple(py::slice(0, 2, 1), py::slice(0, 40, 1))]); },
+                 PyExc_ValueError));
+}
+
+TEST_CASE("random_playouts runs natively and returns PlayoutStats", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object eng = m.attr("Engine")();
+  py::object stats = eng.attr("random_playouts")(eng.attr("initial_state")(), 64, py::arg("seed") = 7, py::arg("n_threads") = 2);
+  REQUIRE(stats.attr("playouts").cast<int>() == 64);
+  REQUIRE(stats.attr("wins").cast<int>() + stats.attr("draws").cast<int>() + stats.attr("losses").cast<int>() == 64);
+  REQUIRE(stats.attr("mean_length").cast<double>() > 0.0);
+}
+
+TEST_CASE("mcts calls a Python evaluator with batched NumPy arrays", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ np = py::module_::import("numpy");
+  py::object eng = m.attr("Engine")();
+  const int n = m.attr("NUM_ACTIONS").cast<int>();
+
+  py::list shapes;
+  py::cpp_function evaluate([&](py::object obs, py::object masks, py::object to_move) {
+    shapes.append(obs.attr("shape"));
+    REQUIRE(py::str(masks.attr("dtype")).cast<std::string>() == "int8");
+    REQUIRE(py::len(to_move) == py::len(obs));
+    return py::make_tuple(masks.attr("astype")("float32"), np.attr("zeros")(py::len(obs)));
+  });
+  py::object r =
+      eng.attr("mcts")(eng.attr("initial_state")(), evaluate, py::arg("num_simulations") = 64, py::arg("batch_size") = 8);
+  REQUIRE(r.attr("simulations").cast<int>() == 64);
+  REQUIRE(r.attr("visits").attr("sum")().cast<int>() == 64);
+  REQUIRE(py::len(r.attr("visits")) == static_cast<std::size_t>(n));
+  REQUIRE(py::tuple(shapes[0]).cast<std::vector<int>>() == std::vector<int>{1, 6, 6}); // the root alone
+  REQUIRE(py::tuple(shapes[1]).cast<std::vector<int>>() == std::vector<int>{8, 6, 6});
+
+  py::object s = eng.attr("initial_state")();
+  REQUIRE(raises([&] { eng.attr("mcts")(s, evaluate, py::arg("c_puct") = std::numeric_limits<float>::quiet_NaN()); },
+                 PyExc_ValueError));
+  REQUIRE(raises([&] { eng.attr("mcts")(s, evaluate, py::arg("dirichlet_epsilon") = 0.25f, py::arg("dirichlet_alpha") = 0.0f); },
+                 PyExc_ValueError));
+}
+
+TEST_CASE("strict legality, attack maps and check detection are exposed", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object strict = m.attr("Engine")(py::arg("strict_legality") = true);
+  REQUIRE(strict.attr("strict_legality").cast<bool>());
+  REQUIRE_FALSE(m.attr("Engine")().attr("strict_legality").cast<bool>());
+
+  py::object s = strict.attr("initial_state")();
+  py::object attacked = strict.attr("attack_map")(s, 0);
+  REQUIRE(py::list(attacked.attr("shape")).cast<std::vector<int>>() == std::vector<int>{36});
+  REQUIRE(py::str(attacked.attr("dtype")).cast<std::string>() == "bool");
+  REQUIRE(attacked.attr("any")().cast<bool>());
+  REQUIRE(strict.attr("is_square_attacked")(s, 25, 0).cast<bool>() == attacked[py::int_(25)].cast<bool>());
+  REQUIRE_FALSE(strict.attr("in_check")(s, 0).cast<bool>());
+  REQUIRE_FALSE(strict.attr("in_check")(s, 1).cast<bool>());
+  REQUIRE(raises([&] { strict.attr("in_check")(s, 2); }, PyExc_ValueError));
+  REQUIRE(raises([&] { strict.attr("attack_map")(s, 2); }, PyExc_ValueError));
+  REQUIRE(raises([&] { strict.attr("is_square_attacked")(s, 25, 7); }, PyExc_ValueError));
+  REQUIRE(raises([&] { strict.attr("is_square_attacked")(s, 36, 0); }, PyExc_ValueError));
+
+  py::object be = m.attr("BatchEngine")(2, py::arg("strict_legality") = true);
+  REQUIRE(be.attr("action_masks").attr("sum")().cast<int>() > 0);
+}
+
+TEST_CASE("symmetry transforms work on States and NumPy batches", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ np = py::module_::import("numpy");
+  py::object eng = m.attr("Engine")();
+  py::object Symmetry = m.attr("Symmetry");
+  py::object s = eng.attr("initial_state")();
+
+  py::object flipped = m.attr("transform_state")(s, Symmetry.attr("ColorFlip"));
+  REQUIRE(flipped.attr("to_move").cast<int>() == 1);
+  REQUIRE(m.attr("canonical_hash")(flipped).cast<std::uint64_t>() == m.attr("canonical_hash")(s).cast<std::uint64_t>());
+  REQUIRE(m.attr("canonical_symmetry")(flipped).equal(Symmetry.attr("ColorFlip")));
+
+  py::object mirror = Symmetry.attr("Mirror");
+  py::object mirrored = m.attr("transform_state")(s, mirror);
+  py::object boards = np.attr("stack")(py::make_tuple(s.attr("board"), mirrored.attr("board")));
+  py::object to_move = np.attr("zeros")(2, py::arg("dtype") = "uint8");
+  py::tuple out = m.attr("transform_boards")(boards, to_move, mirror);
+  REQUIRE(np.attr("array_equal")(out[0][py::int_(0)], mirrored.attr("board")).cast<bool>());
+  REQUIRE(np.attr("array_equal")(out[0][py::int_(1)], s.attr("board")).cast<bool>());
+
+  py::tuple canon = m.attr("canonicalize_boards")(boards, to_move);
+  REQUIRE(np.attr("array_equal")(canon[0][py::int_(0)], canon[0][py::int_(1)]).cast<bool>());
+  REQUIRE(py::list(canon[2]).cast<std::vector<int>>() == std::vector<int>{0, 1});
+
+  py::object mask = eng.attr("legal_action_mask")(s);
+  py::object moved = m.attr("transform_action_rows")(mask, mirror);
+  REQUIRE(np.attr("array_equal")(moved, eng.attr("legal_action_mask")(mirrored)).cast<bool>());
+  py::object policy = mask.attr("astype")("float32");
+  REQUIRE(py::str(m.attr("transform_action_rows")(policy, mirror).attr("dtype")).cast<std::string>() == "float32");
+  py::object ids = m.attr("transform_actions")(np.attr("array")(py::make_tuple(-1, 0)), np.attr("array")(py::make_tuple(1, 1)));
+  REQUIRE(ids[py::int_(0)].cast<int>() == -1);
+  REQUIRE(ids[py::int_(1)].cast<int>() == m.attr("transform_action")(0, mirror).cast<int>());
+}
+
+TEST_CASE("tablebases are generated, probed and attached from Python", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ os_path = py::module_::import("os.path");
+  py::module_ tempfile = py::module_::import("tempfile");
+  const std::string path = os_path.attr("join")(tempfile.attr("gettempdir")(), "chess_tb3_embed.bin").cast<std::string>();
+
+  py::object summary = m.attr("generate_tablebase")(path, 3);
+  REQUIRE(summary.attr("tables").cast<int>() == 11);
+  py::object tb = m.attr("Tablebase")(path);
+  REQUIRE(tb.attr("max_pieces").cast<int>() == 3);
+  REQUIRE_FALSE(tb.attr("strict_legality").cast<bool>());
+
+  py::object eng = m.attr("Engine")(py::arg("tablebase") = tb);
+  REQUIRE(py::object(eng.attr("tablebase")).is(tb));
+  REQUIRE(m.attr("Engine")().attr("tablebase").is_none());
+  REQUIRE(tb.attr("probe")(eng.attr("initial_state")()).is_none());
+
+  // Lone kings: a draw, and an Engine with the tables ends the game there.
+  py::object s = m.attr("State")();
+  py::object board = s.attr("board_view")(py::arg("writable") = true);
+  board[py::int_(0)] = 6 | 0x10;
+  board[py::int_(35)] = 6;
+  s.attr("refresh_derived")();
+  py::tuple entry = tb.attr("probe")(s);
+  REQUIRE(entry[0].cast<int>() == 0);
+  REQUIRE(eng.attr("probe_tablebase")(s).cast<py::tuple>()[0].cast<int>() == 0);
+  REQUIRE(eng.attr("outcome")(s).equal(m.attr("Outcome").attr("Draw")));
+  REQUIRE(m.attr("Engine")().attr("outcome")(s).equal(m.attr("Outcome").attr("Ongoing")));
+
+  REQUIRE_THROWS_AS(m.attr("Engine")(py::arg("strict_legality") = true, py::arg("tablebase") = tb), py::error_already_set);
+  py::object be = m.attr("BatchEngine")(2, py::arg("tablebase") = tb);
+  REQUIRE(be.attr("num_envs").cast<int>() == 2);
+}
+
+TEST_CASE("hot-path stats are exposed as a dict per probe", "[bindings][embed]") {
+  py::module_ m = core();
+  py::object Engine = m.attr("Engine");
+  py::object eng = Engine();
+  Engine.attr("reset_stats")();
+  eng.attr("legal_moves")(eng.attr("initial_state")());
+
+  py::dict stats = eng.attr("stats")();
+  REQUIRE(stats.size() == 7);
+  py::dict legal = stats["legal_moves"];
+  const bool enabled = m.attr("STATS_ENABLED").cast<bool>();
+  REQUIRE(legal["calls"].cast<int>() == (enabled ? 1 : 0));
+  REQUIRE(legal["allocations"].cast<int>() == (enabled ? 1 : 0));
+  REQUIRE(stats.contains("unit_generate"));
+
+  Engine.attr("reset_stats")();
+  REQUIRE(py::dict(Engine.attr("stats")()["legal_moves"])["calls"].cast<int>() == 0);
+}
+
+TEST_CASE("plane encoders write into caller buffers", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ np = py::module_::import("numpy");
+  py::object eng = m.attr("Engine")();
+  py::object s = eng.attr("initial_state")();
+  const int C = m.attr("NUM_PLANES").cast<int>();
+
+  py::object planes = m.attr("encode_planes")(s);
+  REQUIRE(py::str(planes.attr("dtype")).cast<std::string>() == "float32");
+  REQUIRE(planes.attr("shape").cast<std::vector<int>>() == std::vector<int>{C, 6, 6});
+  REQUIRE(planes.attr("sum")().cast<float>() == 24.0f); // one piece plane per piece, nothing else set
+
+  py::object out = np.attr("full")(py::make_tuple(2, C, 6, 6), 9, py::arg("dtype") = "uint8");
+  py::object boards = np.attr("stack")(py::make_tuple(s.attr("board"), s.attr("board")));
+  py::object result = m.attr("encode_planes_batch")(boards, np.attr("array")(py::make_tuple(0, 1)), py::none(), out);
+  REQUIRE(result.is(out));
+  REQUIRE(out[py::int_(0)].attr("sum")().cast<int>() == 24);
+  REQUIRE(out[py::int_(1)].attr("sum")().cast<int>() == 24 + 36); // side-to-move plane set
+
+  REQUIRE_THROWS_AS(m.attr("encode_planes")(s, py::arg("dtype") = "int32"), py::error_already_set);
+  REQUIRE_THROWS_AS(m.attr("encode_planes")(s, np.attr("zeros")(3, py::arg("dtype") = "float32")), py::error_already_set);
+}
+
+TEST_CASE("native opponents are built by name and answer agent moves", "[bindings][embed]") {
+  py::module_ m = core();
+  py::module_ np = py::module_::import("numpy");
+  py::object eng = m.attr("Engine")();
+  py::object s = eng.attr("initial_state")();
+
+  py::object opp = m.attr("Opponent")("greedy", py::arg("seed") = 3);
+  REQUIRE(opp.attr("kind").cast<std::string>() == "greedy");
+  REQUIRE_THROWS_AS(m.attr("Opponent")("minimax"), py::error_already_set);
+
+  py::object mask = np.attr("zeros")(m.attr("NUM_ACTIONS"), py::arg("dtype") = "int8");
+  py::object move = eng.attr("legal_moves")(s)[py::int_(0)];
+  py::object r = opp.attr("play")(eng, s, move, mask);
+  REQUIRE_FALSE(r.attr("done").cast<bool>());
+  REQUIRE(r.attr("replied").cast<bool>());
+  REQUIRE(s.attr("ply").cast<int>() == 2);
+  REQUIRE(np.attr("array_equal")(mask, eng.attr("legal_action_mask")(s)).cast<bool>());
+  REQUIRE_FALSE(opp.attr("select")(eng, s).is_none());
+  REQUIRE_THROWS_AS(opp.attr("play")(eng, s, move), py::error_already_set); // no longer legal
+  py::list as_list = mask.attr("tolist")();
+  REQUIRE(raises([&] { opp.attr("play")(eng, s, eng.attr("legal_moves")(s)[py::int_(0)], as_list); }, PyExc_TypeError));
+  REQUIRE(s.attr("ply").cast<int>() == 2); // rejected before anything was played
+}
@@ -0,0 +1,124 @@
+/**
+ * @file test_bitboard.cpp
+ * @brief Bitboard tables and generator equivalence with the Unit subclasses.
+ */
+
+#include "chess/bitboard.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+#include "units/factory.hpp"
+#include "units/unit.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <random>
+#include <vector>
+
+using namespace engine;
+
+// Reference generator: the original per-square Unit walk.
+static std::vector<Move> unit_moves(const State &s) {
+  std::vector<Move> out;
+  for (int idx = 0; idx < BOARD_N * BOARD_N; ++idx) {
+    const piece::Code pc = s.board[idx];
+    const bool is_ours = (s.to_move == 0) ? piece::is_p1(pc) : piece::is_p2(pc);
+    if (!is_ours)
+      continue;
+    auto unit = make_unit_from_code(pc);
+    if (!unit)
+      continue;
+    auto v = unit->get_legal_moves(s, idx);
+    out.insert(out.end(), v.begin(), v.end());
+  }
+  return out;
+}
+
+static bool same_moves(const std::vector<Move> &a, const std::vector<Move> &b) {
+  if (a.size() != b.size())
+    return false;
+  for (std::size_t i = 0; i < a.size(); ++i) {
+    if (a[i].from != b[i].from || a[i].to != b[i].to || a[i].type != b[i].type || a[i].promo_piece != b[i].promo_piece ||
+        a[i].special_code != b[i].special_code)
+      return false;
+  }
+  return true;
+}
+
+TEST_CASE("Attack tables have the expected shapes", "[bitboard][tables]") {
+  const AttackTables &t = attack_tables();
+
+  // Corners: knight has 2 jumps, king has 3 neighbours.
+  REQUIRE(bb::popcount(t.knight[0]) == 2);
+  REQUIRE(bb::popcount(t.king[0]) == 3);
+  REQUIRE(bb::popcount(t.king[Engine::get_pos(2, 2)]) == 8);
+
+  // Rays never leave the board and never include the origin.
+  for (int sq = 0; sq < NUM_SQUARES; ++sq) {
+    for (int d = 0; d < NUM_DIRECTIONS; ++d) {
+      REQUIRE((t.rays[d][sq] & ~BOARD_MASK) == 0);
+      REQUIRE((t.rays[d][sq] & bb::square(sq)) == 0);
+    }
+  }
+  REQUIRE(bb::popcount(t.rays[S][0]) == BOARD_N - 1);
+  REQUIRE(t.rays[N][0] == 0);
+
+  // Pawns: P1 pushes towards row 0, P2 towards row BOARD_N - 1.
+  REQUIRE(t.pawn_push[0][Engine::get_pos(4, 2)] == bb::square(Engine::get_pos(3, 2)));
+  REQUIRE(t.pawn_push[1][Engine::get_pos(1, 2)] == bb::square(Engine::get_pos(2, 2)));
+  REQUIRE(t.pawn_push[0][Engine::get_pos(0, 2)] == 0);
+  REQUIRE(bb::popcount(t.pawn_attacks[1][Engine::get_pos(1, 0)]) == 1);
+}
+
+TEST_CASE("Bitboards mirror the board contents", "[bitboard][occupancy]") {
+  Engine E;
+  const State s = E.initial_state();
+  const Bitboards bbs = Bitboards::from_state(s);
+
+  REQUIRE(bb::popcount(bbs.side[0]) == 2 * BOARD_N);
+  REQUIRE(bb::popcount(bbs.side[1]) == 2 * BOARD_N);
+  REQUIRE((bbs.side[0] & bbs.side[1]) == 0);
+  REQUIRE(bbs.kind[0][piece::KING] == bb::square(E.get_pos(BOARD_N - 1, 3)));
+  REQUIRE(bb::popcount(bbs.kind[1][piece::PAWN]) == BOARD_N);
+}
+
+TEST_CASE("Bitboard generator matches Unit generators along random games", "[bitboard][equivalence]") {
+  Engine E;
+  std::mt19937 rng(1234);
+
+  for (int game = 0; game < 50; ++game) {
+    State s = E.initial_state();
+    for (int ply = 0; ply < 200; ++ply) {
+      const auto moves = E.legal_moves(s);
+      REQUIRE(same_moves(moves, unit_moves(s)));
+      if (moves.empty())
+        break;
+      if (E.apply_move(s, moves[rng() % moves.size()]).done)
+        break;
+    }
+  }
+}
+
+TEST_CASE("Bitboard generator matches Unit generators on random boards", "[bitboard][equivalence]") {
+  Engine E;
+  std::mt19937 rng(42);
+
+  for (int trial = 0; trial < 2000; ++trial) {
+    State s{};
+    for (auto &cell : s.board) {
+      // Roughly half the squares empty; any kind, side, moved flag and power level otherwise.
+      cell = (rng() % 2) ? static_cast<piece::Code>(piece::EMPTY) : static_cast<piece::Code>(rng() % 256);
+    }
+    s.to_move = static_cast<Player>(trial % 2);
+
+    REQUIRE(same_moves(E.legal_moves(s), unit_moves(s)));
+    for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+      const piece::Code pc = s.board[sq];
+      const bool is_ours = (s.to_move == 0) ? piece::is_p1(pc) : piece::is_p2(pc);
+      auto unit = is_ours ? make_unit_from_code(pc) : nullptr;
+      const std::vector<Move> expected = unit ? unit->get_legal_moves(s, sq) : std::vector<Move>{};
+      REQUIRE(same_moves(E.legal_moves_from(s, sq), expected));
+    }
+  }
+}
@@ -10,6 +10,7 @@
 #include "chess/state.hpp"
 
 #include <catch2/catch_all.hpp>
+#include <random>
 
 using namespace engine;
 
@@ -108,3 +109,74 @@ TEST_CASE("apply_move updates ply and switches side", "[engine][apply]") {
   // Not terminal at game start.
   REQUIRE(step.done == false);
 }
+
+TEST_CASE("apply_move_unchecked matches apply_move for generated moves", "[engine][apply]") {
+  Engine E;
+  std::mt19937 rng(11);
+
+  for (int game = 0; game < 20; ++game) {
+    State checked = E.initial_state();
+    State unchecked = checked;
+    for (int ply = 0; ply < 200; ++ply) {
+      const auto moves = E.legal_moves(checked);
+      if (moves.empty())
+        break;
+      const Move m = moves[rng() % moves.size()];
+      const auto a = E.apply_move(checked, m);
+      const auto b = E.apply_move_unchecked(unchecked, m);
+      REQUIRE(checked.board == unchecked.board);
+      REQUIRE(checked.ply == unchecked.ply);
+      REQUIRE(a.done == b.done);
+      REQUIRE(a.reward_p0 == b.reward_p0);
+      if (a.done)
+        break;
+    }
+  }
+}
+
+TEST_CASE("apply_move still rejects illegal moves", "[engine][apply]") {
+  Engine E;
+  State s = E.initial_state();
+  const State before = s;
+
+  Move bogus{};
+  bogus.from = 0;
+  bogus.to = 0;
+  const auto step = E.apply_move(s, bogus);
+  REQUIRE(step.info == "Illegal");
+  REQUIRE(s.board == before.board);
+  REQUIRE(s.ply == before.ply);
+}
+
+TEST_CASE("make_move / unmake_move restore the exact state", "[engine][make_unmake]") {
+  Engine E;
+  std::mt19937 rng(5);
+  State s = E.initial_state();
+
+  // Walk a random line, checking every sibling move round-trips on the way.
+  for (int ply = 0; ply < 60; ++ply) {
+    const State before = s;
+    const auto moves = E.legal_moves(s);
+    if (moves.empty())
+      break;
+
+    for (const Move &m : moves) {
+      const UndoRecord u = E.make_move(s, m);
+      REQUIRE(s.ply == before.ply + 1);
+      REQUIRE(s.to_move == 1 - before.to_move);
+      E.unmake_move(s, u);
+      REQUIRE(s.board == before.board);
+      REQUIRE(s.ply == before.ply);
+      REQUIRE(s.to_move == before.to_move);
+    }
+
+    // make_move must leave the same board as apply_move.
+    const Move m = moves[rng() % moves.size()];
+    State applied = s;
+    const auto step = E.apply_move(applied, m);
+    E.make_move(s, m);
+    REQUIRE(s.board == applied.board);
+    if (step.done)
+      break;
+  }
+}
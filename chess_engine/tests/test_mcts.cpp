@@ -0,0 +1,174 @@
+/**
+ * @file test_mcts.cpp
+ * @brief Engine::mcts: batching, visit bookkeeping, tactics, threading and evaluator errors.
+ */
+
+#include "chess/action.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/mcts.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <atomic>
+#include <catch2/catch_all.hpp>
+#include <limits>
+#include <numeric>
+#include <stdexcept>
+
+using namespace engine;
+
+namespace {
+
+/** @brief Uniform priors over legal actions, value 0: MCTS then only sees terminal results. */
+void uniform(const LeafBatch &batch, float *priors, float *values) {
+  for (std::size_t i = 0; i < batch.size; ++i) {
+    for (int a = 0; a < action::NUM_ACTIONS; ++a)
+      priors[i * action::NUM_ACTIONS + a] = batch.action_masks[i * action::NUM_ACTIONS + a];
+    values[i] = 0.0f;
+  }
+}
+
+State rook_takes_king() {
+  Engine E;
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[E.get_pos(5, 5)] = piece::make(piece::KING, piece::P1);
+  s.board[E.get_pos(0, 0)] = piece::make(piece::KING, piece::P2);
+  s.board[E.get_pos(0, 4)] = piece::make(piece::ROOK, piece::P1);
+  refresh_derived(s);
+  return s;
+}
+
+} // namespace
+
+TEST_CASE("mcts runs the requested simulations in batches", "[mcts]") {
+  Engine E;
+  MctsConfig config;
+  config.num_simulations = 400;
+  config.batch_size = 8;
+
+  std::size_t largest = 0;
+  std::atomic<int> mask_errors{0};
+  const MctsResult r = E.mcts(
+      E.initial_state(),
+      [&](const LeafBatch &batch, float *priors, float *values) {
+        largest = std::max(largest, batch.size);
+        for (std::size_t i = 0; i < batch.size; ++i) {
+          State s{};
+          std::copy_n(batch.boards + i * BOARD_N * BOARD_N, BOARD_N * BOARD_N, s.board.begin());
+          s.to_move = batch.to_move[i];
+          refresh_derived(s);
+          std::int8_t mask[action::NUM_ACTIONS];
+          E.legal_action_mask(s, mask);
+          if (!std::equal(mask, mask + action::NUM_ACTIONS, batch.action_masks + i * action::NUM_ACTIONS))
+            ++mask_errors;
+        }
+        uniform(batch, priors, values);
+      },
+      config);
+
+  REQUIRE(mask_errors == 0);
+  REQUIRE(largest == 8);
+  REQUIRE(r.simulations == 400);
+  REQUIRE(r.evaluator_calls < 400 / 4); // leaves really are batched
+  REQUIRE(std::accumulate(r.visits.begin(), r.visits.end(), 0u) == 400);
+  REQUIRE(r.best_action >= 0);
+  REQUIRE(r.visits[r.best_action] == *std::max_element(r.visits.begin(), r.visits.end()));
+
+  std::int8_t root_mask[action::NUM_ACTIONS];
+  E.legal_action_mask(E.initial_state(), root_mask);
+  for (int a = 0; a < action::NUM_ACTIONS; ++a) {
+    if (r.visits[a] > 0)
+      REQUIRE(root_mask[a] == 1);
+  }
+}
+
+TEST_CASE("mcts finds a king capture from uniform priors", "[mcts]") {
+  Engine E;
+  const State s = rook_takes_king();
+  MctsConfig config;
+  config.num_simulations = 200;
+  for (std::uint32_t threads : {1u, 4u}) {
+    config.num_threads = threads;
+    const MctsResult r = E.mcts(s, uniform, config);
+    REQUIRE(r.best_action == action::TABLE.id[E.get_pos(0, 4)][E.get_pos(0, 0)]);
+    REQUIRE(r.root_value > 0.5f);
+    REQUIRE(r.simulations == 200);
+  }
+}
+
+TEST_CASE("mcts on a finished game does not call the evaluator", "[mcts]") {
+  Engine E;
+  State s = rook_takes_king();
+  E.apply_move(s, Move{static_cast<Square>(E.get_pos(0, 4)), static_cast<Square>(E.get_pos(0, 0))});
+  REQUIRE(E.is_terminal(s));
+
+  int calls = 0;
+  const MctsResult r = E.mcts(s, [&](const LeafBatch &, float *, float *) { ++calls; });
+  REQUIRE(calls == 0);
+  REQUIRE(r.best_action == -1);
+  REQUIRE(r.simulations == 0);
+}
+
+TEST_CASE("mcts with root noise still visits only legal actions", "[mcts]") {
+  Engine E;
+  MctsConfig config;
+  config.num_simulations = 300;
+  config.num_threads = 3;
+  config.dirichlet_epsilon = 0.25f;
+  config.seed = 9;
+  const MctsResult r = E.mcts(E.initial_state(), uniform, config);
+  REQUIRE(std::accumulate(r.visits.begin(), r.visits.end(), 0u) == 300);
+  REQUIRE(std::count_if(r.visits.begin(), r.visits.end(), [](std::uint32_t v) { return v > 0; }) <= 14);
+}
+
+TEST_CASE("mcts rethrows evaluator failures", "[mcts]") {
+  Engine E;
+  MctsConfig config;
+  config.num_simulations = 100;
+  config.num_threads = 2;
+  std::atomic<int> calls{0}; // the evaluator may run on both workers at once
+  auto failing = [&](const LeafBatch &batch, float *priors, float *values) {
+    if (calls++ > 0)
+      throw std::runtime_error("evaluator failed");
+    uniform(batch, priors, values);
+  };
+  REQUIRE_THROWS_AS(E.mcts(E.initial_state(), failing, config), std::runtime_error);
+}
+
+TEST_CASE("mcts rejects search parameters it cannot use", "[mcts]") {
+  Engine E;
+  int calls = 0;
+  auto counting = [&](const LeafBatch &batch, float *priors, float *values) {
+    ++calls;
+    uniform(batch, priors, values);
+  };
+  const auto with = [](auto edit) {
+    MctsConfig config;
+    config.num_simulations = 16;
+    edit(config);
+    return config;
+  };
+  for (const MctsConfig &bad : {
+           with([](MctsConfig &c) { c.c_puct = std::numeric_limits<float>::quiet_NaN(); }),
+           with([](MctsConfig &c) { c.c_puct = -1.0f; }),
+           with([](MctsConfig &c) { c.virtual_loss = std::numeric_limits<float>::infinity(); }),
+           with([](MctsConfig &c) { c.virtual_loss = -0.5f; }),
+           with([](MctsConfig &c) { c.dirichlet_epsilon = 1.5f; }),
+           with([](MctsConfig &c) {
+             c.dirichlet_epsilon = 0.25f;
+             c.dirichlet_alpha = 0.0f;
+           }),
+       })
+    REQUIRE_THROWS_AS(E.mcts(E.initial_state(), counting, bad), std::invalid_argument);
+  REQUIRE(calls == 0);
+
+  // Alpha only matters with noise on; zero virtual loss and exploration are valid settings.
+  const MctsResult r = E.mcts(E.initial_state(), counting, with([](MctsConfig &c) {
+                                c.dirichlet_alpha = 0.0f;
+                                c.virtual_loss = 0.0f;
+                                c.c_puct = 0.0f;
+                              }));
+  REQUIRE(r.simulations == 16);
+}
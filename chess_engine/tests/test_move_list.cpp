@@ -0,0 +1,91 @@
+/**
+ * @file test_move_list.cpp
+ * @brief MoveList buffer, allocation-free Engine overloads and factory-free Unit generation.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/move_list.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+#include "units/factory.hpp"
+#include "units/unit.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <random>
+#include <vector>
+
+using namespace engine;
+
+static bool same_move(const Move &a, const Move &b) {
+  return a.from == b.from && a.to == b.to && a.type == b.type && a.promo_piece == b.promo_piece &&
+         a.special_code == b.special_code;
+}
+
+TEST_CASE("MoveList stores moves inline and can be cleared", "[movelist]") {
+  MoveList list;
+  REQUIRE(list.empty());
+
+  list.push_back(Move{1, 2});
+  list.push_back(Move{3, 4, MoveType::Capture});
+  REQUIRE(list.size() == 2);
+  REQUIRE(list[1].to == 4);
+  REQUIRE(list[1].type == MoveType::Capture);
+  REQUIRE(std::distance(list.begin(), list.end()) == 2);
+
+  list.clear();
+  REQUIRE(list.empty());
+}
+
+TEST_CASE("MoveList overloads match the vector API along random games", "[movelist][engine]") {
+  Engine E;
+  std::mt19937 rng(7);
+  MoveList list; // reused across calls: each call must replace the contents
+
+  for (int game = 0; game < 20; ++game) {
+    State s = E.initial_state();
+    for (int ply = 0; ply < 200; ++ply) {
+      const auto moves = E.legal_moves(s);
+      E.legal_moves(s, list);
+      REQUIRE(list.size() == moves.size());
+      for (std::size_t i = 0; i < moves.size(); ++i)
+        REQUIRE(same_move(list[i], moves[i]));
+
+      const auto grouped = E.group_legal_moves_by_from(s);
+      for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+        E.legal_moves_from(s, sq, list);
+        REQUIRE(grouped[sq].size() == list.size());
+        for (std::size_t i = 0; i < list.size(); ++i)
+          REQUIRE(same_move(grouped[sq][i], list[i]));
+      }
+
+      if (moves.empty() || E.apply_move(s, moves[rng() % moves.size()]).done)
+        break;
+    }
+  }
+}
+
+TEST_CASE("Units generate without the unique_ptr factory", "[movelist][unit]") {
+  Engine E;
+  const State s = E.initial_state();
+
+  for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+    const piece::Code pc = s.board[sq];
+    const Unit *shared = unit_for_code(pc);
+    auto owned = make_unit_from_code(pc);
+    REQUIRE((shared == nullptr) == (owned == nullptr));
+    if (!shared)
+      continue;
+
+    REQUIRE(shared->owner() == owned->owner());
+    REQUIRE(unit_for_code(pc) == shared); // same instance every time
+
+    MoveList list;
+    shared->generate_moves(s, sq, list);
+    const auto expected = owned->get_legal_moves(s, sq);
+    REQUIRE(list.size() == expected.size());
+    for (std::size_t i = 0; i < list.size(); ++i)
+      REQUIRE(same_move(list[i], expected[i]));
+  }
+}
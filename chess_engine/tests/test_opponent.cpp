@@ -0,0 +1,139 @@
+/**
+ * @file test_opponent.cpp
+ * @brief Native opponents: policy choices, determinism and agent-versus-opponent steps.
+ */
+
+#include "chess/action.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move_list.hpp"
+#include "chess/opponent.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <algorithm>
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <random>
+#include <stdexcept>
+#include <vector>
+
+using namespace engine;
+
+namespace {
+
+/** Player 0's rook on (0, 4) can take player 1's king on (0, 0) or queen on (3, 4). */
+State king_or_queen() {
+  Engine E;
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[E.get_pos(5, 5)] = piece::make(piece::KING, piece::P1);
+  s.board[E.get_pos(0, 0)] = piece::make(piece::KING, piece::P2);
+  s.board[E.get_pos(3, 4)] = piece::make(piece::QUEEN, piece::P2);
+  s.board[E.get_pos(0, 4)] = piece::make(piece::ROOK, piece::P1);
+  refresh_derived(s);
+  return s;
+}
+
+bool same_move(const Move &a, const Move &b) {
+  return a.from == b.from && a.to == b.to && a.type == b.type && a.promo_piece == b.promo_piece;
+}
+
+bool is_legal_choice(const Engine &E, const State &s, const Move &m) {
+  MoveList moves;
+  E.legal_moves(s, moves);
+  return std::any_of(moves.begin(), moves.end(), [&](const Move &legal) { return same_move(legal, m); });
+}
+
+} // namespace
+
+TEST_CASE("opponent kinds are selected by name", "[opponent]") {
+  REQUIRE(parse_opponent_kind("random") == OpponentKind::Random);
+  REQUIRE(parse_opponent_kind("greedy") == OpponentKind::Greedy);
+  REQUIRE(parse_opponent_kind("search") == OpponentKind::Search);
+  REQUIRE_THROWS_AS(parse_opponent_kind("minimax"), std::invalid_argument);
+  for (OpponentKind kind : {OpponentKind::Random, OpponentKind::Greedy, OpponentKind::Search})
+    REQUIRE(parse_opponent_kind(opponent_kind_name(kind)) == kind);
+}
+
+TEST_CASE("opponents choose legal moves, greedy and search take the king", "[opponent]") {
+  const Engine E;
+  const State s = king_or_queen();
+  const Move take_king{static_cast<Square>(E.get_pos(0, 4)), static_cast<Square>(E.get_pos(0, 0))};
+
+  for (OpponentKind kind : {OpponentKind::Greedy, OpponentKind::Search}) {
+    Opponent o({kind, 2, 0, 3});
+    const auto m = o.select(E, s);
+    REQUIRE(m.has_value());
+    REQUIRE(m->from == take_king.from);
+    REQUIRE(m->to == take_king.to);
+  }
+
+  Opponent random({OpponentKind::Random, 2, 0, 3});
+  Opponent same({OpponentKind::Random, 2, 0, 3});
+  State game = E.initial_state();
+  for (int ply = 0; ply < 20; ++ply) {
+    const auto m = random.select(E, game);
+    REQUIRE(m.has_value());
+    REQUIRE(is_legal_choice(E, game, *m));
+    REQUIRE(same_move(*same.select(E, game), *m)); // deterministic given the seed
+    E.make_move(game, *m);
+  }
+}
+
+TEST_CASE("play applies the agent's move and the reply", "[opponent]") {
+  const Engine E;
+  Opponent o({OpponentKind::Greedy, 2, 0, 1});
+  State s = E.initial_state();
+  std::vector<std::int8_t> mask(action::NUM_ACTIONS), expected(action::NUM_ACTIONS);
+
+  const Move agent = E.legal_moves(s)[0];
+  State after_agent = s;
+  E.make_move(after_agent, agent);
+  const VersusStep r = o.play(E, s, agent, mask.data());
+  REQUIRE_FALSE(r.done);
+  REQUIRE(r.replied);
+  REQUIRE(is_legal_choice(E, after_agent, r.reply));
+  REQUIRE(s.ply == 2);
+  REQUIRE(s.to_move == 0);
+  E.legal_action_mask(s, expected.data());
+  REQUIRE(mask == expected);
+
+  const State before = s;
+  Move illegal{0, 1}; // player 1's rook onto its own bishop
+  REQUIRE_THROWS_AS(o.play(E, s, illegal), std::invalid_argument);
+  REQUIRE(s == before);
+}
+
+TEST_CASE("a game-ending agent move gets no reply", "[opponent]") {
+  const Engine E;
+  Opponent o;
+  State s = king_or_queen();
+  std::vector<std::int8_t> mask(action::NUM_ACTIONS, 1);
+  const VersusStep r =
+      o.play(E, s, Move{static_cast<Square>(E.get_pos(0, 4)), static_cast<Square>(E.get_pos(0, 0))}, mask.data());
+  REQUIRE(r.done);
+  REQUIRE(r.reward_p0 == 1);
+  REQUIRE_FALSE(r.replied);
+  REQUIRE(std::count(mask.begin(), mask.end(), std::int8_t{0}) == action::NUM_ACTIONS);
+}
+
+TEST_CASE("random agents finish games against every opponent", "[opponent]") {
+  const Engine E(EngineConfig{60});
+  std::mt19937 rng(9);
+  for (OpponentKind kind : {OpponentKind::Random, OpponentKind::Greedy, OpponentKind::Search}) {
+    Opponent o({kind, 1, 0, 5});
+    for (int game = 0; game < 3; ++game) {
+      State s = E.initial_state();
+      VersusStep r;
+      while (!r.done) {
+        const std::vector<Move> moves = E.legal_moves(s);
+        REQUIRE_FALSE(moves.empty());
+        r = o.play(E, s, moves[rng() % moves.size()]);
+      }
+      const Outcome out = E.outcome(s);
+      REQUIRE(r.reward_p0 == (out == Outcome::Player0Wins ? 1 : out == Outcome::Player1Wins ? -1 : 0));
+      REQUIRE(s.ply <= 60);
+    }
+  }
+}
@@ -0,0 +1,145 @@
+/**
+ * @file test_outcome.cpp
+ * @brief Incremental king squares / piece counts, O(1) outcome and the configurable ply limit.
+ */
+
+#include "chess/batch_engine.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <random>
+#include <vector>
+
+using namespace engine;
+
+namespace {
+
+/** @brief True if the derived fields of `s` match a from-scratch recomputation. */
+bool derived_fields_current(const State &s) {
+  State fresh = s;
+  refresh_derived(fresh);
+  return fresh.king_sq == s.king_sq && fresh.counts == s.counts && fresh.hash == s.hash;
+}
+
+} // namespace
+
+TEST_CASE("initial_state has both kings and full material", "[outcome]") {
+  Engine E;
+  const State s = E.initial_state();
+  REQUIRE(s.king_sq[0] == E.get_pos(BOARD_N - 1, 3));
+  REQUIRE(s.king_sq[1] == E.get_pos(0, 3));
+  for (int side = 0; side < 2; ++side) {
+    REQUIRE(s.counts[side][piece::PAWN] == BOARD_N);
+    REQUIRE(s.counts[side][piece::ROOK] == 2);
+    REQUIRE(s.counts[side][piece::BISHOP] == 2);
+    REQUIRE(s.counts[side][piece::KNIGHT] == 1);
+    REQUIRE(s.counts[side][piece::KING] == 1);
+  }
+  REQUIRE(E.outcome(s) == Outcome::Ongoing);
+  REQUIRE_FALSE(E.is_terminal(s));
+}
+
+TEST_CASE("make/unmake keep king squares and counts incremental", "[outcome]") {
+  Engine E;
+  std::mt19937 rng(1234);
+  int checks = 0, mismatches = 0;
+
+  for (int game = 0; game < 40; ++game) {
+    State s = E.initial_state();
+    std::vector<UndoRecord> undos;
+    std::vector<State> history{s};
+    while (!E.is_terminal(s)) {
+      const auto moves = E.legal_moves(s);
+      if (moves.empty())
+        break;
+      undos.push_back(E.make_move(s, moves[rng() % moves.size()]));
+      history.push_back(s);
+      ++checks;
+      mismatches += derived_fields_current(s) ? 0 : 1;
+    }
+    // Unwind the whole game and compare against every recorded position.
+    while (!undos.empty()) {
+      E.unmake_move(s, undos.back());
+      undos.pop_back();
+      history.pop_back();
+      ++checks;
+      mismatches += (s.king_sq == history.back().king_sq && s.counts == history.back().counts) ? 0 : 1;
+    }
+  }
+  REQUIRE(checks > 0);
+  REQUIRE(mismatches == 0);
+}
+
+TEST_CASE("outcome agrees with apply_move rewards", "[outcome]") {
+  Engine E;
+  std::mt19937 rng(7);
+  for (int game = 0; game < 40; ++game) {
+    State s = E.initial_state();
+    for (;;) {
+      const auto moves = E.legal_moves(s);
+      if (moves.empty())
+        break;
+      const StepResult r = E.apply_move_unchecked(s, moves[rng() % moves.size()]);
+      REQUIRE(r.done == E.is_terminal(s));
+      if (!r.done)
+        continue;
+      const Outcome o = E.outcome(s);
+      REQUIRE(r.reward_p0 == (o == Outcome::Player0Wins ? 1 : o == Outcome::Player1Wins ? -1 : 0));
+      if (o == Outcome::Player0Wins)
+        REQUIRE(s.king_sq[1] == NO_SQUARE);
+      if (o == Outcome::Player1Wins)
+        REQUIRE(s.king_sq[0] == NO_SQUARE);
+      break;
+    }
+  }
+}
+
+TEST_CASE("king capture is detected from a hand-built position", "[outcome]") {
+  Engine E;
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[E.get_pos(5, 5)] = piece::make(piece::KING, piece::P1);
+  s.board[E.get_pos(0, 0)] = piece::make(piece::KING, piece::P2);
+  s.board[E.get_pos(0, 4)] = piece::make(piece::ROOK, piece::P1);
+  refresh_derived(s);
+  REQUIRE(s.counts[0][piece::ROOK] == 1);
+
+  const StepResult r = E.apply_move(s, Move{static_cast<Square>(E.get_pos(0, 4)), static_cast<Square>(E.get_pos(0, 0))});
+  REQUIRE(r.done);
+  REQUIRE(r.reward_p0 == 1);
+  REQUIRE(E.outcome(s) == Outcome::Player0Wins);
+  REQUIRE(s.king_sq[1] == NO_SQUARE);
+  REQUIRE(s.counts[1][piece::KING] == 0);
+}
+
+TEST_CASE("the ply limit is an engine setting", "[outcome]") {
+  const Engine short_games(EngineConfig{10});
+  REQUIRE(short_games.max_ply() == 10);
+  REQUIRE(Engine{}.max_ply() == MAX_GAME_PLY);
+
+  State s = short_games.initial_state();
+  StepResult r;
+  for (std::uint32_t ply = 0; ply < 10; ++ply) {
+    REQUIRE_FALSE(short_games.is_terminal(s));
+    const auto moves = short_games.legal_moves(s);
+    REQUIRE_FALSE(moves.empty());
+    r = short_games.apply_move_unchecked(s, moves.front());
+  }
+  REQUIRE(r.done);
+  REQUIRE(short_games.outcome(s) == Outcome::Draw);
+  REQUIRE_FALSE(Engine{}.is_terminal(s));
+  REQUIRE_FALSE(short_games.search(s, 2).has_move);
+  REQUIRE(short_games.perft(s, 2) == 0);
+
+  BatchEngine be(3, 0, EngineConfig{4});
+  int done_steps = 0;
+  for (int step = 0; step < 8; ++step) {
+    be.step(be.random_actions());
+    done_steps += be.dones()[0];
+  }
+  REQUIRE(done_steps == 2); // every game is drawn (or won) within 4 plies and auto-resets
+}
@@ -83,6 +83,7 @@ TEST_CASE("P1 pawn promotion on quiet push", "[pawn][promote][quiet]") {
   REQUIRE(piece::unit_type(promote_move.promo_piece) == piece::QUEEN);
   REQUIRE(piece::is_p1(promote_move.promo_piece));
 
+  refresh_derived(s); // hand-built position: sync hash, king squares and counts
   auto step = E.apply_move(s, promote_move);
   REQUIRE(piece::unit_type(s.board[to]) == piece::QUEEN);
   REQUIRE(piece::is_p1(s.board[to]));
@@ -121,6 +122,7 @@ TEST_CASE("P1 pawn promotion on capture", "[pawn][promote][capture]") {
   REQUIRE(piece::unit_type(cap_promote_move.promo_piece) == piece::QUEEN);
   REQUIRE(piece::is_p1(cap_promote_move.promo_piece));
 
+  refresh_derived(s); // hand-built position: sync hash, king squares and counts
   auto step = E.apply_move(s, cap_promote_move);
   REQUIRE(piece::unit_type(s.board[cap_to]) == piece::QUEEN);
   REQUIRE(piece::is_p1(s.board[cap_to]));
@@ -0,0 +1,112 @@
+/**
+ * @file test_perft.cpp
+ * @brief perft reference counts, and make/unmake perft against a copy-based oracle.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <random>
+#include <vector>
+
+using namespace engine;
+
+/** @brief Straightforward perft: vector moves, copied states, apply_move's own `done`. */
+static std::uint64_t naive_perft(const Engine &E, const State &s, int depth) {
+  if (depth == 0)
+    return 1;
+  std::uint64_t nodes = 0;
+  for (const Move &m : E.legal_moves(s)) {
+    State child = s;
+    const StepResult r = E.apply_move(child, m);
+    nodes += r.done ? (depth == 1 ? 1 : 0) : naive_perft(E, child, depth - 1);
+  }
+  return nodes;
+}
+
+TEST_CASE("perft reference counts from the initial position", "[perft]") {
+  Engine E;
+  const State s = E.initial_state();
+
+  // Changing these numbers means the rules or the move generator changed.
+  REQUIRE(E.perft(s, 0) == 1);
+  REQUIRE(E.perft(s, 1) == 14);
+  REQUIRE(E.perft(s, 2) == 186);
+  REQUIRE(E.perft(s, 3) == 2809);
+  REQUIRE(E.perft(s, 4) == 40426);
+  REQUIRE(E.perft(s, 5) == 642552);
+}
+
+TEST_CASE("perft matches the copy-based oracle on random positions", "[perft]") {
+  Engine E;
+  std::mt19937 rng(2024);
+
+  REQUIRE(E.perft(E.initial_state(), 4) == naive_perft(E, E.initial_state(), 4));
+
+  for (int game = 0; game < 20; ++game) {
+    State s = E.initial_state();
+    for (int ply = 0; ply < 60; ++ply) {
+      const auto moves = E.legal_moves(s);
+      if (moves.empty())
+        break;
+      if (E.apply_move(s, moves[rng() % moves.size()]).done)
+        break;
+      if (ply % 10 == 9) {
+        INFO("game " << game << " ply " << ply);
+        REQUIRE(E.perft(s, 3) == naive_perft(E, s, 3));
+      }
+    }
+  }
+}
+
+TEST_CASE("perft_divide sums to perft and leaves the state untouched", "[perft]") {
+  Engine E;
+  const State s = E.initial_state();
+  const State copy = s;
+
+  const auto divide = E.perft_divide(s, 3);
+  const auto moves = E.legal_moves(s);
+  REQUIRE(divide.size() == moves.size());
+
+  std::uint64_t total = 0;
+  for (std::size_t i = 0; i < divide.size(); ++i) {
+    REQUIRE(divide[i].first.from == moves[i].from);
+    REQUIRE(divide[i].first.to == moves[i].to);
+    total += divide[i].second;
+  }
+  REQUIRE(total == E.perft(s, 3));
+  REQUIRE(s == copy);
+  REQUIRE(s.hash == copy.hash);
+}
+
+TEST_CASE("perft does not expand finished games", "[perft]") {
+  Engine E;
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[E.get_pos(5, 5)] = piece::make(piece::KING, piece::P1);
+  s.board[E.get_pos(0, 0)] = piece::make(piece::KING, piece::P2);
+  s.board[E.get_pos(0, 4)] = piece::make(piece::ROOK, piece::P1);
+  refresh_derived(s);
+
+  // Rxa-king ends the game: it counts at depth 1 but has no children at depth 2.
+  const auto divide = E.perft_divide(s, 2);
+  bool saw_king_capture = false;
+  for (const auto &[m, n] : divide) {
+    if (m.to == E.get_pos(0, 0)) {
+      saw_king_capture = true;
+      REQUIRE(n == 0);
+    }
+  }
+  REQUIRE(saw_king_capture);
+  REQUIRE(E.perft(s, 2) == naive_perft(E, s, 2));
+
+  s.board[E.get_pos(0, 0)] = piece::EMPTY;
+  refresh_derived(s);
+  REQUIRE(E.perft(s, 1) == 0);
+  REQUIRE(E.perft_divide(s, 1).empty());
+}
@@ -0,0 +1,114 @@
+/**
+ * @file test_planes.cpp
+ * @brief Plane encoder: one-hot pieces, per-piece flags, constant planes and the batched form.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/piece.hpp"
+#include "chess/planes.hpp"
+#include "chess/state.hpp"
+
+#include <algorithm>
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <vector>
+
+using namespace engine;
+
+namespace {
+
+template <typename T> T at(const std::vector<T> &out, int plane, int sq) {
+  return out[plane * planes::PLANE_SIZE + sq];
+}
+
+} // namespace
+
+TEST_CASE("planes one-hot every piece of the initial position", "[planes]") {
+  const Engine E;
+  const State s = E.initial_state();
+  std::vector<float> out(planes::ENCODED_SIZE, -1.0f); // overwritten completely
+  planes::encode(s, MAX_GAME_PLY, out.data());
+
+  for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq) {
+    const piece::Code pc = s.board[sq];
+    float occupied = 0.0f;
+    for (int p = planes::PIECE; p < planes::PIECE + 12; ++p)
+      occupied += at(out, p, sq);
+    REQUIRE(occupied == (piece::is_empty(pc) ? 0.0f : 1.0f));
+    if (!piece::is_empty(pc))
+      REQUIRE(at(out, planes::piece_plane(pc), sq) == 1.0f);
+    REQUIRE(at(out, planes::MOVED, sq) == 0.0f);
+    REQUIRE(at(out, planes::POWER, sq) == 0.0f);
+    REQUIRE(at(out, planes::TO_MOVE, sq) == 0.0f);
+    REQUIRE(at(out, planes::PLY, sq) == 0.0f);
+  }
+  // Player 0's king on its back rank, player 1's pawns on row 1.
+  REQUIRE(at(out, planes::PIECE + piece::KING - piece::PAWN, E.get_pos(BOARD_N - 1, 3)) == 1.0f);
+  REQUIRE(at(out, planes::PIECE + 6, E.get_pos(1, 0)) == 1.0f);
+}
+
+TEST_CASE("planes carry moved bits, power levels, side to move and ply", "[planes]") {
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[7] = piece::make(piece::ROOK, piece::P2, /*hasMoved=*/true, piece::POWER_7);
+  s.board[20] = piece::make(piece::KNIGHT, piece::P1, /*hasMoved=*/false, piece::POWER_3);
+  s.to_move = 1;
+  s.ply = 50;
+  refresh_derived(s);
+
+  std::vector<float> f(planes::ENCODED_SIZE);
+  planes::encode(s, 200, f.data());
+  REQUIRE(at(f, planes::PIECE + 6 + piece::ROOK - piece::PAWN, 7) == 1.0f);
+  REQUIRE(at(f, planes::MOVED, 7) == 1.0f);
+  REQUIRE(at(f, planes::MOVED, 20) == 0.0f);
+  REQUIRE(at(f, planes::POWER, 7) == 1.0f);
+  REQUIRE(at(f, planes::POWER, 20) == 3.0f / 7.0f);
+  REQUIRE(at(f, planes::TO_MOVE, 0) == 1.0f);
+  REQUIRE(at(f, planes::PLY, 35) == 0.25f);
+
+  std::vector<std::uint8_t> u(planes::ENCODED_SIZE);
+  planes::encode(s, 200, u.data());
+  REQUIRE(at(u, planes::POWER, 7) == 7);
+  REQUIRE(at(u, planes::POWER, 20) == 3);
+  REQUIRE(at(u, planes::PLY, 0) == 63); // 255 * 50 / 200, rounded down
+  for (std::size_t i = 0; i < planes::ENCODED_SIZE; ++i) {
+    if (i / planes::PLANE_SIZE != planes::POWER && i / planes::PLANE_SIZE != planes::PLY)
+      REQUIRE(static_cast<float>(u[i]) == f[i]);
+  }
+
+  s.ply = 1000; // past the limit: clamped
+  planes::encode(s, 200, f.data());
+  REQUIRE(at(f, planes::PLY, 0) == 1.0f);
+  planes::encode(s, 0, f.data());
+  REQUIRE(at(f, planes::PLY, 0) == 0.0f);
+}
+
+TEST_CASE("batched planes match single encodes", "[planes]") {
+  const Engine E;
+  std::vector<State> states{E.initial_state()};
+  for (int i = 0; i < 5; ++i) {
+    State next = states.back();
+    E.make_move(next, E.legal_moves(next)[i]);
+    states.push_back(next);
+  }
+  const std::size_t n = states.size();
+  std::vector<piece::Code> boards;
+  std::vector<Player> to_move;
+  std::vector<std::uint32_t> ply;
+  for (const State &s : states) {
+    boards.insert(boards.end(), s.board.begin(), s.board.end());
+    to_move.push_back(s.to_move);
+    ply.push_back(s.ply);
+  }
+  std::vector<float> batch(n * planes::ENCODED_SIZE);
+  planes::encode_batch(boards.data(), to_move.data(), ply.data(), n, MAX_GAME_PLY, batch.data());
+  std::vector<float> one(planes::ENCODED_SIZE);
+  for (std::size_t i = 0; i < n; ++i) {
+    planes::encode(states[i], MAX_GAME_PLY, one.data());
+    REQUIRE(std::equal(one.begin(), one.end(), batch.begin() + i * planes::ENCODED_SIZE));
+  }
+
+  planes::encode_batch(boards.data(), to_move.data(), nullptr, n, MAX_GAME_PLY, batch.data());
+  REQUIRE(batch[(n - 1) * planes::ENCODED_SIZE + planes::PLY * planes::PLANE_SIZE] == 0.0f);
+}
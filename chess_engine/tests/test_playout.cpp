@@ -0,0 +1,62 @@
+/**
+ * @file test_playout.cpp
+ * @brief Engine::random_playouts: bookkeeping, determinism across thread counts, finished roots.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/piece.hpp"
+#include "chess/playout.hpp"
+#include "chess/state.hpp"
+
+#include <catch2/catch_all.hpp>
+
+using namespace engine;
+
+TEST_CASE("random_playouts counts every game once", "[playout]") {
+  Engine E;
+  const PlayoutStats r = E.random_playouts(E.initial_state(), 300, /*seed=*/1, /*n_threads=*/1);
+  REQUIRE(r.playouts == 300);
+  REQUIRE(r.wins + r.draws + r.losses == 300);
+  REQUIRE(r.mean_length() > 0.0);
+  REQUIRE(r.mean_length() <= MAX_GAME_PLY);
+  REQUIRE(r.mean_score() >= -1.0);
+  REQUIRE(r.mean_score() <= 1.0);
+}
+
+TEST_CASE("random_playouts results depend on the seed, not the thread count", "[playout]") {
+  Engine E;
+  State s = E.initial_state();
+  E.apply_move(s, E.legal_moves(s).front()); // player 1 to move: results are from its view
+
+  const PlayoutStats one = E.random_playouts(s, 257, 42, 1);
+  for (int threads : {2, 3, 8}) {
+    const PlayoutStats many = E.random_playouts(s, 257, 42, threads);
+    REQUIRE(many.wins == one.wins);
+    REQUIRE(many.draws == one.draws);
+    REQUIRE(many.losses == one.losses);
+    REQUIRE(many.total_plies == one.total_plies);
+  }
+  REQUIRE(E.random_playouts(s, 257, 43, 1).total_plies != one.total_plies);
+}
+
+TEST_CASE("random_playouts respects the engine's ply limit", "[playout]") {
+  const Engine E(EngineConfig{6});
+  const PlayoutStats r = E.random_playouts(E.initial_state(), 100, 0, 2);
+  REQUIRE(r.draws == 100); // no king can be captured within 6 plies of the start
+  REQUIRE(r.total_plies == 600);
+}
+
+TEST_CASE("random_playouts from a finished game plays no moves", "[playout]") {
+  Engine E;
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[E.get_pos(5, 5)] = piece::make(piece::KING, piece::P1);
+  s.to_move = 1; // P2's king is gone: player 0 has already won
+  refresh_derived(s);
+
+  const PlayoutStats r = E.random_playouts(s, 10, 0, 4);
+  REQUIRE(r.losses == 10);
+  REQUIRE(r.total_plies == 0);
+  REQUIRE(E.random_playouts(s, 0).playouts == 0);
+}
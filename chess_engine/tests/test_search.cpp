@@ -0,0 +1,144 @@
+/**
+ * @file test_search.cpp
+ * @brief Alpha-beta search: tactics, PV consistency, limits and the transposition table.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+#include "chess/search.hpp"
+#include "chess/state.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <chrono>
+
+using namespace engine;
+
+static piece::Code p1(piece::UnitType t, bool moved = false) {
+  return piece::make(t, piece::P1, moved, piece::POWER_NONE);
+}
+static piece::Code p2(piece::UnitType t, bool moved = false) {
+  return piece::make(t, piece::P2, moved, piece::POWER_NONE);
+}
+
+static State empty_state(Player to_move = 0) {
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.to_move = to_move;
+  return s;
+}
+
+TEST_CASE("search captures the king when it can", "[search]") {
+  Engine E;
+  State s = empty_state();
+  s.board[E.get_pos(5, 5)] = p1(piece::KING);
+  s.board[E.get_pos(0, 0)] = p2(piece::KING);
+  s.board[E.get_pos(0, 4)] = p1(piece::ROOK);
+  refresh_derived(s);
+
+  const SearchResult r = E.search(s, 4);
+  REQUIRE(r.has_move);
+  REQUIRE(r.best_move.from == E.get_pos(0, 4));
+  REQUIRE(r.best_move.to == E.get_pos(0, 0));
+  REQUIRE(r.score == MATE_SCORE - 1);
+  REQUIRE(r.pv.size() == 1);
+}
+
+TEST_CASE("search keeps deepening until a mate lies within its horizon", "[search]") {
+  // King and queen against a lone king: a forced king capture in 9 plies. Transposition hits
+  // report a longer mate at depth 7, which must not end the search early.
+  Engine E;
+  State s = empty_state(1);
+  s.board[25] = p2(piece::KING);
+  s.board[28] = p2(piece::QUEEN);
+  s.board[13] = p1(piece::KING);
+  refresh_derived(s);
+
+  const SearchResult r = E.search(s, 12);
+  REQUIRE(r.has_move);
+  REQUIRE(r.score == MATE_SCORE - 9);
+  REQUIRE(r.depth == 9);
+}
+
+TEST_CASE("search wins an undefended queen and rescues its own", "[search]") {
+  Engine E;
+  State s = empty_state();
+  s.board[E.get_pos(5, 0)] = p1(piece::KING);
+  s.board[E.get_pos(0, 5)] = p2(piece::KING);
+  s.board[E.get_pos(3, 3)] = p1(piece::KNIGHT);
+  s.board[E.get_pos(1, 2)] = p2(piece::QUEEN); // knight fork target, nothing defends it
+  refresh_derived(s);
+
+  const SearchResult r = E.search(s, 3);
+  REQUIRE(r.has_move);
+  REQUIRE(r.best_move.from == E.get_pos(3, 3));
+  REQUIRE(r.best_move.to == E.get_pos(1, 2));
+  REQUIRE(r.score > 0);
+}
+
+TEST_CASE("search PV is a legal line starting with the best move", "[search][pv]") {
+  Engine E;
+  const State root = E.initial_state();
+  const SearchResult r = E.search(root, 4);
+
+  REQUIRE(r.has_move);
+  REQUIRE(r.depth == 4);
+  REQUIRE(r.nodes > 0);
+  REQUIRE_FALSE(r.pv.empty());
+  REQUIRE(r.pv.front().from == r.best_move.from);
+  REQUIRE(r.pv.front().to == r.best_move.to);
+
+  State s = root;
+  for (const Move &m : r.pv) {
+    REQUIRE(E.is_legal(s, m));
+    E.apply_move(s, m);
+  }
+}
+
+TEST_CASE("search respects the time limit but always completes depth 1", "[search][time]") {
+  Engine E;
+  const State root = E.initial_state();
+
+  const auto t0 = std::chrono::steady_clock::now();
+  const SearchResult r = E.search(root, MAX_SEARCH_DEPTH, 50);
+  const auto elapsed = std::chrono::steady_clock::now() - t0;
+
+  REQUIRE(r.has_move);
+  REQUIRE(r.depth >= 1);
+  REQUIRE(r.depth < MAX_SEARCH_DEPTH);
+  REQUIRE(std::chrono::duration_cast<std::chrono::milliseconds>(elapsed).count() < 1000);
+}
+
+TEST_CASE("search on a finished game returns no move", "[search]") {
+  Engine E;
+  State s = empty_state();
+  s.board[E.get_pos(5, 5)] = p1(piece::KING); // P2 king already captured
+  s.board[E.get_pos(0, 0)] = p1(piece::ROOK);
+  refresh_derived(s);
+
+  const SearchResult r = E.search(s, 3);
+  REQUIRE_FALSE(r.has_move);
+  REQUIRE(r.pv.empty());
+}
+
+TEST_CASE("transposition table keeps deep entries and still stores shallow ones", "[search][tt]") {
+  TranspositionTable tt(1000);
+  REQUIRE(tt.num_buckets() == 512);
+
+  const std::uint64_t a = 0x1000, b = 0x1000 + 512 * 7; // same bucket
+  tt.store(a, 6, 42, TranspositionTable::EXACT, Move{1, 2});
+  tt.store(b, 2, -5, TranspositionTable::LOWER, Move{3, 4});
+
+  const auto *ea = tt.probe(a);
+  const auto *eb = tt.probe(b);
+  REQUIRE(ea != nullptr);
+  REQUIRE(eb != nullptr);
+  REQUIRE(ea->depth == 6);
+  REQUIRE(ea->score == 42);
+  REQUIRE(eb->bound == TranspositionTable::LOWER);
+  REQUIRE(tt.probe(0x2000) == nullptr);
+
+  tt.clear();
+  REQUIRE(tt.probe(a) == nullptr);
+}
@@ -0,0 +1,62 @@
+/**
+ * @file test_serialize.cpp
+ * @brief Packed State records: layout, round trips and rejection of bad input.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/serialize.hpp"
+#include "chess/state.hpp"
+
+#include <array>
+#include <catch2/catch_all.hpp>
+#include <random>
+#include <stdexcept>
+
+using namespace engine;
+
+TEST_CASE("packed layout is board, side to move, little-endian ply", "[serialize]") {
+  Engine E;
+  State s = E.initial_state();
+  s.to_move = 1;
+  s.ply = 0x01020304;
+  refresh_derived(s);
+
+  std::array<std::uint8_t, PACKED_STATE_SIZE> buf{};
+  pack_state(s, buf.data());
+  REQUIRE(PACKED_STATE_SIZE == 41);
+  for (int sq = 0; sq < BOARD_N * BOARD_N; ++sq)
+    REQUIRE(buf[sq] == s.board[sq]);
+  REQUIRE(buf[36] == 1);
+  REQUIRE(buf[37] == 0x04);
+  REQUIRE(buf[40] == 0x01);
+}
+
+TEST_CASE("unpack_state restores the position and its derived fields", "[serialize]") {
+  Engine E;
+  std::mt19937 rng(5);
+  std::array<std::uint8_t, PACKED_STATE_SIZE> buf{};
+  int mismatches = 0;
+
+  State s = E.initial_state();
+  for (int ply = 0; ply < 200 && !E.is_terminal(s); ++ply) {
+    const auto moves = E.legal_moves(s);
+    if (moves.empty())
+      break;
+    E.apply_move(s, moves[rng() % moves.size()]);
+
+    pack_state(s, buf.data());
+    const State t = unpack_state(buf.data());
+    mismatches += (t == s && t.hash == s.hash && t.king_sq == s.king_sq && t.counts == s.counts) ? 0 : 1;
+  }
+  REQUIRE(mismatches == 0);
+}
+
+TEST_CASE("unpack_state rejects a bad side to move", "[serialize]") {
+  Engine E;
+  std::array<std::uint8_t, PACKED_STATE_SIZE> buf{};
+  pack_state(E.initial_state(), buf.data());
+  buf[BOARD_N * BOARD_N] = 2;
+  REQUIRE_THROWS_AS(unpack_state(buf.data()), std::invalid_argument);
+}
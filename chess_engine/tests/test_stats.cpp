@@ -0,0 +1,113 @@
+/**
+ * @file test_stats.cpp
+ * @brief Hot-path counters: exact counts when built with CHESS_ENGINE_STATS, zeros otherwise.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move_list.hpp"
+#include "chess/stats.hpp"
+#include "units/factory.hpp"
+#include "units/unit.hpp"
+
+#include <atomic>
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <thread>
+
+using namespace engine;
+
+TEST_CASE("stats count calls, moves and allocations per probe", "[stats]") {
+  const Engine E;
+  const State s0 = E.initial_state();
+  Engine::reset_stats();
+
+  MoveList list;
+  E.legal_moves(s0, list);
+  const std::uint64_t n = list.size();
+  const auto moves = E.legal_moves(s0); // allocates the returned vector
+  State s = s0;
+  E.apply_move(s, moves.front());
+  E.apply_move(s, Move{0, 0}); // illegal: a call, but no move played
+  const Square pawn = static_cast<Square>(E.get_pos(BOARD_N - 2, 0));
+  const std::uint64_t unit_moves = unit_for_code(s0.board[pawn])->get_legal_moves(s0, pawn).size();
+
+  // Threads that have exited still count.
+  std::thread([&] { E.legal_moves(s0, list); }).join();
+
+  const EngineStats st = Engine::stats();
+  REQUIRE(st.enabled == STATS_ENABLED);
+  const auto &p = st.probes;
+  if constexpr (STATS_ENABLED) {
+    REQUIRE(p[STAT_LEGAL_MOVES].calls == 3);
+    REQUIRE(p[STAT_LEGAL_MOVES].moves == 3 * n);
+    REQUIRE(p[STAT_LEGAL_MOVES].allocations == 1);
+    REQUIRE(p[STAT_APPLY_MOVE].calls == 2);
+    REQUIRE(p[STAT_APPLY_MOVE].moves == 1);
+    REQUIRE(p[STAT_IS_LEGAL].calls == 2);
+    REQUIRE(p[STAT_LEGAL_MOVES_FROM].calls == 2);
+    REQUIRE(p[STAT_LEGAL_MOVES_FROM].allocations == 0);
+    REQUIRE(p[STAT_MAKE_MOVE].calls == 1);
+    REQUIRE(p[STAT_MOVEGEN].calls == 5); // three legal_moves, two legal_moves_from
+    REQUIRE(p[STAT_MOVEGEN].moves == 3 * n + p[STAT_LEGAL_MOVES_FROM].moves);
+    REQUIRE(p[STAT_UNIT_GENERATE].calls == 1);
+    REQUIRE(p[STAT_UNIT_GENERATE].moves == unit_moves);
+    REQUIRE(p[STAT_UNIT_GENERATE].allocations == 1);
+    REQUIRE(p[STAT_LEGAL_MOVES].nanoseconds > 0);
+    REQUIRE(p[STAT_APPLY_MOVE].nanoseconds >= p[STAT_IS_LEGAL].nanoseconds);
+  } else {
+    for (const ProbeStats &c : p)
+      REQUIRE(c.calls + c.moves + c.nanoseconds + c.allocations == 0);
+  }
+
+  Engine::reset_stats();
+  for (const ProbeStats &c : Engine::stats().probes)
+    REQUIRE(c.calls + c.moves + c.nanoseconds + c.allocations == 0);
+}
+
+TEST_CASE("reset_stats holds while other threads keep counting", "[stats]") {
+  const Engine E;
+  const State s0 = E.initial_state();
+  std::atomic<bool> stop{false};
+  std::atomic<std::uint64_t> calls{0};
+  std::thread worker([&] {
+    MoveList list;
+    while (!stop.load()) {
+      E.legal_moves(s0, list);
+      calls.fetch_add(1);
+    }
+  });
+  for (int i = 0; i < 200; ++i) {
+    const std::uint64_t before = calls.load();
+    Engine::reset_stats();
+    const std::uint64_t counted = Engine::stats().probes[STAT_LEGAL_MOVES].calls;
+    REQUIRE(counted <= calls.load() - before + 1); // never the calls from before the reset
+  }
+  stop = true;
+  worker.join();
+
+  // A thread that exits after a reset keeps only what it counted since.
+  Engine::reset_stats();
+  std::thread([&] {
+    MoveList list;
+    for (int i = 0; i < 3; ++i)
+      E.legal_moves(s0, list);
+  }).join();
+  REQUIRE(Engine::stats().probes[STAT_LEGAL_MOVES].calls == (STATS_ENABLED ? 3 : 0));
+}
+
+TEST_CASE("stats follow perft and random playouts", "[stats]") {
+  const Engine E;
+  const State s = E.initial_state();
+  // perft counts the last ply in bulk, so depth 3 makes every move of plies 1 and 2 once.
+  const std::uint64_t interior = E.perft(s, 1) + E.perft(s, 2);
+  Engine::reset_stats();
+  E.perft(s, 3);
+  const ProbeStats make = Engine::stats().probes[STAT_MAKE_MOVE];
+  REQUIRE(make.moves == make.calls);
+  REQUIRE(make.calls == (STATS_ENABLED ? interior : 0));
+
+  Engine::reset_stats();
+  const PlayoutStats r = E.random_playouts(E.initial_state(), 8, 1, 2);
+  REQUIRE(Engine::stats().probes[STAT_MAKE_MOVE].calls == (STATS_ENABLED ? r.total_plies : 0));
+}
@@ -0,0 +1,165 @@
+/**
+ * @file test_symmetry.cpp
+ * @brief Mirror / colour-flip transforms, canonical forms and their batched versions.
+ */
+
+#include "chess/action.hpp"
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/state.hpp"
+#include "chess/symmetry.hpp"
+
+#include <algorithm>
+#include <array>
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <random>
+#include <vector>
+
+using namespace engine;
+
+namespace {
+
+constexpr std::size_t CELLS = BOARD_N * BOARD_N;
+constexpr std::array<symmetry::Transform, 4> ALL = {symmetry::IDENTITY, symmetry::MIRROR, symmetry::COLOR_FLIP,
+                                                    symmetry::MIRROR_COLOR_FLIP};
+
+/** @brief Positions from random games, the start position included. */
+std::vector<State> sample_positions(const Engine &E, int games, std::uint32_t seed) {
+  std::mt19937 rng(seed);
+  std::vector<State> out;
+  for (int g = 0; g < games; ++g) {
+    State s = E.initial_state();
+    while (!E.is_terminal(s)) {
+      out.push_back(s);
+      const auto moves = E.legal_moves(s);
+      if (moves.empty())
+        break;
+      E.apply_move(s, moves[rng() % moves.size()]);
+    }
+  }
+  return out;
+}
+
+std::array<std::int8_t, action::NUM_ACTIONS> mask_of(const Engine &E, const State &s) {
+  std::array<std::int8_t, action::NUM_ACTIONS> mask{};
+  E.legal_action_mask(s, mask.data());
+  return mask;
+}
+
+} // namespace
+
+TEST_CASE("symmetry tables are involutive permutations", "[symmetry]") {
+  for (int t = 0; t < symmetry::NUM_TRANSFORMS; ++t) {
+    std::vector<int> hits(action::NUM_ACTIONS, 0);
+    for (int a = 0; a < action::NUM_ACTIONS; ++a) {
+      const int b = symmetry::map_action(t, a);
+      REQUIRE(b >= 0);
+      REQUIRE(symmetry::map_action(t, b) == a);
+      hits[b] += 1;
+    }
+    REQUIRE(std::all_of(hits.begin(), hits.end(), [](int h) { return h == 1; }));
+    for (int sq = 0; sq < action::NUM_SQUARES; ++sq)
+      REQUIRE(symmetry::TABLE.square[t][symmetry::TABLE.square[t][sq]] == sq);
+  }
+  REQUIRE(symmetry::map_square(symmetry::MIRROR, Engine::get_pos(5, 3)) == Engine::get_pos(5, 2));
+  REQUIRE(symmetry::map_square(symmetry::COLOR_FLIP, Engine::get_pos(5, 3)) == Engine::get_pos(0, 3));
+}
+
+TEST_CASE("the start position has the colour flip but not the mirror", "[symmetry]") {
+  Engine E;
+  const State s = E.initial_state();
+  const State flipped = symmetry::apply(s, symmetry::COLOR_FLIP);
+  REQUIRE(flipped.board == s.board);
+  REQUIRE(flipped.to_move == 1);
+  REQUIRE(symmetry::apply(s, symmetry::MIRROR).board != s.board);
+  REQUIRE(symmetry::canonical_transform(s) == symmetry::IDENTITY);
+}
+
+TEST_CASE("legal moves, masks and outcomes commute with every transform", "[symmetry]") {
+  for (const bool strict : {false, true}) {
+    const Engine E(EngineConfig{MAX_GAME_PLY, strict});
+    int mismatches = 0;
+    for (const State &s : sample_positions(E, 10, strict ? 11 : 5)) {
+      const auto mask = mask_of(E, s);
+      for (const symmetry::Transform t : ALL) {
+        const State img = symmetry::apply(s, t);
+        REQUIRE(symmetry::apply(img, t) == s);
+
+        std::array<std::int8_t, action::NUM_ACTIONS> moved{};
+        const std::uint8_t id = t;
+        symmetry::apply_action_rows(mask.data(), &id, 1, moved.data());
+        mismatches += moved != mask_of(E, img);
+
+        Outcome expected = E.outcome(s);
+        if (t & symmetry::COLOR_FLIP && expected == Outcome::Player0Wins)
+          expected = Outcome::Player1Wins;
+        else if (t & symmetry::COLOR_FLIP && expected == Outcome::Player1Wins)
+          expected = Outcome::Player0Wins;
+        mismatches += E.outcome(img) != expected;
+      }
+    }
+    REQUIRE(mismatches == 0);
+  }
+}
+
+TEST_CASE("perft is invariant under the transforms", "[symmetry][perft]") {
+  Engine E;
+  const auto positions = sample_positions(E, 1, 99);
+  for (std::size_t i = 0; i < positions.size(); i += 7) {
+    const std::uint64_t nodes = E.perft(positions[i], 3);
+    for (const symmetry::Transform t : ALL)
+      REQUIRE(E.perft(symmetry::apply(positions[i], t), 3) == nodes);
+  }
+}
+
+TEST_CASE("all images of a position share one canonical form", "[symmetry]") {
+  Engine E;
+  for (const State &s : sample_positions(E, 10, 21)) {
+    const State canon = symmetry::canonicalize(s);
+    REQUIRE(canon.to_move == 0);
+    REQUIRE(canon == symmetry::apply(s, symmetry::canonical_transform(s)));
+    for (const symmetry::Transform t : ALL) {
+      const State img = symmetry::apply(s, t);
+      REQUIRE(symmetry::canonicalize(img) == canon);
+      REQUIRE(symmetry::canonical_hash(img) == canon.hash);
+    }
+  }
+}
+
+TEST_CASE("batched transforms match the single-state versions", "[symmetry]") {
+  Engine E;
+  const auto positions = sample_positions(E, 4, 8);
+  const std::size_t n = positions.size();
+  std::vector<piece::Code> boards(n * CELLS);
+  std::vector<Player> to_move(n);
+  std::vector<std::uint8_t> transforms(n);
+  std::vector<std::int64_t> actions(n);
+  for (std::size_t i = 0; i < n; ++i) {
+    std::copy(positions[i].board.begin(), positions[i].board.end(), boards.begin() + i * CELLS);
+    to_move[i] = positions[i].to_move;
+    transforms[i] = static_cast<std::uint8_t>(i % symmetry::NUM_TRANSFORMS);
+    actions[i] = i % 5 == 0 ? -1 : static_cast<std::int64_t>(i % action::NUM_ACTIONS);
+  }
+
+  std::vector<piece::Code> out_boards(n * CELLS);
+  std::vector<Player> out_to_move(n);
+  symmetry::apply_boards(boards.data(), to_move.data(), transforms.data(), n, out_boards.data(), out_to_move.data());
+  std::vector<std::int64_t> out_actions(n);
+  symmetry::apply_actions(actions.data(), transforms.data(), n, out_actions.data());
+  for (std::size_t i = 0; i < n; ++i) {
+    const State img = symmetry::apply(positions[i], static_cast<symmetry::Transform>(transforms[i]));
+    REQUIRE(std::equal(img.board.begin(), img.board.end(), out_boards.begin() + i * CELLS));
+    REQUIRE(out_to_move[i] == img.to_move);
+    REQUIRE(out_actions[i] == (actions[i] < 0 ? -1 : symmetry::map_action(transforms[i], static_cast<int>(actions[i]))));
+  }
+
+  std::vector<std::uint8_t> used(n);
+  symmetry::canonicalize_boards(boards.data(), to_move.data(), n, boards.data(), to_move.data(), used.data()); // in place
+  for (std::size_t i = 0; i < n; ++i) {
+    const State canon = symmetry::canonicalize(positions[i]);
+    REQUIRE(std::equal(canon.board.begin(), canon.board.end(), boards.begin() + i * CELLS));
+    REQUIRE(to_move[i] == 0);
+    REQUIRE(used[i] == symmetry::canonical_transform(positions[i]));
+  }
+}
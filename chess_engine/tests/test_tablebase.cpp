@@ -0,0 +1,242 @@
+/**
+ * @file test_tablebase.cpp
+ * @brief Retrograde tablebase: self-consistency with the move rules, symmetry, file handling
+ * and adjudication through EngineConfig::tablebase.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+#include "chess/search.hpp"
+#include "chess/state.hpp"
+#include "chess/symmetry.hpp"
+#include "chess/tablebase.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <filesystem>
+#include <fstream>
+#include <memory>
+#include <optional>
+#include <random>
+#include <string>
+
+using namespace engine;
+
+namespace {
+
+/** @brief Three-piece tables for one rule set, generated once per test run. */
+std::shared_ptr<const Tablebase> three_piece_tables(bool strict) {
+  static std::shared_ptr<const Tablebase> cached[2];
+  if (!cached[strict]) {
+    const auto path = std::filesystem::temp_directory_path() / (strict ? "chess_tb3_strict.bin" : "chess_tb3.bin");
+    const TablebaseSummary summary = generate_tablebase(path.string(), 3, strict, 2);
+    REQUIRE(summary.tables == 11); // KvK plus one table per (side, non-king type)
+    REQUIRE(summary.positions == summary.wins + summary.draws + summary.losses);
+    cached[strict] = std::make_shared<Tablebase>(path.string());
+  }
+  return cached[strict];
+}
+
+piece::Code make(piece::UnitType t, int side) {
+  return piece::make(t, side ? piece::P2 : piece::P1, /*hasMoved=*/t == piece::PAWN);
+}
+
+/** @brief Random position with both kings and `extra` other pieces; pawns stay off the back ranks. */
+State random_position(std::mt19937 &rng, int extra) {
+  for (;;) {
+    State s{};
+    s.board.fill(piece::EMPTY);
+    auto place = [&](piece::Code pc) {
+      for (;;) {
+        const int sq = static_cast<int>(rng() % (BOARD_N * BOARD_N));
+        const int row = sq / BOARD_N;
+        if (!piece::is_empty(s.board[sq]))
+          continue;
+        if (piece::unit_type(pc) == piece::PAWN && (row == 0 || row == BOARD_N - 1))
+          continue;
+        // Pawns on their start row are unmoved (the tables only hold such positions).
+        const int start = side_index(pc) == 0 ? BOARD_N - 2 : 1;
+        s.board[sq] = piece::unit_type(pc) == piece::PAWN && row == start ? piece::clear_has_moved(pc) : pc;
+        return;
+      }
+    };
+    place(make(piece::KING, 0));
+    place(make(piece::KING, 1));
+    for (int i = 0; i < extra; ++i)
+      place(make(static_cast<piece::UnitType>(piece::PAWN + rng() % 5), static_cast<int>(rng() % 2)));
+    s.to_move = static_cast<Player>(rng() % 2);
+    s.ply = 0;
+    refresh_derived(s);
+    return s;
+  }
+}
+
+/**
+ * @brief The entry `s` must have given its children's entries: win in 1 + the fastest
+ * losing child, else loss in 1 + the slowest winning child, else draw.
+ */
+std::optional<TablebaseEntry> one_ply_backup(const Engine &E, const Tablebase &tb, const State &s) {
+  const auto moves = E.legal_moves(s);
+  if (moves.empty()) {
+    if (E.config().strict_legality && E.in_check(s, s.to_move))
+      return TablebaseEntry{-1, 0};
+    return TablebaseEntry{0, 0};
+  }
+  std::optional<std::uint32_t> fastest_win, slowest_loss;
+  bool draw = false;
+  for (const Move &m : moves) {
+    State child = s;
+    E.make_move(child, m);
+    std::optional<TablebaseEntry> c;
+    if (child.king_sq[0] == NO_SQUARE || child.king_sq[1] == NO_SQUARE)
+      c = TablebaseEntry{-1, 0}; // the opponent's king is gone: it has lost
+    else
+      c = tb.probe(child);
+    if (!c)
+      return std::nullopt;
+    if (c->result < 0)
+      fastest_win = std::min(fastest_win.value_or(c->plies + 1), c->plies + 1);
+    else if (c->result == 0)
+      draw = true;
+    else
+      slowest_loss = std::max(slowest_loss.value_or(0), c->plies + 1);
+  }
+  if (fastest_win)
+    return TablebaseEntry{1, *fastest_win};
+  if (draw)
+    return TablebaseEntry{0, 0};
+  return TablebaseEntry{-1, *slowest_loss};
+}
+
+} // namespace
+
+TEST_CASE("tablebase entries agree with one ply of search over their children", "[tablebase]") {
+  for (const bool strict : {false, true}) {
+    const auto tb = three_piece_tables(strict);
+    REQUIRE(tb->max_pieces() == 3);
+    REQUIRE(tb->strict_legality() == strict);
+    const Engine E(EngineConfig{MAX_GAME_PLY, strict});
+    std::mt19937 rng(strict ? 5 : 4);
+    int checked = 0, decisive = 0, mismatches = 0;
+    for (int i = 0; i < 4000; ++i) {
+      const State s = random_position(rng, static_cast<int>(rng() % 2));
+      const std::optional<TablebaseEntry> e = tb->probe(s);
+      REQUIRE(e.has_value());
+      const std::optional<TablebaseEntry> expected = one_ply_backup(E, *tb, s);
+      REQUIRE(expected.has_value());
+      mismatches += e->result != expected->result || e->plies != expected->plies;
+      decisive += e->result != 0;
+      ++checked;
+    }
+    REQUIRE(checked == 4000);
+    REQUIRE(decisive > 100);
+    REQUIRE(mismatches == 0);
+  }
+}
+
+TEST_CASE("tablebase probes are invariant under the board symmetries", "[tablebase][symmetry]") {
+  const auto tb = three_piece_tables(false);
+  std::mt19937 rng(9);
+  for (int i = 0; i < 500; ++i) {
+    const State s = random_position(rng, 1);
+    const auto e = tb->probe(s);
+    REQUIRE(e.has_value());
+    for (int t = 0; t < symmetry::NUM_TRANSFORMS; ++t) {
+      const auto img = tb->probe(symmetry::apply(s, static_cast<symmetry::Transform>(t)));
+      REQUIRE(img.has_value());
+      REQUIRE(img->result == e->result);
+      REQUIRE(img->plies == e->plies);
+    }
+  }
+}
+
+TEST_CASE("tablebase does not cover larger or malformed positions", "[tablebase]") {
+  const auto tb = three_piece_tables(false);
+  Engine E;
+  REQUIRE_FALSE(tb->probe(E.initial_state()).has_value());
+
+  std::mt19937 rng(2);
+  REQUIRE_FALSE(tb->probe(random_position(rng, 2)).has_value());
+
+  // A king-less position is already decided; it has no entry.
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[E.get_pos(3, 3)] = make(piece::KING, 0);
+  refresh_derived(s);
+  REQUIRE_FALSE(tb->probe(s).has_value());
+
+  // A moved pawn on its start row could not double-push; that is not the stored position.
+  s.board[E.get_pos(0, 0)] = make(piece::KING, 1);
+  s.board[E.get_pos(BOARD_N - 2, 1)] = make(piece::PAWN, 0);
+  refresh_derived(s);
+  REQUIRE_FALSE(tb->probe(s).has_value());
+  s.board[E.get_pos(BOARD_N - 2, 1)] = piece::clear_has_moved(make(piece::PAWN, 0));
+  refresh_derived(s);
+  REQUIRE(tb->probe(s).has_value());
+}
+
+TEST_CASE("an attached tablebase adjudicates games, playouts and searches", "[tablebase]") {
+  const auto tb = three_piece_tables(false);
+  const Engine plain;
+  const Engine E(EngineConfig{MAX_GAME_PLY, false, tb});
+
+  // Player 0: king and rook against a lone king, player 1 to move.
+  State s{};
+  s.board.fill(piece::EMPTY);
+  s.board[E.get_pos(5, 5)] = make(piece::KING, 0);
+  s.board[E.get_pos(2, 4)] = make(piece::ROOK, 0);
+  s.board[E.get_pos(0, 0)] = make(piece::KING, 1);
+  s.to_move = 1;
+  refresh_derived(s);
+  const auto e = E.probe_tablebase(s);
+  REQUIRE(e.has_value());
+  REQUIRE(e->result == -1);
+  REQUIRE_FALSE(plain.probe_tablebase(s).has_value());
+  REQUIRE(plain.outcome(s) == Outcome::Ongoing);
+  REQUIRE(E.outcome(s) == Outcome::Player0Wins);
+
+  // A win that needs more plies than the limit leaves is a draw.
+  s.ply = MAX_GAME_PLY - e->plies + 1;
+  REQUIRE(E.outcome(s) == Outcome::Draw);
+  s.ply = MAX_GAME_PLY - e->plies;
+  REQUIRE(E.outcome(s) == Outcome::Player0Wins);
+  s.ply = 0;
+
+  const PlayoutStats r = E.random_playouts(s, 16, 0, 1);
+  REQUIRE(r.losses == 16); // from player 1's view, without playing a move
+  REQUIRE(r.total_plies == 0);
+
+  // Capturing the knight enters a won three-piece ending: apply_move ends the game there.
+  s.board[E.get_pos(2, 1)] = make(piece::KNIGHT, 1);
+  s.to_move = 0;
+  refresh_derived(s);
+  REQUIRE(E.outcome(s) == Outcome::Ongoing);
+  const Move capture{static_cast<Square>(E.get_pos(2, 4)), static_cast<Square>(E.get_pos(2, 1))};
+  REQUIRE(E.is_legal(s, capture));
+  State after = s;
+  const StepResult step = E.apply_move(after, capture);
+  REQUIRE(step.done);
+  REQUIRE(step.reward_p0 == 1);
+
+  const SearchResult best = E.search(s, 2);
+  REQUIRE(best.has_move);
+  REQUIRE(is_mate_score(best.score));
+  REQUIRE(best.score > 0);
+}
+
+TEST_CASE("tablebase files are validated", "[tablebase]") {
+  const auto strict_tb = three_piece_tables(true);
+  REQUIRE_THROWS_AS(Engine(EngineConfig{MAX_GAME_PLY, false, strict_tb}), std::invalid_argument);
+  REQUIRE_NOTHROW(Engine(EngineConfig{MAX_GAME_PLY, true, strict_tb}));
+
+  const auto path = std::filesystem::temp_directory_path() / "chess_tb_garbage.bin";
+  {
+    std::ofstream out(path, std::ios::binary);
+    out << "definitely not a tablebase";
+  }
+  REQUIRE_THROWS_AS(Tablebase(path.string()), std::runtime_error);
+  REQUIRE_THROWS_AS(Tablebase((path.parent_path() / "chess_tb_missing.bin").string()), std::runtime_error);
+  REQUIRE_THROWS_AS(generate_tablebase(path.string(), MAX_TABLEBASE_PIECES + 1), std::invalid_argument);
+  std::filesystem::remove(path);
+}
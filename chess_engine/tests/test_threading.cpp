@@ -0,0 +1,106 @@
+/**
+ * @file test_threading.cpp
+ * @brief One Engine shared by several threads gives the same results as sequential use.
+ */
+
+#include "chess/batch_engine.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/state.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <cstdint>
+#include <random>
+#include <thread>
+#include <vector>
+
+using namespace engine;
+
+namespace {
+
+struct GameSummary {
+  std::uint64_t hash = 0;
+  std::uint32_t ply = 0;
+  int reward_p0 = 0;
+};
+
+/** @brief Random game driven only through the shared engine. */
+GameSummary play_random_game(const Engine &E, unsigned seed) {
+  std::mt19937 rng(seed);
+  State s = E.initial_state();
+  GameSummary out;
+  for (;;) {
+    const auto moves = E.legal_moves(s);
+    if (moves.empty())
+      break;
+    const StepResult r = E.apply_move(s, moves[rng() % moves.size()]);
+    if (r.done) {
+      out.reward_p0 = r.reward_p0;
+      break;
+    }
+  }
+  out.hash = s.hash;
+  out.ply = s.ply;
+  return out;
+}
+
+} // namespace
+
+TEST_CASE("a shared Engine is safe to use from many threads", "[threading]") {
+  constexpr int THREADS = 4;
+  constexpr int GAMES_PER_THREAD = 50;
+  const Engine shared;
+
+  std::vector<GameSummary> expected(THREADS * GAMES_PER_THREAD);
+  for (int i = 0; i < THREADS * GAMES_PER_THREAD; ++i)
+    expected[i] = play_random_game(shared, static_cast<unsigned>(i));
+  const std::uint64_t expected_perft = shared.perft(shared.initial_state(), 4);
+
+  std::vector<GameSummary> got(THREADS * GAMES_PER_THREAD);
+  std::vector<std::uint64_t> perfts(THREADS);
+  std::vector<std::thread> pool;
+  for (int t = 0; t < THREADS; ++t) {
+    pool.emplace_back([&, t] {
+      for (int g = 0; g < GAMES_PER_THREAD; ++g) {
+        const int i = t * GAMES_PER_THREAD + g;
+        got[i] = play_random_game(shared, static_cast<unsigned>(i));
+      }
+      perfts[t] = shared.perft(shared.initial_state(), 4);
+    });
+  }
+  for (auto &th : pool)
+    th.join();
+
+  for (int i = 0; i < THREADS * GAMES_PER_THREAD; ++i) {
+    REQUIRE(got[i].hash == expected[i].hash);
+    REQUIRE(got[i].ply == expected[i].ply);
+    REQUIRE(got[i].reward_p0 == expected[i].reward_p0);
+  }
+  for (std::uint64_t p : perfts)
+    REQUIRE(p == expected_perft);
+}
+
+TEST_CASE("BatchEngines in separate threads are independent", "[threading][batch]") {
+  constexpr int THREADS = 4;
+  auto run = [](std::uint64_t seed) {
+    BatchEngine be(16, seed);
+    std::uint64_t checksum = 0;
+    for (int step = 0; step < 300; ++step) {
+      be.step(be.random_actions());
+      for (std::size_t i = 0; i < be.num_envs(); ++i)
+        checksum = checksum * 31 + be.get_state(i).hash + be.dones()[i];
+    }
+    return checksum;
+  };
+
+  std::vector<std::uint64_t> expected(THREADS), got(THREADS);
+  for (int t = 0; t < THREADS; ++t)
+    expected[t] = run(static_cast<std::uint64_t>(t));
+
+  std::vector<std::thread> pool;
+  for (int t = 0; t < THREADS; ++t)
+    pool.emplace_back([&, t] { got[t] = run(static_cast<std::uint64_t>(t)); });
+  for (auto &th : pool)
+    th.join();
+  REQUIRE(got == expected);
+}
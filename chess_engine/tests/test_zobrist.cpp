@@ -0,0 +1,94 @@
+/**
+ * @file test_zobrist.cpp
+ * @brief Zobrist keys: incremental updates, undo and state equality.
+ */
+
+#include "chess/config.hpp"
+#include "chess/engine.hpp"
+#include "chess/move.hpp"
+#include "chess/piece.hpp"
+#include "chess/state.hpp"
+#include "chess/zobrist.hpp"
+
+#include <catch2/catch_all.hpp>
+#include <random>
+
+using namespace engine;
+
+TEST_CASE("initial_state carries a computed hash", "[zobrist]") {
+  Engine E;
+  const State s = E.initial_state();
+  REQUIRE(s.hash != 0);
+  REQUIRE(s.hash == zobrist::compute(s));
+}
+
+TEST_CASE("apply_move and make/unmake keep the hash incremental", "[zobrist]") {
+  Engine E;
+  std::mt19937 rng(99);
+
+  for (int game = 0; game < 30; ++game) {
+    State s = E.initial_state();
+    for (int ply = 0; ply < 200; ++ply) {
+      const auto moves = E.legal_moves(s);
+      if (moves.empty())
+        break;
+
+      const std::uint64_t before = s.hash;
+      const UndoRecord u = E.make_move(s, moves.front());
+      REQUIRE(s.hash == zobrist::compute(s));
+      E.unmake_move(s, u);
+      REQUIRE(s.hash == before);
+
+      const auto step = E.apply_move(s, moves[rng() % moves.size()]);
+      REQUIRE(s.hash == zobrist::compute(s));
+      if (step.done)
+        break;
+    }
+  }
+}
+
+TEST_CASE("hash depends on side to move, moved and power bits but not ply", "[zobrist]") {
+  Engine E;
+  State a = E.initial_state();
+
+  State b = a;
+  b.ply = 17;
+  refresh_derived(b);
+  REQUIRE(b.hash == a.hash);
+  REQUIRE(b != a); // equality still compares ply
+
+  State c = a;
+  c.to_move = 1;
+  refresh_derived(c);
+  REQUIRE(c.hash != a.hash);
+
+  State d = a;
+  d.board[0] = piece::set_has_moved(d.board[0]);
+  refresh_derived(d);
+  REQUIRE(d.hash != a.hash);
+
+  State e = a;
+  e.board[0] = piece::with_power(e.board[0], piece::POWER_2);
+  refresh_derived(e);
+  REQUIRE(e.hash != a.hash);
+}
+
+TEST_CASE("transposed move orders reach the same key", "[zobrist]") {
+  Engine E;
+  const State start = E.initial_state();
+  auto knight_hop = [&](State &s, int fr, int fc, int tr, int tc) {
+    E.apply_move(s, Move{static_cast<Square>(E.get_pos(fr, fc)), static_cast<Square>(E.get_pos(tr, tc))});
+  };
+
+  // The P1 knight reaches (1,2), capturing a P2 pawn, via two different routes.
+  State x = start, y = start;
+  knight_hop(x, 5, 2, 3, 1);
+  knight_hop(x, 0, 2, 2, 1);
+  knight_hop(x, 3, 1, 1, 2);
+  knight_hop(y, 5, 2, 3, 3);
+  knight_hop(y, 0, 2, 2, 1);
+  knight_hop(y, 3, 3, 1, 2);
+  REQUIRE(x.board == y.board);
+  REQUIRE(x.hash == y.hash);
+  REQUIRE(x == y);
+}
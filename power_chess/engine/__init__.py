@@ -1,6 +1,47 @@
 try:
     # Re-export symbols from the compiled extension.
-    from ._ccore import BOARD_N, MoveType, Move, StepResult, State, Engine  # type: ignore[attr-defined]
+    from ._ccore import (  # type: ignore[attr-defined]
+        BOARD_N,
+        NUM_ACTIONS,
+        MAX_GAME_PLY,
+        STATS_ENABLED,
+        PACKED_STATE_SIZE,
+        NUM_SYMMETRIES,
+        NUM_PLANES,
+        MAX_TABLEBASE_PIECES,
+        MoveType,
+        Outcome,
+        Symmetry,
+        Move,
+        UndoRecord,
+        StepResult,
+        SearchResult,
+        PlayoutStats,
+        MctsResult,
+        VersusStep,
+        State,
+        Tablebase,
+        TablebaseSummary,
+        Engine,
+        BatchEngine,
+        Opponent,
+        encode_action,
+        decode_action,
+        pack_states,
+        unpack_states,
+        transform_state,
+        transform_action,
+        canonical_symmetry,
+        canonicalize,
+        canonical_hash,
+        transform_boards,
+        canonicalize_boards,
+        transform_actions,
+        transform_action_rows,
+        encode_planes,
+        encode_planes_batch,
+        generate_tablebase,
+    )
 except Exception as e:  # ImportError, OSError (bad ABI), etc.
     raise ImportError(
         "power_chess.engine: native extension '_ccore' is not available.\n"
@@ -12,4 +53,45 @@ except Exception as e:  # ImportError, OSError (bad ABI), etc.
         f"Original error: {e}"
     ) from e
 
-__all__ = ["BOARD_N", "MoveType", "Move", "StepResult", "State", "Engine"]
+__all__ = [
+    "BOARD_N",
+    "NUM_ACTIONS",
+    "MAX_GAME_PLY",
+    "STATS_ENABLED",
+    "PACKED_STATE_SIZE",
+    "NUM_SYMMETRIES",
+    "NUM_PLANES",
+    "MAX_TABLEBASE_PIECES",
+    "MoveType",
+    "Outcome",
+    "Symmetry",
+    "Move",
+    "UndoRecord",
+    "StepResult",
+    "SearchResult",
+    "PlayoutStats",
+    "MctsResult",
+    "VersusStep",
+    "State",
+    "Tablebase",
+    "TablebaseSummary",
+    "Engine",
+    "BatchEngine",
+    "Opponent",
+    "encode_action",
+    "decode_action",
+    "pack_states",
+    "unpack_states",
+    "transform_state",
+    "transform_action",
+    "canonical_symmetry",
+    "canonicalize",
+    "canonical_hash",
+    "transform_boards",
+    "canonicalize_boards",
+    "transform_actions",
+    "transform_action_rows",
+    "encode_planes",
+    "encode_planes_batch",
+    "generate_tablebase",
+]
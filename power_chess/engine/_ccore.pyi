@@ -1,7 +1,17 @@
 from __future__ import annotations
-from typing import List
+from typing import Callable, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 BOARD_N: int
+NUM_ACTIONS: int  # size of the canonical action space
+MAX_GAME_PLY: int  # default Engine/BatchEngine max_ply
+STATS_ENABLED: bool  # built with -DCHESS_ENGINE_STATS=ON
+PACKED_STATE_SIZE: int  # bytes per State.to_bytes() record / pack_states() row
+NUM_SYMMETRIES: int
+MAX_TABLEBASE_PIECES: int  # largest generate_tablebase max_pieces
+NUM_PLANES: int  # channels of encode_planes
 
 class MoveType:
     Quiet: MoveType
@@ -10,38 +20,292 @@ class MoveType:
     CapturePromote: MoveType
     Special: MoveType
 
+class Outcome:
+    Ongoing: Outcome
+    Player0Wins: Outcome
+    Player1Wins: Outcome
+    Draw: Outcome
+
+class Symmetry:  # each is its own inverse
+    Identity: Symmetry
+    Mirror: Symmetry  # columns reversed
+    ColorFlip: Symmetry  # rows reversed, players swapped
+    MirrorColorFlip: Symmetry
+
 class Move:
     def __init__(self) -> None: ...
+    def __getstate__(self) -> tuple[int, int, MoveType, int, int]: ...
+    def __setstate__(self, state: tuple[int, int, MoveType, int, int]) -> None: ...
     from_: int
     to: int
     type: MoveType
     promo_piece: int
     special_code: int
 
+class UndoRecord:
+    @property
+    def move(self) -> Move: ...
+    @property
+    def moved(self) -> int: ...
+    @property
+    def captured(self) -> int: ...
+
 class StepResult:
     def __init__(self) -> None: ...
     state: State
     done: bool
     reward_p0: float
     info: str
+    def __getstate__(self) -> tuple[bytes, bool, int, str]: ...
+    def __setstate__(self, state: tuple[bytes, bool, int, str]) -> None: ...
+
+class SearchResult:
+    @property
+    def best_move(self) -> Move: ...
+    @property
+    def has_move(self) -> bool: ...
+    @property
+    def score(self) -> int: ...  # centipawns, side to move's view
+    @property
+    def depth(self) -> int: ...
+    @property
+    def nodes(self) -> int: ...
+    @property
+    def pv(self) -> list[Move]: ...
+
+class PlayoutStats:
+    @property
+    def playouts(self) -> int: ...
+    @property
+    def wins(self) -> int: ...  # from the view of the side to move
+    @property
+    def draws(self) -> int: ...
+    @property
+    def losses(self) -> int: ...
+    @property
+    def total_plies(self) -> int: ...
+    @property
+    def mean_length(self) -> float: ...
+    @property
+    def mean_score(self) -> float: ...  # (wins - losses) / playouts
+
+class VersusStep:
+    @property
+    def done(self) -> bool: ...
+    @property
+    def reward_p0(self) -> int: ...  # once done, else 0
+    @property
+    def replied(self) -> bool: ...
+    @property
+    def reply(self) -> Move: ...
+
+class MctsResult:
+    @property
+    def visits(self) -> npt.NDArray[np.uint32]: ...  # (NUM_ACTIONS,) root visit counts
+    @property
+    def best_action(self) -> int: ...  # -1 if the root is terminal
+    @property
+    def root_value(self) -> float: ...  # for the side to move
+    @property
+    def simulations(self) -> int: ...
+    @property
+    def evaluator_calls(self) -> int: ...
+
+# evaluate(observations (B, BOARD_N, BOARD_N) uint8, action_masks (B, NUM_ACTIONS) int8, to_move (B,) uint8)
+#     -> (priors (B, NUM_ACTIONS), values (B,))
+LeafEvaluator = Callable[
+    [npt.NDArray[np.uint8], npt.NDArray[np.int8], npt.NDArray[np.uint8]],
+    tuple[npt.ArrayLike, npt.ArrayLike],
+]
 
 class State:
     def __init__(self) -> None: ...
-    board: List[int]  # len = BOARD_N * BOARD_N
+    @property
+    def board(self) -> npt.NDArray[np.uint8]: ...  # read-only view aliasing the state, len = BOARD_N * BOARD_N
+    @board.setter
+    def board(self, value: Sequence[int] | npt.NDArray[np.uint8]) -> None: ...
+    def board_view(self, writable: bool = False) -> npt.NDArray[np.uint8]: ...
+    def refresh_derived(self) -> None: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
     to_move: int  # 0 or 1
     ply: int
+    @property
+    def hash(self) -> int: ...  # Zobrist key of board + to_move
+    @property
+    def king_squares(self) -> tuple[int | None, int | None]: ...  # None once that king was captured
+    @property
+    def piece_counts(self) -> npt.NDArray[np.uint8]: ...  # read-only (2, 8), [player][UnitType]
+    def __eq__(self, other: object) -> bool: ...
+    def __ne__(self, other: object) -> bool: ...
+    def to_bytes(self) -> bytes: ...  # board, to_move, ply (little-endian uint32)
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview) -> State: ...
+    def __getstate__(self) -> bytes: ...
+    def __setstate__(self, state: bytes) -> None: ...
+    def __hash__(self) -> int: ...
+
+def pack_states(states: Sequence[State], out: npt.NDArray[np.uint8] | None = None) -> npt.NDArray[np.uint8]: ...  # (N, K)
+def unpack_states(packed: npt.NDArray[np.uint8]) -> list[State]: ...  # K = PACKED_STATE_SIZE
+
+SymmetryIds = Symmetry | int | npt.ArrayLike  # one for every row, or (N,) ids
+
+def transform_state(state: State, symmetry: Symmetry) -> State: ...
+def transform_action(action: int, symmetry: Symmetry) -> int: ...
+def canonical_symmetry(state: State) -> Symmetry: ...
+def canonicalize(state: State) -> State: ...
+def canonical_hash(state: State) -> int: ...
+def transform_boards(
+    boards: npt.ArrayLike, to_move: npt.ArrayLike, symmetries: SymmetryIds
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8]]: ...  # boards (N, 36) or (N, 6, 6)
+def canonicalize_boards(
+    boards: npt.ArrayLike, to_move: npt.ArrayLike
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8], npt.NDArray[np.uint8]]: ...  # boards, to_move, symmetries
+def transform_actions(actions: npt.ArrayLike, symmetries: SymmetryIds) -> npt.NDArray[np.int64]: ...
+def transform_action_rows(rows: npt.NDArray[np.generic], symmetries: SymmetryIds) -> npt.NDArray[np.generic]: ...
+
+# Planes: 0-5 player 0 pawn..king, 6-11 player 1, 12 has-moved, 13 power, 14 side to move, 15 ply / max_ply.
+def encode_planes(
+    state: State,
+    out: npt.NDArray[np.float32] | npt.NDArray[np.uint8] | None = None,
+    dtype: npt.DTypeLike = "float32",
+    max_ply: int = ...,
+) -> npt.NDArray[np.float32] | npt.NDArray[np.uint8]: ...  # (NUM_PLANES, BOARD_N, BOARD_N)
+def encode_planes_batch(
+    boards: npt.ArrayLike,
+    to_move: npt.ArrayLike,
+    ply: npt.ArrayLike | None = None,
+    out: npt.NDArray[np.float32] | npt.NDArray[np.uint8] | None = None,
+    dtype: npt.DTypeLike = "float32",
+    max_ply: int = ...,
+) -> npt.NDArray[np.float32] | npt.NDArray[np.uint8]: ...  # (N, NUM_PLANES, BOARD_N, BOARD_N)
+
+class TablebaseSummary:
+    @property
+    def tables(self) -> int: ...
+    @property
+    def positions(self) -> int: ...
+    @property
+    def wins(self) -> int: ...  # from the view of the side to move
+    @property
+    def draws(self) -> int: ...
+    @property
+    def losses(self) -> int: ...
+    @property
+    def longest(self) -> int: ...  # plies
+    @property
+    def bytes(self) -> int: ...
+
+def generate_tablebase(
+    path: str, max_pieces: int = 3, strict_legality: bool = False, n_threads: int = 0
+) -> TablebaseSummary: ...
+
+class Tablebase:
+    def __init__(self, path: str) -> None: ...
+    def probe(self, state: State) -> tuple[int, int] | None: ...  # (result, plies) for the side to move
+    @property
+    def max_pieces(self) -> int: ...
+    @property
+    def strict_legality(self) -> bool: ...
+    @property
+    def path(self) -> str: ...
 
 class Engine:
-    def __init__(self) -> None: ...
+    def __init__(self, max_ply: int = ..., strict_legality: bool = False, tablebase: Tablebase | None = None) -> None: ...
+    @property
+    def max_ply(self) -> int: ...
+    @property
+    def strict_legality(self) -> bool: ...
+    @property
+    def tablebase(self) -> Tablebase | None: ...
+    def probe_tablebase(self, state: State) -> tuple[int, int] | None: ...
     def initial_state(self) -> State: ...
     def legal_moves(self, state: State) -> list[Move]: ...
     def legal_moves_from(self, state: State, from_: int) -> list[Move]: ...
     def group_legal_moves_by_from(self, state: State) -> list[list[Move]]: ...
     def is_legal(self, state: State, move: Move) -> bool: ...
+    def legal_action_mask(self, state: State, out: npt.NDArray[np.int8] | None = None) -> npt.NDArray[np.int8]: ...
     def apply_move(self, state: State, move: Move) -> StepResult: ...
+    def apply_move_unchecked(self, state: State, move: Move) -> StepResult: ...
+    def make_move(self, state: State, move: Move) -> UndoRecord: ...
+    def unmake_move(self, state: State, undo: UndoRecord) -> None: ...
+    def outcome(self, state: State) -> Outcome: ...
+    def is_terminal(self, state: State) -> bool: ...
+    def attack_map(self, state: State, by: int) -> npt.NDArray[np.bool_]: ...  # len = BOARD_N * BOARD_N
+    def is_square_attacked(self, state: State, square: int, by: int) -> bool: ...
+    def in_check(self, state: State, side: int) -> bool: ...
+    def search(self, state: State, max_depth: int = 4, time_limit_ms: int = 0) -> SearchResult: ...
+    def random_playouts(self, state: State, n_playouts: int, seed: int = 0, n_threads: int = 0) -> PlayoutStats: ...
+    def mcts(
+        self,
+        state: State,
+        evaluate: LeafEvaluator,
+        num_simulations: int = 800,
+        batch_size: int = 16,
+        num_threads: int = 1,
+        c_puct: float = 1.5,
+        virtual_loss: float = 1.0,
+        dirichlet_alpha: float = 0.3,
+        dirichlet_epsilon: float = 0.0,
+        seed: int = 0,
+    ) -> MctsResult: ...
+    def perft(self, state: State, depth: int) -> int: ...
+    def perft_divide(self, state: State, depth: int) -> list[tuple[Move, int]]: ...
+    # {probe: {"calls", "moves", "nanoseconds", "allocations"}}; probes: legal_moves, legal_moves_from,
+    # is_legal, apply_move, make_move, movegen, unit_generate. All zero unless STATS_ENABLED.
+    @staticmethod
+    def stats() -> dict[str, dict[str, int]]: ...
+    @staticmethod
+    def reset_stats() -> None: ...
     @staticmethod
     def get_pos(row: int, col: int) -> int: ...
     @staticmethod
     def row(idx: int) -> int: ...
     @staticmethod
     def col(idx: int) -> int: ...
+
+def encode_action(move: Move) -> int: ...  # -1 if the move has no action id
+def decode_action(state: State, action: int) -> Move: ...
+
+class BatchEngine:
+    def __init__(
+        self,
+        num_envs: int,
+        seed: int = 0,
+        max_ply: int = ...,
+        strict_legality: bool = False,
+        tablebase: Tablebase | None = None,
+    ) -> None: ...
+    @property
+    def num_envs(self) -> int: ...
+    def reset(self) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int8]]: ...
+    def step(
+        self, actions: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int8], npt.NDArray[np.float32], npt.NDArray[np.bool_]]: ...
+    def random_actions(self) -> npt.NDArray[np.int64]: ...  # (N,) one random legal action per game
+    @property
+    def observations(self) -> npt.NDArray[np.uint8]: ...  # (N, BOARD_N, BOARD_N)
+    @property
+    def to_move(self) -> npt.NDArray[np.uint8]: ...  # (N,)
+    @property
+    def ply(self) -> npt.NDArray[np.uint32]: ...  # (N,)
+    @property
+    def action_masks(self) -> npt.NDArray[np.int8]: ...  # (N, NUM_ACTIONS)
+    @property
+    def rewards(self) -> npt.NDArray[np.float32]: ...  # (N,) player-0 reward of the last step
+    @property
+    def dones(self) -> npt.NDArray[np.bool_]: ...  # (N,)
+    def get_state(self, index: int) -> State: ...
+    def final_state(self, index: int) -> State: ...  # game as the last step ended it, where dones[index]
+    def set_state(self, index: int, state: State) -> None: ...
+
+class Opponent:
+    def __init__(self, kind: str = "random", search_depth: int = 2, time_limit_ms: int = 0, seed: int = 0) -> None: ...
+    @property
+    def kind(self) -> str: ...  # "random", "greedy" or "search"
+    @property
+    def search_depth(self) -> int: ...
+    @property
+    def time_limit_ms(self) -> int: ...
+    def seed(self, seed: int) -> None: ...
+    def select(self, engine: Engine, state: State) -> Move | None: ...
+    def play(self, engine: Engine, state: State, move: Move, mask: npt.NDArray[np.int8] | None = None) -> VersusStep: ...
@@ -1,5 +1,21 @@
 """Reinforcement learning utilities for Power-Chess."""
 
-from .env.power_chess_aec import PowerChessAECEnv, make_aec_env
+from .env import (
+    OPPONENT_ENV_ID,
+    SELF_PLAY_ENV_ID,
+    PowerChessAECEnv,
+    PowerChessEnvPool,
+    PowerChessOpponentEnv,
+    PowerChessVectorEnv,
+    make_aec_env,
+)
 
-__all__ = ["PowerChessAECEnv", "make_aec_env"]
+__all__ = [
+    "OPPONENT_ENV_ID",
+    "SELF_PLAY_ENV_ID",
+    "PowerChessAECEnv",
+    "PowerChessEnvPool",
+    "PowerChessOpponentEnv",
+    "PowerChessVectorEnv",
+    "make_aec_env",
+]
@@ -1,5 +1,23 @@
-"""PettingZoo environments for Power-Chess."""
+"""PettingZoo and Gymnasium environments, and a subprocess pool, for Power-Chess."""
 
+import gymnasium
+
+from .opponent import OPPONENT_ENV_ID, PowerChessOpponentEnv
+from .pool import PowerChessEnvPool
 from .power_chess_aec import PowerChessAECEnv, make_aec_env
+from .vector import SELF_PLAY_ENV_ID, PowerChessVectorEnv
+
+# gymnasium.make_vec(SELF_PLAY_ENV_ID, num_envs=N, **kwargs) builds a PowerChessVectorEnv directly.
+gymnasium.register(SELF_PLAY_ENV_ID, vector_entry_point="rl.env.vector:PowerChessVectorEnv")
+# gymnasium.make(OPPONENT_ENV_ID, opponent="greedy") plays one side against a native opponent.
+gymnasium.register(OPPONENT_ENV_ID, entry_point="rl.env.opponent:PowerChessOpponentEnv")
 
-__all__ = ["PowerChessAECEnv", "make_aec_env"]
+__all__ = [
+    "OPPONENT_ENV_ID",
+    "SELF_PLAY_ENV_ID",
+    "PowerChessAECEnv",
+    "PowerChessEnvPool",
+    "PowerChessOpponentEnv",
+    "PowerChessVectorEnv",
+    "make_aec_env",
+]
@@ -1,71 +1,43 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Iterable, List
 
-from power_chess.engine import Move, MoveType
-
-
-@dataclass(frozen=True)
-class MoveKey:
-    """Immutable signature for a move used to index the discrete action space."""
-
-    from_square: int
-    to_square: int
-    move_type: MoveType
-    promo_piece: int
-    special_code: int
+from power_chess.engine import NUM_ACTIONS, Move, State, decode_action, encode_action
 
 
 class DiscreteActionMapper:
-    """Bi-directional mapping between engine moves and discrete action ids."""
-
-    def __init__(self, max_actions: int) -> None:
+    """Fixed mapping between engine moves and the engine's canonical action ids.
+
+    Ids come from a static table in the C++ core (every geometrically possible (from, to) pair on
+    the board, sorted), so they are identical across env instances, processes and runs. Promotion
+    is implied by the board and special moves have no ids yet. Lookups are array indexing on the
+    native side in both directions.
+    """
+
+    def __init__(self, max_actions: int = NUM_ACTIONS) -> None:
+        if max_actions < NUM_ACTIONS:
+            raise ValueError(f"max_actions must be at least NUM_ACTIONS ({NUM_ACTIONS}), got {max_actions}.")
+        # Ids at or above NUM_ACTIONS are padding and never legal.
         self._max_actions = max_actions
-        self._move_to_id: Dict[MoveKey, int] = {}
-        self._id_to_move: Dict[int, MoveKey] = {}
 
     @property
     def size(self) -> int:
         """Return the size of the discrete action space."""
         return self._max_actions
 
-    def register_moves(self, moves: Iterable[Move]) -> List[int]:
-        """Register moves and return their corresponding action ids."""
-        action_ids: List[int] = []
-        for move in moves:
-            key = self._move_to_key(move)
-            if key not in self._move_to_id:
-                self._register_new_move(key)
-            action_ids.append(self._move_to_id[key])
-        return action_ids
+    def encode(self, move: Move) -> int:
+        """Return the action id of a move."""
+        action_id = encode_action(move)
+        if action_id < 0:
+            raise KeyError(f"Move {move.from_}->{move.to} has no action id.")
+        return action_id
 
-    def build_move(self, action_id: int) -> Move:
-        """Instantiate a Move from its action id."""
-        if action_id not in self._id_to_move:
-            raise KeyError(f"Unknown action id: {action_id}")
-        key = self._id_to_move[action_id]
-        move = Move()
-        move.from_ = key.from_square
-        move.to = key.to_square
-        move.type = key.move_type
-        move.promo_piece = key.promo_piece
-        move.special_code = key.special_code
-        return move
-
-    def _register_new_move(self, key: MoveKey) -> None:
-        if len(self._move_to_id) >= self._max_actions:
-            raise RuntimeError("Action mapper exhausted capacity for unique moves.")
-        new_id = len(self._move_to_id)
-        self._move_to_id[key] = new_id
-        self._id_to_move[new_id] = key
+    def encode_moves(self, moves: Iterable[Move]) -> List[int]:
+        """Return the action ids of several moves, in order."""
+        return [self.encode(move) for move in moves]
 
-    @staticmethod
-    def _move_to_key(move: Move) -> MoveKey:
-        return MoveKey(
-            from_square=move.from_,
-            to_square=move.to,
-            move_type=move.type,
-            promo_piece=move.promo_piece,
-            special_code=move.special_code,
-        )
+    def build_move(self, state: State, action_id: int) -> Move:
+        """Instantiate the Move that an action id stands for in ``state``."""
+        if not 0 <= action_id < NUM_ACTIONS:
+            raise KeyError(f"Unknown action id: {action_id}")
+        return decode_action(state, action_id)
@@ -1,51 +1,78 @@
 from __future__ import annotations
 
-from typing import Iterable
-
 import numpy as np
 from gymnasium import spaces
 
-from power_chess.engine import BOARD_N, State
+from power_chess.engine import BOARD_N, MAX_GAME_PLY, NUM_PLANES, State, encode_planes
 
 BOARD_AREA = BOARD_N * BOARD_N
 
+# "board": raw packed piece codes, (BOARD_N, BOARD_N) uint8.
+# "planes" / "planes_uint8": decoded (NUM_PLANES, BOARD_N, BOARD_N) plane stack (see encode_planes).
+OBSERVATION_MODES = ("board", "planes", "planes_uint8")
+_PLANE_DTYPES = {"planes": np.float32, "planes_uint8": np.uint8}
+
+
+def check_observation_mode(mode: str) -> None:
+    """Raise ValueError for an unknown observation mode."""
+    if mode not in OBSERVATION_MODES:
+        raise ValueError(f"observation_mode must be one of {OBSERVATION_MODES}, got {mode!r}.")
+
+
+def read_only(value):
+    """Mark an array, or every array in a dict, read-only and return it."""
+    if isinstance(value, dict):
+        for array in value.values():
+            array.flags.writeable = False
+    else:
+        value.flags.writeable = False
+    return value
+
 
 def board_as_tensor(state: State) -> np.ndarray:
-    """Convert the engine state board into a (BOARD_N, BOARD_N) tensor."""
-    board_array = np.asarray(state.board, dtype=np.uint8)
-    return board_array.reshape((BOARD_N, BOARD_N))
+    """Convert the engine state board into a (BOARD_N, BOARD_N) tensor.
+
+    ``state.board`` is a view of the live state, so the result is copied: observations must not
+    change when the game moves on.
+    """
+    return state.board.reshape((BOARD_N, BOARD_N)).copy()
+
 
+def board_as_planes(state: State, dtype: type = np.float32, max_ply: int = MAX_GAME_PLY) -> np.ndarray:
+    """Encode the state natively into a new (NUM_PLANES, BOARD_N, BOARD_N) float32 or uint8 plane stack."""
+    return encode_planes(state, out=np.empty((NUM_PLANES, BOARD_N, BOARD_N), dtype=dtype), max_ply=max_ply)
 
-def action_mask_from_ids(max_actions: int, legal_action_ids: Iterable[int]) -> np.ndarray:
-    """Construct a binary action mask with ones at legal action ids."""
-    mask = np.zeros((max_actions,), dtype=np.int8)
-    for action_id in legal_action_ids:
-        if 0 <= action_id < max_actions:
-            mask[action_id] = 1
-    return mask
 
+def state_observation(state: State, mode: str = "board", max_ply: int = MAX_GAME_PLY) -> np.ndarray:
+    """Return the ``observation`` entry of ``state`` for an observation mode."""
+    if mode == "board":
+        return board_as_tensor(state)
+    return board_as_planes(state, _PLANE_DTYPES[mode], max_ply)
 
-def observation_space(max_actions: int) -> spaces.Dict:
+
+def board_space(mode: str = "board") -> spaces.Box:
+    """Return the space of the ``observation`` entry for an observation mode."""
+    if mode == "board":
+        return spaces.Box(low=0, high=255, shape=(BOARD_N, BOARD_N), dtype=np.uint8)
+    if mode == "planes":
+        return spaces.Box(low=0.0, high=1.0, shape=(NUM_PLANES, BOARD_N, BOARD_N), dtype=np.float32)
+    return spaces.Box(low=0, high=255, shape=(NUM_PLANES, BOARD_N, BOARD_N), dtype=np.uint8)
+
+
+def observation_space(max_actions: int, mode: str = "board") -> spaces.Dict:
     """Return the observation space shared across agents."""
     return spaces.Dict(
         {
-            "observation": spaces.Box(low=0, high=255, shape=(BOARD_N, BOARD_N), dtype=np.uint8),
+            "observation": board_space(mode),
             "action_mask": spaces.Box(low=0, high=1, shape=(max_actions,), dtype=np.int8),
         }
     )
 
 
-def format_observation(state: State, legal_action_ids: Iterable[int], max_actions: int) -> dict[str, np.ndarray]:
-    """Build the observation dictionary consumed by RLlib policies."""
-    return {
-        "observation": board_as_tensor(state),
-        "action_mask": action_mask_from_ids(max_actions, legal_action_ids),
-    }
-
-
-def empty_observation(max_actions: int) -> dict[str, np.ndarray]:
+def empty_observation(max_actions: int, mode: str = "board") -> dict[str, np.ndarray]:
     """Return an observation structure filled with zeros."""
+    space = board_space(mode)
     return {
-        "observation": np.zeros((BOARD_N, BOARD_N), dtype=np.uint8),
+        "observation": np.zeros(space.shape, dtype=space.dtype),
         "action_mask": np.zeros((max_actions,), dtype=np.int8),
     }
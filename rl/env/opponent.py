@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import gymnasium
+import numpy as np
+from gymnasium import spaces
+
+from power_chess.engine import BOARD_N, MAX_GAME_PLY, NUM_ACTIONS, Engine, Opponent, State, Tablebase, encode_action
+from .action_mapper import DiscreteActionMapper
+from .observation import check_observation_mode, observation_space, state_observation
+
+OPPONENT_ENV_ID = "PowerChessVsOpponent-v0"
+
+
+class PowerChessOpponentEnv(gymnasium.Env):
+    """Single-agent Gymnasium environment: the agent plays one side against a native opponent.
+
+    ``opponent`` names the policy of the other side, run in C++ by ``Opponent``: ``"random"``,
+    ``"greedy"`` (captures the most valuable piece it can) or ``"search"`` (alpha-beta to
+    ``search_depth`` plies, optionally capped at ``time_limit_ms``). ``step`` applies the agent's
+    move and the opponent's reply in one native call, so every transition is a single Python
+    step. ``agent_player`` is 0 or 1, or None to draw the agent's side at every reset; when the
+    agent plays player 1 the opponent opens the game during ``reset``.
+
+    Observations are dictionaries like ``PowerChessAECEnv``'s (``observation_mode`` included),
+    with new arrays every step. Rewards are the result from the agent's view once the game ends
+    (a win 1, a loss -1, a draw 0) and 0 before; ``infos["opponent_action"]`` is the reply's
+    action id, or -1 if the opponent did not move.
+    """
+
+    metadata = {"render_modes": ["ansi"]}
+
+    def __init__(
+        self,
+        opponent: str = "random",
+        *,
+        agent_player: Optional[int] = 0,
+        search_depth: int = 2,
+        time_limit_ms: int = 0,
+        observation_mode: str = "board",
+        max_ply: int = MAX_GAME_PLY,
+        strict_legality: bool = False,
+        tablebase: Optional[Tablebase] = None,
+        render_mode: Optional[str] = None,
+    ) -> None:
+        check_observation_mode(observation_mode)
+        if agent_player not in (0, 1, None):
+            raise ValueError(f"agent_player must be 0, 1 or None, got {agent_player!r}.")
+        if render_mode is not None and render_mode not in self.metadata["render_modes"]:
+            raise ValueError(f"Unsupported render_mode {render_mode!r}.")
+        self.render_mode = render_mode
+        self._engine = Engine(max_ply=max_ply, strict_legality=strict_legality, tablebase=tablebase)
+        self._opponent = Opponent(opponent, search_depth=search_depth, time_limit_ms=time_limit_ms)
+        self._observation_mode = observation_mode
+        self._action_mapper = DiscreteActionMapper()
+        self._agent_setting = agent_player
+
+        self.observation_space = observation_space(NUM_ACTIONS, observation_mode)
+        self.action_space = spaces.Discrete(NUM_ACTIONS)
+
+        self._state: Optional[State] = None
+        self._agent_player = 0 if agent_player is None else agent_player
+        self._mask = np.zeros((NUM_ACTIONS,), dtype=np.int8)
+
+    # --------------------------------------------------------------------- API
+    def reset(
+        self, *, seed: Optional[int] = None, options: Optional[dict] = None
+    ) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+        """Start a new game; with a seed, the opponent's random stream restarts too."""
+        super().reset(seed=seed)
+        if seed is not None:
+            self._opponent.seed(seed)
+        self._agent_player = int(self.np_random.integers(2)) if self._agent_setting is None else self._agent_setting
+        self._state = self._engine.initial_state()
+
+        opponent_action = -1
+        if self._agent_player == 1:
+            reply = self._opponent.select(self._engine, self._state)
+            self._engine.make_move(self._state, reply)
+            opponent_action = encode_action(reply)
+        self._mask = self._engine.legal_action_mask(self._state)
+        return self._observation(), {"agent_player": self._agent_player, "opponent_action": opponent_action}
+
+    def step(self, action: int) -> tuple[dict[str, np.ndarray], float, bool, bool, dict[str, Any]]:
+        """Play the agent's action and the opponent's reply."""
+        if self._state is None:
+            raise RuntimeError("Call reset() before step().")
+        action = int(action)
+        if not 0 <= action < NUM_ACTIONS or not self._mask[action]:
+            raise ValueError(f"Action {action} is illegal.")
+
+        move = self._action_mapper.build_move(self._state, action)
+        self._mask = np.empty((NUM_ACTIONS,), dtype=np.int8)
+        result = self._opponent.play(self._engine, self._state, move, mask=self._mask)
+
+        reward = float(result.reward_p0 if self._agent_player == 0 else -result.reward_p0)
+        info = {"opponent_action": encode_action(result.reply) if result.replied else -1}
+        return self._observation(), reward, result.done, False, info
+
+    def render(self) -> Optional[str]:
+        """Render the board as an ASCII string."""
+        if self._state is None:
+            return "<not started>"
+        board = self._state.board
+        rows = []
+        for r in range(BOARD_N):
+            row_values = board[r * BOARD_N : (r + 1) * BOARD_N]
+            rows.append(" ".join(f"{value:02d}" for value in row_values))
+        return "\n".join(rows)
+
+    @property
+    def agent_player(self) -> int:
+        """Side the agent plays in the current game."""
+        return self._agent_player
+
+    @property
+    def opponent(self) -> Opponent:
+        """The native opponent."""
+        return self._opponent
+
+    # ----------------------------------------------------------------- Helpers
+    def _observation(self) -> dict[str, np.ndarray]:
+        return {
+            "observation": state_observation(self._state, self._observation_mode, self._engine.max_ply),
+            "action_mask": self._mask,
+        }
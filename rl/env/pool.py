@@ -0,0 +1,264 @@
+"""Shared-memory subprocess pool of ``PowerChessAECEnv`` games.
+
+Games are sharded across worker processes. Every game's observation, action mask, rewards and
+termination flag live in ``multiprocessing.shared_memory`` arrays written by the workers and
+read in place by the controller, so only action ids (and a one-object reply) cross the pipes.
+Workers run independently: the controller can dispatch actions to all of them and collect
+whichever finish first, keeping a learner busy on many cores without one process per game.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import traceback
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection, wait
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .observation import check_observation_mode, observation_space
+from .power_chess_aec import DEFAULT_MAX_ACTIONS, PLAYER_AGENT_NAMES, PowerChessAECEnv
+
+
+def _array_specs(num_games: int, max_actions: int, observation_mode: str) -> dict[str, tuple[tuple[int, ...], np.dtype]]:
+    """Shape and dtype of every shared array, one row per game."""
+    board = observation_space(max_actions, observation_mode)["observation"]
+    return {
+        "observations": ((num_games, *board.shape), np.dtype(board.dtype)),
+        "action_masks": ((num_games, max_actions), np.dtype(np.int8)),
+        "rewards": ((num_games, len(PLAYER_AGENT_NAMES)), np.dtype(np.float32)),
+        "terminations": ((num_games,), np.dtype(np.bool_)),
+        "to_move": ((num_games,), np.dtype(np.uint8)),
+    }
+
+
+def _attach(blocks: dict[str, shared_memory.SharedMemory], specs: dict) -> dict[str, np.ndarray]:
+    return {name: np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf) for name, (shape, dtype) in specs.items()}
+
+
+def _worker(
+    conn: Connection,
+    block_names: dict[str, str],
+    specs: dict,
+    first: int,
+    num_games: int,
+    max_actions: int,
+    observation_mode: str,
+) -> None:
+    """Run games ``first .. first + num_games - 1``: reset/step on command, write rows, reply."""
+    blocks = {name: shared_memory.SharedMemory(name=block_name) for name, block_name in block_names.items()}
+    arrays = _attach(blocks, specs)
+    envs = [PowerChessAECEnv(max_actions=max_actions, observation_mode=observation_mode) for _ in range(num_games)]
+    rows = range(first, first + num_games)
+
+    def publish(row: int, env: PowerChessAECEnv) -> None:
+        observation = env.observe(env.agent_selection)
+        arrays["observations"][row] = observation["observation"]
+        arrays["action_masks"][row] = observation["action_mask"]
+        arrays["to_move"][row] = PLAYER_AGENT_NAMES.index(env.agent_selection)
+
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "close":
+                break
+            try:
+                if command == "reset":
+                    for row, env in zip(rows, envs):
+                        env.reset(seed=None if payload is None else payload + row)
+                        arrays["rewards"][row] = 0.0
+                        arrays["terminations"][row] = False
+                        publish(row, env)
+                elif command == "step":
+                    for row, env, action in zip(rows, envs, payload):
+                        env.step(int(action))
+                        arrays["rewards"][row] = [env.rewards[agent] for agent in PLAYER_AGENT_NAMES]
+                        arrays["terminations"][row] = not env.agents
+                        if not env.agents:
+                            env.reset()
+                        publish(row, env)
+                else:
+                    raise ValueError(f"Unknown command {command!r}.")
+            except Exception:
+                conn.send(traceback.format_exc())
+            else:
+                conn.send(None)
+    finally:
+        del arrays
+        for block in blocks.values():
+            block.close()
+        conn.close()
+
+
+class PowerChessEnvPool:
+    """``num_workers`` processes each running ``games_per_worker`` ``PowerChessAECEnv`` games.
+
+    Game ``i`` is row ``i`` of the shared arrays ``observations`` (the ``observation`` entry for the
+    agent to move), ``action_masks``, ``rewards`` (``(num_games, 2)``, this step's reward of each
+    agent), ``terminations`` and ``to_move`` (index of the agent to move), and belongs to worker
+    ``i // games_per_worker``. A finished game is reset by its worker in the same step: its row
+    then shows the new game, with the final rewards and ``terminations`` set.
+
+    ``send`` hands actions to idle workers and returns at once; ``recv`` waits for the first
+    busy workers to finish and returns their ids, whose rows (``worker_games``) are then up to
+    date. ``step`` does both for every worker. The arrays are views of shared memory that the
+    workers overwrite, so copy whatever must outlive a worker's next step.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        games_per_worker: int = 1,
+        *,
+        max_actions: int = DEFAULT_MAX_ACTIONS,
+        observation_mode: str = "board",
+        start_method: Optional[str] = None,
+    ) -> None:
+        check_observation_mode(observation_mode)
+        if num_workers < 1 or games_per_worker < 1:
+            raise ValueError("num_workers and games_per_worker must be positive.")
+        self.num_workers = num_workers
+        self.games_per_worker = games_per_worker
+        self.num_games = num_workers * games_per_worker
+
+        specs = _array_specs(self.num_games, max_actions, observation_mode)
+        self._blocks = {
+            name: shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * dtype.itemsize)
+            for name, (shape, dtype) in specs.items()
+        }
+        self._arrays = _attach(self._blocks, specs)
+        self._views = {name: array.view() for name, array in self._arrays.items()}
+        for view in self._views.values():
+            view.flags.writeable = False
+
+        context = mp.get_context(start_method)
+        block_names = {name: block.name for name, block in self._blocks.items()}
+        self._conns: list[Connection] = []
+        self._processes = []
+        for worker in range(num_workers):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker,
+                args=(child, block_names, specs, worker * games_per_worker, games_per_worker, max_actions, observation_mode),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+        self._busy = [False] * num_workers
+        self._closed = False
+
+    # --------------------------------------------------------------------- API
+    @property
+    def observations(self) -> np.ndarray:
+        return self._views["observations"]
+
+    @property
+    def action_masks(self) -> np.ndarray:
+        return self._views["action_masks"]
+
+    @property
+    def rewards(self) -> np.ndarray:
+        return self._views["rewards"]
+
+    @property
+    def terminations(self) -> np.ndarray:
+        return self._views["terminations"]
+
+    @property
+    def to_move(self) -> np.ndarray:
+        return self._views["to_move"]
+
+    def worker_games(self, worker: int) -> slice:
+        """Rows of the shared arrays owned by ``worker``."""
+        return slice(worker * self.games_per_worker, (worker + 1) * self.games_per_worker)
+
+    def reset(self, *, seed: Optional[int] = None) -> None:
+        """Wait for busy workers, then restart every game (game ``i`` seeded with ``seed + i``)."""
+        self.recv_all()
+        self._dispatch(range(self.num_workers), "reset", lambda worker: seed)
+        self.recv_all()
+
+    def send(self, actions: np.ndarray, workers: Optional[Iterable[int]] = None) -> None:
+        """Dispatch ``actions`` (one id per game; only the given workers' rows are read) to idle workers.
+
+        Raises ValueError, without dispatching anything, if a worker is busy or an action is illegal.
+        """
+        workers = range(self.num_workers) if workers is None else list(workers)
+        actions = np.asarray(actions, dtype=np.int64).reshape(self.num_games)
+        masks = self._arrays["action_masks"]
+        for worker in workers:
+            if self._busy[worker]:
+                raise ValueError(f"Worker {worker} is still stepping.")
+            rows = self.worker_games(worker)
+            chosen = actions[rows]
+            if ((chosen < 0) | (chosen >= masks.shape[1])).any() or not masks[rows][np.arange(len(chosen)), chosen].all():
+                raise ValueError(f"Illegal action among {chosen.tolist()} for worker {worker}.")
+        self._dispatch(workers, "step", lambda worker: actions[self.worker_games(worker)])
+
+    def recv(self, timeout: Optional[float] = None) -> list[int]:
+        """Wait for at least one busy worker to finish (or ``timeout``) and return the finished ids."""
+        pending = {self._conns[worker]: worker for worker in range(self.num_workers) if self._busy[worker]}
+        if not pending:
+            raise RuntimeError("No worker is stepping.")
+        ready = [pending[conn] for conn in wait(list(pending), timeout)]
+        errors = []
+        for worker in ready:
+            reply = self._conns[worker].recv()
+            self._busy[worker] = False
+            if reply is not None:
+                errors.append(f"worker {worker}:\n{reply}")
+        if errors:
+            raise RuntimeError("\n".join(errors))
+        return sorted(ready)
+
+    def recv_all(self) -> None:
+        """Wait for every busy worker."""
+        while any(self._busy):
+            self.recv()
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Step every game and wait; returns (observations, action_masks, rewards, terminations, to_move)."""
+        self.send(actions)
+        self.recv_all()
+        return self.observations, self.action_masks, self.rewards, self.terminations, self.to_move
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+        for worker, (conn, process) in enumerate(zip(self._conns, self._processes)):
+            try:
+                if self._busy[worker]:
+                    conn.recv()
+                conn.send(("close", None))
+            except (BrokenPipeError, EOFError, OSError):
+                pass  # the worker is already gone
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._arrays.clear()
+        self._views.clear()
+        for block in self._blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                pass  # arrays handed out earlier still map it; the mapping goes with them
+            block.unlink()
+
+    def __enter__(self) -> PowerChessEnvPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ----------------------------------------------------------------- Helpers
+    def _dispatch(self, workers: Iterable[int], command: str, payload) -> None:
+        for worker in workers:
+            self._conns[worker].send((command, payload(worker)))
+            self._busy[worker] = True
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Optional, Set
+from typing import Dict, Optional
 
 import numpy as np
 from gymnasium import spaces
@@ -9,28 +9,42 @@ from pettingzoo.utils import agent_selector
 from pettingzoo.utils.env import AECEnv
 from pettingzoo.utils.wrappers import OrderEnforcingWrapper
 
-from power_chess.engine import BOARD_N, Engine, State
+from power_chess.engine import BOARD_N, NUM_ACTIONS, Engine, State
 from .action_mapper import DiscreteActionMapper
-from .observation import empty_observation, format_observation, observation_space
+from .observation import check_observation_mode, empty_observation, observation_space, read_only, state_observation
 
 PLAYER_AGENT_NAMES: tuple[str, str] = ("player_0", "player_1")
-DEFAULT_MAX_ACTIONS = 4096
+DEFAULT_MAX_ACTIONS = NUM_ACTIONS
 
 
-def make_aec_env(*, max_actions: int = DEFAULT_MAX_ACTIONS) -> AECEnv:
+def make_aec_env(*, max_actions: int = DEFAULT_MAX_ACTIONS, observation_mode: str = "board") -> AECEnv:
     """Return an order-enforced PettingZoo AEC environment."""
-    base_env = PowerChessAECEnv(max_actions=max_actions)
+    base_env = PowerChessAECEnv(max_actions=max_actions, observation_mode=observation_mode)
     return OrderEnforcingWrapper(base_env)
 
 
 class PowerChessAECEnv(AECEnv):
-    """Two-player PettingZoo environment backed by the C++ power-chess engine."""
+    """Two-player PettingZoo environment backed by the C++ power-chess engine.
+
+    ``observation_mode`` selects the ``observation`` entry: ``"board"`` (raw packed piece codes,
+    ``(BOARD_N, BOARD_N)`` uint8), ``"planes"`` (``(NUM_PLANES, BOARD_N, BOARD_N)`` float32 planes in
+    [0, 1], encoded natively) or ``"planes_uint8"`` (the same planes as uint8).
+
+    Observations are encoded once per ply, when the position changes, and ``observe`` returns
+    those cached dictionaries of read-only arrays. Each ply gets new arrays, so observations kept
+    from earlier plies (e.g. in a replay buffer) never change.
+
+    A game ends on a captured king or the ply limit, and as a draw once the agent to move has no
+    legal action.
+    """
 
     metadata = {"name": "power_chess_aec_v0", "is_parallelizable": False, "render_modes": ["ansi"]}
 
-    def __init__(self, *, max_actions: int = DEFAULT_MAX_ACTIONS) -> None:
+    def __init__(self, *, max_actions: int = DEFAULT_MAX_ACTIONS, observation_mode: str = "board") -> None:
         super().__init__()
+        check_observation_mode(observation_mode)
         self._engine = Engine()
+        self._observation_mode = observation_mode
         self._state: Optional[State] = None
         self._max_actions = max_actions
         self._action_mapper = DiscreteActionMapper(max_actions=max_actions)
@@ -43,10 +57,18 @@ class PowerChessAECEnv(AECEnv):
         self.action_spaces: Dict[str, spaces.Space] = {
             agent: spaces.Discrete(self._action_mapper.size) for agent in self.possible_agents
         }
-        obs_space = observation_space(self._action_mapper.size)
+        obs_space = observation_space(self._action_mapper.size, observation_mode)
         self.observation_spaces: Dict[str, spaces.Space] = {agent: obs_space for agent in self.possible_agents}
 
-        self._legal_actions: Dict[str, Set[int]] = {agent: set() for agent in self.possible_agents}
+        # Shared read-only stand-ins for "no game" and "not your turn".
+        self._no_legal_ids = read_only(np.zeros((0,), dtype=np.int64))
+        self._empty_observation = read_only(empty_observation(self._action_mapper.size, observation_mode))
+
+        # Current ply: the agent to move and its legal actions, and every agent's observation.
+        self._legal_agent: Optional[str] = None
+        self._legal_ids = self._no_legal_ids
+        self._legal_mask = self._empty_observation["action_mask"]
+        self._observations: Dict[str, dict[str, np.ndarray]] = {agent: self._empty_observation for agent in self.possible_agents}
 
     # --------------------------------------------------------------------- API
     def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None) -> None:  # type: ignore[override]
@@ -60,11 +82,10 @@ class PowerChessAECEnv(AECEnv):
         self.terminations = {agent: False for agent in self.agents}
         self.truncations = {agent: False for agent in self.agents}
         self.infos = {agent: {} for agent in self.agents}
-        self._legal_actions = {agent: set() for agent in self.possible_agents}
 
         self._agent_selector = agent_selector(self.agents)
         self.agent_selection = self._agent_selector.next()
-        self._sync_legal_actions()
+        self._refresh_observations()
         self.has_reset = True
 
     def action_space(self, agent: str) -> spaces.Space:
@@ -80,15 +101,17 @@ class PowerChessAECEnv(AECEnv):
         return self.observation_spaces[agent]
 
     def observe(self, agent: str) -> dict[str, np.ndarray]:
-        """Return the observation dictionary for the requested agent."""
-        if agent not in self.possible_agents:
+        """Return the requested agent's observation dictionary for this ply (cached; arrays are read-only)."""
+        observation = self._observations.get(agent)
+        if observation is None:
             raise ValueError(f"Unknown agent '{agent}'.")
+        return observation
 
-        if self._state is None or agent not in self.agents:
-            return empty_observation(self._action_mapper.size)
-
-        legal_ids = self._legal_actions.get(agent, set())
-        return format_observation(self._state, legal_ids, self._action_mapper.size)
+    def legal_action_ids(self, agent: str) -> np.ndarray:
+        """Return the legal action ids of ``agent`` this ply (read-only int64, ascending; empty if not its turn)."""
+        if agent not in self.possible_agents:
+            raise ValueError(f"Unknown agent '{agent}'.")
+        return self._legal_ids if agent == self._legal_agent else self._no_legal_ids
 
     def step(self, action: int) -> None:
         """Apply the selected action for the current agent."""
@@ -98,32 +121,31 @@ class PowerChessAECEnv(AECEnv):
             self._was_dead_step(action)
             return
 
-        legal_for_agent = self._legal_actions.get(agent, set())
-        if action not in legal_for_agent:
-            raise ValueError(f"Action {action} is illegal for agent '{agent}'.")
-
         if self._state is None:
             raise RuntimeError("Environment state is uninitialised.")
-        move = self._action_mapper.build_move(action)
-        step_result = self._engine.apply_move(self._state, move)
-        self._state = step_result.state
+        if not 0 <= action < self._legal_mask.shape[0] or not self._legal_mask[action]:
+            raise ValueError(f"Action {action} is illegal for agent '{agent}'.")
 
-        reward_p0 = float(step_result.reward_p0)
-        self.rewards["player_0"] = reward_p0
-        self.rewards["player_1"] = -reward_p0
+        move = self._action_mapper.build_move(self._state, action)
+        # The action was just validated against this ply's legal mask, so skip the engine's re-check.
+        # The state is updated in place.
+        step_result = self._engine.apply_move_unchecked(self._state, move)
 
-        for agent_name in self.agents:
-            self._cumulative_rewards[agent_name] = 0.0
-        self._accumulate_rewards()
+        # Rewards are only ever this step's, so the cumulative rewards equal them.
+        reward_p0 = float(step_result.reward_p0)
+        self.rewards["player_0"] = self._cumulative_rewards["player_0"] = reward_p0
+        self.rewards["player_1"] = self._cumulative_rewards["player_1"] = -reward_p0
 
-        if step_result.done:
+        done = step_result.done
+        if not done:
+            self.agent_selection = self._agent_selector.next()
+            self._refresh_observations()
+            done = self._legal_ids.size == 0  # no legal move: a draw, as in BatchEngine and Opponent
+        if done:
             for agent_name in self.agents:
                 self.terminations[agent_name] = True
-            self._legal_actions = {agent_name: set() for agent_name in self.possible_agents}
             self.agents = []
-        else:
-            self.agent_selection = self._agent_selector.next()
-            self._sync_legal_actions()
+            self._refresh_observations()
 
     def render(self) -> str:
         """Render the board as an ASCII string."""
@@ -137,18 +159,23 @@ class PowerChessAECEnv(AECEnv):
         return "\n".join(rows)
 
     # ----------------------------------------------------------------- Helpers
-    def _sync_legal_actions(self) -> None:
+    def _refresh_observations(self) -> None:
+        """Encode this ply's observations once; observe() and step() read them until the next ply."""
         if self._state is None or not self.agents:
+            self._legal_agent = None
+            self._legal_ids = self._no_legal_ids
+            self._legal_mask = self._empty_observation["action_mask"]
+            self._observations = {agent: self._empty_observation for agent in self.possible_agents}
             return
-        current_agent = self.agent_selection
-        moves = self._engine.legal_moves(self._state)
-        action_ids = self._action_mapper.register_moves(moves)
-        self._legal_actions = {agent: set() for agent in self.possible_agents}
-        self._legal_actions[current_agent] = set(action_ids)
-
-    def _accumulate_rewards(self) -> None:
-        for agent in self.agents:
-            self._cumulative_rewards[agent] += self.rewards[agent]
+        board = read_only(state_observation(self._state, self._observation_mode, self._engine.max_ply))
+        mask = np.zeros((self._action_mapper.size,), dtype=np.int8)
+        self._engine.legal_action_mask(self._state, out=mask[:NUM_ACTIONS])  # ids past NUM_ACTIONS are padding
+        self._legal_agent = self.agent_selection
+        self._legal_mask = read_only(mask)
+        self._legal_ids = read_only(np.flatnonzero(mask))
+        waiting = {"observation": board, "action_mask": self._empty_observation["action_mask"]}
+        self._observations = {agent: waiting for agent in self.possible_agents}
+        self._observations[self.agent_selection] = {"observation": board, "action_mask": self._legal_mask}
 
     def _seed(self, seed: Optional[int]) -> None:
         self.np_random, self._last_seed = seeding.np_random(seed)
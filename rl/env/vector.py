@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+from gymnasium import spaces
+from gymnasium.utils import seeding
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
+
+from power_chess.engine import MAX_GAME_PLY, NUM_ACTIONS, BatchEngine, Tablebase, encode_planes_batch
+from .observation import check_observation_mode, empty_observation, observation_space, state_observation
+
+SELF_PLAY_ENV_ID = "PowerChessSelfPlay-v0"
+
+
+class PowerChessVectorEnv(VectorEnv):
+    """``num_envs`` independent self-play games stepped in lock-step by one native ``BatchEngine``.
+
+    Every step takes one action id per game and returns stacked arrays: observations as
+    ``{"observation": (N, ...), "action_mask": (N, NUM_ACTIONS) int8}`` (see ``observation_mode``
+    in ``PowerChessAECEnv``), rewards, terminations and truncations of shape ``(N,)``. Both sides
+    are played by the caller, so each reward is the one earned by the side that just moved, and
+    ``infos["to_move"]`` / ``to_move`` give the side to move next in every game.
+
+    Finished games restart within the same step (``AutoresetMode.SAME_STEP``): the returned row
+    already holds the new game, and ``infos["final_obs"]`` holds the finished game's last
+    observation where ``infos["_final_obs"]`` is set. Games end on a captured king, a side to move
+    without legal moves or the ply limit; the last two are draws and count as termination, so
+    truncations are always False.
+
+    With ``copy=False`` the returned arrays are buffers the next step overwrites in place.
+    """
+
+    metadata = {"autoreset_mode": AutoresetMode.SAME_STEP}
+
+    def __init__(
+        self,
+        num_envs: int,
+        *,
+        observation_mode: str = "board",
+        max_ply: int = MAX_GAME_PLY,
+        strict_legality: bool = False,
+        tablebase: Optional[Tablebase] = None,
+        copy: bool = True,
+    ) -> None:
+        check_observation_mode(observation_mode)
+        if num_envs < 1:
+            raise ValueError(f"num_envs must be positive, got {num_envs}.")
+        self.num_envs = num_envs
+        self.copy = copy
+        self._observation_mode = observation_mode
+        self._max_ply = max_ply
+        self._engine_kwargs = {"max_ply": max_ply, "strict_legality": strict_legality, "tablebase": tablebase}
+        self._batch = BatchEngine(num_envs, **self._engine_kwargs)
+        self._np_random, self._np_random_seed = seeding.np_random(None)
+
+        self.single_observation_space = observation_space(NUM_ACTIONS, observation_mode)
+        self.single_action_space = spaces.Discrete(NUM_ACTIONS)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        # Reused per-step buffers: the plane stack (planes modes) and the side that moved.
+        board = self.single_observation_space["observation"]
+        self._planes = None if observation_mode == "board" else np.empty((num_envs, *board.shape), dtype=board.dtype)
+        self._movers = np.empty((num_envs,), dtype=np.uint8)
+        self._all_envs = np.ones((num_envs,), dtype=np.bool_)
+        self._final_action_mask = empty_observation(NUM_ACTIONS, observation_mode)["action_mask"]
+
+    # --------------------------------------------------------------------- API
+    def reset(
+        self, *, seed: Optional[int] = None, options: Optional[dict] = None
+    ) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+        """Restart every game; ``seed`` also reseeds ``sample_legal_actions``."""
+        if seed is not None:
+            self._np_random, self._np_random_seed = seeding.np_random(seed)
+            self._batch = BatchEngine(self.num_envs, seed=seed, **self._engine_kwargs)
+        else:
+            self._batch.reset()
+        return self._observations(), self._infos()
+
+    def step(self, actions: np.ndarray) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """Play one action id per game. Raises ValueError, without changing any game, if one is illegal."""
+        batch = self._batch
+        np.copyto(self._movers, batch.to_move)
+        batch.step(np.asarray(actions, dtype=np.int64).reshape(self.num_envs))
+
+        rewards_p0 = batch.rewards
+        rewards = np.where(self._movers == 0, rewards_p0, -rewards_p0)
+        terminations = batch.dones.copy()
+        infos = self._infos()
+        if terminations.any():
+            final_obs = np.full((self.num_envs,), None, dtype=object)
+            for index in np.flatnonzero(terminations):
+                final_obs[index] = {
+                    "observation": state_observation(batch.final_state(int(index)), self._observation_mode, self._max_ply),
+                    "action_mask": self._final_action_mask,
+                }
+            infos["final_obs"], infos["_final_obs"] = final_obs, terminations.copy()
+        return self._observations(), rewards, terminations, np.zeros((self.num_envs,), dtype=np.bool_), infos
+
+    def sample_legal_actions(self) -> np.ndarray:
+        """Return one uniformly random legal action id per game (reused buffer)."""
+        return self._batch.random_actions()
+
+    @property
+    def to_move(self) -> np.ndarray:
+        """Side to move in every game (read-only, updated in place by each step)."""
+        return self._batch.to_move
+
+    @property
+    def action_masks(self) -> np.ndarray:
+        """Legal-action masks of every game (read-only, updated in place by each step)."""
+        return self._batch.action_masks
+
+    @property
+    def batch_engine(self) -> BatchEngine:
+        """The underlying ``BatchEngine``."""
+        return self._batch
+
+    # ----------------------------------------------------------------- Helpers
+    def _observations(self) -> dict[str, np.ndarray]:
+        batch = self._batch
+        if self._planes is None:
+            board = batch.observations
+        else:
+            board = encode_planes_batch(batch.observations, batch.to_move, batch.ply, out=self._planes, max_ply=self._max_ply)
+        mask = batch.action_masks
+        if self.copy:
+            return {"observation": board.copy(), "action_mask": mask.copy()}
+        return {"observation": board, "action_mask": mask}
+
+    def _infos(self) -> dict[str, Any]:
+        return {"to_move": self._batch.to_move.copy(), "_to_move": self._all_envs.copy()}
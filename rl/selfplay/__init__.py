@@ -0,0 +1,16 @@
+"""Self-play drivers for Power-Chess."""
+
+from .generate import generate_selfplay
+from .shards import RECORD_DTYPE, ShardReader, ShardWriter, open_shard, unpack_records
+from .threaded import SelfPlayStats, run_threaded_selfplay
+
+__all__ = [
+    "RECORD_DTYPE",
+    "SelfPlayStats",
+    "ShardReader",
+    "ShardWriter",
+    "generate_selfplay",
+    "open_shard",
+    "run_threaded_selfplay",
+    "unpack_records",
+]
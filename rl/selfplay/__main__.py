@@ -0,0 +1,11 @@
+"""Module entry point for ``python -m rl.selfplay``: thread-scaling benchmark, or ``generate DIR ...`` for shards."""
+
+import sys
+
+from . import generate, threaded
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["generate"]:
+        raise SystemExit(generate.main(sys.argv[2:]))
+    raise SystemExit(threaded.main())
@@ -0,0 +1,149 @@
+"""Self-play data generation into trajectory shards across a process pool.
+
+Every worker process drives its own ``BatchEngine`` and appends finished games to its own
+shard files (see ``shards``), so actors never wait on each other or on a learner: training
+reads the shards through ``ShardReader`` while they grow.
+
+Usage: ``python -m rl.selfplay generate DIR [--games N] [--workers N] [--envs N] [--seed N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from power_chess.engine import MAX_GAME_PLY, BatchEngine
+from .shards import RECORD_DTYPE, PathLike, ShardWriter
+from .threaded import SelfPlayStats
+
+# (observations, action_masks, to_move) of a BatchEngine -> one action id per game.
+Policy = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+def _generate_worker(
+    directory: PathLike,
+    prefix: str,
+    num_games: int,
+    num_envs: int,
+    seed: int,
+    max_ply: int,
+    records_per_shard: int,
+    policy: Optional[Policy],
+) -> SelfPlayStats:
+    """Play until ``num_games`` games finished, writing each one as it ends."""
+    engine = BatchEngine(num_envs, seed=seed, max_ply=max_ply)
+    games = np.zeros((num_envs, max_ply), dtype=RECORD_DTYPE)  # moves so far of each game in progress
+    lengths = np.zeros((num_envs,), dtype=np.int64)
+    rows = np.arange(num_envs)
+    step = np.empty((num_envs,), dtype=RECORD_DTYPE)
+    stats = SelfPlayStats()
+    start = time.perf_counter()
+
+    with ShardWriter(directory, prefix, records_per_shard) as writer:
+        while stats.games < num_games:
+            if policy is None:
+                actions = engine.random_actions()
+            else:
+                actions = np.asarray(policy(engine.observations, engine.action_masks, engine.to_move), dtype=np.int64)
+            step["board"] = engine.observations.reshape(num_envs, -1)
+            step["to_move"] = engine.to_move
+            step["ply"] = engine.ply
+            step["action"] = actions
+            step["legal"] = np.packbits(engine.action_masks.view(np.uint8), axis=1)
+            engine.step(actions)
+            step["reward_p0"] = engine.rewards
+            games[rows, lengths] = step
+            lengths += 1
+            stats.steps += num_envs
+
+            for game in np.flatnonzero(engine.dones):
+                records = games[game, : lengths[game]]
+                result = int(step["reward_p0"][game])  # the last move's reward is the result
+                records["outcome"] = result
+                writer.write_game(records)
+                lengths[game] = 0
+                stats.games += 1
+                stats.p0_wins += result > 0
+                stats.p1_wins += result < 0
+                stats.draws += result == 0
+                if stats.games == num_games:
+                    break
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def _worker_seeds(seed: int, num_workers: int) -> list[int]:
+    """Independent engine seeds for the workers of a run (``seed + i`` would overlap with ``seed + 1``'s)."""
+    return [int(child.generate_state(1, np.uint64)[0]) for child in np.random.SeedSequence(seed).spawn(num_workers)]
+
+
+def generate_selfplay(
+    directory: PathLike,
+    num_games: int,
+    *,
+    num_workers: Optional[int] = None,
+    envs_per_worker: int = 64,
+    seed: int = 0,
+    max_ply: int = MAX_GAME_PLY,
+    records_per_shard: int = 1 << 20,
+    policy: Optional[Policy] = None,
+    start_method: Optional[str] = None,
+) -> SelfPlayStats:
+    """Play ``num_games`` self-play games on ``num_workers`` processes (default: one per CPU).
+
+    Worker ``i`` plays its share of the games on a ``BatchEngine(envs_per_worker)`` seeded from
+    the ``i``-th child of ``np.random.SeedSequence(seed)``, so no two (seed, worker) pairs share a
+    random stream, and writes them to ``selfplay-<seed>-<i>-<n>.shard`` files in ``directory``. Moves come from
+    ``policy`` (a picklable callable on the batch's observations, action masks and side to move),
+    or uniformly at random without one. Games still running once a worker's share is done are
+    dropped, never written in part.
+    """
+    if max_ply >= 1 << 16:
+        raise ValueError("max_ply must fit the shards' uint16 ply field.")
+    num_workers = num_workers or os.cpu_count() or 1
+    shares = [num_games // num_workers + (worker < num_games % num_workers) for worker in range(num_workers)]
+    total = SelfPlayStats()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=mp.get_context(start_method)) as pool:
+        jobs = [
+            pool.submit(
+                _generate_worker,
+                directory,
+                f"selfplay-{seed}-{worker:03d}",
+                share,
+                envs_per_worker,
+                worker_seed,
+                max_ply,
+                records_per_shard,
+                policy,
+            )
+            for worker, (share, worker_seed) in enumerate(zip(shares, _worker_seeds(seed, num_workers)))
+            if share > 0
+        ]
+        for job in jobs:
+            total.merge(job.result())
+    total.seconds = time.perf_counter() - start
+    return total
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--envs", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    stats = generate_selfplay(args.directory, args.games, num_workers=args.workers, envs_per_worker=args.envs, seed=args.seed)
+    print(
+        f"{stats.games} games ({stats.p0_wins} / {stats.draws} / {stats.p1_wins} player-0 wins / draws / losses), "
+        f"{stats.steps_per_second:.0f} moves/s"
+    )
+    return 0
@@ -0,0 +1,206 @@
+"""Fixed-schema, append-only trajectory shards and a memory-mapping reader.
+
+A shard is a 64-byte header followed by packed ``RECORD_DTYPE`` records, one per move:
+
+    board      (BOARD_N*BOARD_N,) uint8  packed piece codes before the move
+    to_move    uint8                     side that made the move
+    ply        uint16                    half-moves played before it
+    action     int16                     action id of the move (see encode_action)
+    legal      (LEGAL_BYTES,) uint8      legal-action mask of the position, np.packbits order
+    reward_p0  int8                      player-0 reward of the move (non-zero only on the last one)
+    outcome    int8                      final result of the game for player 0 (1, 0, -1)
+    game       uint32                    game number within the shard
+
+Writers append whole games at a time, so each game's records are contiguous and every field,
+including the outcome, is final when it is written. Readers derive the record count from the
+file size, so a shard can be read while its writer is still appending: a partially written
+trailing record is simply not counted yet.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from power_chess.engine import BOARD_N, NUM_ACTIONS
+
+SHARD_MAGIC = b"PCSHARD\0"
+SHARD_VERSION = 1
+SHARD_SUFFIX = ".shard"
+HEADER_SIZE = 64
+LEGAL_BYTES = (NUM_ACTIONS + 7) // 8
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("board", np.uint8, (BOARD_N * BOARD_N,)),
+        ("to_move", np.uint8),
+        ("ply", np.uint16),
+        ("action", np.int16),
+        ("legal", np.uint8, (LEGAL_BYTES,)),
+        ("reward_p0", np.int8),
+        ("outcome", np.int8),
+        ("game", np.uint32),
+    ]
+)
+
+# magic, version, record size, NUM_ACTIONS, BOARD_N; zero padding up to HEADER_SIZE.
+_HEADER = struct.Struct("<8sIIII")
+
+PathLike = Union[str, os.PathLike]
+
+
+def _header() -> bytes:
+    packed = _HEADER.pack(SHARD_MAGIC, SHARD_VERSION, RECORD_DTYPE.itemsize, NUM_ACTIONS, BOARD_N)
+    return packed.ljust(HEADER_SIZE, b"\0")
+
+
+def open_shard(path: PathLike) -> np.ndarray:
+    """Memory-map the complete records of a shard (read-only; empty if it has none yet).
+
+    Raises ValueError if the file is not a shard of this schema.
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    with path.open("rb") as handle:
+        header = handle.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{path}: shorter than a shard header.")
+    if header != _header():
+        raise ValueError(f"{path}: not a shard of this schema (version {SHARD_VERSION}, {NUM_ACTIONS} actions).")
+    count = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return np.zeros((0,), dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+class ShardWriter:
+    """Append games to ``<prefix>-<index>.shard`` files in ``directory``.
+
+    A new shard is started once the current one holds ``records_per_shard`` records (games are
+    never split). Existing shards are left alone: numbering continues after the last one.
+    """
+
+    def __init__(self, directory: PathLike, prefix: str, records_per_shard: int = 1 << 20) -> None:
+        if records_per_shard < 1:
+            raise ValueError("records_per_shard must be positive.")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._prefix = prefix
+        self._records_per_shard = records_per_shard
+        existing = sorted(self._directory.glob(f"{prefix}-*{SHARD_SUFFIX}"))
+        self._next_index = int(existing[-1].stem.rsplit("-", 1)[1]) + 1 if existing else 0
+        self._file = None
+        self._records = 0
+        self._games = 0
+        self.paths: list[Path] = []
+
+    def write_game(self, records: np.ndarray) -> None:
+        """Append one game's records (``RECORD_DTYPE``); their ``game`` field is set here."""
+        if records.dtype != RECORD_DTYPE:
+            raise ValueError("records must have RECORD_DTYPE.")
+        if self._file is None or self._records >= self._records_per_shard:
+            self._open_next()
+        records["game"] = self._games
+        self._file.write(records.tobytes())
+        self._file.flush()
+        self._records += len(records)
+        self._games += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> ShardWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _open_next(self) -> None:
+        self.close()
+        path = self._directory / f"{self._prefix}-{self._next_index:05d}{SHARD_SUFFIX}"
+        self._next_index += 1
+        self._file = path.open("xb")
+        self._file.write(_header())
+        self._file.flush()
+        self._records = 0
+        self._games = 0
+        self.paths.append(path)
+
+
+class ShardReader:
+    """Memory-mapped view over every shard in a directory, a single shard file, or a list of paths.
+
+    Nothing is deserialized: ``records`` are the mapped shards and ``sample`` gathers a batch of
+    plain NumPy arrays from them. Call ``refresh`` to pick up records appended since.
+    """
+
+    def __init__(self, source: Union[PathLike, Iterable[PathLike]]) -> None:
+        self._directory: Optional[Path] = None
+        self._paths: list[Path] = []
+        if isinstance(source, (str, os.PathLike)):
+            path = Path(source)
+            if path.is_dir():
+                self._directory = path
+            elif path.is_file():
+                self._paths = [path]
+            else:
+                raise FileNotFoundError(f"{path}: no such shard or directory.")
+        else:
+            self._paths = [Path(path) for path in source]
+        self.shards: list[np.ndarray] = []
+        self._offsets = np.zeros((1,), dtype=np.int64)
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Re-map the shards (and, for a directory, find new ones); returns the record count."""
+        if self._directory is not None:
+            self._paths = sorted(self._directory.glob(f"*{SHARD_SUFFIX}"))
+        self.shards = [open_shard(path) for path in self._paths if path.stat().st_size >= HEADER_SIZE]
+        self._offsets = np.cumsum([0] + [len(shard) for shard in self.shards], dtype=np.int64)
+        return len(self)
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def records(self, indices: np.ndarray) -> np.ndarray:
+        """Return the records at global ``indices`` (in shard order) as one array."""
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.size and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError("record index out of range")
+        shard_of = np.searchsorted(self._offsets, indices, side="right") - 1
+        out = np.empty(indices.shape, dtype=RECORD_DTYPE)
+        for shard in np.unique(shard_of):
+            rows = shard_of == shard
+            out[rows] = self.shards[shard][indices[rows] - self._offsets[shard]]
+        return out
+
+    def sample(self, batch_size: int, rng: Optional[np.random.Generator] = None) -> dict[str, np.ndarray]:
+        """Draw ``batch_size`` records uniformly (with replacement) as training arrays.
+
+        Returns ``observation`` (B, BOARD_N, BOARD_N) uint8, ``action_mask`` (B, NUM_ACTIONS)
+        int8, and ``to_move``, ``ply``, ``action``, ``reward_p0``, ``outcome`` of shape (B,).
+        """
+        if len(self) == 0:
+            raise ValueError("no records to sample from")
+        rng = np.random.default_rng() if rng is None else rng
+        return unpack_records(self.records(rng.integers(len(self), size=batch_size)))
+
+
+def unpack_records(records: np.ndarray) -> dict[str, np.ndarray]:
+    """Turn records into the env's array layout (see ``ShardReader.sample``)."""
+    masks = np.unpackbits(records["legal"], axis=-1, count=NUM_ACTIONS).view(np.int8)
+    return {
+        "observation": records["board"].reshape(*records.shape, BOARD_N, BOARD_N),
+        "action_mask": masks,
+        "to_move": records["to_move"],
+        "ply": records["ply"],
+        "action": records["action"],
+        "reward_p0": records["reward_p0"],
+        "outcome": records["outcome"],
+    }
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from power_chess.engine import BOARD_N, NUM_ACTIONS, NUM_PLANES, Engine, State, decode_action, encode_planes_batch
 from rl.env import make_aec_env
 
 
@@ -22,28 +23,156 @@ def test_initial_action_mask_matches_legal_moves(env):
     mask = observation["action_mask"]
     assert mask.dtype == np.int8
 
-    legal_ids = env.unwrapped._legal_actions[current_agent]
+    legal_ids = env.unwrapped.legal_action_ids(current_agent)
     assert mask.sum() == len(legal_ids)
-    active_indices = set(np.nonzero(mask)[0].tolist())
-    assert active_indices == legal_ids
+    np.testing.assert_array_equal(np.flatnonzero(mask), legal_ids)
+    other = next(agent for agent in env.possible_agents if agent != current_agent)
+    assert len(env.unwrapped.legal_action_ids(other)) == 0
+    assert not env.observe(other)["action_mask"].any()
+
+
+def test_observations_are_cached_and_read_only(env):
+    agent = env.agent_selection
+    first = env.observe(agent)
+    assert env.observe(agent) is first
+    for array in first.values():
+        assert not array.flags.writeable
+        with pytest.raises(ValueError):
+            array[...] = 0
+    assert not env.unwrapped.legal_action_ids(agent).flags.writeable
+
+    env.step(int(env.unwrapped.legal_action_ids(agent)[0]))
+    assert env.observe(env.agent_selection) is not first
 
 
 def test_illegal_action_raises(env):
     current_agent = env.agent_selection
-    legal_ids = env.unwrapped._legal_actions[current_agent]
+    legal_ids = set(env.unwrapped.legal_action_ids(current_agent).tolist())
     full_range = range(env.action_space(current_agent).n)
     illegal_candidate = next(idx for idx in full_range if idx not in legal_ids)
     with pytest.raises(ValueError):
         env.step(illegal_candidate)
+    with pytest.raises(ValueError):
+        env.step(env.action_space(current_agent).n)
 
 
 def test_step_switches_active_agent(env):
     current_agent = env.agent_selection
-    legal_ids = env.unwrapped._legal_actions[current_agent]
-    action = next(iter(legal_ids))
+    legal_ids = env.unwrapped.legal_action_ids(current_agent)
+    action = int(legal_ids[0])
     env.step(action)
 
     assert env.agent_selection != current_agent
     if env.agents:
         next_observation = env.observe(env.agent_selection)
         assert next_observation["action_mask"].sum() > 0
+
+
+def test_observation_is_a_snapshot(env):
+    agent = env.agent_selection
+    board_before = env.observe(agent)["observation"]
+    snapshot = board_before.copy()
+    env.step(int(env.unwrapped.legal_action_ids(agent)[0]))
+    np.testing.assert_array_equal(board_before, snapshot)
+
+
+def test_action_ids_are_fixed_across_instances():
+    first, second = make_aec_env(), make_aec_env()
+    try:
+        first.reset(seed=1)
+        second.reset(seed=2)
+        agent = first.agent_selection
+        np.testing.assert_array_equal(first.unwrapped.legal_action_ids(agent), second.unwrapped.legal_action_ids(agent))
+
+        unwrapped = first.unwrapped
+        assert unwrapped.action_space(agent).n == NUM_ACTIONS
+        mapper = unwrapped._action_mapper
+        moves = unwrapped._engine.legal_moves(unwrapped._state)
+        assert sorted(mapper.encode_moves(moves)) == unwrapped.legal_action_ids(agent).tolist()
+        for move, action_id in zip(moves, mapper.encode_moves(moves)):
+            rebuilt = mapper.build_move(unwrapped._state, action_id)
+            assert (rebuilt.from_, rebuilt.to, rebuilt.type) == (move.from_, move.to, move.type)
+    finally:
+        first.close()
+        second.close()
+
+
+def test_mcts_evaluator_sees_env_observations(env):
+    batches = []
+
+    def evaluate(observations, action_masks, to_move):
+        batches.append((observations.copy(), action_masks.copy(), to_move.copy()))
+        return action_masks.astype(np.float32), np.zeros(len(observations), dtype=np.float32)
+
+    base = env.unwrapped
+    result = base._engine.mcts(base._state, evaluate, num_simulations=32, batch_size=8)
+    observation = env.observe(env.agent_selection)
+    root_obs, root_mask, root_to_move = (array[0] for array in batches[0])
+    np.testing.assert_array_equal(root_obs, observation["observation"])
+    np.testing.assert_array_equal(root_mask, observation["action_mask"])
+    assert root_to_move == 0
+    assert max(len(batch[0]) for batch in batches) == 8
+
+    env.step(result.best_action)
+    assert env.agent_selection == "player_1"
+
+
+@pytest.mark.parametrize("mode, dtype", [("planes", np.float32), ("planes_uint8", np.uint8)])
+def test_plane_observations(mode, dtype):
+    env = make_aec_env(observation_mode=mode)
+    try:
+        env.reset()
+        agent = env.agent_selection
+        observation = env.observe(agent)["observation"]
+        space = env.observation_space(agent)["observation"]
+        assert observation.shape == (NUM_PLANES, BOARD_N, BOARD_N) == space.shape
+        assert observation.dtype == dtype
+        assert space.contains(observation)
+
+        state = env.unwrapped._state
+        board = state.board
+        # Every piece is one-hot over the 12 piece planes; empty squares are zero there.
+        np.testing.assert_array_equal(observation[:12].sum(axis=0).ravel(), (board != 0).astype(dtype))
+        assert not observation[14].any()  # player 0 to move
+
+        env.step(int(env.unwrapped.legal_action_ids(agent)[0]))
+        after = env.observe(env.agent_selection)["observation"]
+        assert after[14].all()
+        assert after[15, 0, 0] > observation[15, 0, 0]
+        batch = encode_planes_batch(state.board[None], np.array([state.to_move]), np.array([state.ply]), dtype=dtype)
+        np.testing.assert_array_equal(batch[0], after)
+    finally:
+        env.close()
+
+
+def test_unknown_observation_mode_raises():
+    with pytest.raises(ValueError):
+        make_aec_env(observation_mode="pixels")
+
+
+def walled_in_state() -> State:
+    """Player 0 to move; after its king steps 35 -> 34, player 1's king is walled in by its own pawns."""
+    board = np.zeros((BOARD_N * BOARD_N,), dtype=np.uint8)
+    board[0] = 0x16  # player 1 king
+    board[[1, 6, 7, 12, 13, 18, 19, 24, 25, 30, 31]] = 0x19  # player 1 pawns, moved
+    board[35] = 0x06  # player 0 king
+    state = State()
+    state.board = board
+    state.refresh_derived()
+    return state
+
+
+def king_step(state: State) -> int:
+    """Action id of player 0's king step 35 -> 34 in ``walled_in_state``."""
+    engine = Engine()
+    return next(int(a) for a in np.flatnonzero(engine.legal_action_mask(state)) if decode_action(state, int(a)).to == 34)
+
+
+def test_no_legal_move_ends_the_game_as_a_draw(env):
+    base = env.unwrapped
+    base._state = walled_in_state()
+    base._refresh_observations()
+    env.step(king_step(base._state))
+    assert env.agents == []
+    assert env.terminations == {"player_0": True, "player_1": True}
+    assert env.rewards == {"player_0": 0.0, "player_1": 0.0}
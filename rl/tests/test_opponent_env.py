@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import gymnasium
+import numpy as np
+import pytest
+
+from power_chess.engine import BOARD_N, Engine
+from rl.env import OPPONENT_ENV_ID, PowerChessOpponentEnv
+
+
+def _play(env: gymnasium.Env, seed: int) -> tuple[list[int], float]:
+    rng = np.random.default_rng(seed)
+    observation, _ = env.reset(seed=seed)
+    replies = []
+    while True:
+        action = int(rng.choice(np.flatnonzero(observation["action_mask"])))
+        observation, reward, terminated, truncated, info = env.step(action)
+        assert not truncated
+        replies.append(info["opponent_action"])
+        if terminated:
+            assert not observation["action_mask"].any()
+            return replies, reward
+        assert reward == 0.0
+        assert info["opponent_action"] >= 0
+
+
+@pytest.mark.parametrize("opponent", ["random", "greedy", "search"])
+def test_games_against_native_opponents(opponent):
+    env = gymnasium.make(OPPONENT_ENV_ID, opponent=opponent, search_depth=1, max_ply=60)
+    try:
+        replies, reward = _play(env, seed=4)
+        assert reward in (-1.0, 0.0, 1.0)
+        assert len(replies) <= 30  # one agent move and one reply per step
+        assert _play(env, seed=4) == (replies, reward)
+    finally:
+        env.close()
+
+
+def test_each_step_is_one_agent_move_and_one_reply():
+    env = PowerChessOpponentEnv("greedy")
+    engine = Engine()
+    observation, info = env.reset(seed=0)
+    assert info == {"agent_player": 0, "opponent_action": -1}
+    np.testing.assert_array_equal(observation["observation"], engine.initial_state().board.reshape(BOARD_N, BOARD_N))
+
+    action = int(np.flatnonzero(observation["action_mask"])[0])
+    observation, reward, terminated, _, info = env.step(action)
+    state = env.unwrapped._state
+    assert (state.ply, state.to_move) == (2, 0)
+    np.testing.assert_array_equal(observation["action_mask"], engine.legal_action_mask(state))
+    illegal = int(np.flatnonzero(observation["action_mask"] == 0)[0])
+    with pytest.raises(ValueError):
+        env.step(illegal)
+
+
+def test_agent_as_player_one_and_unknown_opponent():
+    env = PowerChessOpponentEnv("random", agent_player=1, observation_mode="planes")
+    observation, info = env.reset(seed=2)
+    assert info["agent_player"] == 1
+    assert info["opponent_action"] >= 0  # the opponent opened
+    assert observation["observation"][-2].min() == 1.0  # player 1 to move
+
+    sides = {PowerChessOpponentEnv(agent_player=None).reset(seed=seed)[1]["agent_player"] for seed in range(16)}
+    assert sides == {0, 1}
+    with pytest.raises(ValueError):
+        PowerChessOpponentEnv("minimax")
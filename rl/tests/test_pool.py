@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from rl.env import PowerChessAECEnv, PowerChessEnvPool
+from rl.env.power_chess_aec import PLAYER_AGENT_NAMES
+
+
+@pytest.fixture()
+def pool():
+    with PowerChessEnvPool(num_workers=2, games_per_worker=3) as environment_pool:
+        environment_pool.reset(seed=0)
+        yield environment_pool
+
+
+def _random_actions(masks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return np.array([rng.choice(np.flatnonzero(row)) for row in masks], dtype=np.int64)
+
+
+def test_pool_games_match_local_envs(pool):
+    mirror = [PowerChessAECEnv() for _ in range(pool.num_games)]
+    for env in mirror:
+        env.reset()
+    rng = np.random.default_rng(3)
+    finished = 0
+
+    for _ in range(150):
+        actions = _random_actions(pool.action_masks, rng)
+        observations, masks, rewards, terminations, to_move = pool.step(actions)
+        for game, env in enumerate(mirror):
+            env.step(int(actions[game]))
+            np.testing.assert_array_equal(rewards[game], [env.rewards[agent] for agent in PLAYER_AGENT_NAMES])
+            assert terminations[game] == (not env.agents)
+            if not env.agents:
+                env.reset()
+                finished += 1
+            expected = env.observe(env.agent_selection)
+            np.testing.assert_array_equal(observations[game], expected["observation"])
+            np.testing.assert_array_equal(masks[game], expected["action_mask"])
+            assert PLAYER_AGENT_NAMES[to_move[game]] == env.agent_selection
+    assert finished > 0  # auto-reset was exercised
+
+
+def test_async_send_and_recv(pool):
+    rng = np.random.default_rng(5)
+    pool.send(_random_actions(pool.action_masks, rng))
+    with pytest.raises(ValueError):
+        pool.send(np.zeros(pool.num_games, dtype=np.int64), workers=[0])  # still stepping
+    done = set()
+    while len(done) < pool.num_workers:
+        done.update(pool.recv(timeout=30))
+    np.testing.assert_array_equal(pool.to_move, 1)
+
+    pool.send(_random_actions(pool.action_masks, rng), workers=[1])
+    assert pool.recv(timeout=30) == [1]
+    np.testing.assert_array_equal(pool.to_move[pool.worker_games(0)], 1)
+    np.testing.assert_array_equal(pool.to_move[pool.worker_games(1)], 0)
+    with pytest.raises(RuntimeError):
+        pool.recv()  # nothing in flight
+    assert not pool.observations.flags.writeable
+
+
+def test_illegal_action_is_rejected_before_dispatch(pool):
+    actions = _random_actions(pool.action_masks, np.random.default_rng(0))
+    actions[4] = np.flatnonzero(pool.action_masks[4] == 0)[0]
+    before = pool.observations.copy()
+    with pytest.raises(ValueError):
+        pool.send(actions)
+    with pytest.raises(RuntimeError):
+        pool.recv()  # nothing was sent, not even to the worker holding only legal actions
+    np.testing.assert_array_equal(pool.observations, before)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from power_chess.engine import BOARD_N, NUM_ACTIONS, Engine, decode_action
+from rl.selfplay import RECORD_DTYPE, ShardReader, ShardWriter, generate_selfplay, run_threaded_selfplay, unpack_records
+
+
+def _random_game(engine: Engine, seed: int) -> tuple[int, int, float]:
+    rng = random.Random(seed)
+    state = engine.initial_state()
+    while True:
+        result = engine.apply_move_unchecked(state, rng.choice(engine.legal_moves(state)))
+        if result.done:
+            return state.hash, state.ply, result.reward_p0
+
+
+def test_shared_engine_across_threads_matches_sequential():
+    engine = Engine()
+    seeds = range(40)
+    expected = [_random_game(engine, seed) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        got = list(pool.map(lambda seed: _random_game(engine, seed), seeds))
+    assert got == expected
+
+
+def test_threaded_selfplay_is_reproducible():
+    first = run_threaded_selfplay(num_threads=2, envs_per_thread=16, num_steps=150, seed=3)
+    second = run_threaded_selfplay(num_threads=2, envs_per_thread=16, num_steps=150, seed=3)
+    assert first.steps == 2 * 16 * 150
+    assert first.games > 0
+    assert first.games == first.p0_wins + first.p1_wins + first.draws
+    assert (first.games, first.p0_wins, first.p1_wins) == (second.games, second.p0_wins, second.p1_wins)
+
+
+def _games(records: np.ndarray) -> list[np.ndarray]:
+    starts = np.flatnonzero(np.diff(records["game"].astype(np.int64), prepend=-1))
+    return np.split(records, starts[1:])
+
+
+def test_generated_shards_replay_exactly(tmp_path):
+    stats = generate_selfplay(tmp_path, 12, num_workers=2, envs_per_worker=4, max_ply=40, records_per_shard=64, seed=1)
+    assert stats.games == 12
+    assert stats.games == stats.p0_wins + stats.p1_wins + stats.draws
+
+    reader = ShardReader(tmp_path)
+    assert len(reader.shards) > 2  # 64-record shards rotate
+    assert len(reader) == sum(len(shard) for shard in reader.shards)
+    engine = Engine(max_ply=40)
+    games = [game for shard in reader.shards for game in _games(shard)]
+    assert len(games) == 12
+    for game in games:
+        state = engine.initial_state()
+        arrays = unpack_records(game)
+        for i, record in enumerate(game):
+            np.testing.assert_array_equal(record["board"], state.board)
+            assert (record["to_move"], record["ply"]) == (state.to_move, state.ply)
+            np.testing.assert_array_equal(arrays["action_mask"][i], engine.legal_action_mask(state))
+            result = engine.apply_move(state, decode_action(state, int(record["action"])))
+            assert record["reward_p0"] == result.reward_p0
+            assert result.done == (i == len(game) - 1)
+        assert (game["outcome"] == result.reward_p0).all()
+
+    batch = reader.sample(32, np.random.default_rng(0))
+    assert batch["observation"].shape == (32, BOARD_N, BOARD_N)
+    assert batch["action_mask"].shape == (32, NUM_ACTIONS)
+    assert batch["action_mask"][np.arange(32), batch["action"]].all()
+
+
+def test_nearby_seeds_share_no_game(tmp_path):
+    for seed in (0, 1):
+        generate_selfplay(tmp_path, 6, num_workers=2, envs_per_worker=2, max_ply=40, seed=seed)
+    reader = ShardReader(tmp_path)
+    assert len(reader.shards) == 4
+    games = [game["action"].tobytes() for shard in reader.shards for game in _games(shard)]
+    assert len(games) == 12
+    assert len(set(games)) == len(games)
+
+
+def test_readers_see_only_complete_appended_records(tmp_path):
+    generate_selfplay(tmp_path / "source", 1, num_workers=1, envs_per_worker=1, max_ply=20)
+    source = ShardReader(tmp_path / "source")
+    game = source.records(np.arange(len(source)))
+
+    with ShardWriter(tmp_path / "live", "test") as writer:
+        writer.write_game(game.copy())
+        reader = ShardReader(tmp_path / "live")
+        assert len(reader) == len(game)
+    (path,) = writer.paths
+    with path.open("ab") as handle:
+        handle.write(b"\1" * 7)  # a record torn mid-write is not counted
+        handle.flush()
+        assert reader.refresh() == len(game)
+        handle.write(b"\1" * (RECORD_DTYPE.itemsize - 7))
+    assert reader.refresh() == len(game) + 1
+
+    assert len(ShardReader(path)) == len(ShardReader([str(path)])) == len(game) + 1
+    for missing in (tmp_path / "missing", str(tmp_path / "missing-00000.shard")):
+        with pytest.raises(FileNotFoundError, match="missing"):
+            ShardReader(missing)
+
+    path.write_bytes(b"not a shard".ljust(100, b"\0"))
+    with pytest.raises(ValueError):
+        ShardReader(tmp_path / "live")
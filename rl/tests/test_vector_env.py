@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import gymnasium
+import numpy as np
+import pytest
+
+from power_chess.engine import BOARD_N, NUM_ACTIONS, NUM_PLANES, Engine, decode_action, encode_planes_batch
+from rl.env import SELF_PLAY_ENV_ID, PowerChessVectorEnv
+from rl.tests.test_env import king_step, walled_in_state
+
+
+def test_make_vec_builds_the_native_vector_env():
+    envs = gymnasium.make_vec(SELF_PLAY_ENV_ID, num_envs=3, observation_mode="planes_uint8")
+    try:
+        assert isinstance(envs, PowerChessVectorEnv)
+        assert envs.metadata["autoreset_mode"] is gymnasium.vector.AutoresetMode.SAME_STEP
+        assert envs.action_space.shape == (3,)
+        observations, infos = envs.reset(seed=1)
+        assert observations in envs.observation_space
+        assert observations["observation"].shape == (3, NUM_PLANES, BOARD_N, BOARD_N)
+        assert observations["action_mask"].shape == (3, NUM_ACTIONS)
+        np.testing.assert_array_equal(infos["to_move"], 0)
+    finally:
+        envs.close()
+
+
+def test_games_match_independent_engine_games():
+    num_envs, max_ply = 6, 24  # a short ply limit ends games quickly
+    envs = PowerChessVectorEnv(num_envs, max_ply=max_ply)
+    engine = Engine(max_ply=max_ply)
+    mirror = [engine.initial_state() for _ in range(num_envs)]
+    observations, _ = envs.reset(seed=7)
+    finished = 0
+
+    for _ in range(3 * max_ply):
+        actions = envs.sample_legal_actions().copy()
+        movers = envs.to_move.copy()
+        observations, rewards, terminations, truncations, infos = envs.step(actions)
+        assert not truncations.any()
+        for i in range(num_envs):
+            assert movers[i] == mirror[i].to_move
+            result = engine.apply_move(mirror[i], decode_action(mirror[i], int(actions[i])))
+            assert terminations[i] == result.done
+            assert rewards[i] == (result.reward_p0 if movers[i] == 0 else -result.reward_p0)
+            if result.done:
+                assert infos["_final_obs"][i]
+                np.testing.assert_array_equal(infos["final_obs"][i]["observation"], mirror[i].board.reshape(BOARD_N, BOARD_N))
+                mirror[i] = engine.initial_state()
+                finished += 1
+            np.testing.assert_array_equal(observations["observation"][i], mirror[i].board.reshape(BOARD_N, BOARD_N))
+            assert infos["to_move"][i] == mirror[i].to_move
+            legal_ids = np.flatnonzero(engine.legal_action_mask(mirror[i]))
+            np.testing.assert_array_equal(np.flatnonzero(observations["action_mask"][i]), legal_ids)
+    assert finished >= num_envs
+
+
+def test_illegal_action_leaves_every_game_unchanged():
+    envs = PowerChessVectorEnv(2)
+    observations, _ = envs.reset()
+    actions = envs.sample_legal_actions().copy()
+    actions[1] = np.flatnonzero(observations["action_mask"][1] == 0)[0]
+    with pytest.raises(ValueError):
+        envs.step(actions)
+    np.testing.assert_array_equal(envs.batch_engine.observations, observations["observation"])
+    np.testing.assert_array_equal(envs.to_move, 0)
+    envs.step(envs.sample_legal_actions())
+    np.testing.assert_array_equal(envs.to_move, 1)
+
+
+def test_planes_and_copy_modes():
+    envs = PowerChessVectorEnv(4, observation_mode="planes", copy=False)
+    observations, _ = envs.reset()
+    observations, *_ = envs.step(envs.sample_legal_actions())
+    batch = envs.batch_engine
+    expected = encode_planes_batch(batch.observations, batch.to_move, batch.ply)
+    np.testing.assert_array_equal(observations["observation"], expected)
+
+    following, *_ = envs.step(envs.sample_legal_actions())
+    assert following["observation"] is observations["observation"]  # reused buffer
+
+    copied = PowerChessVectorEnv(4, observation_mode="planes")
+    first, _ = copied.reset()
+    second, *_ = copied.step(copied.sample_legal_actions())
+    assert not np.shares_memory(first["observation"], second["observation"])
+    assert first["observation"][:, -2].max() == 0.0  # player 0 to move at ply 0
+    assert second["observation"][:, -2].min() == 1.0
+
+
+def test_game_without_legal_moves_terminates_as_a_draw():
+    envs = PowerChessVectorEnv(2)
+    envs.reset()
+    state = walled_in_state()
+    envs.batch_engine.set_state(1, state)
+    actions = envs.sample_legal_actions().copy()
+    actions[1] = king_step(state)
+    observations, rewards, terminations, _, infos = envs.step(actions)
+    assert terminations[1] and rewards[1] == 0.0
+    assert infos["_final_obs"][1]
+    assert (infos["final_obs"][1]["observation"] != 0).sum() == 13  # the walled-in position, not a new game
+    assert observations["action_mask"].any(axis=1).all()
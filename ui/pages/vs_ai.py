@@ -8,7 +8,7 @@ from textual.widget import Widget
 
 from power_chess.engine import Engine, State
 from ui.models.types import AgentConfig
-from ui.services.ai_policy import RandomPolicy
+from ui.services.ai_policy import Policy, RandomPolicy, make_policy
 from ui.widgets.board_view import BoardView
 from ui.widgets.agent_picker import AgentPicker
 from ui.widgets.control_bar import ControlBar
@@ -21,7 +21,7 @@ class VsAIPage(Widget):
         super().__init__()
         self.engine = Engine()
         self.state: State = self.engine.initial_state()
-        self.ai_policy: RandomPolicy = RandomPolicy()
+        self.ai_policy: Policy = RandomPolicy()
         self.agent_configuration: Optional[AgentConfig] = None
 
     def compose(self) -> ComposeResult:
@@ -33,7 +33,8 @@ class VsAIPage(Widget):
     @on(AgentPicker.AgentChosen)
     def _set_agent(self, event: AgentPicker.AgentChosen) -> None:
         self.agent_configuration = event.config
-        # In the future: instantiate policy based on self.agent_configuration.name / checkpoint
+        # Checkpoints are not used yet: the available policies are built from their name alone.
+        self.ai_policy = make_policy(event.config.name)
 
     @on(ControlBar.Step)
     def _ai_step(self) -> None:
@@ -1,10 +1,14 @@
 from __future__ import annotations
 import random
-from typing import Optional
+from typing import Optional, Protocol
 
 from power_chess.engine import Engine, State, Move
 
 
+class Policy(Protocol):
+    def select(self, engine: Engine, state: State) -> Optional[Move]: ...
+
+
 class RandomPolicy:
     """Placeholder AI that uniformly samples a legal move."""
 
@@ -16,3 +20,27 @@ class RandomPolicy:
         if not legal_moves:
             return None
         return self._rng.choice(legal_moves)
+
+
+class SearchPolicy:
+    """Native alpha-beta search (Engine.search) with a depth and optional time budget."""
+
+    def __init__(self, max_depth: int = 4, time_limit_ms: int = 500) -> None:
+        self.max_depth = max_depth
+        self.time_limit_ms = time_limit_ms
+
+    def select(self, engine: Engine, state: State) -> Optional[Move]:
+        result = engine.search(state, self.max_depth, self.time_limit_ms)
+        return result.best_move if result.has_move else None
+
+
+POLICY_NAMES = ["RandomPolicy", "SearchPolicy"]
+
+
+def make_policy(name: str) -> Policy:
+    """Instantiate a policy by its name in POLICY_NAMES."""
+    if name == "SearchPolicy":
+        return SearchPolicy()
+    if name == "RandomPolicy":
+        return RandomPolicy()
+    raise ValueError(f"unknown policy: {name!r}")
@@ -8,6 +8,7 @@ from textual.message import Message
 from textual import on
 
 from ui.models.types import AgentConfig
+from ui.services.ai_policy import POLICY_NAMES
 
 
 class AgentPicker(Widget):
@@ -28,7 +29,7 @@ class AgentPicker(Widget):
     def compose(self):
         with Vertical():
             yield Label("Agent", id="agent-title")
-            yield Select(((n, n) for n in ["RandomPolicy"]), id="agent-name", value=self._default_name)
+            yield Select(((n, n) for n in POLICY_NAMES), id="agent-name", value=self._default_name)
             with Horizontal():
                 yield Label("Checkpoint:")
                 yield Input(self._default_checkpoint or "", placeholder="/path/to/checkpoint.pt", id="agent-ckpt")
@@ -148,7 +148,7 @@ class BoardView(DataTable):
     # --- Rendering ----------------------------------------------------------
 
     def _cell_text(self, flat_index: int) -> Text:
-        code = self.state.board[flat_index]
+        code = int(self.state.board[flat_index])
         # Render piece
         disp = self.piece_text_fn(code)
 